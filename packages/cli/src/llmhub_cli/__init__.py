@@ -33,17 +33,37 @@ For more details, see individual module documentation.
 
 __version__ = "0.1.0"
 
-# Catalog operations
-from .catalog import build_catalog, get_catalog, Catalog, CanonicalModel
+# Public API, imported on first attribute access: the catalog and generator
+# pull in numpy, requests and the provider SDKs, which CLI commands such as
+# `llmhub --help` or `llmhub path` never need
+_LAZY_ATTRIBUTES = {
+    # Catalog operations
+    "build_catalog": ".catalog",
+    "get_catalog": ".catalog",
+    "Catalog": ".catalog",
+    "CanonicalModel": ".catalog",
+    # Spec management
+    "load_spec": ".spec",
+    "SpecConfig": ".spec",
+    # Generator
+    "generate_runtime_from_spec": ".generator",
+    "GeneratorOptions": ".generator",
+    "GenerationResult": ".generator",
+    # Runtime management
+    "load_runtime": ".runtime",
+    "save_runtime": ".runtime",
+}
 
-# Spec management
-from .spec import load_spec, SpecConfig
 
-# Generator
-from .generator import generate_runtime_from_spec, GeneratorOptions, GenerationResult
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Runtime management
-from .runtime import load_runtime, save_runtime
 
 __all__ = [
     # Version
@@ -0,0 +1,168 @@
+"""
+Batch generation: regenerate every project under a directory tree.
+
+Each project is a directory with an llmhub.spec.yaml. The catalog and its
+scoring feature matrix are loaded once and shared in memory by a thread
+pool that generates the projects concurrently.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+from llmhub_runtime.models import RuntimeConfig
+from .context import resolve_context, ContextOverrides
+from .spec_models import load_spec
+from .runtime_io import load_runtime, load_runtime_fingerprints, save_runtime
+from .env_manager import generate_env_example
+from .generator_hook import generate_runtime, GeneratorOptions, GenerationResult
+
+
+SPEC_FILENAME = "llmhub.spec.yaml"
+
+# Directories never searched for specs
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", "site-packages", "dist", "build"}
+
+
+class ProjectOutcome(BaseModel):
+    """Result of regenerating one project."""
+    root: Path
+    status: Literal["created", "updated", "unchanged", "failed"]
+    changes: list[str] = Field(default_factory=list)  # Human-readable role changes
+    error: Optional[str] = None
+
+
+def discover_specs(root: Path) -> list[Path]:
+    """
+    Find project directories containing a spec under root.
+
+    Hidden directories, virtualenvs and build output are skipped.
+
+    Args:
+        root: Directory tree to search.
+
+    Returns:
+        Sorted project directories.
+    """
+    projects = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS]
+        if SPEC_FILENAME in filenames:
+            projects.append(Path(dirpath))
+    return sorted(projects)
+
+
+def describe_changes(old: Optional[RuntimeConfig], new: RuntimeConfig) -> list[str]:
+    """
+    List role changes between two runtimes.
+
+    Args:
+        old: Previous runtime (None if there was none).
+        new: Generated runtime.
+
+    Returns:
+        One line per added, removed or changed role.
+    """
+    old_roles = old.roles if old else {}
+    changes = []
+    for role, config in new.roles.items():
+        target = f"{config.provider}:{config.model}"
+        previous = old_roles.get(role)
+        if previous is None:
+            changes.append(f"+ {role} → {target}")
+        elif (previous.provider, previous.model) != (config.provider, config.model):
+            changes.append(f"~ {role}: {previous.provider}:{previous.model} → {target}")
+        elif previous != config:
+            changes.append(f"~ {role}: settings changed")
+    for role in old_roles:
+        if role not in new.roles:
+            changes.append(f"- {role}")
+    return changes
+
+
+def generate_project(
+    project_root: Path,
+    options: Optional[GeneratorOptions] = None,
+    write: bool = True
+) -> ProjectOutcome:
+    """
+    Regenerate one project's runtime incrementally.
+
+    Args:
+        project_root: Directory containing llmhub.spec.yaml.
+        options: Generation options.
+        write: Write llmhub.yaml and .env.example when the runtime changed.
+
+    Returns:
+        ProjectOutcome (failures are reported, not raised).
+    """
+    try:
+        context = resolve_context(overrides=ContextOverrides(root=project_root))
+        spec = load_spec(context.spec_path)
+
+        previous = None
+        if context.runtime_path.exists():
+            previous = GenerationResult(
+                runtime=load_runtime(context.runtime_path),
+                fingerprints=load_runtime_fingerprints(context.runtime_path)
+            )
+
+        result = generate_runtime(spec, options, previous)
+        changes = describe_changes(previous.runtime if previous else None, result.runtime)
+
+        if previous is None:
+            status = "created"
+        elif result.runtime != previous.runtime:
+            status = "updated"
+        else:
+            status = "unchanged"
+
+        if write and (status != "unchanged" or result.fingerprints != previous.fingerprints):
+            save_runtime(context.runtime_path, result.runtime, result.fingerprints)
+            generate_env_example(spec, context.env_example_path, overwrite=True)
+
+        return ProjectOutcome(root=project_root, status=status, changes=changes)
+    except Exception as e:
+        return ProjectOutcome(root=project_root, status="failed", error=str(e))
+
+
+def generate_all(
+    root: Path,
+    options: Optional[GeneratorOptions] = None,
+    max_workers: Optional[int] = None,
+    write: bool = True
+) -> list[ProjectOutcome]:
+    """
+    Regenerate every project under a directory tree.
+
+    Args:
+        root: Directory tree to search for specs.
+        options: Generation options shared by all projects.
+        max_workers: Thread pool size (default: CPU count, at most 8).
+        write: Write each changed project's llmhub.yaml and .env.example.
+
+    Returns:
+        One ProjectOutcome per project, in discovery order.
+    """
+    if options is None:
+        options = GeneratorOptions()
+
+    projects = discover_specs(Path(root))
+    if not projects:
+        return []
+
+    if options.no_llm:
+        # Load the catalog and build its feature matrix once, before the
+        # workers share them
+        from .generator_hook import _load_offline_catalog
+        from .generator.selection import engine_for
+
+        catalog = _load_offline_catalog()
+        if catalog is not None:
+            engine_for(catalog.models)
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda project: generate_project(project, options, write), projects))
@@ -3,17 +3,21 @@ Catalog: local model catalog with cost/quality/capability metadata.
 
 Public API for building and accessing the catalog of available models.
 """
-from typing import Optional, List
-from .schema import Catalog, CanonicalModel
+from typing import Optional, List, Union
+from .schema import Catalog, CanonicalModel, BuildProfile
 from .builder import build_catalog
 from .cache import load_cached_catalog, clear_cache
+from .handle import CatalogHandle, get_catalog_handle
+from .fingerprint import compute_fingerprint
+from .index import CatalogIndex, index_for, And, Provider, HasTag
 
 
 def get_catalog(
     ttl_hours: int = 24,
     force_refresh: bool = False,
     provider: Optional[str] = None,
-    tags: Optional[List[str]] = None
+    tags: Optional[Union[List[str], str]] = None,
+    max_stale_hours: Optional[float] = None
 ) -> Catalog:
     """
     Get catalog with optional filtering by provider and tags.
@@ -26,7 +30,9 @@ def get_catalog(
         ttl_hours: Cache TTL in hours, default 24
         force_refresh: If True, ignore cache and rebuild, default False
         provider: Optional provider name to filter by (e.g., "openai")
-        tags: Optional list of tags to filter by (models must have all tags)
+        tags: Optional tag or list of tags to filter by (models must have all tags)
+        max_stale_hours: Serve an expired cache up to this age while it is
+            rebuilt in the background (see build_catalog)
     
     Returns:
         Catalog object with filtered models (or all models if no filters)
@@ -56,30 +62,37 @@ def get_catalog(
         - build_catalog: Build catalog without filtering
         - Catalog: The catalog model with .models attribute
         - CanonicalModel: Individual model schema
+        - CatalogIndex: Bitset index for composing richer queries
     """
     # Build the catalog
-    catalog = build_catalog(ttl_hours=ttl_hours, force_refresh=force_refresh)
+    catalog = build_catalog(
+        ttl_hours=ttl_hours,
+        force_refresh=force_refresh,
+        max_stale_hours=max_stale_hours
+    )
     
-    # Apply filters if specified
-    filtered_models = catalog.models
+    # Apply filters if specified, using the catalog's bitset index
+    query = And()
     
     if provider:
-        filtered_models = [
-            m for m in filtered_models 
-            if m.provider.lower() == provider.lower()
-        ]
+        query &= Provider(provider, case_sensitive=False)
     
     if tags:
+        if isinstance(tags, str):
+            tags = [tags]
         # Filter models that have all specified tags
-        filtered_models = [
-            m for m in filtered_models
-            if all(tag in m.tags for tag in tags)
-        ]
+        for tag in tags:
+            query &= HasTag(tag)
+    
+    filtered_models = index_for(catalog.models).select(query)
     
     # Return new Catalog with filtered models
+    # The fingerprint only describes the unfiltered model list
     return Catalog(
         catalog_version=catalog.catalog_version,
         built_at=catalog.built_at,
+        fingerprint=catalog.fingerprint if len(filtered_models) == len(catalog.models) else None,
+        build_profile=catalog.build_profile,
         models=filtered_models
     )
 
@@ -87,8 +100,14 @@ def get_catalog(
 __all__ = [
     "Catalog",
     "CanonicalModel",
+    "BuildProfile",
     "build_catalog",
     "get_catalog",
     "load_cached_catalog",
     "clear_cache",
+    "CatalogHandle",
+    "get_catalog_handle",
+    "compute_fingerprint",
+    "CatalogIndex",
+    "index_for",
 ]
@@ -3,19 +3,51 @@ Builder: main build_catalog pipeline.
 
 Coordinates source loading, fusion, global statistics, tier derivation,
 and produces the final Catalog.
+
+With max_stale_hours, build_catalog serves an expired cache immediately and
+rebuilds it in the background (stale-while-revalidate); only a cache older
+than max_stale_hours blocks the caller for a full rebuild.
+
+Rebuilds hold a lock file next to the cache, so across processes only one
+rebuild runs at a time and processes that waited reuse its result.
 """
+import os
+import subprocess
+import sys
+import threading
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional, Union
 from pathlib import Path
 import numpy as np
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from .schema import FusedRaw, CanonicalModel, Catalog
-from .sources.anyllm import load_anyllm_models
-from .sources.modelsdev import fetch_modelsdev_json, normalize_modelsdev
+from .sources.anyllm import load_anyllm_models, discovery_providers
+from .sources.modelsdev import load_modelsdev_models
 from .sources.arena import load_arena_models
-from .mapper import load_overrides, fuse_sources
+from .sources.telemetry import load_telemetry_latency
+from .mapper import load_overrides, fuse_sources, modelsdev_provider
+from .probe import probe_latency
 from . import cache as cache_module
+from .fingerprint import compute_fingerprint
+from .handle import get_catalog_handle, _stat_key, _is_within_ttl
+from .lock import FileLock
+from .profile import BuildProfiler
+
+
+# Expired caches younger than this are served while they are rebuilt
+DEFAULT_MAX_STALE_HOURS = 24 * 7
+
+# Background rebuild started by this process (thread or detached process)
+_revalidation: Optional[Union[threading.Thread, subprocess.Popen]] = None
+_revalidation_lock = threading.Lock()
+
+# Run by a detached revalidation process
+_REVALIDATE_COMMAND = "from llmhub_cli.catalog.builder import _revalidate; _revalidate({ttl_hours!r})"
+
+# How long a process waits for another process's rebuild before building itself
+REBUILD_LOCK_TIMEOUT_SECONDS = 600
 
 
 class GlobalStats(BaseModel):
@@ -31,12 +63,31 @@ class GlobalStats(BaseModel):
     arena_p40: float = 1100.0
     arena_p60: float = 1200.0
     arena_p80: float = 1300.0
+    
+    def price_quantiles(self) -> np.ndarray:
+        """Price quantile vector [p20, p40, p60, p80]."""
+        return np.array([self.price_p20, self.price_p40, self.price_p60, self.price_p80])
+    
+    def arena_quantiles(self) -> np.ndarray:
+        """Arena score quantile vector [p20, p40, p60, p80]."""
+        return np.array([self.arena_p20, self.arena_p40, self.arena_p60, self.arena_p80])
 
 
 def _load_env_file() -> None:
     """
     Load .env file from common locations to populate environment variables.
     
+    Only the first call per working directory touches the filesystem; later
+    calls within the same process are no-ops.
+    """
+    _load_env_file_for(Path.cwd())
+
+
+@lru_cache(maxsize=None)
+def _load_env_file_for(cwd: Path) -> None:
+    """
+    Load .env file for a given working directory.
+    
     This function checks for .env files in:
     1. Current working directory
     2. Project root (by looking for llmhub.spec.yaml, .git, or pyproject.toml)
@@ -46,13 +97,13 @@ def _load_env_file() -> None:
     This ensures API keys are available before any-llm tries to detect providers.
     """
     # Check current working directory first
-    cwd_env = Path.cwd() / ".env"
+    cwd_env = cwd / ".env"
     if cwd_env.exists():
         load_dotenv(cwd_env, override=False)
         return
     
     # Try to find project root and check there
-    current = Path.cwd()
+    current = cwd
     for path in [current] + list(current.parents):
         # Check for project markers
         if (path / "llmhub.spec.yaml").exists() or (path / ".git").exists() or (path / "pyproject.toml").exists():
@@ -67,6 +118,106 @@ def _load_env_file() -> None:
         load_dotenv(home_env, override=False)
 
 
+# Quality tier fallback when no arena score is available
+PROVIDER_QUALITY_TIERS = {
+    "openai": 2,
+    "anthropic": 1,
+    "google": 2,
+    "deepseek": 3,
+    "mistral": 3,
+    "qwen": 3,
+}
+
+# Capability/modality tags in the order they are attached to a model
+TAG_ORDER = (
+    "reasoning",
+    "tools",
+    "structured-output",
+    "open-weights",
+    "vision",
+    "audio-input",
+    "image-gen",
+)
+
+_TIER_PERCENTILES = [20, 40, 60, 80]
+
+
+class _DerivationColumns:
+    """
+    Column arrays extracted from fused records, one entry per record.
+    
+    Missing numeric values are NaN; capability flags are False when the
+    record has no models.dev data.
+    """
+    
+    def __init__(self, fused: list[FusedRaw]) -> None:
+        n = len(fused)
+        nan = float("nan")
+        
+        self.providers = [f.anyllm.provider for f in fused]
+        
+        price_input = [f.modelsdev.price_input_per_million if f.modelsdev else None for f in fused]
+        price_output = [f.modelsdev.price_output_per_million if f.modelsdev else None for f in fused]
+        self.price_input = np.array([nan if p is None else p for p in price_input], dtype=np.float64)
+        self.price_output = np.array([nan if p is None else p for p in price_output], dtype=np.float64)
+        self.avg_price = (self.price_input + self.price_output) / 2
+        
+        arena = [f.arena.rating if f.arena else None for f in fused]
+        self.arena = np.array([nan if a is None else a for a in arena], dtype=np.float64)
+        
+        def flags(getter) -> np.ndarray:
+            return np.fromiter((bool(f.modelsdev and getter(f.modelsdev)) for f in fused), dtype=bool, count=n)
+        
+        self.supports_reasoning = flags(lambda m: m.supports_reasoning)
+        self.supports_tool_call = flags(lambda m: m.supports_tool_call)
+        self.supports_structured_output = flags(lambda m: m.supports_structured_output)
+        self.open_weights = flags(lambda m: m.open_weights)
+        self.image_input = flags(lambda m: "image" in m.input_modalities)
+        self.audio_input = flags(lambda m: "audio" in m.input_modalities)
+        self.image_output = flags(lambda m: "image" in m.output_modalities)
+    
+    def stats_prices(self) -> np.ndarray:
+        """Average prices of records with non-zero input and output price."""
+        mask = (
+            ~np.isnan(self.price_input) & (self.price_input != 0)
+            & ~np.isnan(self.price_output) & (self.price_output != 0)
+        )
+        return self.avg_price[mask]
+    
+    def stats_arena_scores(self) -> np.ndarray:
+        """Non-zero arena ratings."""
+        return self.arena[~np.isnan(self.arena) & (self.arena != 0)]
+    
+    def tag_masks(self) -> dict[str, np.ndarray]:
+        """Boolean mask per tag in TAG_ORDER."""
+        return {
+            "reasoning": self.supports_reasoning,
+            "tools": self.supports_tool_call,
+            "structured-output": self.supports_structured_output,
+            "open-weights": self.open_weights,
+            "vision": self.image_input,
+            "audio-input": self.audio_input,
+            "image-gen": self.image_output,
+        }
+
+
+def _stats_from_columns(columns: _DerivationColumns) -> GlobalStats:
+    """Compute tier quantiles from extracted columns."""
+    stats = GlobalStats()
+    
+    prices = columns.stats_prices()
+    if prices.size:
+        p20, p40, p60, p80 = (float(v) for v in np.percentile(prices, _TIER_PERCENTILES))
+        stats.price_p20, stats.price_p40, stats.price_p60, stats.price_p80 = p20, p40, p60, p80
+    
+    arena_scores = columns.stats_arena_scores()
+    if arena_scores.size:
+        p20, p40, p60, p80 = (float(v) for v in np.percentile(arena_scores, _TIER_PERCENTILES))
+        stats.arena_p20, stats.arena_p40, stats.arena_p60, stats.arena_p80 = p20, p40, p60, p80
+    
+    return stats
+
+
 def _compute_global_stats(fused: list[FusedRaw]) -> GlobalStats:
     """
     Compute price and arena-score quantiles for tier bucketing.
@@ -77,238 +228,199 @@ def _compute_global_stats(fused: list[FusedRaw]) -> GlobalStats:
     Returns:
         GlobalStats with quantiles for tier derivation
     """
-    # Collect prices (average of input/output)
-    prices = []
-    for f in fused:
-        if f.modelsdev and f.modelsdev.price_input_per_million and f.modelsdev.price_output_per_million:
-            avg_price = (f.modelsdev.price_input_per_million + f.modelsdev.price_output_per_million) / 2
-            prices.append(avg_price)
-    
-    # Collect arena scores
-    arena_scores = []
-    for f in fused:
-        if f.arena and f.arena.rating:
-            arena_scores.append(f.arena.rating)
+    return _stats_from_columns(_DerivationColumns(fused))
+
+
+def _derive_cost_tiers(avg_prices: np.ndarray, stats: GlobalStats) -> np.ndarray:
+    """
+    Derive cost tiers from average prices (1=cheapest, 5=most expensive).
     
-    stats = GlobalStats()
+    A price lands in the first bucket whose quantile it does not exceed.
+    The quantile vector is made monotone with a running max so searchsorted
+    reproduces that first-match rule exactly. Unknown prices (NaN) get 3.
+    """
+    bounds = np.maximum.accumulate(stats.price_quantiles())
+    tiers = 1 + np.searchsorted(bounds, avg_prices, side="left")
+    return np.where(np.isnan(avg_prices), 3, tiers)
+
+
+def _derive_quality_tiers(arena_scores: np.ndarray, providers: list[str], stats: GlobalStats) -> np.ndarray:
+    """
+    Derive quality tiers from arena scores (1=best, 5=worst).
     
-    # Compute price quantiles if we have data
-    if prices:
-        prices_array = np.array(prices)
-        stats.price_p20 = float(np.percentile(prices_array, 20))
-        stats.price_p40 = float(np.percentile(prices_array, 40))
-        stats.price_p60 = float(np.percentile(prices_array, 60))
-        stats.price_p80 = float(np.percentile(prices_array, 80))
-    
-    # Compute arena score quantiles if we have data
-    if arena_scores:
-        arena_array = np.array(arena_scores)
-        stats.arena_p20 = float(np.percentile(arena_array, 20))
-        stats.arena_p40 = float(np.percentile(arena_array, 40))
-        stats.arena_p60 = float(np.percentile(arena_array, 60))
-        stats.arena_p80 = float(np.percentile(arena_array, 80))
+    A score lands in the first of p80, p60, p40, p20 it reaches. Records
+    without an arena score fall back to PROVIDER_QUALITY_TIERS.
+    """
+    # Descending bounds made monotone with a running min, then flipped for searchsorted
+    bounds = np.minimum.accumulate(stats.arena_quantiles()[::-1])[::-1]
+    tiers = 5 - np.searchsorted(bounds, arena_scores, side="right")
     
-    return stats
+    missing = np.isnan(arena_scores)
+    if missing.any():
+        unique, inverse = np.unique(np.array([p.lower() for p in providers], dtype=object), return_inverse=True)
+        fallback = np.array([PROVIDER_QUALITY_TIERS.get(p, 3) for p in unique], dtype=np.int64)[inverse]
+        tiers = np.where(missing, fallback, tiers)
+    
+    return tiers
 
 
-def _derive_cost_tier(avg_price: Optional[float], stats: GlobalStats) -> int:
-    """Derive cost tier from price (1=cheapest, 5=most expensive)."""
-    if avg_price is None:
-        return 3  # Default to medium
-    
-    # Lower price = lower tier number = better
-    if avg_price <= stats.price_p20:
-        return 1
-    elif avg_price <= stats.price_p40:
-        return 2
-    elif avg_price <= stats.price_p60:
-        return 3
-    elif avg_price <= stats.price_p80:
-        return 4
-    else:
-        return 5
-
-
-def _derive_quality_tier(arena_score: Optional[float], provider: str, stats: GlobalStats) -> int:
-    """Derive quality tier from arena score (1=best, 5=worst)."""
-    if arena_score is not None:
-        # Higher arena score = lower tier number = better quality
-        if arena_score >= stats.arena_p80:
-            return 1
-        elif arena_score >= stats.arena_p60:
-            return 2
-        elif arena_score >= stats.arena_p40:
-            return 3
-        elif arena_score >= stats.arena_p20:
-            return 4
-        else:
-            return 5
-    
-    # Fallback based on provider reputation
-    provider_tiers = {
-        "openai": 2,
-        "anthropic": 1,
-        "google": 2,
-        "deepseek": 3,
-        "mistral": 3,
-        "qwen": 3,
-    }
-    return provider_tiers.get(provider.lower(), 3)
-
-
-def _derive_tags(f: FusedRaw) -> list[str]:
-    """Derive tags from model capabilities and metadata."""
-    tags = []
-    
-    if f.modelsdev:
-        if f.modelsdev.supports_reasoning:
-            tags.append("reasoning")
-        if f.modelsdev.supports_tool_call:
-            tags.append("tools")
-        if f.modelsdev.supports_structured_output:
-            tags.append("structured-output")
-        if f.modelsdev.open_weights:
-            tags.append("open-weights")
-        
-        # Modality tags
-        if "image" in f.modelsdev.input_modalities:
-            tags.append("vision")
-        if "audio" in f.modelsdev.input_modalities:
-            tags.append("audio-input")
-        if "image" in f.modelsdev.output_modalities:
-            tags.append("image-gen")
-    
+def _derive_tag_lists(columns: _DerivationColumns, size: int) -> list[list[str]]:
+    """Build each record's tag list from per-tag masks, preserving TAG_ORDER."""
+    tags: list[list[str]] = [[] for _ in range(size)]
+    masks = columns.tag_masks()
+    for tag in TAG_ORDER:
+        for i in np.flatnonzero(masks[tag]):
+            tags[i].append(tag)
     return tags
 
 
-def _derive_canonical(f: FusedRaw, stats: GlobalStats, overrides: dict) -> CanonicalModel:
+def _merge_latency(*sources: dict) -> dict:
+    """Merge canonical_id → latency field dicts; later sources win per field."""
+    merged: dict[str, dict] = {}
+    for source in sources:
+        for canonical_id, values in source.items():
+            merged.setdefault(canonical_id, {}).update(values)
+    return merged
+
+
+def _infer_family(model_id: str, overrides: dict) -> Optional[str]:
+    """Infer a model family from model_id using override patterns."""
+    model_families = overrides.get("model_families", {})
+    for family_key, family_name in model_families.items():
+        if family_key.lower() in model_id.lower():
+            return family_name
+    return None
+
+
+def _derive_canonical_models(
+    fused: list[FusedRaw],
+    stats: GlobalStats,
+    overrides: dict,
+    columns: Optional[_DerivationColumns] = None
+) -> list[CanonicalModel]:
     """
-    Derive a CanonicalModel from a FusedRaw record.
+    Derive CanonicalModels for all fused records at once.
+    
+    Tiers and tags are computed column-wise; the per-record loop only
+    copies source fields into the CanonicalModel.
     
     Args:
-        f: Fused raw record
+        fused: Fused raw records
         stats: Global statistics for tier derivation
         overrides: Override data including model families
+        columns: Precomputed columns for fused (extracted if omitted)
         
     Returns:
-        CanonicalModel with all fields populated
+        CanonicalModels in the same order as fused
     """
-    # Basic identity
-    provider = f.anyllm.provider
-    model_id = f.anyllm.model_id
-    canonical_id = f.canonical_id
-    
-    # Determine family and display name
-    family = None
-    display_name = None
-    
-    if f.modelsdev:
-        family = f.modelsdev.family
-        display_name = f.modelsdev.display_name
-    
-    # Try to infer family from model_id using overrides
-    if not family:
-        model_families = overrides.get("model_families", {})
-        for family_key, family_name in model_families.items():
-            if family_key.lower() in model_id.lower():
-                family = family_name
-                break
-    
-    if not display_name:
-        display_name = model_id
-    
-    # Capabilities - use modelsdev if available, else defaults
-    supports_reasoning = f.modelsdev.supports_reasoning if f.modelsdev else False
-    supports_tool_call = f.modelsdev.supports_tool_call if f.modelsdev else False
-    supports_structured_output = f.modelsdev.supports_structured_output if f.modelsdev else False
-    input_modalities = f.modelsdev.input_modalities if f.modelsdev else ["text"]
-    output_modalities = f.modelsdev.output_modalities if f.modelsdev else ["text"]
-    attachments = f.modelsdev.attachments if f.modelsdev else []
-    
-    # Limits
-    context_tokens = f.modelsdev.context_tokens if f.modelsdev else None
-    max_input_tokens = f.modelsdev.max_input_tokens if f.modelsdev else None
-    max_output_tokens = f.modelsdev.max_output_tokens if f.modelsdev else None
-    
-    # Pricing
-    price_input = f.modelsdev.price_input_per_million if f.modelsdev else None
-    price_output = f.modelsdev.price_output_per_million if f.modelsdev else None
-    price_reasoning = f.modelsdev.price_reasoning_per_million if f.modelsdev else None
-    
-    # Calculate average price for tier
-    avg_price = None
-    if price_input is not None and price_output is not None:
-        avg_price = (price_input + price_output) / 2
+    if columns is None:
+        columns = _DerivationColumns(fused)
     
     # Derive tiers
-    cost_tier = _derive_cost_tier(avg_price, stats)
-    arena_score = f.arena.rating if f.arena else None
-    quality_tier = _derive_quality_tier(arena_score, provider, stats)
+    cost_tiers = _derive_cost_tiers(columns.avg_price, stats)
+    quality_tiers = _derive_quality_tiers(columns.arena, columns.providers, stats)
     
     # Reasoning tier: base on quality, bump if reasoning supported
-    reasoning_tier = quality_tier
-    if supports_reasoning and reasoning_tier > 1:
-        reasoning_tier = max(1, reasoning_tier - 1)
+    reasoning_tiers = np.where(
+        columns.supports_reasoning & (quality_tiers > 1),
+        np.maximum(1, quality_tiers - 1),
+        quality_tiers
+    )
     
     # Creative tier: start with quality tier (can be refined later)
-    creative_tier = quality_tier
-    
-    # Arena confidence intervals
-    arena_ci_low = f.arena.rating_q025 if f.arena else None
-    arena_ci_high = f.arena.rating_q975 if f.arena else None
-    
-    # Meta
-    knowledge_cutoff = f.modelsdev.knowledge_cutoff if f.modelsdev else None
-    release_date = f.modelsdev.release_date if f.modelsdev else None
-    last_updated = f.modelsdev.last_updated if f.modelsdev else None
-    open_weights = f.modelsdev.open_weights if f.modelsdev else False
-    
-    # Tags
-    tags = _derive_tags(f)
-    
-    return CanonicalModel(
-        canonical_id=canonical_id,
-        provider=provider,
-        model_id=model_id,
-        family=family,
-        display_name=display_name,
-        supports_reasoning=supports_reasoning,
-        supports_tool_call=supports_tool_call,
-        supports_structured_output=supports_structured_output,
-        input_modalities=input_modalities,
-        output_modalities=output_modalities,
-        attachments=attachments,
-        context_tokens=context_tokens,
-        max_input_tokens=max_input_tokens,
-        max_output_tokens=max_output_tokens,
-        price_input_per_million=price_input,
-        price_output_per_million=price_output,
-        price_reasoning_per_million=price_reasoning,
-        quality_tier=quality_tier,
-        reasoning_tier=reasoning_tier,
-        creative_tier=creative_tier,
-        cost_tier=cost_tier,
-        arena_score=arena_score,
-        arena_ci_low=arena_ci_low,
-        arena_ci_high=arena_ci_high,
-        knowledge_cutoff=knowledge_cutoff,
-        release_date=release_date,
-        last_updated=last_updated,
-        open_weights=open_weights,
-        tags=tags
-    )
+    creative_tiers = quality_tiers
+    
+    tag_lists = _derive_tag_lists(columns, len(fused))
+    
+    # Typical latency and reliability per canonical_id, where known
+    latency_overrides = overrides.get("latency", {})
+    rate_limits = overrides.get("rate_limits", {})
+    
+    canonical_models = []
+    for i, f in enumerate(fused):
+        md = f.modelsdev
+        latency = latency_overrides.get(f.canonical_id, {})
+        # Model limits refine provider-wide limits
+        limits = {**rate_limits.get(f.anyllm.provider, {}), **rate_limits.get(f.canonical_id, {})}
+        
+        # Determine family and display name
+        family = md.family if md else None
+        display_name = md.display_name if md else None
+        if not family:
+            family = _infer_family(f.anyllm.model_id, overrides)
+        if not display_name:
+            display_name = f.anyllm.model_id
+        
+        canonical_models.append(CanonicalModel(
+            canonical_id=f.canonical_id,
+            provider=f.anyllm.provider,
+            model_id=f.anyllm.model_id,
+            family=family,
+            display_name=display_name,
+            supports_reasoning=md.supports_reasoning if md else False,
+            supports_tool_call=md.supports_tool_call if md else False,
+            supports_structured_output=md.supports_structured_output if md else False,
+            input_modalities=md.input_modalities if md else ["text"],
+            output_modalities=md.output_modalities if md else ["text"],
+            attachments=md.attachments if md else [],
+            context_tokens=md.context_tokens if md else None,
+            max_input_tokens=md.max_input_tokens if md else None,
+            max_output_tokens=md.max_output_tokens if md else None,
+            price_input_per_million=md.price_input_per_million if md else None,
+            price_output_per_million=md.price_output_per_million if md else None,
+            price_reasoning_per_million=md.price_reasoning_per_million if md else None,
+            ttft_ms=latency.get("ttft_ms"),
+            output_tokens_per_second=latency.get("output_tokens_per_second"),
+            observed_latency_ms=latency.get("observed_latency_ms"),
+            error_rate=latency.get("error_rate"),
+            rate_limit_rpm=limits.get("rpm"),
+            rate_limit_tpm=limits.get("tpm"),
+            quality_tier=int(quality_tiers[i]),
+            reasoning_tier=int(reasoning_tiers[i]),
+            creative_tier=int(creative_tiers[i]),
+            cost_tier=int(cost_tiers[i]),
+            arena_score=f.arena.rating if f.arena else None,
+            arena_ci_low=f.arena.rating_q025 if f.arena else None,
+            arena_ci_high=f.arena.rating_q975 if f.arena else None,
+            knowledge_cutoff=md.knowledge_cutoff if md else None,
+            release_date=md.release_date if md else None,
+            last_updated=md.last_updated if md else None,
+            open_weights=md.open_weights if md else False,
+            tags=tag_lists[i]
+        ))
+    
+    return canonical_models
+
+
+def _derive_canonical(f: FusedRaw, stats: GlobalStats, overrides: dict) -> CanonicalModel:
+    """
+    Derive a single CanonicalModel from a FusedRaw record.
+    
+    Args:
+        f: Fused raw record
+        stats: Global statistics for tier derivation
+        overrides: Override data including model families
+        
+    Returns:
+        CanonicalModel with all fields populated
+    """
+    return _derive_canonical_models([f], stats, overrides)[0]
 
 
 def build_catalog(
     ttl_hours: int = 24,
-    force_refresh: bool = False
+    force_refresh: bool = False,
+    max_stale_hours: Optional[float] = None,
+    detach: bool = False,
+    profile: bool = False
 ) -> Catalog:
     """
     Build the complete catalog from all sources.
     
     This is the main public entrypoint for catalog building. It:
     0. Loads .env file if available (for API keys)
-    1. Checks cache if force_refresh=False
+    1. Checks cache if force_refresh=False (memoized per process, see
+       CatalogHandle)
     2. Loads data from all sources
     3. Fuses sources using ID mapping
     4. Computes global statistics
@@ -319,69 +431,272 @@ def build_catalog(
     Args:
         ttl_hours: Cache TTL in hours (default 24)
         force_refresh: If True, ignore cache and rebuild
+        max_stale_hours: If set, a cache older than ttl_hours but younger
+            than this is returned immediately and rebuilt in the background;
+            older caches are rebuilt before returning (default None: always
+            rebuild an expired cache before returning)
+        detach: Rebuild in a detached process that outlives this one rather
+            than in a daemon thread (for short-lived CLI commands)
+        profile: If this call rebuilds the catalog, record wall time, CPU
+            time, peak memory and item counts per stage in
+            Catalog.build_profile (see catalog.profile). A rebuild finished
+            by another process while waiting is not reused then.
         
     Returns:
         Catalog with all available models
     """
-    # 0. Try to load .env file from common locations
-    # This ensures any-llm can discover providers
+    handle = get_catalog_handle()
+    # Identifies the cache file as it was before this call, so a rebuild
+    # finished by another process while we wait for the lock is recognized
+    seen = _stat_key(cache_module._get_cache_path())
+    
+    # Builds are serialized so concurrent callers reuse one result
+    with handle.lock:
+        # 0. Try to load .env file from common locations
+        # This ensures any-llm can discover providers
+        _load_env_file()
+        
+        # 1. Check cache
+        if not force_refresh:
+            cached = handle.load(ttl_hours)
+            if cached:
+                return cached
+            
+            if max_stale_hours is not None:
+                stale = handle.load(max_stale_hours)
+                if stale:
+                    _revalidate_in_background(ttl_hours, detach)
+                    return stale
+        
+        # 2. Rebuild, one process at a time
+        rebuild_lock = FileLock(cache_module._get_rebuild_lock_path())
+        if not rebuild_lock.acquire(timeout=REBUILD_LOCK_TIMEOUT_SECONDS):
+            print("Warning: Another process is still rebuilding the catalog, rebuilding anyway")
+        try:
+            # A rebuild finished while we waited is reused, unless a profile
+            # of this build was asked for
+            if not profile and _stat_key(cache_module._get_cache_path()) != seen:
+                rebuilt = handle.load(ttl_hours=None)
+                if rebuilt:
+                    return rebuilt
+            
+            catalog = _build_fresh_catalog(profile=profile)
+            handle.store(catalog)
+            return catalog
+        finally:
+            rebuild_lock.release()
+
+
+def _modelsdev_providers(anyllm_models: list, overrides: dict) -> set[str]:
+    """
+    Providers whose models.dev entries fusion can use: those of the
+    discovered models (under their models.dev names) plus those their
+    id_mappings point at.
+    
+    Args:
+        anyllm_models: Discovered AnyLLMModels
+        overrides: Override data including id_mappings
+        
+    Returns:
+        Set of models.dev provider names
+    """
+    catalog_providers = {m.provider for m in anyllm_models}
+    providers = {modelsdev_provider(p, overrides) for p in catalog_providers}
+    for canonical_id, mapping in overrides.get("id_mappings", {}).items():
+        modelsdev_id = mapping.get("modelsdev_id")
+        if modelsdev_id and canonical_id.split("/", 1)[0] in catalog_providers:
+            providers.add(modelsdev_id.split("/", 1)[0])
+    return providers
+
+
+def _revalidation_running() -> bool:
+    """Check whether this process's background rebuild is still running."""
+    if isinstance(_revalidation, threading.Thread):
+        return _revalidation.is_alive()
+    return _revalidation is not None and _revalidation.poll() is None
+
+
+def _revalidate_in_background(ttl_hours: int, detach: bool = False) -> bool:
+    """
+    Start a background rebuild of the catalog cache unless one started by
+    this process is still running.
+    
+    Args:
+        ttl_hours: Cache TTL in hours (skip the rebuild if another process
+            refreshed the cache in the meantime)
+        detach: Rebuild in a detached process instead of a daemon thread
+        
+    Returns:
+        True if a rebuild was started
+    """
+    global _revalidation
+    with _revalidation_lock:
+        if _revalidation_running():
+            return False
+        if detach:
+            options: dict = {"start_new_session": True}
+            if os.name == "nt":
+                options = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+            try:
+                _revalidation = subprocess.Popen(
+                    [sys.executable, "-c", _REVALIDATE_COMMAND.format(ttl_hours=ttl_hours)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    **options,
+                )
+            except OSError:
+                return False
+        else:
+            _revalidation = threading.Thread(
+                target=_revalidate,
+                args=(ttl_hours,),
+                name="llmhub-catalog-revalidate",
+                daemon=True,
+            )
+            _revalidation.start()
+        return True
+
+
+def _revalidate(ttl_hours: int = 24) -> None:
+    """
+    Rebuild the catalog quietly and atomically replace the disk cache.
+    
+    Does nothing if another process holds the rebuild lock or has already
+    refreshed the cache. The handle picks up the new file on its next load.
+    
+    Args:
+        ttl_hours: Cache TTL in hours
+    """
     _load_env_file()
+    rebuild_lock = FileLock(cache_module._get_rebuild_lock_path())
+    if not rebuild_lock.acquire(blocking=False):
+        return
+    try:
+        key = _stat_key(cache_module._get_cache_path())
+        if key is not None and _is_within_ttl(key, ttl_hours):
+            return
+        quiet = lambda message: None
+        catalog = _build_fresh_catalog(echo=quiet, save=False)
+        cache_module.save_catalog(catalog, echo=quiet)
+    except Exception:
+        # The stale cache stays in place; the next expired load retries
+        return
+    finally:
+        rebuild_lock.release()
+
+
+def _wait_for_revalidation(timeout: Optional[float] = None) -> None:
+    """Block until this process's background rebuild (if any) finishes."""
+    revalidation = _revalidation
+    if isinstance(revalidation, threading.Thread):
+        revalidation.join(timeout)
+    elif revalidation is not None:
+        try:
+            revalidation.wait(timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def _build_fresh_catalog(
+    echo: Callable[[str], None] = print,
+    save: bool = True,
+    profile: bool = False
+) -> Catalog:
+    """
+    Run the full source → fusion → derivation pipeline and save the result.
+    
+    Args:
+        echo: Receives progress messages (default: print)
+        save: Write the result to the disk cache
+        profile: Record a BuildProfile of every stage in the catalog
+            metadata (saving the cache is not part of it)
     
-    # 1. Check cache
-    if not force_refresh:
-        cached = cache_module.load_cached_catalog(ttl_hours)
-        if cached:
-            return cached
-    
-    # 2. Load sources
-    print("Loading models from any-llm...")
-    anyllm_models = load_anyllm_models()
-    
-    if not anyllm_models:
-        print("Warning: No models found from any-llm. Catalog will be empty.")
-        print("")
-        print("Possible reasons:")
-        print("  1. No valid API keys found in environment")
-        print("  2. Check your .env file has valid API keys:")
-        print("     OPENAI_API_KEY=sk-proj-...")
-        print("     ANTHROPIC_API_KEY=sk-ant-...")
-        print("  3. API keys may be invalid or expired")
-        print("")
-    
-    print("Fetching models.dev metadata...")
-    modelsdev_data = fetch_modelsdev_json()
-    modelsdev_map = normalize_modelsdev(modelsdev_data)
-    
-    print("Loading arena quality scores...")
-    arena_map = load_arena_models()
-    
-    print("Loading overrides...")
-    overrides = load_overrides()
-    
-    # 3. Fuse sources
-    print("Fusing data sources...")
-    fused_raw = fuse_sources(anyllm_models, modelsdev_map, arena_map, overrides)
-    
-    # 4. Compute global stats
-    print("Computing global statistics...")
-    stats = _compute_global_stats(fused_raw)
-    
-    # 5. Derive canonical models
-    print("Deriving canonical models...")
-    canonical_models = [
-        _derive_canonical(f, stats, overrides)
-        for f in fused_raw
-    ]
+    Returns:
+        Freshly built Catalog
+    """
+    profiler = BuildProfiler(enabled=profile)
+    try:
+        # 2. Load sources
+        echo("Loading overrides...")
+        with profiler.stage("overrides") as stage:
+            overrides = load_overrides()
+            stage.items = sum(len(v) for v in overrides.values() if isinstance(v, dict))
+        
+        echo("Loading models from any-llm...")
+        with profiler.stage("anyllm") as stage:
+            anyllm_models = load_anyllm_models(discovery_providers(overrides, echo), echo=echo)
+            stage.items = len(anyllm_models)
+        
+        if not anyllm_models:
+            echo("Warning: No models found from any-llm. Catalog will be empty.")
+            echo("")
+            echo("Possible reasons:")
+            echo("  1. No valid API keys found in environment")
+            echo("  2. Check your .env file has valid API keys:")
+            echo("     OPENAI_API_KEY=sk-proj-...")
+            echo("     ANTHROPIC_API_KEY=sk-ant-...")
+            echo("  3. API keys may be invalid or expired")
+            echo("")
+        
+        echo("Fetching models.dev metadata...")
+        with profiler.stage("modelsdev") as stage:
+            modelsdev_map = load_modelsdev_models(_modelsdev_providers(anyllm_models, overrides), echo=echo)
+            stage.items = len(modelsdev_map)
+        
+        echo("Loading arena quality scores...")
+        with profiler.stage("arena") as stage:
+            arena_map = load_arena_models(echo=echo)
+            stage.items = len(arena_map)
+        
+        echo("Loading latency measurements...")
+        with profiler.stage("latency") as stage:
+            # Per field: overrides, then deployment telemetry, then probes
+            overrides["latency"] = _merge_latency(
+                probe_latency(),
+                load_telemetry_latency(),
+                overrides.get("latency", {}),
+            )
+            stage.items = len(overrides["latency"])
+        
+        # 3. Fuse sources
+        echo("Fusing data sources...")
+        with profiler.stage("fuse") as stage:
+            fused_raw = fuse_sources(anyllm_models, modelsdev_map, arena_map, overrides)
+            stage.items = len(fused_raw)
+        
+        # 4. Compute global stats
+        echo("Computing global statistics...")
+        with profiler.stage("stats") as stage:
+            columns = _DerivationColumns(fused_raw)
+            stats = _stats_from_columns(columns)
+            stage.items = len(fused_raw)
+        
+        # 5. Derive canonical models
+        echo("Deriving canonical models...")
+        with profiler.stage("derive") as stage:
+            canonical_models = _derive_canonical_models(fused_raw, stats, overrides, columns)
+            stage.items = len(canonical_models)
+        
+        with profiler.stage("fingerprint") as stage:
+            fingerprint = compute_fingerprint(canonical_models)
+            stage.items = len(canonical_models)
+    finally:
+        build_profile = profiler.finish()
     
     # 6. Create catalog
     catalog = Catalog(
         catalog_version=1,
         built_at=datetime.now().isoformat(),
+        fingerprint=fingerprint,
+        build_profile=build_profile,
         models=canonical_models
     )
     
     # 7. Save to cache
-    print(f"Saving catalog with {len(canonical_models)} models...")
-    cache_module.save_catalog(catalog)
+    if save:
+        echo(f"Saving catalog with {len(canonical_models)} models...")
+        cache_module.save_catalog(catalog, echo)
     
     return catalog
@@ -5,9 +5,10 @@ Caches catalog.json to ~/.config/llmhub/ (or OS-appropriate config dir).
 """
 import json
 import os
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 import platform
 from .schema import Catalog
 
@@ -34,12 +35,28 @@ def _get_cache_path() -> Path:
     return _get_cache_dir() / "catalog.json"
 
 
-def load_cached_catalog(ttl_hours: int = 24) -> Optional[Catalog]:
+def _get_features_dir() -> Path:
+    """Get directory holding feature tables derived from the cached catalog."""
+    return _get_cache_path().parent / "features"
+
+
+def _get_sources_dir() -> Path:
+    """Get directory holding per-source caches used by catalog builds."""
+    return _get_cache_path().parent / "sources"
+
+
+def _get_rebuild_lock_path() -> Path:
+    """Get lock file held while the catalog is being rebuilt."""
+    return _get_cache_path().parent / "catalog.lock"
+
+
+def load_cached_catalog(ttl_hours: Optional[int] = 24) -> Optional[Catalog]:
     """
     Load cached catalog if it exists and is fresh.
     
     Args:
         ttl_hours: Time-to-live in hours. Cache older than this is ignored.
+            None accepts a cache of any age.
         
     Returns:
         Catalog if cache is fresh, None otherwise.
@@ -54,7 +71,7 @@ def load_cached_catalog(ttl_hours: int = 24) -> Optional[Catalog]:
         mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
         age = datetime.now() - mtime
         
-        if age > timedelta(hours=ttl_hours):
+        if ttl_hours is not None and age > timedelta(hours=ttl_hours):
             # Cache is stale
             return None
         
@@ -69,12 +86,16 @@ def load_cached_catalog(ttl_hours: int = 24) -> Optional[Catalog]:
         return None
 
 
-def save_catalog(catalog: Catalog) -> None:
+def save_catalog(catalog: Catalog, echo: Callable[[str], None] = print) -> None:
     """
     Save catalog to disk cache.
     
+    The file is written next to the cache and renamed over it, so readers
+    see either the previous catalog or the new one, never a partial file.
+    
     Args:
         catalog: Catalog instance to save.
+        echo: Receives warnings (default: print)
     """
     cache_path = _get_cache_path()
     
@@ -82,13 +103,19 @@ def save_catalog(catalog: Catalog) -> None:
         # Serialize to JSON
         data = catalog.model_dump()
         
-        # Write to file
-        with open(cache_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temporary file, then atomically replace the cache
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
             
     except (IOError, ValueError) as e:
         # Non-fatal - just log warning
-        print(f"Warning: Failed to save catalog cache: {e}")
+        echo(f"Warning: Failed to save catalog cache: {e}")
 
 
 def clear_cache() -> bool:
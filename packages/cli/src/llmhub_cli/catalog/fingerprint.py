@@ -0,0 +1,28 @@
+"""
+Fingerprint: stable content hash of a catalog's models.
+
+The fingerprint changes whenever any model field changes and is independent
+of when the catalog was built, so values derived from the models (feature
+tables, selection results) can be cached on disk keyed by it.
+"""
+import hashlib
+import json
+from typing import Sequence
+from .schema import CanonicalModel
+
+
+def compute_fingerprint(models: Sequence[CanonicalModel]) -> str:
+    """
+    Compute the content fingerprint of a model list.
+
+    Args:
+        models: Models in catalog order
+
+    Returns:
+        Hex SHA-256 digest of the models' canonical JSON encoding
+    """
+    digest = hashlib.sha256()
+    for model in models:
+        digest.update(json.dumps(model.model_dump(mode="json"), sort_keys=True, separators=(",", ":")).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
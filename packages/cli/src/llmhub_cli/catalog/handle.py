@@ -0,0 +1,126 @@
+"""
+Handle: process-wide memoized access to the cached Catalog.
+
+A single llmhub process may ask for the catalog several times (get_catalog,
+load_catalog_view, catalog show, ...). The handle keeps the last loaded
+Catalog in memory keyed on the cache file's (path, mtime, size), so repeated
+calls skip re-reading and re-validating catalog.json until the file changes.
+"""
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+from .schema import Catalog, CanonicalModel
+from .fingerprint import compute_fingerprint
+from . import cache as cache_module
+
+
+CacheKey = Tuple[str, int, int]
+
+
+def _stat_key(path: Path) -> Optional[CacheKey]:
+    """Return (path, mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _is_within_ttl(key: CacheKey, ttl_hours: Optional[int]) -> bool:
+    """Check whether the file described by key is younger than ttl_hours."""
+    if ttl_hours is None:
+        return True
+    mtime = datetime.fromtimestamp(key[1] / 1e9)
+    return datetime.now() - mtime <= timedelta(hours=ttl_hours)
+
+
+class CatalogHandle:
+    """
+    Thread-safe, in-memory memo of the on-disk catalog cache.
+
+    The memoized Catalog is shared by every caller in the process and must
+    be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._key: Optional[CacheKey] = None
+        self._catalog: Optional[Catalog] = None
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Re-entrant lock serializing loads and rebuilds within the process."""
+        return self._lock
+
+    def load(self, ttl_hours: Optional[int] = 24) -> Optional[Catalog]:
+        """
+        Return the cached catalog if it is fresh, using the in-memory copy
+        when the cache file has not changed since it was last read.
+
+        Args:
+            ttl_hours: Cache TTL in hours (None accepts any age)
+
+        Returns:
+            Catalog if the disk cache is fresh, None otherwise.
+        """
+        with self._lock:
+            key = _stat_key(cache_module._get_cache_path())
+            if key is None:
+                self._key = None
+                self._catalog = None
+                return None
+
+            if key == self._key and self._catalog is not None:
+                return self._catalog if _is_within_ttl(key, ttl_hours) else None
+
+            catalog = cache_module.load_cached_catalog(ttl_hours)
+            if catalog is not None:
+                if catalog.fingerprint is None:
+                    # Caches written before fingerprints existed
+                    catalog.fingerprint = compute_fingerprint(catalog.models)
+                self._key = key
+                self._catalog = catalog
+            return catalog
+
+    def store(self, catalog: Catalog) -> None:
+        """
+        Remember a catalog that was just written to the disk cache.
+
+        Args:
+            catalog: Catalog instance that matches the current cache file.
+        """
+        with self._lock:
+            key = _stat_key(cache_module._get_cache_path())
+            self._key = key
+            self._catalog = catalog if key is not None else None
+
+    def fingerprint_of(self, models: Sequence[CanonicalModel]) -> Optional[str]:
+        """
+        Return the fingerprint of the memoized catalog if models is its
+        model list (by identity), None for any other list.
+
+        Args:
+            models: Model list, typically Catalog.models
+
+        Returns:
+            Catalog fingerprint or None
+        """
+        with self._lock:
+            if self._catalog is not None and self._catalog.models is models:
+                return self._catalog.fingerprint
+            return None
+
+    def invalidate(self) -> None:
+        """Drop the in-memory catalog; the next load re-reads the disk cache."""
+        with self._lock:
+            self._key = None
+            self._catalog = None
+
+
+_default_handle = CatalogHandle()
+
+
+def get_catalog_handle() -> CatalogHandle:
+    """Return the process-wide CatalogHandle shared by all catalog entry points."""
+    return _default_handle
@@ -0,0 +1,407 @@
+"""
+Index: bitset capability index and query API over catalog models.
+
+CatalogIndex precomputes one bitset (a NumPy boolean array with one entry
+per model) for every provider, tag, capability flag and modality, plus
+sorted arrays for context_tokens, average price, time to first token and
+rate limits. Queries are composed
+from predicates with & (AND), | (OR) and ~ (NOT) and evaluate to a handful
+of bitwise operations instead of a Python loop over every model.
+
+Example:
+    >>> from llmhub_cli.catalog.index import index_for, Provider, HasTag, ContextRange
+    >>> index = index_for(catalog.models)
+    >>> query = (Provider("openai") | Provider("anthropic")) & HasTag("vision") & ContextRange(min=100_000)
+    >>> models = index.select(query)
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+import numpy as np
+from .schema import CanonicalModel
+from .memo import IdentityMemo
+
+
+# Rate limit name → CanonicalModel attribute
+RATE_LIMIT_FIELDS = {
+    "rpm": "rate_limit_rpm",
+    "tpm": "rate_limit_tpm",
+}
+
+# Capability flag name → CanonicalModel attribute
+CAPABILITY_FIELDS = {
+    "reasoning": "supports_reasoning",
+    "tool_call": "supports_tool_call",
+    "structured_output": "supports_structured_output",
+    "open_weights": "open_weights",
+}
+
+
+def _average_price(model: CanonicalModel) -> Optional[float]:
+    """Average of input/output price per million, if both are known."""
+    if model.price_input_per_million is None or model.price_output_per_million is None:
+        return None
+    return (model.price_input_per_million + model.price_output_per_million) / 2
+
+
+class _SortedColumn:
+    """Sorted values of a numeric column with the model positions they came from."""
+
+    def __init__(self, values: List[Optional[float]]) -> None:
+        known = np.array([i for i, v in enumerate(values) if v is not None], dtype=np.intp)
+        raw = np.array([values[i] for i in known], dtype=np.float64)
+        order = np.argsort(raw, kind="stable")
+        self.positions = known[order]
+        self.values = raw[order]
+
+    def range_mask(self, size: int, min_value: Optional[float], max_value: Optional[float]) -> np.ndarray:
+        """Mask of models whose value lies in [min_value, max_value]; unknown values never match."""
+        lo = 0 if min_value is None else int(np.searchsorted(self.values, min_value, side="left"))
+        hi = len(self.values) if max_value is None else int(np.searchsorted(self.values, max_value, side="right"))
+        mask = np.zeros(size, dtype=bool)
+        if hi > lo:
+            mask[self.positions[lo:hi]] = True
+        return mask
+
+    def unknown_mask(self, size: int) -> np.ndarray:
+        """Mask of models without a value."""
+        mask = np.ones(size, dtype=bool)
+        mask[self.positions] = False
+        return mask
+
+
+def _bitsets(size: int, keys_per_model: Iterable[Iterable[str]]) -> Dict[str, np.ndarray]:
+    """Build one bitset per distinct key from each model's keys."""
+    bitsets: Dict[str, np.ndarray] = {}
+    for i, keys in enumerate(keys_per_model):
+        for key in keys:
+            bits = bitsets.get(key)
+            if bits is None:
+                bits = bitsets[key] = np.zeros(size, dtype=bool)
+            bits[i] = True
+    for bits in bitsets.values():
+        bits.flags.writeable = False
+    return bitsets
+
+
+class CatalogIndex:
+    """
+    Bitset index over a fixed list of CanonicalModels.
+
+    Build it once per catalog (see index_for) and evaluate any number of
+    queries against it. Result order always follows the original list.
+    """
+
+    def __init__(self, models: Sequence[CanonicalModel]) -> None:
+        self.models = models
+        self.size = len(models)
+
+        self._providers = _bitsets(self.size, ([m.provider] for m in models))
+        self._tags = _bitsets(self.size, (m.tags for m in models))
+        self._input_modalities = _bitsets(self.size, (m.input_modalities for m in models))
+        self._output_modalities = _bitsets(self.size, (m.output_modalities for m in models))
+        self._ids = _bitsets(self.size, ({m.canonical_id, m.model_id} for m in models))
+        self._capabilities = {
+            name: np.fromiter((bool(getattr(m, field)) for m in models), dtype=bool, count=self.size)
+            for name, field in CAPABILITY_FIELDS.items()
+        }
+        for bits in self._capabilities.values():
+            bits.flags.writeable = False
+
+        self._context = _SortedColumn([m.context_tokens for m in models])
+        self._price = _SortedColumn([_average_price(m) for m in models])
+        self._ttft = _SortedColumn([m.ttft_ms for m in models])
+        self._rate_limits = {
+            name: _SortedColumn([getattr(m, field) for m in models])
+            for name, field in RATE_LIMIT_FIELDS.items()
+        }
+
+    # ----- Primitive bitsets -----
+
+    def all(self) -> np.ndarray:
+        """Bitset matching every model."""
+        return np.ones(self.size, dtype=bool)
+
+    def none(self) -> np.ndarray:
+        """Bitset matching no model."""
+        return np.zeros(self.size, dtype=bool)
+
+    def _lookup(self, bitsets: Dict[str, np.ndarray], key: str) -> np.ndarray:
+        bits = bitsets.get(key)
+        return bits if bits is not None else self.none()
+
+    def provider(self, name: str, case_sensitive: bool = True) -> np.ndarray:
+        """Bitset of models served by provider."""
+        if case_sensitive:
+            return self._lookup(self._providers, name)
+        mask = self.none()
+        for provider, bits in self._providers.items():
+            if provider.lower() == name.lower():
+                mask |= bits
+        return mask
+
+    def tag(self, name: str) -> np.ndarray:
+        """Bitset of models carrying tag."""
+        return self._lookup(self._tags, name)
+
+    def capability(self, name: str) -> np.ndarray:
+        """Bitset of models with a capability flag (see CAPABILITY_FIELDS)."""
+        if name not in self._capabilities:
+            raise ValueError(f"Unknown capability '{name}'. Expected one of: {', '.join(CAPABILITY_FIELDS)}")
+        return self._capabilities[name]
+
+    def input_modality(self, name: str) -> np.ndarray:
+        """Bitset of models accepting input modality."""
+        return self._lookup(self._input_modalities, name)
+
+    def output_modality(self, name: str) -> np.ndarray:
+        """Bitset of models producing output modality."""
+        return self._lookup(self._output_modalities, name)
+
+    def model_id(self, identifier: str) -> np.ndarray:
+        """Bitset of models whose canonical_id or model_id equals identifier."""
+        return self._lookup(self._ids, identifier)
+
+    def context_range(self, min_tokens: Optional[float] = None, max_tokens: Optional[float] = None) -> np.ndarray:
+        """Bitset of models with known context_tokens in [min_tokens, max_tokens]."""
+        return self._context.range_mask(self.size, min_tokens, max_tokens)
+
+    def price_range(self, min_price: Optional[float] = None, max_price: Optional[float] = None) -> np.ndarray:
+        """Bitset of models with known average price per million in [min_price, max_price]."""
+        return self._price.range_mask(self.size, min_price, max_price)
+
+    def ttft_range(self, min_ms: Optional[float] = None, max_ms: Optional[float] = None) -> np.ndarray:
+        """Bitset of models with known ttft_ms in [min_ms, max_ms]."""
+        return self._ttft.range_mask(self.size, min_ms, max_ms)
+
+    def ttft_unknown(self) -> np.ndarray:
+        """Bitset of models without a known ttft_ms."""
+        return self._ttft.unknown_mask(self.size)
+
+    def _rate_limit(self, name: str) -> _SortedColumn:
+        if name not in self._rate_limits:
+            raise ValueError(f"Unknown rate limit '{name}'. Expected one of: {', '.join(RATE_LIMIT_FIELDS)}")
+        return self._rate_limits[name]
+
+    def rate_limit_range(self, name: str, min_value: Optional[float] = None, max_value: Optional[float] = None) -> np.ndarray:
+        """Bitset of models with a known rate limit (see RATE_LIMIT_FIELDS) in [min_value, max_value]."""
+        return self._rate_limit(name).range_mask(self.size, min_value, max_value)
+
+    def rate_limit_unknown(self, name: str) -> np.ndarray:
+        """Bitset of models without a known rate limit."""
+        return self._rate_limit(name).unknown_mask(self.size)
+
+    # ----- Query evaluation -----
+
+    def mask(self, query: Union["Query", np.ndarray]) -> np.ndarray:
+        """Evaluate a query (or pass through a ready bitset)."""
+        if isinstance(query, np.ndarray):
+            return query
+        return query.evaluate(self)
+
+    def count(self, query: Union["Query", np.ndarray]) -> int:
+        """Number of models matching query."""
+        return int(np.count_nonzero(self.mask(query)))
+
+    def positions(self, query: Union["Query", np.ndarray]) -> np.ndarray:
+        """Positions (in list order) of models matching query."""
+        return np.flatnonzero(self.mask(query))
+
+    def select(self, query: Union["Query", np.ndarray]) -> List[CanonicalModel]:
+        """Models matching query, in original list order."""
+        models = self.models
+        return [models[i] for i in self.positions(query)]
+
+
+# ===== Query predicates =====
+
+class Query:
+    """Composable catalog predicate. Combine with &, | and ~."""
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        raise NotImplementedError
+
+    def __and__(self, other: "Query") -> "Query":
+        return And(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return Or(self, other)
+
+    def __invert__(self) -> "Query":
+        return Not(self)
+
+
+class And(Query):
+    """All sub-queries match (an empty And matches everything)."""
+
+    def __init__(self, *queries: Query) -> None:
+        self.queries = queries
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        mask = index.all()
+        for query in self.queries:
+            mask &= query.evaluate(index)
+        return mask
+
+
+class Or(Query):
+    """Any sub-query matches (an empty Or matches nothing)."""
+
+    def __init__(self, *queries: Query) -> None:
+        self.queries = queries
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        mask = index.none()
+        for query in self.queries:
+            mask |= query.evaluate(index)
+        return mask
+
+
+class Not(Query):
+    """Sub-query does not match."""
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return ~self.query.evaluate(index)
+
+
+class Provider(Query):
+    """Model is served by provider."""
+
+    def __init__(self, name: str, case_sensitive: bool = True) -> None:
+        self.name = name
+        self.case_sensitive = case_sensitive
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.provider(self.name, self.case_sensitive)
+
+
+class HasTag(Query):
+    """Model carries tag."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.tag(self.name)
+
+
+class HasCapability(Query):
+    """Model has a capability flag: reasoning, tool_call, structured_output or open_weights."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.capability(self.name)
+
+
+class InputModality(Query):
+    """Model accepts input modality."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.input_modality(self.name)
+
+
+class OutputModality(Query):
+    """Model produces output modality."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.output_modality(self.name)
+
+
+class ModelIn(Query):
+    """Model's canonical_id or model_id is one of identifiers."""
+
+    def __init__(self, identifiers: Iterable[str]) -> None:
+        self.identifiers = list(identifiers)
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        mask = index.none()
+        for identifier in self.identifiers:
+            mask |= index.model_id(identifier)
+        return mask
+
+
+class ContextRange(Query):
+    """Model's context_tokens is known and within [min, max]."""
+
+    def __init__(self, min: Optional[float] = None, max: Optional[float] = None) -> None:
+        self.min = min
+        self.max = max
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.context_range(self.min, self.max)
+
+
+class PriceRange(Query):
+    """Model's average price per million tokens is known and within [min, max]."""
+
+    def __init__(self, min: Optional[float] = None, max: Optional[float] = None) -> None:
+        self.min = min
+        self.max = max
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.price_range(self.min, self.max)
+
+
+class TtftRange(Query):
+    """Model's time to first token is known and within [min, max] milliseconds."""
+
+    def __init__(self, min: Optional[float] = None, max: Optional[float] = None) -> None:
+        self.min = min
+        self.max = max
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.ttft_range(self.min, self.max)
+
+
+class TtftUnknown(Query):
+    """Model has no known time to first token."""
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.ttft_unknown()
+
+
+class RateLimitRange(Query):
+    """Model's rate limit ("rpm" or "tpm") is known and within [min, max]."""
+
+    def __init__(self, name: str, min: Optional[float] = None, max: Optional[float] = None) -> None:
+        self.name = name
+        self.min = min
+        self.max = max
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.rate_limit_range(self.name, self.min, self.max)
+
+
+class RateLimitUnknown(Query):
+    """Model has no known rate limit ("rpm" or "tpm")."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, index: CatalogIndex) -> np.ndarray:
+        return index.rate_limit_unknown(self.name)
+
+
+_index_memo: IdentityMemo[CatalogIndex] = IdentityMemo(CatalogIndex)
+
+
+def index_for(models: Sequence[CanonicalModel]) -> CatalogIndex:
+    """
+    Return the CatalogIndex for a model list, building it on first use.
+
+    Args:
+        models: Model list, e.g. Catalog.models
+
+    Returns:
+        CatalogIndex shared by all callers passing the same list
+    """
+    return _index_memo.get(models)
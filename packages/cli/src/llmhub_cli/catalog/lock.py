@@ -0,0 +1,107 @@
+"""
+Lock: advisory cross-process file lock for catalog rebuilds.
+
+Parallel llmhub processes (e.g. CI jobs on a cold cache) take this lock
+around a rebuild, so one process builds while the others wait and reuse
+its result. The lock is released by the OS if its holder dies.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive lock on a file, usable as a context manager.
+
+    Locks are held per FileLock instance: two instances for the same path
+    exclude each other, within one process as well as across processes.
+    Not re-entrant.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.05
+    ):
+        """
+        Initialize the lock (nothing is locked until acquire).
+
+        Args:
+            path: Lock file, created if missing
+            timeout: Seconds the context manager waits before raising
+                TimeoutError (None waits forever)
+            poll_interval: Seconds between attempts while waiting
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether this instance holds the lock."""
+        return self._fd is not None
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the lock.
+
+        Args:
+            blocking: Wait for the lock if another holder has it
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            True if the lock was acquired
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"{self.path} is already locked by this FileLock")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._try_lock(fd):
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                os.close(fd)
+                return False
+            time.sleep(self.poll_interval)
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock if this instance holds it."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        if not self.acquire(timeout=self.timeout):
+            raise TimeoutError(f"Timed out after {self.timeout}s waiting for {self.path}")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
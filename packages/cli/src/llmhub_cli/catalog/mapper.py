@@ -8,20 +8,60 @@ import json
 from pathlib import Path
 from typing import Optional
 from .schema import AnyLLMModel, ModelsDevModel, ArenaModel, FusedRaw
+from . import cache as cache_module
 
 
-def load_overrides() -> dict:
-    """Load static ID overrides from data/overrides.json."""
-    overrides_path = Path(__file__).parent / "data" / "overrides.json"
-    
-    if not overrides_path.exists():
-        return {"id_mappings": {}, "model_families": {}}
+def _read_overrides(path: Path) -> dict:
+    """Read one overrides file, empty if missing or invalid."""
+    if not path.exists():
+        return {}
     
     try:
-        with open(overrides_path, 'r') as f:
-            return json.load(f)
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
     except (json.JSONDecodeError, IOError):
-        return {"id_mappings": {}, "model_families": {}}
+        return {}
+
+
+def _get_user_overrides_path() -> Path:
+    """Path of the user's overrides.json, next to the catalog cache."""
+    return cache_module._get_cache_path().parent / "overrides.json"
+
+
+def load_overrides() -> dict:
+    """
+    Load static overrides from data/overrides.json.
+    
+    Sections of the user's overrides.json (next to the catalog cache) are
+    merged over the packaged ones entry by entry, so account-specific data
+    such as rate limits can be added without editing the package.
+    """
+    overrides = {"id_mappings": {}, "model_families": {}}
+    overrides.update(_read_overrides(Path(__file__).parent / "data" / "overrides.json"))
+    
+    for section, entries in _read_overrides(_get_user_overrides_path()).items():
+        if isinstance(entries, dict) and isinstance(overrides.get(section), dict):
+            overrides[section] = {**overrides[section], **entries}
+        else:
+            overrides[section] = entries
+    
+    return overrides
+
+
+def modelsdev_provider(provider: str, overrides: dict) -> str:
+    """
+    Name models.dev uses for a catalog provider.
+    
+    Args:
+        provider: Catalog provider name (e.g. "qwen")
+        overrides: Override data including the "modelsdev_providers" aliases
+        
+    Returns:
+        models.dev provider name (e.g. "alibaba"), the provider itself if
+        it has no alias
+    """
+    return overrides.get("modelsdev_providers", {}).get(provider, provider)
 
 
 def _normalize_model_name(name: str) -> str:
@@ -57,8 +97,11 @@ def fuse_sources(
         # Look up models.dev data
         modelsdev_model: Optional[ModelsDevModel] = None
         
+        # models.dev may name the provider differently (see modelsdev_provider)
+        dev_provider = modelsdev_provider(anyllm_model.provider, overrides)
+        
         # 1. Try direct match
-        modelsdev_model = modelsdev_map.get(canonical_id)
+        modelsdev_model = modelsdev_map.get(f"{dev_provider}/{anyllm_model.model_id}")
         
         # 2. Try override mapping
         if not modelsdev_model and canonical_id in id_mappings:
@@ -71,7 +114,7 @@ def fuse_sources(
         if not modelsdev_model:
             normalized_model_id = _normalize_model_name(anyllm_model.model_id)
             for dev_id, dev_model in modelsdev_map.items():
-                if dev_model.provider == anyllm_model.provider:
+                if dev_model.provider == dev_provider:
                     if _normalize_model_name(dev_model.model_id) == normalized_model_id:
                         modelsdev_model = dev_model
                         break
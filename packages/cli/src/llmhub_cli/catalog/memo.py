@@ -0,0 +1,53 @@
+"""
+Memo: small identity-keyed caches for values derived from a model list.
+
+Derived structures (indexes, feature matrices) are expensive to build but
+only depend on the list of models they were built from. Callers pass the
+same list object around (e.g. Catalog.models from the memoized catalog), so
+the list identity is a cheap and reliable key.
+"""
+import threading
+from typing import Callable, Generic, List, Sequence, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class IdentityMemo(Generic[T]):
+    """
+    LRU memo keyed on the identity (and length) of a source sequence.
+
+    Entries hold a strong reference to their source, so an id() can never be
+    reused while it is cached. Sources are assumed not to be mutated in place
+    after a value has been derived from them.
+    """
+
+    def __init__(self, factory: Callable[[Sequence], T], maxsize: int = 4) -> None:
+        self._factory = factory
+        self._maxsize = maxsize
+        self._entries: List[Tuple[Sequence, int, T]] = []
+        self._lock = threading.Lock()
+
+    def get(self, source: Sequence) -> T:
+        """Return the value derived from source, building it on first use."""
+        with self._lock:
+            for i, (cached_source, size, value) in enumerate(self._entries):
+                if cached_source is source and size == len(source):
+                    self._entries.append(self._entries.pop(i))
+                    return value
+
+            value = self._factory(source)
+            self._entries.append((source, len(source), value))
+            if len(self._entries) > self._maxsize:
+                self._entries.pop(0)
+            return value
+
+    def cached(self) -> List[T]:
+        """Values currently cached, most recently used first (builds nothing)."""
+        with self._lock:
+            return [value for _, _, value in reversed(self._entries)]
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
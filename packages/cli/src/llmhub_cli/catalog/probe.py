@@ -0,0 +1,274 @@
+"""
+Probe: measure real latency and throughput of catalog models.
+
+Each model gets a standard short prompt and a standard long-output prompt,
+repeated over a number of samples and sent concurrently through LLMHub with
+streaming enabled, so the first streamed chunk marks the time to first
+token. Results are stored as percentile summaries in probes.json next to
+the catalog cache; build_catalog merges the medians into
+CanonicalModel.ttft_ms and output_tokens_per_second on the next rebuild.
+"""
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+from pydantic import BaseModel
+from .schema import CanonicalModel
+from . import cache as cache_module
+
+
+# Bump when the probes.json layout changes; older files are ignored
+PROBES_VERSION = 1
+
+# (name, prompt, max_tokens). TTFT is measured on both, throughput only on
+# the long-output prompt.
+PROBE_PROMPTS = [
+    ("short", "Reply with the single word: ok", 16),
+    ("long", "Count from 1 to 200 in words, separated by commas.", 512),
+]
+
+PERCENTILES = (50, 90, 99)
+
+
+class Percentiles(BaseModel):
+    """Percentile summary of one measurement."""
+    p50: float
+    p90: float
+    p99: float
+
+
+class ProbeSample(BaseModel):
+    """One probe request."""
+    prompt: str
+    ttft_ms: Optional[float] = None
+    output_tokens_per_second: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ProbeSummary(BaseModel):
+    """Latency, throughput and error rate of one model over all its samples."""
+    canonical_id: str
+    probed_at: str
+    requests: int
+    errors: int
+    error_rate: float
+    ttft_ms: Optional[Percentiles] = None
+    output_tokens_per_second: Optional[Percentiles] = None
+    last_error: Optional[str] = None
+
+
+def _get_probes_path() -> Path:
+    """Get path of probes.json, next to the catalog cache."""
+    return cache_module._get_cache_path().parent / "probes.json"
+
+
+def _percentiles(values: List[float]) -> Optional[Percentiles]:
+    """Percentile summary of values, or None if there are none."""
+    if not values:
+        return None
+    p50, p90, p99 = (round(float(v), 1) for v in np.percentile(values, PERCENTILES))
+    return Percentiles(p50=p50, p90=p90, p99=p99)
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text content of a streamed chat completion chunk."""
+    choices = getattr(chunk, "choices", None) or []
+    if not choices:
+        return ""
+    delta = getattr(choices[0], "delta", None)
+    return getattr(delta, "content", None) or ""
+
+
+def _probe_once(hub: Any, role: str, prompt_name: str, prompt: str, max_tokens: int) -> ProbeSample:
+    """Send one streamed request and time it."""
+    started = time.perf_counter()
+    first: Optional[float] = None
+    chunks = 0
+    usage_tokens: Optional[int] = None
+    # A stream that breaks off after its first chunks is an error sample,
+    # not a partial throughput measurement
+    try:
+        stream = hub.completion(
+            role,
+            [{"role": "user", "content": prompt}],
+            params_override={"stream": True, "max_tokens": max_tokens},
+        )
+        for chunk in stream:
+            if _chunk_text(chunk):
+                if first is None:
+                    first = time.perf_counter()
+                chunks += 1
+            usage = getattr(chunk, "usage", None)
+            if usage is not None and getattr(usage, "completion_tokens", None):
+                usage_tokens = usage.completion_tokens
+        ended = time.perf_counter()
+    except Exception as e:
+        return ProbeSample(prompt=prompt_name, error=f"{type(e).__name__}: {e}")
+
+    if first is None:
+        return ProbeSample(prompt=prompt_name, error="Empty response")
+
+    # Tokens after the first one, over the time it took to stream them
+    tokens = usage_tokens or chunks
+    duration = ended - first
+    tps = (tokens - 1) / duration if tokens > 1 and duration > 0 else None
+    return ProbeSample(prompt=prompt_name, ttft_ms=(first - started) * 1000, output_tokens_per_second=tps)
+
+
+def summarize_samples(canonical_id: str, samples: Sequence[ProbeSample]) -> ProbeSummary:
+    """
+    Summarize a model's probe samples.
+
+    Args:
+        canonical_id: Model the samples belong to
+        samples: Probe samples of that model
+
+    Returns:
+        ProbeSummary
+    """
+    errors = [s for s in samples if s.error]
+    return ProbeSummary(
+        canonical_id=canonical_id,
+        probed_at=datetime.now().isoformat(),
+        requests=len(samples),
+        errors=len(errors),
+        error_rate=round(len(errors) / len(samples), 4) if samples else 0.0,
+        ttft_ms=_percentiles([s.ttft_ms for s in samples if s.ttft_ms is not None]),
+        output_tokens_per_second=_percentiles([
+            s.output_tokens_per_second for s in samples
+            if s.prompt == "long" and s.output_tokens_per_second is not None
+        ]),
+        last_error=errors[-1].error if errors else None,
+    )
+
+
+def probe_models(
+    models: Sequence[CanonicalModel],
+    samples: int = 5,
+    max_workers: int = 8,
+    hub_factory: Optional[Callable[[Any], Any]] = None
+) -> Dict[str, ProbeSummary]:
+    """
+    Measure TTFT, output tokens per second and error rate of models.
+
+    Args:
+        models: Models to probe (chat models the current keys can call)
+        samples: Requests per prompt per model
+        max_workers: Concurrent requests
+        hub_factory: Builds a hub from a RuntimeConfig (default: LLMHub)
+
+    Returns:
+        canonical_id → ProbeSummary
+    """
+    from llmhub_runtime.models import RuntimeConfig, RoleConfig, ProviderConfig, LLMMode
+
+    if hub_factory is None:
+        from llmhub_runtime import LLMHub
+
+        def hub_factory(config):
+            return LLMHub(config_obj=config)
+
+    # One role per model, named by canonical_id
+    config = RuntimeConfig(
+        project="llmhub-probe",
+        env="probe",
+        providers={m.provider: ProviderConfig() for m in models},
+        roles={
+            m.canonical_id: RoleConfig(provider=m.provider, model=m.model_id, mode=LLMMode.chat)
+            for m in models
+        },
+    )
+    hub = hub_factory(config)
+
+    tasks = [
+        (m.canonical_id, name, prompt, max_tokens)
+        for m in models
+        for _ in range(samples)
+        for name, prompt, max_tokens in PROBE_PROMPTS
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = list(pool.map(lambda task: _probe_once(hub, *task), tasks))
+
+    by_model: Dict[str, List[ProbeSample]] = {m.canonical_id: [] for m in models}
+    for (canonical_id, *_), sample in zip(tasks, results):
+        by_model[canonical_id].append(sample)
+
+    return {canonical_id: summarize_samples(canonical_id, s) for canonical_id, s in by_model.items()}
+
+
+def load_probe_summaries() -> Dict[str, ProbeSummary]:
+    """
+    Load stored probe summaries.
+
+    Returns:
+        canonical_id → ProbeSummary, empty if nothing was probed yet or the
+        file is unreadable
+    """
+    path = _get_probes_path()
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != PROBES_VERSION:
+            return {}
+        return {cid: ProbeSummary(**summary) for cid, summary in data.get("models", {}).items()}
+    except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_probe_summaries(summaries: Dict[str, ProbeSummary]) -> Path:
+    """
+    Merge summaries into probes.json (atomically, temp file then rename).
+
+    Models probed earlier and not in summaries keep their previous results.
+
+    Args:
+        summaries: canonical_id → ProbeSummary
+
+    Returns:
+        Path of probes.json
+    """
+    path = _get_probes_path()
+    merged = load_probe_summaries()
+    merged.update(summaries)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "version": PROBES_VERSION,
+                "models": {cid: s.model_dump() for cid, s in sorted(merged.items())},
+            }, f, indent=2)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def probe_latency() -> Dict[str, dict]:
+    """
+    Median latency and error rate per model from stored probes, in
+    overrides.json's "latency" format.
+
+    Returns:
+        canonical_id → {"ttft_ms": ..., "output_tokens_per_second": ...,
+        "error_rate": ...}
+    """
+    latency = {}
+    for canonical_id, summary in load_probe_summaries().items():
+        values = {"error_rate": summary.error_rate} if summary.requests else {}
+        if summary.ttft_ms is not None:
+            values["ttft_ms"] = summary.ttft_ms.p50
+        if summary.output_tokens_per_second is not None:
+            values["output_tokens_per_second"] = summary.output_tokens_per_second.p50
+        if values:
+            latency[canonical_id] = values
+    return latency
@@ -0,0 +1,110 @@
+"""
+Profile: stage-level resource accounting for catalog builds.
+
+A BuildProfiler times each build stage (wall clock and process CPU time),
+tracks its peak traced memory with tracemalloc and records how many items
+it produced. The result is a BuildProfile that profiled builds store in
+the catalog metadata, so build performance can be compared across builds.
+
+Memory is Python allocations traced by tracemalloc, which also slows the
+build down; profiling is therefore opt-in.
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from .schema import BuildProfile, StageProfile
+
+
+_MB = 1024 * 1024
+
+
+class StageRecord:
+    """Handle yielded by BuildProfiler.stage(); set items to the stage's output size."""
+
+    def __init__(self) -> None:
+        self.items: Optional[int] = None
+
+
+class BuildProfiler:
+    """
+    Records a StageProfile per stage of one build.
+
+    Stages are sequential and not nested. A disabled profiler measures
+    nothing and finish() returns None, so a build can use one
+    unconditionally.
+    """
+
+    def __init__(self, enabled: bool = True, measure_memory: bool = True) -> None:
+        self.enabled = enabled
+        self._measure_memory = enabled and measure_memory
+        self._stages: list[StageProfile] = []
+        self._owns_tracing = False
+        self._peak_mb: Optional[float] = None
+
+        if self._measure_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self._baseline = tracemalloc.get_traced_memory()[0] if self._measure_memory else 0
+        self._started = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageRecord]:
+        """
+        Measure the enclosed block as one stage.
+
+        Args:
+            name: Stage name (e.g. "anyllm", "fuse")
+
+        Yields:
+            StageRecord whose items the block sets
+        """
+        record = StageRecord()
+        if not self.enabled:
+            yield record
+            return
+
+        start_memory = 0
+        if self._measure_memory:
+            start_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        started_cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - started
+            cpu_seconds = time.process_time() - started_cpu
+            peak_mb = None
+            if self._measure_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                peak_mb = (peak - start_memory) / _MB
+                overall = (peak - self._baseline) / _MB
+                self._peak_mb = overall if self._peak_mb is None else max(self._peak_mb, overall)
+            self._stages.append(StageProfile(
+                stage=name,
+                seconds=seconds,
+                cpu_seconds=cpu_seconds,
+                peak_mb=peak_mb,
+                items=record.items,
+            ))
+
+    def finish(self) -> Optional[BuildProfile]:
+        """
+        Stop measuring.
+
+        Returns:
+            BuildProfile of the stages recorded so far, None if disabled
+        """
+        if not self.enabled:
+            return None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        return BuildProfile(
+            seconds=time.perf_counter() - self._started,
+            cpu_seconds=time.process_time() - self._started_cpu,
+            peak_mb=self._peak_mb,
+            stages=list(self._stages),
+        )
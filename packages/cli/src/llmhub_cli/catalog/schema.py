@@ -95,6 +95,16 @@ class CanonicalModel(BaseModel):
     price_output_per_million: Optional[float] = None
     price_reasoning_per_million: Optional[float] = None
     
+    # Latency (typical values; None if not measured)
+    ttft_ms: Optional[float] = None  # Time to first token in milliseconds
+    output_tokens_per_second: Optional[float] = None
+    observed_latency_ms: Optional[float] = None  # Median call latency in our own deployment
+    error_rate: Optional[float] = None  # Fraction of failed calls (probes or deployment)
+    
+    # Rate limits (per minute; None if not known)
+    rate_limit_rpm: Optional[int] = None  # Requests
+    rate_limit_tpm: Optional[int] = None  # Tokens
+    
     # Derived tiers (1-5, where 1 is best/lowest cost, 5 is worst/highest cost)
     quality_tier: int = 3  # Default to medium
     reasoning_tier: int = 3
@@ -114,8 +124,27 @@ class CanonicalModel(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
+class StageProfile(BaseModel):
+    """Resources used by one catalog build stage."""
+    stage: str
+    seconds: float  # Wall clock
+    cpu_seconds: float  # Process CPU time (all threads)
+    peak_mb: Optional[float] = None  # Peak traced memory above the stage's starting point
+    items: Optional[int] = None  # Records the stage produced
+
+
+class BuildProfile(BaseModel):
+    """Stage-level profile of a catalog build, see catalog.profile."""
+    seconds: float
+    cpu_seconds: float
+    peak_mb: Optional[float] = None
+    stages: list[StageProfile] = Field(default_factory=list)
+
+
 class Catalog(BaseModel):
     """Complete catalog of available models with metadata."""
     catalog_version: int = 1
     built_at: str
+    fingerprint: Optional[str] = None  # Content hash of models, see catalog.fingerprint
+    build_profile: Optional[BuildProfile] = None  # Set by profiled builds
     models: list[CanonicalModel] = Field(default_factory=list)
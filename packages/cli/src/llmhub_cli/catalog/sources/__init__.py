@@ -1,7 +1,25 @@
 """Catalog data source integrations."""
 
-from llmhub_cli.catalog.sources.anyllm import load_anyllm_models
-from llmhub_cli.catalog.sources.modelsdev import fetch_modelsdev_json, normalize_modelsdev
+from llmhub_cli.catalog.sources.anyllm import (
+    ProviderSpec,
+    discovery_providers,
+    load_anyllm_models,
+)
+from llmhub_cli.catalog.sources.modelsdev import (
+    fetch_modelsdev_json,
+    normalize_modelsdev,
+    load_modelsdev_models,
+)
 from llmhub_cli.catalog.sources.arena import load_arena_models
+from llmhub_cli.catalog.sources.telemetry import load_telemetry_latency
 
-__all__ = ["load_anyllm_models", "fetch_modelsdev_json", "normalize_modelsdev", "load_arena_models"]
+__all__ = [
+    "ProviderSpec",
+    "discovery_providers",
+    "load_anyllm_models",
+    "fetch_modelsdev_json",
+    "normalize_modelsdev",
+    "load_modelsdev_models",
+    "load_arena_models",
+    "load_telemetry_latency",
+]
@@ -3,46 +3,253 @@ AnyLLM source: discover models that are actually callable via any-llm.
 
 This module introspects the any-llm configuration to determine which models
 are available given the current environment and API keys.
+
+Providers come from a registry (DEFAULT_DISCOVERY_PROVIDERS, extended or
+adjusted by the "discovery" section of overrides.json). A provider whose
+credential env vars are all unset is skipped before anything is imported;
+the others are listed in parallel worker threads, which is also where
+any-llm and the provider SDKs are imported. Each provider's listing is
+cached in sources/anyllm/<provider>.json next to the catalog cache, valid
+for that provider's TTL and only for the credentials it was listed with.
 """
-from typing import Optional
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from pydantic import BaseModel, Field, ValidationError
 from ..schema import AnyLLMModel
+from ..mapper import load_overrides
+from .. import cache as cache_module
+
+
+# Bump when the per-provider cache format changes
+ANYLLM_CACHE_VERSION = 1
+
+# Upper bound on concurrent provider listings
+MAX_DISCOVERY_WORKERS = 8
+
+
+class ProviderSpec(BaseModel):
+    """A provider that catalog builds try to list models for."""
+    name: str  # any-llm provider id
+    catalog_provider: Optional[str] = None  # Provider name in the catalog (default: name)
+    model_prefix: Optional[str] = None  # Stripped from listed model ids (e.g. "models/")
+    env_keys: list[str] = Field(default_factory=list)  # Any one set enables discovery; empty: always try
+    ttl_hours: float = 24
+    enabled: bool = True
+
 
+DEFAULT_DISCOVERY_PROVIDERS = [
+    ProviderSpec(name="openai", env_keys=["OPENAI_API_KEY"]),
+    ProviderSpec(name="anthropic", env_keys=["ANTHROPIC_API_KEY"]),
+    # Listed through any-llm ids, catalogued under the names models.dev,
+    # overrides and existing specs use
+    ProviderSpec(
+        name="gemini",
+        catalog_provider="google",
+        model_prefix="models/",
+        env_keys=["GEMINI_API_KEY", "GOOGLE_API_KEY"],
+    ),
+    ProviderSpec(name="mistral", env_keys=["MISTRAL_API_KEY"]),
+    ProviderSpec(name="deepseek", env_keys=["DEEPSEEK_API_KEY"]),
+    ProviderSpec(name="dashscope", catalog_provider="qwen", env_keys=["DASHSCOPE_API_KEY"]),
+    ProviderSpec(name="groq", env_keys=["GROQ_API_KEY"]),
+    ProviderSpec(name="together", env_keys=["TOGETHER_API_KEY"]),
+    ProviderSpec(name="cohere", env_keys=["COHERE_API_KEY"]),
+    # Keyless; discovered when a server is configured
+    ProviderSpec(name="ollama", env_keys=["OLLAMA_HOST"], ttl_hours=1),
+]
 
-def load_anyllm_models() -> list[AnyLLMModel]:
+
+def discovery_providers(
+    overrides: Optional[dict] = None,
+    echo: Callable[[str], None] = print
+) -> list[ProviderSpec]:
     """
-    Discover all models that are callable via any-llm given local environment.
+    Resolve the discovery registry.
+    
+    Entries of the overrides "discovery" section are keyed by any-llm
+    provider id. They update the fields of a default provider (e.g.
+    {"ollama": {"enabled": false}}) or add a new one (e.g.
+    {"xai": {"env_keys": ["XAI_API_KEY"]}}).
+    
+    Args:
+        overrides: Override data (see mapper.load_overrides)
+        echo: Receives warnings (default: print)
+    
+    Returns:
+        Provider specs, defaults first in their registry order
+    """
+    specs = {spec.name: spec for spec in DEFAULT_DISCOVERY_PROVIDERS}
+    
+    for name, entry in ((overrides or {}).get("discovery") or {}).items():
+        base = specs[name].model_dump() if name in specs else {}
+        try:
+            specs[name] = ProviderSpec(**{**base, **(entry or {}), "name": name})
+        except (TypeError, ValidationError) as e:
+            echo(f"Warning: Ignoring invalid discovery override for {name}: {e}")
+    
+    return list(specs.values())
+
+
+def _credentials_fingerprint(spec: ProviderSpec) -> Optional[str]:
+    """
+    Fingerprint of the credentials the provider would be listed with.
     
     Returns:
-        List of AnyLLMModel instances representing available models.
+        Short hash of the set env vars ("" for providers without env_keys),
+        or None if none of the provider's env vars is set
     """
-    models: list[AnyLLMModel] = []
+    if not spec.env_keys:
+        return ""
+    present = [(key, os.environ[key]) for key in spec.env_keys if os.environ.get(key)]
+    if not present:
+        return None
+    digest = hashlib.sha256("\n".join(f"{key}={value}" for key, value in present).encode())
+    return digest.hexdigest()[:16]
+
+
+def _get_provider_cache_path(name: str) -> Path:
+    """Get path of a provider's cached model listing."""
+    return cache_module._get_sources_dir() / "anyllm" / f"{name}.json"
+
+
+def _read_provider_cache(path: Path, fingerprint: str) -> Optional[list[str]]:
+    """
+    Read a provider's cached model ids.
     
+    Returns:
+        Model ids, or None if the cache is missing, unreadable or was
+        listed with other credentials
+    """
     try:
-        # Try to import any-llm
-        from any_llm import list_models
-        
-        # Try common providers
-        # any-llm will only return models if the API key is valid
-        common_providers = ["openai", "anthropic", "google", "mistral", "deepseek", "qwen", "groq", "together", "cohere", "ollama"]
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != ANYLLM_CACHE_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        models = data["models"]
+        return models if all(isinstance(m, str) for m in models) else None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_provider_cache(
+    path: Path,
+    fingerprint: str,
+    model_ids: list[str],
+    echo: Callable[[str], None] = print
+) -> None:
+    """Atomically write a provider's model ids."""
+    payload = {"version": ANYLLM_CACHE_VERSION, "fingerprint": fingerprint, "models": model_ids}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        echo(f"Warning: Failed to save {path.stem} model listing: {e}")
+
+
+def _is_fresh(path: Path, ttl_hours: float) -> bool:
+    try:
+        age = datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)
+    except OSError:
+        return False
+    return age <= timedelta(hours=ttl_hours)
+
+
+def _list_provider_models(provider: str) -> list[str]:
+    """
+    List a provider's model ids through any-llm (runs in a worker thread).
+    
+    Raises:
+        ImportError: If any-llm or the provider's SDK is not installed
+        Exception: Whatever the provider raises (missing key, network, ...)
+    """
+    from any_llm import list_models
+    
+    return [
+        model_obj.id if hasattr(model_obj, "id") else str(model_obj)
+        for model_obj in list_models(provider=provider)
+    ]
+
+
+def _strip_prefix(model_id: str, prefix: Optional[str]) -> str:
+    if prefix and model_id.startswith(prefix):
+        return model_id[len(prefix):]
+    return model_id
+
+
+def load_anyllm_models(
+    providers: Optional[Iterable[ProviderSpec]] = None,
+    max_workers: int = MAX_DISCOVERY_WORKERS,
+    echo: Callable[[str], None] = print
+) -> list[AnyLLMModel]:
+    """
+    Discover all models that are callable via any-llm given local environment.
+    
+    Providers without credentials are skipped; fresh per-provider caches are
+    served; the remaining providers are listed concurrently. A provider that
+    fails to list is reported and falls back to its stale cache, if any.
+    
+    Args:
+        providers: Providers to try (default: the registry with the
+            overrides.json "discovery" section applied)
+        max_workers: Maximum number of concurrent listings
+        echo: Receives warnings (default: print)
+    
+    Returns:
+        List of AnyLLMModel instances representing available models,
+        grouped by provider in registry order and named by their
+        catalog_provider.
+    """
+    if providers is None:
+        providers = discovery_providers(load_overrides(), echo)
+    specs = [spec for spec in providers if spec.enabled]
+    
+    listed: dict[str, list[str]] = {}
+    pending: dict[str, tuple[ProviderSpec, str, Path]] = {}
+    for spec in specs:
+        fingerprint = _credentials_fingerprint(spec)
+        if fingerprint is None:
+            # Not configured on this machine: no import, no request
+            continue
+        cache_path = _get_provider_cache_path(spec.name)
+        cached = _read_provider_cache(cache_path, fingerprint)
+        if cached is not None and _is_fresh(cache_path, spec.ttl_hours):
+            listed[spec.name] = cached
+        else:
+            pending[spec.name] = (spec, fingerprint, cache_path)
+    
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+            futures = {name: pool.submit(_list_provider_models, name) for name in pending}
         
-        for provider in common_providers:
+        for name, future in futures.items():
+            _, fingerprint, cache_path = pending[name]
             try:
-                provider_models = list_models(provider=provider)
-                for model_obj in provider_models:
-                    # Extract model ID from the Model object
-                    model_id = model_obj.id if hasattr(model_obj, 'id') else str(model_obj)
-                    models.append(AnyLLMModel(
-                        provider=provider,
-                        model_id=model_id
-                    ))
+                listed[name] = future.result()
             except Exception as e:
-                # Provider not available, no API key, or API key invalid
-                # This is expected for providers that aren't configured
+                stale = _read_provider_cache(cache_path, fingerprint)
+                if stale is not None:
+                    echo(f"Warning: Failed to list {name} models ({e}), using cached listing")
+                    listed[name] = stale
+                else:
+                    echo(f"Warning: Failed to list {name} models: {e}")
                 continue
-                    
-    except ImportError:
-        # any-llm not installed or not available
-        # Return empty list - catalog will still build but with no models
-        pass
+            _write_provider_cache(cache_path, fingerprint, listed[name], echo)
     
-    return models
+    return [
+        AnyLLMModel(provider=spec.catalog_provider or spec.name, model_id=_strip_prefix(model_id, spec.model_prefix))
+        for spec in specs
+        for model_id in listed.get(spec.name, [])
+    ]
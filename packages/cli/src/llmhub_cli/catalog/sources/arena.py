@@ -2,16 +2,29 @@
 LMArena source: load and normalize arena-catalog leaderboard data.
 
 This module provides quality scores (Elo ratings) from the LMArena leaderboard.
-Integrates with the vendored update_leaderboard_data.py script with 24h TTL caching.
+The leaderboard JSON is downloaded in-process from the arena-catalog
+repository and cached for 24h; refreshes are conditional requests
+(ETag / Last-Modified), so an unchanged leaderboard is not downloaded again.
+The cached file is parsed incrementally, one leaderboard entry at a time.
 """
 import json
 import os
-import sys
-import subprocess
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+import requests
 from ..schema import ArenaModel
+from .jsonstream import CHUNK_SIZE, JsonStream, file_chunks
+
+
+# Raw leaderboard: { category: { model_name: { rating, rating_q025, rating_q975 } } }
+ARENA_LEADERBOARD_URL = "https://raw.githubusercontent.com/lmarena/arena-catalog/main/data/leaderboard-text.json"
+
+# Overrides the leaderboard URL (e.g. a mirror)
+ARENA_URL_ENV = "LLMHUB_ARENA_URL"
+
+_TIMEOUT = (10, 30)  # Connect, read (seconds)
 
 
 def _get_arena_cache_path() -> Path:
@@ -35,6 +48,11 @@ def _get_arena_cache_path() -> Path:
     return cache_dir / "leaderboard-text.json"
 
 
+def _get_arena_meta_path(cache_path: Path) -> Path:
+    """Validators (URL, ETag, Last-Modified) of the cached leaderboard."""
+    return cache_path.with_name(f"{cache_path.stem}.meta.json")
+
+
 def _is_fresh(path: Path, ttl_hours: int = 24) -> bool:
     """
     Return True if file exists and its mtime is within ttl_hours.
@@ -42,7 +60,7 @@ def _is_fresh(path: Path, ttl_hours: int = 24) -> bool:
     Args:
         path: Path to check
         ttl_hours: Time-to-live in hours
-        
+    
     Returns:
         True if file is fresh, False otherwise
     """
@@ -57,170 +75,202 @@ def _is_fresh(path: Path, ttl_hours: int = 24) -> bool:
         return False
 
 
-def _run_arena_update_script(cache_dir: Path) -> bool:
-    """
-    Run the vendor script update_leaderboard_data.py to populate
-    the arena leaderboard JSON files under cache_dir.
+def _atomic_write(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file next to path, then rename it over path."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _read_meta(meta_path: Path) -> dict:
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
 
-    Returns True if it appears to succeed (expected JSON file exists),
-    False otherwise.
+def _fetch_arena_json(cache_path: Path, url: str) -> bool:
+    """
+    Download the leaderboard into cache_path unless the server reports that
+    the cached copy is still current.
+    
+    A download is checked to be a parsable leaderboard before it replaces
+    the cache.
     
     Args:
-        cache_dir: Directory where the script should write output
-        
+        cache_path: Cached leaderboard JSON
+        url: Leaderboard URL
+    
     Returns:
-        True if successful, False otherwise
+        True if cache_path now holds the current leaderboard
+    
+    Raises:
+        requests.RequestException: If the request fails
+        ValueError: If the downloaded payload is not a leaderboard
     """
-    try:
-        # Get path to vendor script
-        vendor_script = Path(__file__).parent / "vendor" / "arena" / "update_leaderboard_data.py"
-        
-        if not vendor_script.exists():
-            print(f"Warning: Arena update script not found at {vendor_script}")
-            return False
-        
-        # Create a data subdirectory in cache_dir for the script's output
-        data_dir = cache_dir / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Run the script using subprocess
-        # The script writes to 'data/leaderboard-*.json' relative to its working directory
-        result = subprocess.run(
-            [sys.executable, str(vendor_script)],
-            cwd=str(cache_dir),
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        # Check if the expected output file was created
-        expected_output = data_dir / "leaderboard-text.json"
-        
-        if expected_output.exists():
-            # Move the file to the parent cache_dir for consistency
-            target_path = cache_dir / "leaderboard-text.json"
-            expected_output.replace(target_path)
+    meta_path = _get_arena_meta_path(cache_path)
+    meta = _read_meta(meta_path) if cache_path.exists() else {}
+    
+    headers = {}
+    if meta.get("url") == url:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    
+    with requests.get(url, headers=headers, stream=True, timeout=_TIMEOUT) as response:
+        if response.status_code == 304:
+            # Unchanged: restart the TTL without downloading
+            os.utime(cache_path)
             return True
+        response.raise_for_status()
         
-        # Script ran but didn't produce expected output
-        if result.returncode != 0:
-            print(f"Warning: Arena update script failed with code {result.returncode}")
-            if result.stderr:
-                print(f"Error output: {result.stderr[:500]}")
-        
-        return False
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+            for _ in _iter_leaderboard(file_chunks(Path(tmp))):
+                pass
+            os.replace(tmp, cache_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
         
-    except subprocess.TimeoutExpired:
-        print("Warning: Arena update script timed out after 5 minutes")
-        return False
-    except Exception as e:
-        print(f"Warning: Failed to run arena update script: {e}")
-        return False
+        validators = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+    
+    _atomic_write(meta_path, [json.dumps(validators).encode()])
+    return True
 
 
-def _ensure_arena_json(ttl_hours: int = 24) -> Optional[Path]:
+def _ensure_arena_json(ttl_hours: int = 24, echo: Callable[[str], None] = print) -> Optional[Path]:
     """
     Ensure we have a leaderboard JSON file.
-
+    
     Steps:
       1) Determine cache_path via _get_arena_cache_path().
       2) If cache_path exists and _is_fresh(cache_path, ttl_hours): return cache_path.
-      3) Else, attempt to run _run_arena_update_script(cache_dir).
-         - If success and cache_path exists: return cache_path.
+      3) Else, conditionally fetch the leaderboard (_fetch_arena_json).
+         - If success: return cache_path.
          - If failure:
              - If a stale cache_path exists: log warning and return cache_path.
              - Else: log error and return None.
-             
+    
     Args:
         ttl_hours: Time-to-live in hours
-        
+        echo: Receives warnings (default: print)
+    
     Returns:
         Path to arena JSON if available, None otherwise
     """
     cache_path = _get_arena_cache_path()
-    cache_dir = cache_path.parent
     
     # Check if we have fresh data
     if _is_fresh(cache_path, ttl_hours):
         return cache_path
     
-    # Need to refresh - run the update script
-    print("Arena data is stale or missing, attempting to refresh...")
-    success = _run_arena_update_script(cache_dir)
+    url = os.environ.get(ARENA_URL_ENV) or ARENA_LEADERBOARD_URL
+    try:
+        if _fetch_arena_json(cache_path, url):
+            return cache_path
+    except (requests.RequestException, OSError, ValueError) as e:
+        # Fetch failed - check if we have stale data to fall back on
+        if cache_path.exists():
+            echo(f"Warning: Failed to refresh arena data ({e}), using stale data from {cache_path}")
+            return cache_path
+        echo(f"Warning: Failed to fetch arena data and no cached data available: {e}")
     
-    if success and cache_path.exists():
-        print("✓ Arena data refreshed successfully")
-        return cache_path
+    return None
+
+
+def _iter_leaderboard(chunks: Iterable[str]) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Stream (category, model_name, scores) entries out of leaderboard JSON.
     
-    # Script failed - check if we have stale data to fall back on
-    if cache_path.exists():
-        print(f"Warning: Arena update script failed, using stale data from {cache_path}")
-        return cache_path
+    Categories whose value is not an object are skipped.
     
-    # No data available at all
-    print("Error: Arena update script failed and no cached data available")
-    return None
+    Raises:
+        ValueError: If the text is not a JSON object of objects
+    """
+    stream = JsonStream(chunks)
+    for category in stream.members():
+        if stream.peek() != "{":
+            stream.skip()
+            continue
+        for model_name in stream.members():
+            yield category, model_name, stream.value()
 
 
-def load_arena_models(path: Optional[Path] = None) -> dict[str, ArenaModel]:
+def load_arena_models(
+    path: Optional[Path] = None,
+    echo: Callable[[str], None] = print
+) -> dict[str, ArenaModel]:
     """
     Ensure LMArena leaderboard JSON exists and is fresh enough (24h TTL),
     then load it and normalize into dict[str, ArenaModel].
     
     Args:
         path: Optional explicit path to arena catalog JSON. If provided,
-              reads directly without TTL check or script execution.
+              reads directly without TTL check or download.
               If None, uses TTL-based cache with automatic refresh.
-        
+        echo: Receives warnings (default: print)
+    
     Returns:
         Dict mapping arena_id (model name) to ArenaModel with ratings.
         Returns empty dict if no data is available.
     """
-    # If explicit path provided, use it directly (no TTL/script logic)
+    # If explicit path provided, use it directly (no TTL/download logic)
     if path is not None:
         if not path.exists():
-            print(f"Warning: Provided arena path does not exist: {path}")
+            echo(f"Warning: Provided arena path does not exist: {path}")
             return {}
         data_path = path
     else:
         # Use TTL-based cache with automatic refresh
-        data_path = _ensure_arena_json(ttl_hours=24)
+        data_path = _ensure_arena_json(ttl_hours=24, echo=echo)
         if data_path is None:
             return {}
     
-    # Parse the JSON file
+    # Parse the JSON file entry by entry
     arena_map: dict[str, ArenaModel] = {}
     
     try:
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-        
-        # Arena data structure: { category: { model_name: { rating, rating_q975, rating_q025 } } }
         # Prefer "overall_text" category if available
-        for category, models in data.items():
-            for model_name, scores in models.items():
-                if not isinstance(scores, dict):
-                    continue
-                
-                rating = scores.get("rating")
-                if rating is None:
-                    continue
-                
-                # Use model_name as arena_id
-                arena_id = model_name
-                
-                # Only keep if we don't already have this model or if this is "overall_text"
-                if arena_id not in arena_map or category == "overall_text":
-                    arena_map[arena_id] = ArenaModel(
-                        arena_id=arena_id,
-                        rating=float(rating),
-                        rating_q025=float(scores["rating_q025"]) if scores.get("rating_q025") is not None else None,
-                        rating_q975=float(scores["rating_q975"]) if scores.get("rating_q975") is not None else None,
-                        category=category
-                    )
+        for category, model_name, scores in _iter_leaderboard(file_chunks(data_path)):
+            if not isinstance(scores, dict):
+                continue
+            
+            rating = scores.get("rating")
+            if rating is None:
+                continue
+            
+            # Use model_name as arena_id
+            arena_id = model_name
+            
+            # Only keep if we don't already have this model or if this is "overall_text"
+            if arena_id not in arena_map or category == "overall_text":
+                arena_map[arena_id] = ArenaModel(
+                    arena_id=arena_id,
+                    rating=float(rating),
+                    rating_q025=float(scores["rating_q025"]) if scores.get("rating_q025") is not None else None,
+                    rating_q975=float(scores["rating_q975"]) if scores.get("rating_q975") is not None else None,
+                    category=category
+                )
         
         return arena_map
-        
-    except (json.JSONDecodeError, IOError, ValueError) as e:
-        print(f"Warning: Failed to parse arena JSON from {data_path}: {e}")
+    
+    except (IOError, ValueError) as e:
+        echo(f"Warning: Failed to parse arena JSON from {data_path}: {e}")
         return {}
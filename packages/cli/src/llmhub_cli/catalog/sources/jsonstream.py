@@ -0,0 +1,177 @@
+"""
+JSON stream: incremental, event-style reading of large JSON payloads.
+
+Sources walk a payload member by member instead of materializing it:
+JsonStream buffers only the unconsumed tail of the text, decodes the values
+a source asks for and skips the rest without building them, so peak memory
+is bounded by the largest value that is actually decoded.
+"""
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+# Structural characters and quotes, and a complete JSON string
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# Characters a number can continue with ("1" may become "1.5", "2e3", ...)
+_NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*')
+
+
+class JsonStream:
+    """
+    Incremental reader over JSON text arriving in chunks.
+
+    Navigation is driven by the caller: members() and items() iterate over
+    an object's keys or an array's positions, and the caller consumes each
+    value with value(), skip() or a nested members()/items() before
+    advancing.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text. False at the end."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\n\r":
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at the end)."""
+        self._skip_whitespace()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def next(self) -> str:
+        """Consume the next non-whitespace character ('' at the end)."""
+        char = self.peek()
+        self._pos += len(char)
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number (or literal) whose possible continuation reaches the
+            # end of the buffer may go on in the next chunk: "1." + "5"
+            if not isinstance(value, (str, dict, list)):
+                if _NUMBER_TAIL.match(self._buffer, end).end() == len(self._buffer) and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """
+        Consume the next JSON value without building it.
+
+        Raises:
+            ValueError: If the text ends inside the value
+        """
+        if self.peek() not in "{[":
+            self.value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise ValueError("JSON text ended inside a value")
+                continue
+            char = match.group()
+            if char == '"':
+                string = _STRING.match(self._buffer, match.start())
+                if string is None:
+                    # The string continues in the next chunk
+                    self._pos = match.start()
+                    if not self._fill():
+                        raise ValueError("JSON text ended inside a string")
+                    continue
+                self._pos = string.end()
+                continue
+            self._pos = match.end()
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object.
+
+        Raises:
+            ValueError: If the next value is not a well-formed object
+        """
+        if self.next() != "{":
+            raise ValueError("Expected a JSON object")
+        if self.peek() == "}":
+            self.next()
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str) or self.next() != ":":
+                raise ValueError("Malformed JSON object")
+            yield key
+            separator = self.next()
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError("Malformed JSON object")
+
+    def items(self) -> Iterator[int]:
+        """
+        Iterate over the positions of the next JSON array.
+
+        Raises:
+            ValueError: If the next value is not a well-formed array
+        """
+        if self.next() != "[":
+            raise ValueError("Expected a JSON array")
+        if self.peek() == "]":
+            self.next()
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            separator = self.next()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError("Malformed JSON array")
+
+
+def decode_chunks(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode UTF-8 byte chunks into text chunks (characters may span chunks)."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def file_chunks(path: Path) -> Iterator[str]:
+    """Read a UTF-8 file as text chunks."""
+    with open(path, "rb") as f:
+        yield from decode_chunks(iter(lambda: f.read(CHUNK_SIZE), b""))
@@ -2,23 +2,64 @@
 Models.dev source: fetch and normalize model metadata from models.dev/api.json.
 
 This module provides pricing, limits, modalities, and capability flags.
+
+load_modelsdev_models() streams the payload and normalizes only the models
+of the providers the catalog can use, then keeps the normalized result in
+a compact per-source cache (sources/modelsdev.json next to the catalog
+cache) so later builds skip both the download and the parse.
 """
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
 import requests
-from typing import Optional
 from ..schema import ModelsDevModel
+from .. import cache as cache_module
+from .jsonstream import CHUNK_SIZE, JsonStream, decode_chunks
+
+
+MODELSDEV_URL = "https://models.dev/api.json"
+
+# Overrides the models.dev URL (e.g. a mirror)
+MODELSDEV_URL_ENV = "LLMHUB_MODELSDEV_URL"
+
+# Bump when the normalized cache format or normalization changes
+MODELSDEV_CACHE_VERSION = 1
+
+_TIMEOUT = (10, 30)  # Connect, read (seconds)
+
+# (provider, key of the model in its provider's "models" object, raw model data)
+RawEntry = Tuple[str, Optional[str], Any]
 
 
-def fetch_modelsdev_json() -> dict:
+def _get_modelsdev_cache_path() -> Path:
+    """Get path of the normalized models.dev cache."""
+    return cache_module._get_sources_dir() / "modelsdev.json"
+
+
+def _modelsdev_url() -> str:
+    return os.environ.get(MODELSDEV_URL_ENV) or MODELSDEV_URL
+
+
+def fetch_modelsdev_json(echo: Callable[[str], None] = print) -> dict:
     """
     HTTP GET models.dev/api.json and return parsed dict.
     
+    Prefer load_modelsdev_models(), which streams the payload and caches
+    the normalized result.
+    
+    Args:
+        echo: Receives warnings (default: print)
+    
     Returns:
         Parsed JSON response as dict.
-        
+    
     Raises:
         requests.RequestException: If the request fails.
     """
-    url = "https://models.dev/api.json"
+    url = _modelsdev_url()
     
     try:
         response = requests.get(url, timeout=10)
@@ -26,116 +67,339 @@ def fetch_modelsdev_json() -> dict:
         return response.json()
     except requests.RequestException as e:
         # Log warning but don't crash - catalog can build without models.dev data
-        print(f"Warning: Failed to fetch models.dev data: {e}")
+        echo(f"Warning: Failed to fetch models.dev data: {e}")
         return {}
 
 
-def normalize_modelsdev(data: dict) -> dict[str, ModelsDevModel]:
+def _iter_provider_stream(
+    stream: JsonStream,
+    provider: str,
+    providers: Optional[set[str]]
+) -> Iterator[RawEntry]:
+    """Yield the raw models of one provider object, skipping unwanted providers unbuilt."""
+    if (providers is not None and provider not in providers) or stream.peek() != "{":
+        stream.skip()
+        return
+    
+    for field in stream.members():
+        if field == "models" and stream.peek() == "[":
+            for _ in stream.items():
+                yield provider, None, stream.value()
+        elif field == "models" and stream.peek() == "{":
+            for model_key in stream.members():
+                yield provider, model_key, stream.value()
+        else:
+            stream.skip()
+
+
+def _iter_modelsdev_stream(
+    chunks: Iterable[str],
+    providers: Optional[set[str]] = None
+) -> Iterator[RawEntry]:
+    """
+    Stream raw model entries out of models.dev JSON text.
+    
+    Accepts both { provider: { models: {...} } } and the wrapped
+    { providers: { provider: { models: [...] } } } layout.
+    
+    Args:
+        chunks: JSON text in chunks
+        providers: Only yield models of these providers (None: all)
+    
+    Raises:
+        ValueError: If the text is not a JSON object
+    """
+    stream = JsonStream(chunks)
+    for key in stream.members():
+        if key == "providers" and stream.peek() == "{":
+            for provider in stream.members():
+                yield from _iter_provider_stream(stream, provider, providers)
+        else:
+            yield from _iter_provider_stream(stream, key, providers)
+
+
+def _iter_modelsdev_dict(data: dict, providers: Optional[set[str]] = None) -> Iterator[RawEntry]:
+    """Raw model entries of an already parsed payload (see _iter_modelsdev_stream)."""
+    wrapped = data.get("providers")
+    provider_items = wrapped.items() if isinstance(wrapped, dict) else data.items()
+    
+    for provider_name, provider_data in provider_items:
+        if providers is not None and provider_name not in providers:
+            continue
+        if not isinstance(provider_data, dict):
+            continue
+        models = provider_data.get("models", [])
+        if isinstance(models, dict):
+            for model_key, model_data in models.items():
+                yield provider_name, model_key, model_data
+        elif isinstance(models, list):
+            for model_data in models:
+                yield provider_name, None, model_data
+
+
+def _price(value: Any) -> Optional[float]:
+    """Per-million price from a number or a {"price": ...} object."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return float(value.get("price", 0))
+    return None
+
+
+def _normalize_model(provider_name: str, model_key: Optional[str], model_data: Any) -> Optional[ModelsDevModel]:
+    """
+    Normalize one raw models.dev entry.
+    
+    Field names of both models.dev layouts are understood (e.g. "pricing" /
+    "cost", "limits" / "limit", "capabilities.tools" / "tool_call").
+    
+    Args:
+        provider_name: Provider the entry belongs to
+        model_key: Key of the entry in its provider's models object, if any
+        model_data: Raw entry
+    
+    Returns:
+        ModelsDevModel, or None for entries without an id or with invalid data
+    """
+    if not isinstance(model_data, dict):
+        return None
+    try:
+        return _normalize_model_data(provider_name, model_key, model_data)
+    except (ValueError, TypeError, AttributeError):
+        # Malformed entry (e.g. a string where an object is expected)
+        return None
+
+
+def _normalize_model_data(provider_name: str, model_key: Optional[str], model_data: dict) -> Optional[ModelsDevModel]:
+    model_id = model_data.get("id") or model_key or model_data.get("name", "")
+    if not model_id:
+        return None
+    
+    canonical_id = f"{provider_name}/{model_id}"
+    
+    # Parse capabilities
+    capabilities = model_data.get("capabilities", {})
+    modalities = model_data.get("modalities", {})
+    
+    # Parse pricing (per million tokens)
+    pricing = model_data.get("pricing") or model_data.get("cost") or {}
+    price_input = _price(pricing.get("input", pricing.get("prompt")))
+    price_output = _price(pricing.get("output", pricing.get("completion")))
+    price_reasoning = _price(pricing.get("reasoning"))
+    
+    # Parse limits
+    limits = model_data.get("limits") or model_data.get("limit") or {}
+    context_tokens = limits.get("context", limits.get("context_length"))
+    max_input = limits.get("max_input", limits.get("max_input_tokens", limits.get("input")))
+    max_output = limits.get("max_output", limits.get("max_output_tokens", limits.get("output")))
+    
+    # Parse input/output modalities
+    input_mods = modalities.get("input", ["text"])
+    output_mods = modalities.get("output", ["text"])
+    
+    # Ensure lists
+    if not isinstance(input_mods, list):
+        input_mods = [input_mods] if input_mods else ["text"]
+    if not isinstance(output_mods, list):
+        output_mods = [output_mods] if output_mods else ["text"]
+    
+    return ModelsDevModel(
+        canonical_id=canonical_id,
+        provider=provider_name,
+        model_id=model_id,
+        family=model_data.get("family"),
+        display_name=model_data.get("display_name", model_data.get("name")),
+        
+        # Capabilities
+        supports_reasoning=capabilities.get("reasoning", model_data.get("reasoning", False)),
+        supports_tool_call=capabilities.get(
+            "tools", capabilities.get("function_calling", model_data.get("tool_call", False))
+        ),
+        supports_structured_output=capabilities.get(
+            "structured_output", model_data.get("structured_output", False)
+        ),
+        input_modalities=input_mods,
+        output_modalities=output_mods,
+        attachments=model_data.get("attachments", []),
+        
+        # Limits
+        context_tokens=context_tokens,
+        max_input_tokens=max_input,
+        max_output_tokens=max_output,
+        
+        # Pricing
+        price_input_per_million=price_input,
+        price_output_per_million=price_output,
+        price_reasoning_per_million=price_reasoning,
+        
+        # Meta
+        knowledge_cutoff=model_data.get("knowledge_cutoff", model_data.get("knowledge")),
+        release_date=model_data.get("release_date"),
+        last_updated=model_data.get("last_updated"),
+        open_weights=model_data.get("open_weights", model_data.get("open_source", False))
+    )
+
+
+def _normalize_entries(entries: Iterable[RawEntry]) -> dict[str, ModelsDevModel]:
+    normalized: dict[str, ModelsDevModel] = {}
+    for provider_name, model_key, model_data in entries:
+        model = _normalize_model(provider_name, model_key, model_data)
+        if model is not None:
+            normalized[model.canonical_id] = model
+    return normalized
+
+
+def normalize_modelsdev(
+    data: dict,
+    providers: Optional[Iterable[str]] = None
+) -> dict[str, ModelsDevModel]:
     """
     Flatten provider → models into dict keyed by canonical ID.
     
     Args:
         data: Raw JSON from models.dev/api.json
-        
+        providers: Only normalize models of these providers (None: all)
+    
     Returns:
         Dict mapping canonical_id (e.g. "openai/gpt-4o-mini") to ModelsDevModel
     """
-    normalized: dict[str, ModelsDevModel] = {}
-    
     if not data:
-        return normalized
+        return {}
+    wanted = None if providers is None else set(providers)
+    return _normalize_entries(_iter_modelsdev_dict(data, wanted))
+
+
+def _fetch_normalized(url: str, providers: Optional[set[str]]) -> dict[str, ModelsDevModel]:
+    """
+    Stream the models.dev payload and normalize the wanted providers' models.
     
-    # models.dev structure is typically: { providers: { provider_name: { models: [...] } } }
-    providers = data.get("providers", {})
+    Raises:
+        requests.RequestException: If the request fails
+        ValueError: If the payload is not a JSON object
+    """
+    with requests.get(url, stream=True, timeout=_TIMEOUT) as response:
+        response.raise_for_status()
+        chunks = decode_chunks(response.iter_content(CHUNK_SIZE))
+        return _normalize_entries(_iter_modelsdev_stream(chunks, providers))
+
+
+def _read_normalized_cache(path: Path, url: str) -> Optional[Tuple[Optional[set[str]], dict[str, ModelsDevModel]]]:
+    """
+    Read the normalized cache.
     
-    for provider_name, provider_data in providers.items():
-        models = provider_data.get("models", [])
-        
-        for model_data in models:
-            model_id = model_data.get("id", model_data.get("name", ""))
-            if not model_id:
-                continue
-            
-            canonical_id = f"{provider_name}/{model_id}"
-            
-            # Parse capabilities
-            capabilities = model_data.get("capabilities", {})
-            modalities = model_data.get("modalities", {})
-            
-            # Parse pricing
-            pricing = model_data.get("pricing", {})
-            price_input = None
-            price_output = None
-            price_reasoning = None
-            
-            if pricing:
-                # Pricing might be in various formats - normalize to per million
-                input_price_data = pricing.get("input", pricing.get("prompt"))
-                output_price_data = pricing.get("output", pricing.get("completion"))
-                
-                if isinstance(input_price_data, (int, float)):
-                    price_input = float(input_price_data)
-                elif isinstance(input_price_data, dict):
-                    price_input = float(input_price_data.get("price", 0))
-                
-                if isinstance(output_price_data, (int, float)):
-                    price_output = float(output_price_data)
-                elif isinstance(output_price_data, dict):
-                    price_output = float(output_price_data.get("price", 0))
-                
-                # Reasoning pricing if available
-                reasoning_price_data = pricing.get("reasoning")
-                if isinstance(reasoning_price_data, (int, float)):
-                    price_reasoning = float(reasoning_price_data)
-                elif isinstance(reasoning_price_data, dict):
-                    price_reasoning = float(reasoning_price_data.get("price", 0))
-            
-            # Parse limits
-            limits = model_data.get("limits", {})
-            context_tokens = limits.get("context", limits.get("context_length"))
-            max_input = limits.get("max_input", limits.get("max_input_tokens"))
-            max_output = limits.get("max_output", limits.get("max_output_tokens"))
-            
-            # Parse input/output modalities
-            input_mods = modalities.get("input", ["text"])
-            output_mods = modalities.get("output", ["text"])
-            
-            # Ensure lists
-            if not isinstance(input_mods, list):
-                input_mods = [input_mods] if input_mods else ["text"]
-            if not isinstance(output_mods, list):
-                output_mods = [output_mods] if output_mods else ["text"]
-            
-            normalized[canonical_id] = ModelsDevModel(
-                canonical_id=canonical_id,
-                provider=provider_name,
-                model_id=model_id,
-                family=model_data.get("family"),
-                display_name=model_data.get("display_name", model_data.get("name")),
-                
-                # Capabilities
-                supports_reasoning=capabilities.get("reasoning", False),
-                supports_tool_call=capabilities.get("tools", capabilities.get("function_calling", False)),
-                supports_structured_output=capabilities.get("structured_output", False),
-                input_modalities=input_mods,
-                output_modalities=output_mods,
-                attachments=model_data.get("attachments", []),
-                
-                # Limits
-                context_tokens=context_tokens,
-                max_input_tokens=max_input,
-                max_output_tokens=max_output,
-                
-                # Pricing
-                price_input_per_million=price_input,
-                price_output_per_million=price_output,
-                price_reasoning_per_million=price_reasoning,
-                
-                # Meta
-                knowledge_cutoff=model_data.get("knowledge_cutoff"),
-                release_date=model_data.get("release_date"),
-                last_updated=model_data.get("last_updated"),
-                open_weights=model_data.get("open_weights", model_data.get("open_source", False))
-            )
+    Returns:
+        (providers the cache covers, None for all; models), or None if the
+        cache is missing, unreadable or was built from another URL/version
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != MODELSDEV_CACHE_VERSION or data.get("url") != url:
+            return None
+        covered = None if data.get("providers") is None else set(data["providers"])
+        models = {}
+        for entry in data.get("models", []):
+            entry["canonical_id"] = f"{entry['provider']}/{entry['model_id']}"
+            models[entry["canonical_id"]] = ModelsDevModel(**entry)
+        return covered, models
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_normalized_cache(
+    path: Path,
+    url: str,
+    providers: Optional[set[str]],
+    models: dict[str, ModelsDevModel],
+    echo: Callable[[str], None] = print
+) -> None:
+    """Atomically write the normalized cache (default-valued fields omitted)."""
+    payload = {
+        "version": MODELSDEV_CACHE_VERSION,
+        "url": url,
+        "providers": None if providers is None else sorted(providers),
+        "models": [
+            model.model_dump(exclude_defaults=True, exclude={"canonical_id"})
+            for model in models.values()
+        ],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except (OSError, ValueError) as e:
+        echo(f"Warning: Failed to save models.dev cache: {e}")
+
+
+def _is_fresh(path: Path, ttl_hours: int) -> bool:
+    try:
+        age = datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)
+    except OSError:
+        return False
+    return age <= timedelta(hours=ttl_hours)
+
+
+def _select(models: dict[str, ModelsDevModel], providers: Optional[set[str]]) -> dict[str, ModelsDevModel]:
+    if providers is None:
+        return models
+    return {cid: model for cid, model in models.items() if model.provider in providers}
+
+
+def load_modelsdev_models(
+    providers: Optional[Iterable[str]] = None,
+    ttl_hours: int = 24,
+    echo: Callable[[str], None] = print
+) -> dict[str, ModelsDevModel]:
+    """
+    Normalized models.dev metadata for the given providers.
     
-    return normalized
+    Serves the normalized cache while it is younger than ttl_hours and
+    covers the providers; otherwise streams models.dev, normalizing only
+    the wanted providers (plus those the fresh cache already covered), and
+    rewrites the cache. If models.dev cannot be reached, a stale cache is
+    used.
+    
+    Args:
+        providers: Providers of interest, known before the parse (None: all)
+        ttl_hours: Normalized cache TTL in hours (default 24)
+        echo: Receives warnings (default: print)
+    
+    Returns:
+        Dict mapping canonical_id to ModelsDevModel, empty if no data is
+        available
+    """
+    wanted = None if providers is None else set(providers)
+    if wanted is not None and not wanted:
+        return {}
+    
+    url = _modelsdev_url()
+    cache_path = _get_modelsdev_cache_path()
+    cached = _read_normalized_cache(cache_path, url)
+    fresh = cached is not None and _is_fresh(cache_path, ttl_hours)
+    
+    parse_for = wanted
+    if fresh:
+        covered, models = cached
+        if covered is None or (wanted is not None and wanted <= covered):
+            return _select(models, wanted)
+        if wanted is not None:
+            parse_for = wanted | covered
+    
+    try:
+        models = _fetch_normalized(url, parse_for)
+    except (requests.RequestException, ValueError) as e:
+        if cached is not None:
+            echo(f"Warning: Failed to fetch models.dev data ({e}), using cached metadata")
+            return _select(cached[1], wanted)
+        # Log warning but don't crash - catalog can build without models.dev data
+        echo(f"Warning: Failed to fetch models.dev data: {e}")
+        return {}
+    
+    _write_normalized_cache(cache_path, url, parse_for, models, echo)
+    return _select(models, wanted)
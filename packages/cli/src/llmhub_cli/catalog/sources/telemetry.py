@@ -0,0 +1,41 @@
+"""
+Telemetry source: observed latency and reliability from the runtime call log.
+
+Hubs created with LLMHub(telemetry=TelemetrySink()) log every call locally
+(see llmhub_runtime.telemetry). This source aggregates that log per
+(provider, model) so the catalog can record how fast and reliable each
+model actually is in this deployment.
+"""
+from pathlib import Path
+from typing import Optional, Union
+from llmhub_runtime.telemetry import aggregate_call_log
+
+
+# Models with fewer calls than this are too noisy to rank by
+MIN_CALLS = 20
+
+
+def load_telemetry_latency(
+    path: Optional[Union[str, Path]] = None,
+    min_calls: int = MIN_CALLS
+) -> dict[str, dict]:
+    """
+    Observed call latency and error rate per model, in overrides.json's
+    "latency" format.
+
+    Args:
+        path: Call log (default: the runtime's default telemetry log)
+        min_calls: Ignore models with fewer logged calls
+
+    Returns:
+        canonical_id → {"observed_latency_ms": ..., "error_rate": ...}
+    """
+    latency: dict[str, dict] = {}
+    for (provider, model), stats in aggregate_call_log(path).items():
+        if stats.calls < min_calls:
+            continue
+        values = {"error_rate": round(stats.error_rate, 4)}
+        if stats.latency_p50_ms is not None:
+            values["observed_latency_ms"] = stats.latency_p50_ms
+        latency[f"{provider}/{model}"] = values
+    return latency
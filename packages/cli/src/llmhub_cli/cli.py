@@ -42,6 +42,7 @@ app.command(name="doctor")(test.doctor)
 catalog_app = typer.Typer(help="Model catalog management")
 catalog_app.command(name="show")(catalog.catalog_show)
 catalog_app.command(name="refresh")(catalog.catalog_refresh)
+catalog_app.command(name="probe")(catalog.catalog_probe)
 app.add_typer(catalog_app, name="catalog")
 
 
@@ -1,13 +1,13 @@
 """
 Catalog CLI commands.
 
-Implements `llmhub catalog show` and `llmhub catalog refresh`.
+Implements `llmhub catalog show`, `llmhub catalog refresh` and
+`llmhub catalog probe`.
 """
 from typing import Optional
 import typer
 from rich.console import Console
 from rich.table import Table
-from ..catalog import build_catalog
 
 
 console = Console()
@@ -15,16 +15,24 @@ console = Console()
 
 def catalog_refresh(
     ttl_hours: int = typer.Option(24, help="Cache TTL in hours"),
+    profile: bool = typer.Option(
+        False, "--profile", help="Record time, CPU, memory and item counts per build stage"
+    ),
 ) -> None:
     """
     Force rebuild of the catalog and update cache.
     
-    Fetches fresh data from all sources and rebuilds the catalog.
+    Fetches fresh data from all sources and rebuilds the catalog. With
+    --profile, per-stage measurements are printed and stored in the
+    catalog metadata (build_profile).
     """
+    # The catalog builder pulls in numpy, requests and every source
+    from ..catalog import build_catalog
+    
     try:
         console.print("\n[bold]Refreshing catalog...[/bold]\n")
         
-        catalog = build_catalog(ttl_hours=ttl_hours, force_refresh=True)
+        catalog = build_catalog(ttl_hours=ttl_hours, force_refresh=True, profile=profile)
         
         console.print(f"\n[green]✓ Catalog built successfully[/green]")
         console.print(f"  Models: {len(catalog.models)}")
@@ -41,6 +49,10 @@ def catalog_refresh(
             for provider, count in sorted(provider_counts.items()):
                 console.print(f"  {provider}: {count}")
         
+        if catalog.build_profile:
+            console.print()
+            console.print(_profile_table(catalog.build_profile))
+        
         console.print()
         
     except Exception as e:
@@ -48,6 +60,31 @@ def catalog_refresh(
         raise typer.Exit(1)
 
 
+def _profile_table(profile) -> Table:
+    """Render a BuildProfile as one row per stage plus a total row."""
+    table = Table(title="Build profile")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Peak (MB)", justify="right")
+    table.add_column("Items", justify="right")
+    
+    def row(name, entry, items=None):
+        peak = f"{entry.peak_mb:.1f}" if entry.peak_mb is not None else "-"
+        table.add_row(
+            name,
+            f"{entry.seconds:.3f}",
+            f"{entry.cpu_seconds:.3f}",
+            peak,
+            str(items) if items is not None else "-",
+        )
+    
+    for stage in profile.stages:
+        row(stage.stage, stage, stage.items)
+    row("[bold]total[/bold]", profile)
+    return table
+
+
 def catalog_show(
     provider: Optional[str] = typer.Option(None, help="Filter by provider"),
     show_details: bool = typer.Option(False, "--details", help="Show detailed model info"),
@@ -57,10 +94,13 @@ def catalog_show(
     
     Displays a table of models with pricing, quality, and capabilities.
     """
+    from ..catalog.builder import build_catalog, DEFAULT_MAX_STALE_HOURS
+    
     try:
         console.print("\n[bold]Loading catalog...[/bold]\n")
         
-        catalog = build_catalog(force_refresh=False)
+        # An expired catalog is shown while a detached process rebuilds it
+        catalog = build_catalog(max_stale_hours=DEFAULT_MAX_STALE_HOURS, detach=True)
         
         if not catalog.models:
             console.print("[yellow]No models found in catalog.[/yellow]")
@@ -124,3 +164,66 @@ def catalog_show(
     except Exception as e:
         console.print(f"\n[red]✗ Failed to load catalog: {e}[/red]\n")
         raise typer.Exit(1)
+
+
+def catalog_probe(
+    provider: Optional[str] = typer.Option(None, help="Only probe models of this provider"),
+    model: Optional[str] = typer.Option(None, help="Only probe models whose id contains this text"),
+    samples: int = typer.Option(5, min=1, help="Requests per prompt per model"),
+    concurrency: int = typer.Option(8, min=1, help="Concurrent requests"),
+    limit: Optional[int] = typer.Option(None, min=1, help="Probe at most this many models"),
+) -> None:
+    """
+    Measure time to first token, throughput and error rate of catalog models.
+    
+    Sends a short prompt and a long-output prompt to each model through
+    LLMHub and stores percentile summaries next to the catalog cache. The
+    next `llmhub catalog refresh` merges them into the catalog.
+    """
+    from ..catalog.builder import build_catalog, DEFAULT_MAX_STALE_HOURS
+    from ..catalog.probe import probe_models, save_probe_summaries
+    
+    try:
+        catalog = build_catalog(max_stale_hours=DEFAULT_MAX_STALE_HOURS, detach=True)
+    except Exception as e:
+        console.print(f"\n[red]✗ Failed to load catalog: {e}[/red]\n")
+        raise typer.Exit(1)
+    
+    models = [m for m in catalog.models if "text" in m.output_modalities]
+    if provider:
+        models = [m for m in models if m.provider.lower() == provider.lower()]
+    if model:
+        models = [m for m in models if model.lower() in m.model_id.lower()]
+    if limit:
+        models = models[:limit]
+    
+    if not models:
+        console.print("[yellow]No matching chat models in catalog.[/yellow]\n")
+        return
+    
+    console.print(f"\n[bold]Probing {len(models)} model(s), {samples} sample(s) each...[/bold]\n")
+    summaries = probe_models(models, samples=samples, max_workers=concurrency)
+    path = save_probe_summaries(summaries)
+    
+    table = Table(title="Probe results")
+    table.add_column("Model", style="cyan")
+    table.add_column("TTFT p50 (ms)", justify="right")
+    table.add_column("TTFT p90 (ms)", justify="right")
+    table.add_column("Tokens/s p50", justify="right")
+    table.add_column("Errors", justify="right")
+    
+    for canonical_id, summary in summaries.items():
+        ttft = summary.ttft_ms
+        tps = summary.output_tokens_per_second
+        errors = f"{summary.error_rate:.0%}"
+        table.add_row(
+            canonical_id,
+            f"{ttft.p50:.0f}" if ttft else "-",
+            f"{ttft.p90:.0f}" if ttft else "-",
+            f"{tps.p50:.1f}" if tps else "-",
+            f"[red]{errors}[/red]" if summary.errors else errors,
+        )
+    
+    console.print(table)
+    console.print(f"\n[green]✓ Probe results saved to {path}[/green]")
+    console.print("Run 'llmhub catalog refresh' to merge them into the catalog.\n")
@@ -1,10 +1,13 @@
 import typer
+from pathlib import Path
+from typing import Optional
 from rich.console import Console
+from rich.table import Table
 from ..context import resolve_context
 from ..spec_models import load_spec, SpecError
-from ..runtime_io import load_runtime, save_runtime, RuntimeError as RTError
+from ..runtime_io import load_runtime, load_runtime_fingerprints, save_runtime, RuntimeError as RTError
 from ..env_manager import generate_env_example
-from ..generator_hook import generate_runtime, GeneratorOptions
+from ..generator_hook import generate_runtime, role_fingerprints, GeneratorOptions, GenerationResult
 from .. import ux
 
 console = Console()
@@ -14,9 +17,17 @@ def generate(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be generated without writing"),
     no_llm: bool = typer.Option(False, "--no-llm", help="Use heuristic-only mode"),
     force: bool = typer.Option(False, "--force", help="Overwrite existing runtime without confirmation"),
-    explain: bool = typer.Option(False, "--explain", help="Show explanations for model selections")
+    explain: bool = typer.Option(False, "--explain", help="Show explanations for model selections"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="With --no-llm, re-select every role instead of using cached selections"),
+    incremental: bool = typer.Option(False, "--incremental", help="Only regenerate roles whose spec, catalog or options changed"),
+    watch: bool = typer.Option(False, "--watch", help="Keep running and regenerate whenever the spec changes"),
+    all_root: Optional[Path] = typer.Option(None, "--all", help="Regenerate every project with a spec under this directory")
 ) -> None:
     """Generate runtime config from spec."""
+    if all_root is not None:
+        _generate_all(all_root, GeneratorOptions(no_llm=no_llm, explain=explain, no_cache=no_cache), dry_run)
+        return
+    
     context = resolve_context()
     
     if not context.spec_path.exists():
@@ -24,21 +35,41 @@ def generate(
         console.print("Run 'llmhub init' first")
         raise typer.Exit(1)
     
+    if watch:
+        _watch(context, GeneratorOptions(no_llm=no_llm, explain=explain, no_cache=no_cache))
+        return
+    
     try:
         # Load spec
         spec = load_spec(context.spec_path)
         console.print(f"[cyan]Loaded spec: {spec.project}[/cyan]")
         
         # Check if runtime exists
-        if context.runtime_path.exists() and not force and not dry_run:
+        if context.runtime_path.exists() and not force and not dry_run and not incremental:
             if not ux.confirm(f"Runtime already exists at {context.runtime_path}. Overwrite?", default=True):
                 console.print("[yellow]Cancelled[/yellow]")
                 raise typer.Exit()
         
         # Generate runtime
         console.print("[cyan]Generating runtime configuration...[/cyan]")
-        options = GeneratorOptions(no_llm=no_llm, explain=explain)
-        result = generate_runtime(spec, options)
+        options = GeneratorOptions(no_llm=no_llm, explain=explain, no_cache=no_cache)
+        previous = None
+        if incremental and context.runtime_path.exists():
+            previous = GenerationResult(
+                runtime=load_runtime(context.runtime_path),
+                fingerprints=load_runtime_fingerprints(context.runtime_path)
+            )
+        result = generate_runtime(spec, options, previous)
+        
+        if previous is not None:
+            regenerated = [
+                role for role in result.runtime.roles
+                if previous.fingerprints.get(role) != result.fingerprints.get(role)
+            ]
+            console.print(
+                f"[cyan]Regenerating {len(regenerated)} of {len(result.runtime.roles)} role(s)"
+                + (f": {', '.join(regenerated)}" if regenerated else "") + "[/cyan]"
+            )
         
         if dry_run:
             console.print("\n[bold]Generated Runtime (dry-run):[/bold]\n")
@@ -50,7 +81,7 @@ def generate(
                     console.print(f"[cyan]{role}:[/cyan] {explanation}")
         else:
             # Save runtime
-            save_runtime(context.runtime_path, result.runtime)
+            save_runtime(context.runtime_path, result.runtime, result.fingerprints)
             console.print(f"\n[green]✓ Runtime saved to {context.runtime_path}[/green]")
             
             # Update .env.example if providers changed
@@ -75,6 +106,71 @@ def generate(
         raise typer.Exit(1)
 
 
+def _generate_all(root: Path, options: GeneratorOptions, dry_run: bool) -> None:
+    """Regenerate all projects under root and print a summary."""
+    from ..batch import generate_all
+    
+    if not root.is_dir():
+        console.print(f"[red]Not a directory: {root}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"[cyan]Generating runtimes for projects under {root}...[/cyan]")
+    outcomes = generate_all(root, options, write=not dry_run)
+    if not outcomes:
+        console.print(f"[yellow]No llmhub.spec.yaml found under {root}[/yellow]")
+        return
+    
+    table = Table(title="Dry run (nothing written)" if dry_run else None)
+    table.add_column("Project", style="cyan")
+    table.add_column("Status")
+    table.add_column("Changes")
+    styles = {"created": "green", "updated": "green", "unchanged": "dim", "failed": "red"}
+    for outcome in outcomes:
+        try:
+            name = str(outcome.root.relative_to(root)) or "."
+        except ValueError:
+            name = str(outcome.root)
+        details = outcome.error if outcome.status == "failed" else "\n".join(outcome.changes)
+        table.add_row(name, f"[{styles[outcome.status]}]{outcome.status}[/{styles[outcome.status]}]", details)
+    console.print(table)
+    
+    counts = {}
+    for outcome in outcomes:
+        counts[outcome.status] = counts.get(outcome.status, 0) + 1
+    console.print(", ".join(f"{count} {status}" for status, count in counts.items()))
+    
+    if counts.get("failed"):
+        raise typer.Exit(1)
+
+
+def _watch(context, options: GeneratorOptions) -> None:
+    """Regenerate the runtime on every spec change until interrupted."""
+    from ..watch import SpecWatcher
+    
+    watcher = SpecWatcher(context.spec_path, context.runtime_path, options)
+    
+    def on_event(event) -> None:
+        roles = ", ".join(event.regenerated) if event.regenerated else "no roles changed"
+        console.print(
+            f"[green]✓ Runtime saved to {context.runtime_path}[/green] "
+            f"({roles}; {event.elapsed_ms:.0f} ms)"
+        )
+        if options.explain:
+            for role in event.regenerated:
+                explanation = event.result.explanations.get(role)
+                if explanation:
+                    console.print(f"  [cyan]{role}:[/cyan] {explanation}")
+    
+    def on_error(error: Exception) -> None:
+        console.print(f"[red]Generation failed: {error}[/red]")
+    
+    console.print(f"[cyan]Watching {context.spec_path} (Ctrl+C to stop)[/cyan]")
+    try:
+        watcher.run(on_event, on_error)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching[/yellow]")
+
+
 def runtime_show() -> None:
     """Show runtime configuration."""
     context = resolve_context()
@@ -138,15 +234,37 @@ def diff() -> None:
                 console.print(f"  - {role}")
             console.print()
         
-        if in_both:
-            console.print(f"[green]Roles in both ({len(in_both)}):[/green]")
-            for role in sorted(in_both):
+        # Compare recorded input fingerprints with the current inputs, in
+        # the mode the runtime was generated with
+        recorded = load_runtime_fingerprints(context.runtime_path)
+        no_llm = any(fp.interpreter == "offline" for fp in recorded.values())
+        current = role_fingerprints(spec, GeneratorOptions(no_llm=no_llm))
+        stale = {}
+        for role in in_both:
+            if role not in recorded:
+                stale[role] = "no fingerprint recorded"
+            else:
+                changes = recorded[role].changes(current[role])
+                if changes:
+                    stale[role] = f"{', '.join(changes)} changed"
+        
+        if stale:
+            console.print(f"[yellow]Stale roles ({len(stale)}):[/yellow]")
+            for role in sorted(stale):
+                runtime_role = runtime.roles[role]
+                console.print(f"  ~ {role} → {runtime_role.provider}:{runtime_role.model} ({stale[role]})")
+            console.print()
+        
+        up_to_date = in_both - set(stale)
+        if up_to_date:
+            console.print(f"[green]Roles in both ({len(up_to_date)}):[/green]")
+            for role in sorted(up_to_date):
                 runtime_role = runtime.roles[role]
                 console.print(f"  = {role} → {runtime_role.provider}:{runtime_role.model}")
             console.print()
         
-        if only_in_spec or only_in_runtime:
-            console.print("[yellow]Run 'llmhub generate' to sync[/yellow]")
+        if only_in_spec or only_in_runtime or stale:
+            console.print("[yellow]Run 'llmhub generate --incremental' to sync[/yellow]")
         else:
             console.print("[green]✓ Spec and runtime are in sync[/green]")
         
@@ -4,8 +4,6 @@ import typer
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
-from dotenv import load_dotenv
-from llmhub_runtime import LLMHub
 from ..context import resolve_context
 from ..spec_models import load_spec, SpecError
 from ..runtime_io import load_runtime, RuntimeError as RTError
@@ -22,6 +20,10 @@ def test_role(
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON response")
 ) -> None:
     """Test a role with a prompt."""
+    # Provider SDKs are only needed once a call is made
+    from dotenv import load_dotenv
+    from llmhub_runtime import LLMHub
+    
     context = resolve_context()
     
     if not context.runtime_path.exists():
@@ -126,6 +128,9 @@ def doctor(
     no_network: bool = typer.Option(False, "--no-network", help="Skip network test calls")
 ) -> None:
     """Run comprehensive health check."""
+    from dotenv import load_dotenv
+    from llmhub_runtime import LLMHub
+    
     context = resolve_context()
     
     console.print("\n[bold]LLMHub Doctor[/bold]\n")
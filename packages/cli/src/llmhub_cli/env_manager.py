@@ -2,7 +2,6 @@ import os
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel
-from dotenv import load_dotenv
 from .spec_models import SpecConfig
 
 
@@ -56,6 +55,7 @@ def check_env(spec: SpecConfig, load_dotenv_path: Optional[Path] = None) -> list
     """
     # Optionally load .env file
     if load_dotenv_path and load_dotenv_path.exists():
+        from dotenv import load_dotenv
         load_dotenv(load_dotenv_path)
     
     missing = []
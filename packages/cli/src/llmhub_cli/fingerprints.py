@@ -0,0 +1,115 @@
+"""
+Fingerprints: per-role input hashes recorded in generated configs.
+
+A generated role only depends on its spec fragment (with the spec's
+defaults and providers), the catalog it was selected from, the selector
+options and the interpreter that produced its needs. Recording these per
+role in the config metadata lets `generate --incremental` carry unchanged
+roles over and lets `runtime diff` tell exactly which roles are stale.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Mapping, Optional
+from pydantic import BaseModel
+
+
+class RoleFingerprint(BaseModel):
+    """Hashes of the inputs a generated role was built from."""
+    spec: str  # Role spec fragment + spec defaults and providers
+    catalog: Optional[str] = None  # Catalog fingerprint (None if no catalog was used)
+    selector: str  # Selector options
+    interpreter: str  # How needs were interpreted (e.g. "offline", "llm:<model>")
+
+    def changes(self, other: "RoleFingerprint") -> List[str]:
+        """
+        Name the inputs that differ from another fingerprint.
+
+        Args:
+            other: Fingerprint to compare with (e.g. the current inputs)
+
+        Returns:
+            Field names whose hashes differ, empty if identical
+        """
+        return [name for name in type(self).model_fields if getattr(self, name) != getattr(other, name)]
+
+
+def stable_hash(data: Any) -> str:
+    """Hex SHA-256 of the canonical JSON encoding of data."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _dump(value: Any) -> Any:
+    """JSON-compatible form of a pydantic model, dict or None."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Mapping):
+        return {key: _dump(item) for key, item in value.items()}
+    return value
+
+
+def role_spec_hash(spec: BaseModel, role_id: str) -> str:
+    """
+    Hash one role's spec fragment together with the spec-wide inputs that
+    apply to it (defaults and providers).
+
+    Args:
+        spec: Spec model with roles, defaults and providers
+        role_id: Role to hash
+
+    Returns:
+        Hex digest
+    """
+    return stable_hash({
+        "role_id": role_id,
+        "role": _dump(spec.roles[role_id]),
+        "defaults": _dump(getattr(spec, "defaults", None)),
+        "providers": _dump(getattr(spec, "providers", None)),
+    })
+
+
+def compute_role_fingerprints(
+    spec: BaseModel,
+    catalog_fingerprint: Optional[str],
+    selector_options: Any,
+    interpreter: str
+) -> Dict[str, RoleFingerprint]:
+    """
+    Fingerprint every role of a spec.
+
+    Args:
+        spec: Spec model with roles
+        catalog_fingerprint: Fingerprint of the catalog used for selection
+        selector_options: Selector options (model or dict)
+        interpreter: Interpreter identifier
+
+    Returns:
+        Role id → RoleFingerprint, in spec order
+    """
+    selector = stable_hash(_dump(selector_options))
+    return {
+        role_id: RoleFingerprint(
+            spec=role_spec_hash(spec, role_id),
+            catalog=catalog_fingerprint,
+            selector=selector,
+            interpreter=interpreter,
+        )
+        for role_id in spec.roles
+    }
+
+
+def stale_roles(
+    current: Mapping[str, RoleFingerprint],
+    previous: Mapping[str, Optional[RoleFingerprint]]
+) -> List[str]:
+    """
+    List roles that must be regenerated.
+
+    Args:
+        current: Fingerprints of the current inputs
+        previous: Fingerprints recorded when the config was generated
+
+    Returns:
+        Role ids (in current order) that are new or whose fingerprint changed
+    """
+    return [role_id for role_id, fingerprint in current.items() if previous.get(role_id) != fingerprint]
@@ -7,9 +7,13 @@ Exports:
     - generate_machine_config: Main end-to-end function
     - All subproblem models and functions (for advanced usage)
 """
+import logging
 from typing import Optional, List
 from llmhub_runtime import LLMHub
 from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.catalog.fingerprint import compute_fingerprint
+from llmhub_cli.catalog.handle import get_catalog_handle
+from llmhub_cli.fingerprints import compute_role_fingerprints, stale_roles
 
 # Import all subproblems
 from .spec import (
@@ -20,11 +24,13 @@ from .spec import (
 )
 from .needs import (
     interpret_needs,
+    interpret_needs_offline,
     InterpreterError,
     RoleNeed,
     parse_role_needs,
     NeedsSchemaError,
 )
+from .needs.cache import resolve_generator_model
 from .catalog_view import (
     CanonicalModel,
     load_catalog_view,
@@ -34,13 +40,18 @@ from .selection import (
     SelectionResult,
     SelectorOptions,
     select_for_role,
+    select_for_roles,
 )
 from .emitter import (
     MachineConfig,
     build_machine_config,
     write_machine_config,
+    load_machine_config,
+    carry_over_roles,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class GeneratorError(Exception):
     """Base exception for generator errors."""
@@ -49,12 +60,18 @@ class GeneratorError(Exception):
 
 def generate_machine_config(
     spec_path: str,
-    hub: LLMHub,
+    hub: Optional[LLMHub],
     output_path: Optional[str] = None,
     catalog_override: Optional[List[CanonicalModel]] = None,
     catalog_ttl_hours: int = 24,
     force_catalog_refresh: bool = False,
-    selector_options: Optional[SelectorOptions] = None
+    catalog_max_stale_hours: Optional[float] = None,
+    selector_options: Optional[SelectorOptions] = None,
+    use_needs_cache: bool = True,
+    interpret_shard_size: Optional[int] = None,
+    no_llm: bool = False,
+    incremental: bool = False,
+    use_selection_cache: bool = True
 ) -> MachineConfig:
     """
     Generate machine config from human spec (end-to-end).
@@ -64,12 +81,25 @@ def generate_machine_config(
     
     Args:
         spec_path: Path to llmhub.spec.yaml
-        hub: LLMHub instance (must have generator role configured)
+        hub: LLMHub instance (must have generator role configured; may be
+            None with no_llm=True)
         output_path: Optional path to write llmhub.yaml (if None, don't write)
         catalog_override: Optional catalog override for testing
         catalog_ttl_hours: Catalog cache TTL in hours
         force_catalog_refresh: Force catalog rebuild
+        catalog_max_stale_hours: Serve an expired catalog up to this age
+            while it is rebuilt in the background (see build_catalog)
         selector_options: Options for model selection
+        use_needs_cache: Reuse cached per-role interpretations (default True)
+        interpret_shard_size: If set, interpret roles in concurrent shards of
+            at most this many roles (see interpret_needs)
+        no_llm: Interpret needs with deterministic local rules instead of
+            the LLM (see interpret_needs_offline)
+        incremental: Reuse roles from the existing config at output_path
+            whose recorded input fingerprints still match; only new or
+            changed roles are interpreted and selected
+        use_selection_cache: Reuse cached SelectionResults for unchanged
+            needs against the cached catalog (default True)
         
     Returns:
         MachineConfig ready for runtime
@@ -80,30 +110,58 @@ def generate_machine_config(
     try:
         # Step 1: Load and parse spec (SP1)
         spec = load_project_spec(spec_path)
+        if not no_llm and hub is None:
+            raise InterpreterError("An LLMHub is required unless no_llm=True")
+        if selector_options is None:
+            selector_options = SelectorOptions()
         
-        # Step 2: Interpret needs via LLM (SP2)
-        needs = interpret_needs(spec, hub)
-        
-        # Step 3: Load catalog (SP4)
+        # Step 2: Load catalog (SP4)
         models = load_catalog_view(
             ttl_hours=catalog_ttl_hours,
             force_refresh=force_catalog_refresh,
-            catalog_override=catalog_override
+            catalog_override=catalog_override,
+            max_stale_hours=catalog_max_stale_hours
         )
         
-        # Step 4: Select models for each role (SP9)
-        if selector_options is None:
-            selector_options = SelectorOptions()
+        # Step 3: Fingerprint each role's inputs; with incremental, keep
+        # roles of the previous config whose inputs are unchanged
+        catalog_fingerprint = get_catalog_handle().fingerprint_of(models) or compute_fingerprint(models)
+        interpreter = "offline" if no_llm else f"llm:{resolve_generator_model(hub, 'llm.generator') or 'unknown'}"
+        fingerprints = compute_role_fingerprints(spec, catalog_fingerprint, selector_options, interpreter)
         
-        selections = []
-        for need in needs:
-            selection = select_for_role(need, models, selector_options)
-            selections.append(selection)
+        previous = _load_previous_config(output_path) if incremental and output_path else None
+        if previous is not None:
+            recorded = {role_id: meta.fingerprint for role_id, meta in (previous.meta or {}).items()}
+            stale = set(stale_roles(fingerprints, recorded))
+            carried = [r for r in spec.roles if r not in stale and r in previous.roles]
+        else:
+            carried = []
+        pending = spec.model_copy(update={"roles": {
+            role_id: role for role_id, role in spec.roles.items() if role_id not in carried
+        }})
         
-        # Step 5: Build machine config (SP10)
-        machine_config = build_machine_config(spec, selections)
+        # Step 4: Interpret needs via LLM, or locally (SP2)
+        if not pending.roles:
+            needs = []
+        elif no_llm:
+            needs = interpret_needs_offline(pending)
+        else:
+            needs = interpret_needs(
+                pending,
+                hub,
+                use_cache=use_needs_cache,
+                shard_size=interpret_shard_size
+            )
         
-        # Step 6: Write to file if path provided
+        # Step 5: Select models for each role (SP9)
+        selections = select_for_roles(needs, models, selector_options, use_cache=use_selection_cache)
+        
+        # Step 6: Build machine config (SP10)
+        machine_config = build_machine_config(spec, selections, fingerprints)
+        if carried:
+            machine_config = carry_over_roles(spec, machine_config, previous, carried)
+        
+        # Step 7: Write to file if path provided
         if output_path:
             write_machine_config(output_path, machine_config)
         
@@ -115,6 +173,17 @@ def generate_machine_config(
         raise GeneratorError(f"Unexpected error in generator: {str(e)}") from e
 
 
+def _load_previous_config(path: str) -> Optional[MachineConfig]:
+    """Load the config to update incrementally; None if missing or unreadable."""
+    try:
+        return load_machine_config(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable previous config %s: %s", path, e)
+        return None
+
+
 # Import from generator_hook for simple runtime generation API
 from ..generator_hook import (
     generate_runtime,
@@ -140,6 +209,7 @@ def generate_runtime_from_spec(
         options: Optional GeneratorOptions to control generation behavior:
             - no_llm (bool): Use heuristic-only mode without LLM assistance
             - explain (bool): Include explanations for model selections
+            - no_cache (bool): With no_llm, ignore cached model selections
     
     Returns:
         GenerationResult object containing:
@@ -199,9 +269,11 @@ __all__ = [
     "load_project_spec",
     "parse_project_spec",
     "interpret_needs",
+    "interpret_needs_offline",
     "parse_role_needs",
     "load_catalog_view",
     "select_for_role",
+    "select_for_roles",
     "build_machine_config",
     "write_machine_config",
     # Options
@@ -12,7 +12,8 @@ from .errors import CatalogViewError
 def load_catalog_view(
     ttl_hours: int = 24,
     force_refresh: bool = False,
-    catalog_override: Optional[List[CanonicalModel]] = None
+    catalog_override: Optional[List[CanonicalModel]] = None,
+    max_stale_hours: Optional[float] = None
 ) -> List[CanonicalModel]:
     """
     Load catalog as list of CanonicalModel objects.
@@ -21,6 +22,8 @@ def load_catalog_view(
         ttl_hours: Cache TTL in hours (default 24)
         force_refresh: Force rebuild of catalog (default False)
         catalog_override: Optional override for testing (default None)
+        max_stale_hours: Serve an expired cache up to this age while it is
+            rebuilt in the background (default None)
         
     Returns:
         List of CanonicalModel instances
@@ -34,7 +37,11 @@ def load_catalog_view(
     
     try:
         # Load catalog using catalog module
-        catalog = build_catalog(ttl_hours=ttl_hours, force_refresh=force_refresh)
+        catalog = build_catalog(
+            ttl_hours=ttl_hours,
+            force_refresh=force_refresh,
+            max_stale_hours=max_stale_hours
+        )
         return catalog.models
         
     except Exception as e:
@@ -4,12 +4,15 @@ SP10 - Machine Config Emitter: Build and emit machine config.
 Exports:
     - MachineConfig (model)
     - build_machine_config, write_machine_config (functions)
+    - load_machine_config, carry_over_roles (incremental generation)
 """
 from .models import MachineConfig
-from .builder import build_machine_config, write_machine_config
+from .builder import build_machine_config, write_machine_config, load_machine_config, carry_over_roles
 
 __all__ = [
     "MachineConfig",
     "build_machine_config",
     "write_machine_config",
+    "load_machine_config",
+    "carry_over_roles",
 ]
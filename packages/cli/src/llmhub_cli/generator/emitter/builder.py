@@ -4,8 +4,9 @@ SP10 - Machine Config Emitter: Config builder and writer.
 Builds MachineConfig from selections and writes to YAML.
 """
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 import yaml
+from llmhub_cli.fingerprints import RoleFingerprint
 from llmhub_cli.generator.spec import ProjectSpec
 from llmhub_cli.generator.selection import SelectionResult
 from .models import (
@@ -16,9 +17,20 @@ from .models import (
 )
 
 
+# Default API key variables for providers selected but not listed in the spec
+PROVIDER_ENV_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+    "mistral": "MISTRAL_API_KEY",
+}
+
+
 def build_machine_config(
     spec: ProjectSpec,
-    selections: List[SelectionResult]
+    selections: List[SelectionResult],
+    fingerprints: Optional[Dict[str, RoleFingerprint]] = None
 ) -> MachineConfig:
     """
     Build MachineConfig from ProjectSpec and SelectionResults.
@@ -26,6 +38,7 @@ def build_machine_config(
     Args:
         spec: Original ProjectSpec
         selections: List of SelectionResult for each role
+        fingerprints: Optional per-role input fingerprints to record in meta
         
     Returns:
         MachineConfig ready for runtime
@@ -44,14 +57,7 @@ def build_machine_config(
     for selection in selections:
         if selection.primary_provider and selection.primary_provider not in providers:
             # Infer env_key from provider name
-            env_key_map = {
-                "openai": "OPENAI_API_KEY",
-                "anthropic": "ANTHROPIC_API_KEY",
-                "google": "GOOGLE_API_KEY",
-                "deepseek": "DEEPSEEK_API_KEY",
-                "mistral": "MISTRAL_API_KEY",
-            }
-            env_key = env_key_map.get(selection.primary_provider.lower())
+            env_key = PROVIDER_ENV_KEYS.get(selection.primary_provider.lower())
             providers[selection.primary_provider] = MachineProviderConfig(env_key=env_key)
     
     # Build roles dict
@@ -76,7 +82,8 @@ def build_machine_config(
             meta[selection.role_id] = MachineRoleMeta(
                 rationale=selection.rationale,
                 relaxations_applied=selection.relaxations_applied,
-                backups=selection.backups
+                backups=selection.backups,
+                fingerprint=(fingerprints or {}).get(selection.role_id)
             )
     
     return MachineConfig(
@@ -88,6 +95,72 @@ def build_machine_config(
     )
 
 
+def carry_over_roles(
+    spec: ProjectSpec,
+    config: MachineConfig,
+    previous: MachineConfig,
+    role_ids: Iterable[str]
+) -> MachineConfig:
+    """
+    Merge unchanged roles from a previous config into a freshly built one.
+    
+    Args:
+        spec: Current ProjectSpec (defines role order)
+        config: Config built for the regenerated roles
+        previous: Previously generated config
+        role_ids: Roles to copy from previous unchanged
+        
+    Returns:
+        MachineConfig with roles in spec order
+    """
+    carried = set(role_ids)
+    previous_meta = previous.meta or {}
+    fresh_meta = config.meta or {}
+    
+    roles: Dict[str, MachineRoleConfig] = {}
+    meta: Dict[str, MachineRoleMeta] = {}
+    for role_id in spec.roles:
+        source, source_meta = (previous.roles, previous_meta) if role_id in carried else (config.roles, fresh_meta)
+        if role_id in source:
+            roles[role_id] = source[role_id]
+        if role_id in source_meta:
+            meta[role_id] = source_meta[role_id]
+    
+    # Keep providers used by carried roles
+    providers = dict(config.providers)
+    for role_id in carried & set(roles):
+        provider = roles[role_id].provider
+        if provider not in providers and provider in previous.providers:
+            providers[provider] = previous.providers[provider]
+    
+    return MachineConfig(
+        project=config.project,
+        env=config.env,
+        providers=providers,
+        roles=roles,
+        meta=meta if meta else None
+    )
+
+
+def load_machine_config(path: str) -> MachineConfig:
+    """
+    Load a previously written MachineConfig.
+    
+    Args:
+        path: Path to llmhub.yaml
+        
+    Returns:
+        MachineConfig
+        
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid machine config
+    """
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f)
+    return MachineConfig.model_validate(data)
+
+
 def write_machine_config(path: str, config: MachineConfig) -> None:
     """
     Write MachineConfig to YAML file.
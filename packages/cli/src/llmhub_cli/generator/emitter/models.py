@@ -1,6 +1,7 @@
 """SP10 - Machine Config Emitter: Data models."""
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
+from llmhub_cli.fingerprints import RoleFingerprint
 
 
 class MachineProviderConfig(BaseModel):
@@ -21,6 +22,7 @@ class MachineRoleMeta(BaseModel):
     rationale: Optional[str] = None
     relaxations_applied: List[str] = Field(default_factory=list)
     backups: List[str] = Field(default_factory=list)
+    fingerprint: Optional[RoleFingerprint] = None  # Inputs the role was generated from
 
 
 class MachineConfig(BaseModel):
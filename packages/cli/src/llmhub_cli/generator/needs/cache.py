@@ -0,0 +1,118 @@
+"""
+SP2 - Needs Interpreter: On-disk cache of interpreted RoleNeeds.
+
+Each role's RoleNeed is stored under a key that combines the role's spec
+fragment, the spec defaults, the prompt template version and the generator
+model, so unchanged roles are never sent to the LLM again. Entries live in
+a "needs" directory next to the catalog cache, one JSON file per key.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+from pydantic import ValidationError
+from llmhub_runtime import LLMHub, RuntimeConfig
+from llmhub_runtime.errors import LLMHubRuntimeError
+from llmhub_runtime.resolver import resolve_role
+from llmhub_cli.catalog import cache as catalog_cache
+from llmhub_cli.generator.spec import ProjectSpec
+from .models import RoleNeed
+from .prompt import prompt_fingerprint
+
+
+def _get_needs_cache_dir() -> Path:
+    """Get directory holding cached RoleNeeds."""
+    return catalog_cache._get_cache_dir() / "needs"
+
+
+def resolve_generator_model(hub: LLMHub, model_role: str) -> Optional[str]:
+    """
+    Identify the model that interprets specs, as part of the cache key.
+
+    Args:
+        hub: LLMHub used for interpretation
+        model_role: Role name in hub config
+
+    Returns:
+        "provider:model" plus call params, or None if the hub has no
+        resolvable runtime config (results are then not cached)
+    """
+    config = getattr(hub, "config", None)
+    if not isinstance(config, RuntimeConfig):
+        return None
+
+    try:
+        resolved = resolve_role(config, model_role)
+    except LLMHubRuntimeError:
+        return None
+
+    params = json.dumps(resolved.params, sort_keys=True, default=str)
+    return f"{resolved.provider}:{resolved.model} {params}"
+
+
+def role_cache_key(spec: ProjectSpec, role_id: str, generator_model: str) -> str:
+    """
+    Compute the cache key of one role of a spec.
+
+    Args:
+        spec: ProjectSpec containing the role
+        role_id: Role to key
+        generator_model: Result of resolve_generator_model
+
+    Returns:
+        Hex SHA-256 key
+    """
+    payload = {
+        "role_id": role_id,
+        "role": spec.roles[role_id].model_dump(mode="json"),
+        "defaults": spec.defaults.model_dump(mode="json") if spec.defaults else None,
+        "prompt": prompt_fingerprint(),
+        "generator_model": generator_model,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def load_cached_need(key: str) -> Optional[RoleNeed]:
+    """
+    Load a cached RoleNeed.
+
+    Args:
+        key: Key from role_cache_key
+
+    Returns:
+        RoleNeed, or None if missing or unreadable
+    """
+    path = _get_needs_cache_dir() / f"{key}.json"
+    try:
+        with open(path, "r") as f:
+            return RoleNeed.model_validate(json.load(f))
+    except (OSError, json.JSONDecodeError, ValidationError):
+        return None
+
+
+def save_cached_need(key: str, need: RoleNeed) -> None:
+    """
+    Save a RoleNeed atomically (temp file, then rename).
+
+    Failures are non-fatal; the role is simply interpreted again next time.
+
+    Args:
+        key: Key from role_cache_key
+        need: Interpreted RoleNeed
+    """
+    cache_dir = _get_needs_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=key, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(need.model_dump(mode="json"), f, indent=2)
+            os.replace(tmp, cache_dir / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        print(f"Warning: Failed to save interpreted needs cache: {e}")
@@ -4,89 +4,275 @@ SP2 - Needs Interpreter: LLM-based spec interpretation.
 Converts ProjectSpec to RoleNeeds using structured LLM output.
 """
 import json
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from llmhub_runtime import LLMHub
 from llmhub_cli.generator.spec import ProjectSpec
 from llmhub_cli.generator.needs.models import RoleNeed
 from llmhub_cli.generator.needs.schema import parse_role_needs
-from .errors import InterpreterError
-from .prompt import build_interpretation_prompt, ROLE_NEED_SCHEMA
+from .errors import InterpreterError, NeedsSchemaError
+from .prompt import build_interpretation_prompt, ROLE_NEED_SCHEMA, SYSTEM_PROMPT
+from .cache import resolve_generator_model, role_cache_key, load_cached_need, save_cached_need
 
 
 def interpret_needs(
     spec: ProjectSpec,
     hub: LLMHub,
-    model_role: str = "llm.generator"
+    model_role: str = "llm.generator",
+    use_cache: bool = True,
+    shard_size: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_retries: int = 1
 ) -> List[RoleNeed]:
     """
     Interpret human spec into canonical RoleNeeds using LLM.
     
+    Interpretations are cached per role (see needs.cache), so only roles
+    that are new or whose spec fragment, defaults, prompt or generator
+    model changed are sent to the LLM.
+    
     Args:
         spec: ProjectSpec from SP1
         hub: LLMHub instance for making LLM calls
         model_role: Role name in hub config (default: "llm.generator")
+        use_cache: If False, re-interpret every role (results are still
+            written to the cache)
+        shard_size: If set, interpret roles in shards of at most this many
+            roles with concurrent LLM calls instead of one prompt
+        max_concurrency: Maximum concurrent LLM calls in sharded mode
+        max_retries: Retries per failed shard in sharded mode. Roles of
+            shards that succeeded are cached even if another shard fails.
         
     Returns:
         List of RoleNeed objects
         
+    Raises:
+        InterpreterError: If LLM call or parsing fails
+    """
+    generator_model = resolve_generator_model(hub, model_role)
+    
+    # Look up cached interpretations (only when the generator model is known)
+    keys: Dict[str, str] = {}
+    cached: Dict[str, RoleNeed] = {}
+    if generator_model is not None:
+        for role_id in spec.roles:
+            keys[role_id] = role_cache_key(spec, role_id, generator_model)
+            if use_cache:
+                need = load_cached_need(keys[role_id])
+                if need is not None:
+                    cached[role_id] = need
+    
+    pending = [role_id for role_id in spec.roles if role_id not in cached]
+    if not pending:
+        return [cached[role_id] for role_id in spec.roles]
+    
+    # Interpret only the roles that are not cached
+    subset = spec
+    if cached:
+        subset = spec.model_copy(update={"roles": {role_id: spec.roles[role_id] for role_id in pending}})
+    if shard_size:
+        # Shards cache their roles as they succeed
+        fresh = _interpret_sharded(subset, hub, model_role, shard_size, max_concurrency, max_retries, keys)
+    else:
+        fresh = _interpret_with_llm(subset, hub, model_role)
+        for need in fresh:
+            if need.id in keys and need.id in pending:
+                save_cached_need(keys[need.id], need)
+    
+    if not cached:
+        return fresh
+    
+    # Merge in spec order; keep any extra roles the LLM returned
+    fresh_by_id = {need.id: need for need in fresh}
+    needs = []
+    for role_id in spec.roles:
+        need = cached.get(role_id) or fresh_by_id.get(role_id)
+        if need is not None:
+            needs.append(need)
+    needs.extend(need for need in fresh if need.id not in spec.roles)
+    return needs
+
+
+def _interpret_with_llm(
+    spec: ProjectSpec,
+    hub: LLMHub,
+    model_role: str
+) -> List[RoleNeed]:
+    """
+    Interpret all roles of spec with a single LLM call.
+    
     Raises:
         InterpreterError: If LLM call or parsing fails
     """
     try:
-        # Build prompt
-        prompt = build_interpretation_prompt(spec)
-        
-        # Prepare messages
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at interpreting LLM usage specifications and converting them into structured role requirements."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
+        # Parse into RoleNeed objects
+        return parse_role_needs(_request_raw_needs(spec, hub, model_role))
+    except InterpreterError:
+        raise
+    except Exception as e:
+        raise InterpreterError(f"Failed to interpret needs: {str(e)}") from e
+
+
+def _interpret_sharded(
+    spec: ProjectSpec,
+    hub: LLMHub,
+    model_role: str,
+    shard_size: int,
+    max_concurrency: int,
+    max_retries: int,
+    keys: Optional[Dict[str, str]] = None
+) -> List[RoleNeed]:
+    """
+    Interpret roles in small shards with concurrent LLM calls.
+    
+    Each shard is one prompt holding at most shard_size roles. Shards run on
+    a bounded thread pool; shards that fail (call error, invalid JSON,
+    invalid or missing roles) are retried up to max_retries times, without
+    re-running the shards that succeeded. Each successful shard's roles are
+    cached right away, so after a failure the next run only re-interprets
+    the failed roles.
+    
+    Args:
+        keys: role_id → needs cache key of the roles to cache
+    
+    Returns:
+        RoleNeeds in spec order
         
-        # Call LLM with structured output
-        # Note: This assumes the hub/runtime supports response_format parameter
-        response = hub.completion(
-            role=model_role,
-            messages=messages,
-            params_override={
-                "response_format": {"type": "json_object"},
-                "temperature": 0.3,
+    Raises:
+        InterpreterError: If any shard still fails after all retries
+    """
+    keys = keys or {}
+    shard_size = max(1, shard_size)
+    max_concurrency = max(1, max_concurrency)
+    max_retries = max(0, max_retries)
+    role_ids = list(spec.roles)
+    shards = [role_ids[i:i + shard_size] for i in range(0, len(role_ids), shard_size)]
+    raw_by_shard: Dict[int, List[Dict[str, Any]]] = {}
+    errors: Dict[int, str] = {}
+    pending = list(range(len(shards)))
+    
+    for _ in range(max_retries + 1):
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as pool:
+            futures = {
+                i: pool.submit(_request_shard, spec, shards[i], hub, model_role)
+                for i in pending
             }
-        )
-        
-        # Extract content
-        if hasattr(response, 'choices') and response.choices:
-            content = response.choices[0].message.content
-        elif isinstance(response, dict):
-            content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
-        else:
-            content = str(response)
         
-        # Parse JSON
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise InterpreterError(f"LLM returned invalid JSON: {str(e)}")
+        errors = {}
+        for i, future in futures.items():
+            try:
+                raw_by_shard[i], needs = future.result()
+            except InterpreterError as e:
+                errors[i] = str(e)
+                continue
+            for need in needs:
+                if need.id in keys and need.id in shards[i]:
+                    save_cached_need(keys[need.id], need)
         
-        # Extract role needs array
-        if "roles" in data:
-            raw_needs = data["roles"]
-        elif isinstance(data, list):
-            raw_needs = data
-        else:
-            raise InterpreterError(f"Unexpected response format: {data}")
+        pending = sorted(errors)
+        if not pending:
+            break
+    
+    if pending:
+        failed = [role_id for i in pending for role_id in shards[i]]
+        details = "\n".join(f"Roles {', '.join(shards[i])}: {errors[i]}" for i in pending)
+        raise InterpreterError(f"Failed to interpret roles {', '.join(failed)}:\n{details}")
+    
+    # Merge in shard (= spec) order and validate as a whole
+    raw_needs = [item for i in range(len(shards)) for item in raw_by_shard[i]]
+    try:
+        return parse_role_needs(raw_needs)
+    except NeedsSchemaError as e:
+        raise InterpreterError(f"Failed to interpret needs: {str(e)}") from e
+
+
+def _request_shard(
+    spec: ProjectSpec,
+    role_ids: List[str],
+    hub: LLMHub,
+    model_role: str
+) -> Tuple[List[Dict[str, Any]], List[RoleNeed]]:
+    """
+    Request raw needs for a subset of roles and check the shard is complete.
+    
+    Returns:
+        (raw role dicts, parsed RoleNeeds)
         
-        # Parse into RoleNeed objects
+    Raises:
+        InterpreterError: If the call fails or any role is missing or invalid
+    """
+    shard_spec = spec.model_copy(update={"roles": {role_id: spec.roles[role_id] for role_id in role_ids}})
+    try:
+        raw_needs = _request_raw_needs(shard_spec, hub, model_role)
         needs = parse_role_needs(raw_needs)
-        
-        return needs
-        
     except InterpreterError:
         raise
     except Exception as e:
         raise InterpreterError(f"Failed to interpret needs: {str(e)}") from e
+    
+    missing = set(role_ids) - {need.id for need in needs}
+    if missing:
+        raise InterpreterError(f"LLM response is missing roles: {', '.join(sorted(missing))}")
+    
+    return raw_needs, needs
+
+
+def _request_raw_needs(
+    spec: ProjectSpec,
+    hub: LLMHub,
+    model_role: str
+) -> List[Dict[str, Any]]:
+    """
+    Ask the LLM to interpret the roles of spec and return the raw role dicts.
+    
+    Raises:
+        InterpreterError: If the response is not valid JSON or has an
+            unexpected shape
+    """
+    # Build prompt
+    prompt = build_interpretation_prompt(spec)
+    
+    # Prepare messages
+    messages = [
+        {
+            "role": "system",
+            "content": SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+    
+    # Call LLM with structured output
+    # Note: This assumes the hub/runtime supports response_format parameter
+    response = hub.completion(
+        role=model_role,
+        messages=messages,
+        params_override={
+            "response_format": {"type": "json_object"},
+            "temperature": 0.3,
+        }
+    )
+    
+    # Extract content
+    if hasattr(response, 'choices') and response.choices:
+        content = response.choices[0].message.content
+    elif isinstance(response, dict):
+        content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
+    else:
+        content = str(response)
+    
+    # Parse JSON
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise InterpreterError(f"LLM returned invalid JSON: {str(e)}")
+    
+    # Extract role needs array
+    if "roles" in data:
+        return data["roles"]
+    elif isinstance(data, list):
+        return data
+    else:
+        raise InterpreterError(f"Unexpected response format: {data}")
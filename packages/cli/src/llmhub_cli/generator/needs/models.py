@@ -69,6 +69,24 @@ class RoleNeed(BaseModel):
         description="Minimum context window size in tokens"
     )
     
+    # ===== Latency Requirements =====
+    max_ttft_ms: Optional[int] = Field(
+        default=None,
+        description="Maximum typical time to first token in milliseconds"
+    )
+    
+    # ===== Expected Load =====
+    expected_rps: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="Expected peak requests per second"
+    )
+    tokens_per_request: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Expected input + output tokens per request"
+    )
+    
     # ===== Modalities =====
     modalities_in: list[str] = Field(
         default_factory=lambda: ["text"],
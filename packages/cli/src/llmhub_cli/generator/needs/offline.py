@@ -0,0 +1,165 @@
+"""
+SP2 - Needs Interpreter: Deterministic rule-based interpretation.
+
+Converts ProjectSpec to RoleNeeds without an LLM, from the role kind, its
+preferences and keywords in its description. Used for --no-llm generation:
+the same spec always yields the same RoleNeeds, with no network access.
+"""
+import re
+from typing import List, Optional, Tuple
+from llmhub_cli.generator.spec import ProjectSpec, RoleSpec, DefaultPreferences
+from .models import RoleNeed
+
+
+# Preference level → bias, for "more is better" preferences (quality)
+LEVEL_BIAS = {"low": 0.2, "medium": 0.5, "high": 0.8}
+
+# Preference level → bias, for "less is better" preferences (cost, latency):
+# asking for low cost means a strong bias towards cheap models
+INVERSE_LEVEL_BIAS = {"low": 0.8, "medium": 0.5, "high": 0.2}
+
+# Minimum context for roles that mention large inputs
+LONG_CONTEXT_MIN = 100000
+
+# (task_kind, description patterns), first match wins
+TASK_KIND_RULES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("reasoning", (r"reason", r"analy[sz]", r"math", r"logic", r"plan", r"code", r"coding", r"debug", r"complex")),
+    ("creative", (r"creative", r"stor(y|ies)", r"poem", r"marketing", r"copywrit", r"brainstorm", r"write", r"writing")),
+    ("factual", (r"extract", r"classif", r"summar", r"fact", r"retriev", r"search", r"lookup", r"answer")),
+]
+
+REASONING_PATTERNS = (r"chain[- ]of[- ]thought", r"step[- ]by[- ]step", r"deep reasoning", r"multi[- ]step reasoning")
+TOOLS_PATTERNS = (r"tool", r"function[- ]call", r"agent", r"api calls?")
+STRUCTURED_PATTERNS = (r"json", r"structured", r"schema")
+VISION_PATTERNS = (r"images?", r"vision", r"screenshots?", r"photos?", r"diagrams?")
+AUDIO_PATTERNS = (r"audio", r"speech", r"transcri", r"voice")
+LONG_CONTEXT_PATTERNS = (r"long (documents?|context|inputs?)", r"large (documents?|files?|inputs?)", r"entire (codebase|repository|book)", r"books?")
+CRITICAL_PATTERNS = (r"critical", r"production", r"customer[- ]facing", r"mission")
+HIGH_IMPORTANCE_PATTERNS = (r"important", r"accura(te|cy)", r"reliab")
+LOW_IMPORTANCE_PATTERNS = (r"prototyp", r"experiment", r"internal", r"draft")
+
+
+def _matches(text: str, patterns: Tuple[str, ...]) -> bool:
+    """Check whether any pattern matches at a word start in text."""
+    return any(re.search(rf"\b{pattern}", text) for pattern in patterns)
+
+
+def _level(value: Optional[str], default: Optional[str]) -> Optional[str]:
+    """Role preference level, falling back to the spec default."""
+    level = value or default
+    return level.lower() if level else None
+
+
+def _task_kind(kind: str, description: str) -> str:
+    """Infer task_kind from role kind and description keywords."""
+    if kind != "chat":
+        return "general"
+    for task_kind, patterns in TASK_KIND_RULES:
+        if _matches(description, patterns):
+            return task_kind
+    return "chat"
+
+
+def _importance(description: str) -> str:
+    """Infer importance from description keywords (medium by default)."""
+    if _matches(description, CRITICAL_PATTERNS):
+        return "critical"
+    if _matches(description, HIGH_IMPORTANCE_PATTERNS):
+        return "high"
+    if _matches(description, LOW_IMPORTANCE_PATTERNS):
+        return "low"
+    return "medium"
+
+
+def interpret_role_offline(
+    role_id: str,
+    role_spec: RoleSpec,
+    defaults: Optional[DefaultPreferences] = None,
+    enabled_providers: Optional[List[str]] = None,
+    disabled_providers: Optional[List[str]] = None
+) -> RoleNeed:
+    """
+    Interpret one role with deterministic rules.
+
+    Args:
+        role_id: Role identifier
+        role_spec: RoleSpec from the spec
+        defaults: Spec-wide default preferences
+        enabled_providers: Providers enabled in the spec (allowlist fallback)
+        disabled_providers: Providers disabled in the spec (blocked)
+
+    Returns:
+        RoleNeed for the role
+    """
+    prefs = role_spec.preferences
+    defaults = defaults or DefaultPreferences()
+    description = role_spec.description.lower()
+    kind = str(getattr(role_spec.kind, "value", role_spec.kind)).lower()
+
+    quality = _level(prefs.quality if prefs else None, defaults.quality)
+    cost = _level(prefs.cost if prefs else None, defaults.cost)
+    latency = _level(prefs.latency if prefs else None, defaults.latency)
+
+    # Provider constraints: explicit preferences, then defaults, then the
+    # providers enabled in the spec; a forced provider overrides them all
+    allowlist = (prefs.providers if prefs else None) or defaults.providers or enabled_providers or None
+    if role_spec.force_provider:
+        allowlist = [role_spec.force_provider]
+    blocklist = list((prefs.provider_blocklist if prefs else None) or [])
+    blocklist += [p for p in disabled_providers or [] if p not in blocklist and p not in (allowlist or [])]
+
+    modalities_in = ["text"]
+    modalities_out = ["text"]
+    if kind == "embedding":
+        modalities_out = ["embedding"]
+    elif kind == "image":
+        modalities_out = ["image"]
+    elif kind == "audio":
+        modalities_in = ["audio"]
+    else:
+        if _matches(description, VISION_PATTERNS):
+            modalities_in.append("image")
+        if _matches(description, AUDIO_PATTERNS):
+            modalities_in.append("audio")
+
+    return RoleNeed(
+        id=role_id,
+        task_kind=_task_kind(kind, description),
+        importance=_importance(description),
+        quality_bias=LEVEL_BIAS.get(quality, 0.5),
+        cost_bias=INVERSE_LEVEL_BIAS.get(cost, 0.5),
+        latency_sensitivity=INVERSE_LEVEL_BIAS.get(latency, 0.5),
+        reasoning_required=_matches(description, REASONING_PATTERNS),
+        tools_required=kind == "tool" or _matches(description, TOOLS_PATTERNS),
+        structured_output_required=_matches(description, STRUCTURED_PATTERNS),
+        context_min=LONG_CONTEXT_MIN if _matches(description, LONG_CONTEXT_PATTERNS) else None,
+        max_ttft_ms=prefs.max_ttft_ms if prefs else None,
+        expected_rps=prefs.expected_rps if prefs else None,
+        tokens_per_request=prefs.tokens_per_request if prefs else None,
+        modalities_in=modalities_in,
+        modalities_out=modalities_out,
+        provider_allowlist=list(allowlist) if allowlist else None,
+        provider_blocklist=blocklist or None,
+        model_denylist=(prefs.model_denylist if prefs else None) or None,
+        notes="Interpreted offline from role kind, preferences and description keywords",
+    )
+
+
+def interpret_needs_offline(spec: ProjectSpec) -> List[RoleNeed]:
+    """
+    Interpret human spec into canonical RoleNeeds with deterministic rules.
+
+    Args:
+        spec: ProjectSpec from SP1
+
+    Returns:
+        List of RoleNeed objects, in spec order
+    """
+    providers = spec.providers or {}
+    enabled = [name for name, provider in providers.items() if provider.enabled]
+    disabled = [name for name, provider in providers.items() if not provider.enabled]
+
+    return [
+        interpret_role_offline(role_id, role_spec, spec.defaults, enabled, disabled)
+        for role_id, role_spec in spec.roles.items()
+    ]
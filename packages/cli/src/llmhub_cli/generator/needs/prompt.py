@@ -3,9 +3,16 @@ SP2 - Needs Interpreter: Prompt building for LLM interpretation.
 
 Constructs prompts and schema for converting ProjectSpec to RoleNeeds.
 """
+import hashlib
 from llmhub_cli.generator.spec import ProjectSpec
 
 
+# Bump whenever the prompt wording changes; cached interpretations made with
+# an older prompt are then ignored (see needs.cache)
+PROMPT_VERSION = 3
+
+SYSTEM_PROMPT = "You are an expert at interpreting LLM usage specifications and converting them into structured role requirements."
+
 ROLE_NEED_SCHEMA = """
 {
   "roles": [
@@ -20,6 +27,9 @@ ROLE_NEED_SCHEMA = """
       "tools_required": "boolean",
       "structured_output_required": "boolean",
       "context_min": "int (minimum context window tokens, optional)",
+      "max_ttft_ms": "int (maximum time to first token in ms, only if the spec sets one, optional)",
+      "expected_rps": "float (expected peak requests per second, only if the spec sets one, optional)",
+      "tokens_per_request": "int (expected tokens per request, only if the spec sets one, optional)",
       "modalities_in": ["text", "image", "audio"],
       "modalities_out": ["text", "image", "audio"],
       "provider_allowlist": ["openai", "anthropic", ...] (optional),
@@ -34,6 +44,12 @@ ROLE_NEED_SCHEMA = """
 """
 
 
+def prompt_fingerprint() -> str:
+    """Identify the prompt template (version, system prompt and output schema)."""
+    template = f"{PROMPT_VERSION}\n{SYSTEM_PROMPT}\n{ROLE_NEED_SCHEMA}"
+    return hashlib.sha256(template.encode()).hexdigest()
+
+
 def build_interpretation_prompt(spec: ProjectSpec) -> str:
     """
     Build prompt for LLM to interpret ProjectSpec into RoleNeeds.
@@ -68,6 +84,12 @@ Description: {role_spec.description}
                 role_desc += f"Blocked providers: {', '.join(prefs.provider_blocklist)}\n"
             if prefs.model_denylist:
                 role_desc += f"Denied models: {', '.join(prefs.model_denylist)}\n"
+            if prefs.max_ttft_ms:
+                role_desc += f"Maximum time to first token: {prefs.max_ttft_ms} ms\n"
+            if prefs.expected_rps:
+                role_desc += f"Expected load: {prefs.expected_rps} requests/second\n"
+            if prefs.tokens_per_request:
+                role_desc += f"Tokens per request: {prefs.tokens_per_request}\n"
         
         if role_spec.force_provider:
             role_desc += f"Forced provider: {role_spec.force_provider}\n"
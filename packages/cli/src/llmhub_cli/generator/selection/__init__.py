@@ -3,16 +3,23 @@
 from llmhub_cli.generator.selection.filter import filter_candidates
 from llmhub_cli.generator.selection.weights import derive_weights
 from llmhub_cli.generator.selection.scorer import score_candidates
-from llmhub_cli.generator.selection.relaxer import relax_and_select
-from llmhub_cli.generator.selection.selector import select_for_role
+from llmhub_cli.generator.selection.relaxer import relax_and_select, ConstraintMasks
+from llmhub_cli.generator.selection.selector import select_for_role, select_for_roles
+from llmhub_cli.generator.selection.engine import ScoringEngine, engine_for
 from llmhub_cli.generator.selection.selector_models import SelectionResult, SelectorOptions
+from llmhub_cli.generator.selection.scorer import SCORER_VERSION
 
 __all__ = [
     "filter_candidates",
     "derive_weights",
     "score_candidates", 
     "relax_and_select",
+    "ConstraintMasks",
     "select_for_role",
+    "select_for_roles",
+    "ScoringEngine",
+    "engine_for",
     "SelectionResult",
-    "SelectorOptions"
+    "SelectorOptions",
+    "SCORER_VERSION"
 ]
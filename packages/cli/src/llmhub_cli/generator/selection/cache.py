@@ -0,0 +1,105 @@
+"""
+SP9 - Selector Orchestrator: On-disk cache of SelectionResults.
+
+A role's selection only depends on its RoleNeed, the SelectorOptions, the
+catalog and the scoring code, plus the current day (freshness scores are
+day-granular). Results are stored under a hash of those inputs in a
+"selections/<catalog fingerprint>" directory next to the catalog cache;
+directories of other catalogs are removed when a new catalog is first
+used, so a catalog refresh invalidates every cached selection.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Optional
+from pydantic import ValidationError
+from llmhub_cli.catalog import cache as catalog_cache
+from llmhub_cli.generator.needs import RoleNeed
+from .scorer import SCORER_VERSION
+from .selector_models import SelectionResult, SelectorOptions
+
+
+def _get_selection_cache_dir() -> Path:
+    """Get directory holding cached SelectionResults."""
+    return catalog_cache._get_cache_path().parent / "selections"
+
+
+def selection_cache_key(role: RoleNeed, options: SelectorOptions, catalog_fingerprint: str) -> str:
+    """
+    Compute the cache key of one role's selection.
+
+    Args:
+        role: RoleNeed to select for
+        options: Selection options
+        catalog_fingerprint: Fingerprint of the catalog selected from
+
+    Returns:
+        Hex SHA-256 key
+    """
+    payload = {
+        "role": role.model_dump(mode="json"),
+        "options": options.model_dump(mode="json"),
+        "catalog": catalog_fingerprint,
+        "scorer": SCORER_VERSION,
+        "as_of": date.today().isoformat(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def load_cached_selection(catalog_fingerprint: str, key: str) -> Optional[SelectionResult]:
+    """
+    Load a cached SelectionResult.
+
+    Args:
+        catalog_fingerprint: Fingerprint of the catalog selected from
+        key: Key from selection_cache_key
+
+    Returns:
+        SelectionResult, or None if missing or unreadable
+    """
+    path = _get_selection_cache_dir() / catalog_fingerprint / f"{key}.json"
+    try:
+        with open(path, "r") as f:
+            return SelectionResult.model_validate(json.load(f))
+    except (OSError, json.JSONDecodeError, ValidationError):
+        return None
+
+
+def save_cached_selection(catalog_fingerprint: str, key: str, result: SelectionResult) -> None:
+    """
+    Save a SelectionResult atomically (temp file, then rename).
+
+    Failures are non-fatal; the role is simply selected again next time.
+
+    Args:
+        catalog_fingerprint: Fingerprint of the catalog selected from
+        key: Key from selection_cache_key
+        result: SelectionResult to cache
+    """
+    cache_dir = _get_selection_cache_dir() / catalog_fingerprint
+    try:
+        if not cache_dir.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _prune_other_catalogs(cache_dir)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=key, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(result.model_dump(mode="json"), f, indent=2)
+            os.replace(tmp, cache_dir / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        print(f"Warning: Failed to save selection cache: {e}")
+
+
+def _prune_other_catalogs(keep: Path) -> None:
+    """Remove cached selections made against other catalogs."""
+    for path in keep.parent.iterdir():
+        if path != keep and path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
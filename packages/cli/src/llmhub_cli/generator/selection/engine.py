@@ -0,0 +1,319 @@
+"""
+SP7 - Scoring Engine: Vectorized scoring over a precomputed feature matrix.
+
+The role-independent part of every score (quality, cost, reasoning,
+creative, latency, reliability) is computed once per catalog into a
+feature matrix, backed by the persisted FeatureTable (see features.py);
+freshness depends on the current time and is computed when scoring. Scoring a role is then a weighted sum of columns plus the
+role's context vector, scaled by reliability and capacity, and scoring many roles at
+once is a (models × features) by (features × roles) product. Ranking keeps
+the scorer's tie-breaking order: score, provider allowlist membership,
+arena score, context tokens (all descending), then model_id ascending.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection.weights_models import Weights
+from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.catalog.memo import IdentityMemo
+from llmhub_cli.catalog.index import index_for, Or, Provider
+from llmhub_cli.generator.selection.features import TIER_FEATURES, feature_table_for
+from llmhub_cli.generator.selection.scorer import required_rpm, required_tpm
+
+
+# Role-independent features; FeatureMatrix.values holds TIER_FEATURES in
+# this order, freshness is computed at scoring time
+FEATURES = TIER_FEATURES + ("freshness",)
+
+# Upper bound on (candidates × roles) elements scored in one block
+_MAX_BLOCK_ELEMENTS = 1 << 22
+
+
+class FeatureMatrix:
+    """
+    Role-independent per-model features and tie-break keys.
+
+    Built from the model list's FeatureTable (persisted for the memoized
+    catalog). Freshness is not stored: it is computed as of the time of
+    each scoring call, so a long-lived engine does not go stale.
+    """
+
+    def __init__(self, models: Sequence[CanonicalModel]) -> None:
+        table = feature_table_for(models)
+        self._table = table
+        self.size = table.size
+        self.values = table.tiers
+        self.context_tokens = table.context_tokens
+        self.arena = table.arena
+        self.rate_limit_rpm = table.rate_limit_rpm
+        self.rate_limit_tpm = table.rate_limit_tpm
+        self.model_id_rank = table.model_id_rank
+
+    def column(self, name: str) -> np.ndarray:
+        """Feature column by name (see FEATURES), freshness as of now."""
+        if name == "freshness":
+            return self.freshness()
+        return self.values[:, TIER_FEATURES.index(name)]
+
+    def freshness(self, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Freshness scores as of now for positions (default: all models)."""
+        return self._table.freshness(positions)
+
+
+def _context_scores(context_tokens: np.ndarray, role: RoleNeed) -> np.ndarray:
+    """Vectorized scorer._compute_context_score for one role."""
+    known = context_tokens != 0
+
+    if role.context_min:
+        excess = context_tokens - role.context_min
+        scores = 0.5 + 0.5 * np.minimum(1.0, excess / 100000)
+        scores = np.where(excess < 0, 0.0, scores)
+    else:
+        scores = np.minimum(1.0, context_tokens / 200000)
+
+    return np.where(known, scores, 0.5)
+
+
+def _capacity_scores(rpm: np.ndarray, tpm: np.ndarray, role: RoleNeed) -> np.ndarray:
+    """Vectorized scorer._compute_capacity_score for one role."""
+    scores = np.ones(len(rpm))
+    for limits, required in ((rpm, required_rpm(role)), (tpm, required_tpm(role))):
+        if required:
+            known = ~np.isnan(limits)
+            scores = np.where(known, np.minimum(scores, np.minimum(1.0, limits / required)), scores)
+    return scores
+
+
+def _weight_matrix(weights: Sequence[Weights]) -> np.ndarray:
+    """Stack weights into a (7 × roles) matrix in scoring order."""
+    return np.array(
+        [
+            [w.w_quality for w in weights],
+            [w.w_cost for w in weights],
+            [w.w_reasoning for w in weights],
+            [w.w_creative for w in weights],
+            [w.w_context for w in weights],
+            [w.w_freshness for w in weights],
+            [w.w_latency for w in weights],
+        ],
+        dtype=np.float64,
+    ).reshape(7, len(weights))
+
+
+class ScoringEngine:
+    """
+    Scores and ranks catalog models for one or many roles.
+
+    Candidates are addressed by their position in the catalog list, which
+    is what CatalogIndex queries return.
+    """
+
+    def __init__(self, models: Sequence[CanonicalModel]) -> None:
+        self.models = models
+        self.features = FeatureMatrix(models)
+        self._positions: Optional[Dict[int, int]] = None
+
+    def positions_of(self, models: Sequence[CanonicalModel]) -> Optional[np.ndarray]:
+        """
+        Positions of models (by identity) in this engine's model list.
+
+        Returns:
+            Position array aligned with models, or None if any model is not
+            one of this engine's models
+        """
+        if self._positions is None:
+            self._positions = {id(model): i for i, model in enumerate(self.models)}
+        positions = np.empty(len(models), dtype=np.intp)
+        for j, model in enumerate(models):
+            i = self._positions.get(id(model))
+            if i is None:
+                return None
+            positions[j] = i
+        return positions
+
+    def score_matrix(
+        self,
+        roles: Sequence[RoleNeed],
+        weights: Sequence[Weights],
+        positions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Score candidates for several roles at once.
+
+        The weighted sum is accumulated feature by feature in the scalar
+        scorer's order so results match it exactly.
+
+        Args:
+            roles: RoleNeeds (used for the per-role context and capacity vectors)
+            weights: Weights, one per role
+            positions: Candidate positions (default: all models)
+
+        Returns:
+            Array of shape (len(positions), len(roles))
+        """
+        values = self.features.values
+        context_tokens = self.features.context_tokens
+        rpm, tpm = self.features.rate_limit_rpm, self.features.rate_limit_tpm
+        if positions is not None:
+            values = values[positions]
+            context_tokens = context_tokens[positions]
+            rpm, tpm = rpm[positions], tpm[positions]
+        freshness = self.features.freshness(positions)[:, None]
+
+        w = _weight_matrix(weights)
+        context = np.column_stack([_context_scores(context_tokens, role) for role in roles]) if roles else \
+            np.empty((len(context_tokens), 0))
+
+        def column(name: str) -> np.ndarray:
+            j = TIER_FEATURES.index(name)
+            return values[:, j:j + 1]
+
+        scores = column("quality") * w[0]
+        scores = scores + column("cost") * w[1]
+        scores = scores + column("reasoning") * w[2]
+        scores = scores + column("creative") * w[3]
+        scores = scores + context * w[4]
+        scores = scores + freshness * w[5]
+        scores = scores + column("latency") * w[6]
+        scores = scores * column("reliability")
+
+        if any(required_rpm(role) for role in roles):
+            capacity = np.column_stack([_capacity_scores(rpm, tpm, role) for role in roles])
+            scores = scores * capacity
+        return scores
+
+    def score(self, role: RoleNeed, weights: Weights, positions: np.ndarray) -> np.ndarray:
+        """Scores of candidates for a single role."""
+        return self.score_matrix([role], [weights], positions)[:, 0]
+
+    def rank(
+        self,
+        role: RoleNeed,
+        positions: np.ndarray,
+        scores: np.ndarray,
+        top_k: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Order scored candidates best-first with the scorer's tie-breakers.
+
+        With top_k, only candidates scoring at least the k-th best score are
+        sorted (found with argpartition), which yields the same prefix as a
+        full sort.
+
+        Args:
+            role: RoleNeed (its provider allowlist is a tie-breaker)
+            positions: Candidate positions
+            scores: Scores aligned with positions
+            top_k: Optional number of results to return
+
+        Returns:
+            Tuple of (ordered positions, ordered scores)
+        """
+        if top_k is not None and top_k < len(positions):
+            if top_k <= 0:
+                return positions[:0], scores[:0]
+            kth = scores[np.argpartition(-scores, top_k - 1)[top_k - 1]]
+            keep = np.flatnonzero(scores >= kth)
+            positions, scores = positions[keep], scores[keep]
+
+        if role.provider_allowlist:
+            allowed = index_for(self.models).mask(Or(*(Provider(p) for p in role.provider_allowlist)))
+            in_allowlist = allowed[positions].astype(np.int8)
+        else:
+            in_allowlist = np.zeros(len(positions), dtype=np.int8)
+
+        f = self.features
+        order = np.lexsort((
+            f.model_id_rank[positions],
+            -f.context_tokens[positions],
+            -f.arena[positions],
+            -in_allowlist,
+            -scores,
+        ))
+        if top_k is not None:
+            order = order[:top_k]
+        return positions[order], scores[order]
+
+    def rank_candidates(
+        self,
+        role: RoleNeed,
+        weights: Weights,
+        positions: np.ndarray,
+        top_k: Optional[int] = None
+    ) -> List[Tuple[CanonicalModel, float]]:
+        """
+        Score and rank candidates for one role.
+
+        Returns:
+            List of (model, score) tuples, best first
+        """
+        ranked, scores = self.rank(role, positions, self.score(role, weights, positions), top_k)
+        return [(self.models[i], float(s)) for i, s in zip(ranked, scores)]
+
+    def rank_many(
+        self,
+        roles: Sequence[RoleNeed],
+        weights: Sequence[Weights],
+        candidates: Sequence[np.ndarray],
+        top_k: Optional[int] = None
+    ) -> List[List[Tuple[CanonicalModel, float]]]:
+        """
+        Score and rank candidates for many roles with blocked matrix products.
+
+        Roles are scored in blocks against the union of their candidates so
+        the score matrix stays bounded in memory.
+
+        Args:
+            roles: RoleNeeds
+            weights: Weights, one per role
+            candidates: Candidate positions, one array per role
+            top_k: Optional number of results per role
+
+        Returns:
+            Ranked (model, score) lists, one per role
+        """
+        results: List[List[Tuple[CanonicalModel, float]]] = []
+        n = max(self.features.size, 1)
+        block = max(1, _MAX_BLOCK_ELEMENTS // n)
+
+        for start in range(0, len(roles), block):
+            block_roles = roles[start:start + block]
+            block_candidates = candidates[start:start + block]
+            union = np.unique(np.concatenate(block_candidates)) if block_candidates else np.empty(0, dtype=np.intp)
+            matrix = self.score_matrix(block_roles, weights[start:start + block], union)
+
+            for j, (role, positions) in enumerate(zip(block_roles, block_candidates)):
+                rows = np.searchsorted(union, positions)
+                ranked, scores = self.rank(role, positions, matrix[rows, j], top_k)
+                results.append([(self.models[i], float(s)) for i, s in zip(ranked, scores)])
+
+        return results
+
+
+_engine_memo: IdentityMemo[ScoringEngine] = IdentityMemo(ScoringEngine)
+
+
+def engine_for(models: Sequence[CanonicalModel]) -> ScoringEngine:
+    """
+    Return the ScoringEngine for a model list, building its feature matrix
+    on first use.
+    """
+    return _engine_memo.get(models)
+
+
+def engine_containing(models: Sequence[CanonicalModel]) -> Tuple[ScoringEngine, np.ndarray]:
+    """
+    Engine and positions for a subset of a catalog (e.g. filtered candidates).
+
+    Uses an already built engine whose model list contains every model;
+    otherwise builds a throwaway engine for models alone, which is not
+    memoized so it cannot evict a catalog's engine.
+
+    Returns:
+        Tuple of (engine, positions of models in engine.models)
+    """
+    for engine in _engine_memo.cached():
+        positions = engine.positions_of(models)
+        if positions is not None:
+            return engine, positions
+    return ScoringEngine(models), np.arange(len(models))
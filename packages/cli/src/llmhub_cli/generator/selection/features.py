@@ -0,0 +1,276 @@
+"""
+SP7 - Scoring Engine: Per-model feature table.
+
+Holds everything the scorer derives from a model on its own: normalized
+quality/cost/reasoning/creative/latency/reliability scores, the parsed
+model date, context and arena tie-break keys, rate limits, and the
+model_id sort rank. None of it depends on a role or on the current time,
+so for the memoized catalog the table is persisted next to the catalog
+cache, keyed by the catalog fingerprint, and later runs load it instead of
+re-parsing dates and re-normalizing tiers.
+
+Freshness depends on the current time and is computed from the stored
+dates when the table is used.
+"""
+import os
+import tempfile
+import zipfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Sequence
+import numpy as np
+from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.catalog.handle import get_catalog_handle
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.generator.selection import scorer
+
+
+# Bump when the stored features or their computation change
+FEATURE_TABLE_VERSION = 4
+
+# Per-model score columns, in FeatureTable.tiers column order
+TIER_FEATURES = ("quality", "cost", "reasoning", "creative", "latency", "reliability")
+
+# date_kind values
+DATE_UNKNOWN = 0
+DATE_NAIVE = 1
+DATE_AWARE = 2
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+
+_ARRAYS = (
+    "tiers", "date_us", "date_kind", "context_tokens", "arena", "model_id_rank",
+    "rate_limit_rpm", "rate_limit_tpm",
+)
+
+
+def _date_columns(models: Sequence[CanonicalModel]):
+    """
+    Parse model dates into microseconds since the epoch.
+
+    Naive dates are measured against a naive epoch and aware dates against
+    UTC, mirroring how the scalar scorer compares them with datetime.now().
+    """
+    n = len(models)
+    date_us = np.zeros(n, dtype=np.int64)
+    date_kind = np.full(n, DATE_UNKNOWN, dtype=np.int8)
+
+    for i, model in enumerate(models):
+        date_str = model.last_updated or model.release_date
+        if not date_str:
+            continue
+        model_date = scorer._parse_model_date(date_str)
+        if model_date is None:
+            continue
+        if model_date.tzinfo:
+            date_us[i] = (model_date - _EPOCH_AWARE) // _MICROSECOND
+            date_kind[i] = DATE_AWARE
+        else:
+            date_us[i] = (model_date - _EPOCH_NAIVE) // _MICROSECOND
+            date_kind[i] = DATE_NAIVE
+
+    return date_us, date_kind
+
+
+class FeatureTable:
+    """
+    Role- and time-independent features of a model list, one row per model.
+
+    Attributes:
+        tiers: (n × 6) normalized scores, columns as in TIER_FEATURES
+        date_us: Model date in microseconds since the epoch
+        date_kind: DATE_UNKNOWN, DATE_NAIVE or DATE_AWARE
+        context_tokens: Context window, unknown as 0
+        arena: Arena score, unknown as 0
+        model_id_rank: Dense rank of model_id in ascending string order
+        rate_limit_rpm: Requests per minute, unknown as NaN
+        rate_limit_tpm: Tokens per minute, unknown as NaN
+    """
+
+    def __init__(
+        self,
+        tiers: np.ndarray,
+        date_us: np.ndarray,
+        date_kind: np.ndarray,
+        context_tokens: np.ndarray,
+        arena: np.ndarray,
+        model_id_rank: np.ndarray,
+        rate_limit_rpm: np.ndarray,
+        rate_limit_tpm: np.ndarray
+    ) -> None:
+        self.tiers = tiers
+        self.date_us = date_us
+        self.date_kind = date_kind
+        self.context_tokens = context_tokens
+        self.arena = arena
+        self.model_id_rank = model_id_rank
+        self.rate_limit_rpm = rate_limit_rpm
+        self.rate_limit_tpm = rate_limit_tpm
+
+    @property
+    def size(self) -> int:
+        """Number of models in the table."""
+        return len(self.date_us)
+
+    @classmethod
+    def build(cls, models: Sequence[CanonicalModel]) -> "FeatureTable":
+        """
+        Compute the table with the scorer's per-model helpers, so that
+        vectorized scores are bitwise identical to scalar ones.
+
+        Args:
+            models: Models in catalog order
+
+        Returns:
+            FeatureTable
+        """
+        n = len(models)
+        tiers = np.empty((n, len(TIER_FEATURES)), dtype=np.float64)
+        for i, model in enumerate(models):
+            tiers[i] = (
+                scorer._compute_quality_score(model),
+                scorer._compute_cost_score(model),
+                scorer._compute_reasoning_score(model),
+                scorer._compute_creative_score(model),
+                scorer._compute_latency_score(model),
+                scorer._compute_reliability_score(model),
+            )
+
+        date_us, date_kind = _date_columns(models)
+
+        context_tokens = np.fromiter((m.context_tokens or 0 for m in models), dtype=np.float64, count=n)
+        arena = np.fromiter((m.arena_score or 0 for m in models), dtype=np.float64, count=n)
+        rate_limits = [
+            np.array([np.nan if v is None else v for v in (getattr(m, field) for m in models)], dtype=np.float64)
+            for field in ("rate_limit_rpm", "rate_limit_tpm")
+        ]
+
+        if n:
+            _, model_id_rank = np.unique(np.array([m.model_id for m in models], dtype=object), return_inverse=True)
+        else:
+            model_id_rank = np.empty(0, dtype=np.intp)
+
+        return cls(tiers, date_us, date_kind, context_tokens, arena, model_id_rank.astype(np.int64), *rate_limits)
+
+    def freshness(self, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Freshness scores as of now (vectorized scorer._compute_freshness_score).
+
+        Args:
+            positions: Rows to score (default: all models)
+
+        Returns:
+            Array of freshness scores in [0, 1]
+        """
+        date_us, date_kind = self.date_us, self.date_kind
+        if positions is not None:
+            date_us, date_kind = date_us[positions], date_kind[positions]
+
+        now_naive = (datetime.now() - _EPOCH_NAIVE) // _MICROSECOND
+        now_aware = (datetime.now(timezone.utc) - _EPOCH_AWARE) // _MICROSECOND
+        now = np.where(date_kind == DATE_AWARE, now_aware, now_naive)
+
+        # Floor division matches timedelta.days
+        age = (now - date_us) // _US_PER_DAY
+        age_f = age.astype(np.float64)
+
+        scores = np.select(
+            [age <= 0, age <= 365, age <= 730],
+            [1.0, 1.0 - 0.5 * (age_f / 365), 0.5 - 0.5 * ((age_f - 365) / 365)],
+            0.0,
+        )
+        return np.where(date_kind == DATE_UNKNOWN, 0.5, scores)
+
+    def save(self, path: Path) -> None:
+        """
+        Write the table atomically (temp file, then rename).
+
+        Args:
+            path: Destination .npz path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    version=np.array(FEATURE_TABLE_VERSION),
+                    **{name: getattr(self, name) for name in _ARRAYS},
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path, size: int) -> Optional["FeatureTable"]:
+        """
+        Read a table written by save().
+
+        Args:
+            path: .npz path
+            size: Expected number of models
+
+        Returns:
+            FeatureTable, or None if the file is missing, unreadable, from
+            another table version or of the wrong size
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"]) != FEATURE_TABLE_VERSION:
+                    return None
+                table = cls(*(data[name] for name in _ARRAYS))
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+        if table.size != size or any(len(getattr(table, name)) != size for name in _ARRAYS):
+            return None
+        return table
+
+
+def _feature_table_path(fingerprint: str) -> Path:
+    """Path of the persisted table for a catalog fingerprint."""
+    return cache_module._get_features_dir() / f"v{FEATURE_TABLE_VERSION}-{fingerprint}.npz"
+
+
+def _prune_feature_tables(keep: Path) -> None:
+    """Remove tables of older catalogs; only the current catalog is cached."""
+    for path in keep.parent.glob("*.npz"):
+        if path != keep:
+            path.unlink(missing_ok=True)
+
+
+def feature_table_for(models: Sequence[CanonicalModel]) -> FeatureTable:
+    """
+    Return the feature table for a model list.
+
+    If models is the memoized catalog's model list, the table is loaded from
+    (or computed once and saved to) the features directory next to the
+    catalog cache. Any other list gets a freshly computed table.
+
+    Args:
+        models: Models in catalog order
+
+    Returns:
+        FeatureTable
+    """
+    fingerprint = get_catalog_handle().fingerprint_of(models)
+    if fingerprint is None:
+        return FeatureTable.build(models)
+
+    path = _feature_table_path(fingerprint)
+    table = FeatureTable.load(path, len(models))
+    if table is not None:
+        return table
+
+    table = FeatureTable.build(models)
+    try:
+        table.save(path)
+        _prune_feature_tables(path)
+    except OSError as e:
+        # Non-fatal - the table is simply recomputed next time
+        print(f"Warning: Failed to save feature table: {e}")
+    return table
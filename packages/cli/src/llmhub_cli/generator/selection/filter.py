@@ -2,10 +2,105 @@
 SP5 - Filter Candidates: Filtering logic.
 
 Applies hard constraints from RoleNeed to filter catalog models.
+Constraints are translated into CatalogIndex queries, so filtering is a
+few bitwise operations over precomputed bitsets.
 """
-from typing import List
+from typing import List, Tuple
 from llmhub_cli.generator.needs import RoleNeed
 from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.catalog.index import (
+    index_for,
+    Query,
+    And,
+    Or,
+    Not,
+    Provider,
+    ModelIn,
+    HasCapability,
+    InputModality,
+    OutputModality,
+    ContextRange,
+    TtftRange,
+    TtftUnknown,
+    RateLimitRange,
+    RateLimitUnknown,
+)
+from llmhub_cli.generator.selection.scorer import required_rpm, required_tpm
+
+
+def max_ttft_query(max_ttft_ms: float) -> Query:
+    """
+    Query for a time-to-first-token limit.
+
+    Most catalog models have no measured latency, so models with unknown
+    TTFT pass; only models measured as slower than the limit are excluded.
+    """
+    return Or(TtftRange(max=max_ttft_ms), TtftUnknown())
+
+
+def capacity_query(role: RoleNeed) -> Query:
+    """
+    Query for models whose rate limits sustain the role's expected load.
+
+    Models with unknown limits pass; only known limits below the required
+    requests (and tokens) per minute exclude a model.
+    """
+    queries: List[Query] = []
+    for name, required in (("rpm", required_rpm(role)), ("tpm", required_tpm(role))):
+        if required:
+            queries.append(Or(RateLimitRange(name, min=required), RateLimitUnknown(name)))
+    return And(*queries)
+
+
+def constraint_queries(role: RoleNeed) -> List[Tuple[str, Query]]:
+    """
+    Translate the hard constraints of a role into named index queries.
+
+    Only constraints that are actually set on the role are returned.
+
+    Args:
+        role: RoleNeed with constraints
+
+    Returns:
+        List of (constraint name, query) pairs
+    """
+    queries: List[Tuple[str, Query]] = []
+
+    if role.provider_allowlist:
+        queries.append(("provider_allowlist", Or(*(Provider(p) for p in role.provider_allowlist))))
+
+    if role.provider_blocklist:
+        queries.append(("provider_blocklist", Not(Or(*(Provider(p) for p in role.provider_blocklist)))))
+
+    if role.model_denylist:
+        # Matches both canonical_id and model_id
+        queries.append(("model_denylist", Not(ModelIn(role.model_denylist))))
+
+    if role.reasoning_required:
+        queries.append(("reasoning_required", HasCapability("reasoning")))
+
+    if role.tools_required:
+        queries.append(("tools_required", HasCapability("tool_call")))
+
+    if role.structured_output_required:
+        queries.append(("structured_output_required", HasCapability("structured_output")))
+
+    if role.modalities_in or role.modalities_out:
+        queries.append(("modalities", And(
+            *(InputModality(m) for m in role.modalities_in),
+            *(OutputModality(m) for m in role.modalities_out),
+        )))
+
+    if role.context_min is not None:
+        queries.append(("context_min", ContextRange(min=role.context_min)))
+
+    if role.max_ttft_ms is not None:
+        queries.append(("max_ttft_ms", max_ttft_query(role.max_ttft_ms)))
+
+    if required_rpm(role):
+        queries.append(("capacity", capacity_query(role)))
+
+    return queries
 
 
 def filter_candidates(
@@ -14,59 +109,14 @@ def filter_candidates(
 ) -> List[CanonicalModel]:
     """
     Filter models by hard constraints from role need.
-    
+
     Args:
         role: RoleNeed with constraints
         models: Full list of models from catalog
-        
+
     Returns:
-        Filtered list of candidate models
+        Filtered list of candidate models (in catalog order)
     """
-    candidates = []
-    
-    for model in models:
-        # Check provider allowlist
-        if role.provider_allowlist and model.provider not in role.provider_allowlist:
-            continue
-        
-        # Check provider blocklist
-        if role.provider_blocklist and model.provider in role.provider_blocklist:
-            continue
-        
-        # Check model denylist
-        if role.model_denylist:
-            # Check both canonical_id and model_id
-            if model.canonical_id in role.model_denylist or model.model_id in role.model_denylist:
-                continue
-        
-        # Check reasoning requirement
-        if role.reasoning_required and not model.supports_reasoning:
-            continue
-        
-        # Check tools requirement
-        if role.tools_required and not model.supports_tool_call:
-            continue
-        
-        # Check structured output requirement
-        if role.structured_output_required and not model.supports_structured_output:
-            continue
-        
-        # Check input modalities
-        for modality in role.modalities_in:
-            if modality not in model.input_modalities:
-                break
-        else:
-            # Check output modalities (only if input modalities passed)
-            for modality in role.modalities_out:
-                if modality not in model.output_modalities:
-                    break
-            else:
-                # Check context requirement
-                if role.context_min is not None:
-                    if model.context_tokens is None or model.context_tokens < role.context_min:
-                        continue
-                
-                # All constraints passed
-                candidates.append(model)
-    
-    return candidates
+    index = index_for(models)
+    query = And(*(q for _, q in constraint_queries(role)))
+    return index.select(query)
@@ -1,86 +1,182 @@
 """
 SP8 - Relaxation Engine: Constraint relaxation logic.
 
-Systematically relaxes constraints to find candidates.
+Systematically relaxes constraints to find candidates. Each hard constraint
+is evaluated once into a boolean mask over the catalog; a relaxation step
+only drops or swaps masks and recombines them, so no step re-filters the
+catalog. The masks also tell how many models each constraint eliminates,
+which explains why a role has no candidates.
 """
-from typing import List, Tuple
-from copy import deepcopy
+from typing import Dict, List, Mapping, Optional, Tuple
+import numpy as np
 from llmhub_cli.generator.needs import RoleNeed
 from llmhub_cli.generator.selection.weights_models import Weights
 from llmhub_cli.catalog.schema import CanonicalModel
-from llmhub_cli.generator.selection.filter import filter_candidates
-from llmhub_cli.generator.selection.scorer import score_candidates
+from llmhub_cli.catalog.index import index_for, ContextRange
+from llmhub_cli.generator.selection.filter import constraint_queries, max_ttft_query
+from llmhub_cli.generator.selection.engine import engine_for
+
+
+# Fraction of context_min kept when relaxing the context requirement
+CONTEXT_RELAXATION_FACTOR = 0.75
+
+# Multiplier applied to max_ttft_ms when relaxing the latency limit
+LATENCY_RELAXATION_FACTOR = 2.0
+
+
+class ConstraintMasks:
+    """
+    One candidate mask per hard constraint of a role.
+
+    Attributes:
+        total: Number of models in the catalog
+        masks: Constraint name → boolean mask of models satisfying it
+        eliminated: Constraint name → number of models failing it
+    """
+
+    def __init__(self, role: RoleNeed, models: List[CanonicalModel]) -> None:
+        self.total = len(models)
+        self._index = index_for(models)
+        self.masks: Dict[str, np.ndarray] = {
+            name: self._index.mask(query) for name, query in constraint_queries(role)
+        }
+        self.eliminated: Dict[str, int] = {
+            name: self.total - int(np.count_nonzero(mask)) for name, mask in self.masks.items()
+        }
+
+    def context_mask(self, context_min: int) -> np.ndarray:
+        """Mask for a (relaxed) minimum context size."""
+        return self._index.mask(ContextRange(min=context_min))
+
+    def ttft_mask(self, max_ttft_ms: float) -> np.ndarray:
+        """Mask for a (relaxed) time-to-first-token limit."""
+        return self._index.mask(max_ttft_query(max_ttft_ms))
+
+    def combine(self, overrides: Optional[Mapping[str, Optional[np.ndarray]]] = None) -> np.ndarray:
+        """
+        AND all constraint masks together.
+
+        Args:
+            overrides: Constraint name → replacement mask, or None to drop
+                the constraint
+
+        Returns:
+            Boolean mask of models satisfying every remaining constraint
+        """
+        overrides = overrides or {}
+        combined = np.ones(self.total, dtype=bool)
+        for name, mask in self.masks.items():
+            mask = overrides.get(name, mask)
+            if mask is not None:
+                combined &= mask
+        return combined
+
+    def positions(self, overrides: Optional[Mapping[str, Optional[np.ndarray]]] = None) -> np.ndarray:
+        """Catalog positions of models satisfying the (overridden) constraints."""
+        return np.flatnonzero(self.combine(overrides))
+
+    def diagnostic(self) -> str:
+        """
+        Describe how many models each constraint eliminates, worst first.
+
+        Returns:
+            Human-readable summary, empty if the role has no constraints
+        """
+        ranked = sorted(self.eliminated.items(), key=lambda item: -item[1])
+        return ", ".join(f"{name} eliminates {count}/{self.total}" for name, count in ranked)
 
 
 def relax_and_select(
     role: RoleNeed,
     models: List[CanonicalModel],
-    weights: Weights
+    weights: Weights,
+    masks: Optional[ConstraintMasks] = None,
+    top_k: Optional[int] = None
 ) -> Tuple[List[Tuple[CanonicalModel, float]], List[str]]:
     """
     Systematically relax constraints until candidates are found.
-    
+
     Args:
         role: RoleNeed with constraints
         models: Full catalog
         weights: Scoring weights
-        
+        masks: Precomputed ConstraintMasks for role (optional)
+        top_k: Optional number of ranked candidates to return
+
     Returns:
         Tuple of (scored_candidates, relaxations_applied)
     """
+    if masks is None:
+        masks = ConstraintMasks(role, models)
+
     relaxations = []
-    relaxed_role = deepcopy(role)
-    
+    overrides: Dict[str, Optional[np.ndarray]] = {}
+    updates: Dict[str, object] = {}
+
+    def attempt() -> List[Tuple[CanonicalModel, float]]:
+        positions = masks.positions(overrides)
+        if not positions.size:
+            return []
+        # Score against the relaxed role (context score, allowlist tie-break)
+        relaxed_role = role.model_copy(update=updates)
+        return engine_for(models).rank_candidates(relaxed_role, weights, positions, top_k)
+
     # Relaxation Step 1: Remove provider allowlist
-    if relaxed_role.provider_allowlist:
-        relaxed_role.provider_allowlist = None
+    if role.provider_allowlist:
+        overrides["provider_allowlist"] = None
+        updates["provider_allowlist"] = None
         relaxations.append("Removed provider allowlist")
-        
-        filtered = filter_candidates(relaxed_role, models)
-        if filtered:
-            scored = score_candidates(relaxed_role, weights, filtered)
+
+        scored = attempt()
+        if scored:
             return scored, relaxations
-    
+
     # Relaxation Step 2: Lower context_min by 25%
-    if relaxed_role.context_min:
-        original_context = relaxed_role.context_min
-        relaxed_role.context_min = int(relaxed_role.context_min * 0.75)
-        relaxations.append(f"Lowered context requirement from {original_context} to {relaxed_role.context_min}")
-        
-        filtered = filter_candidates(relaxed_role, models)
-        if filtered:
-            scored = score_candidates(relaxed_role, weights, filtered)
-            return scored, relaxations
-    
-    # Relaxation Step 3: Turn structured_output_required into preference
-    if relaxed_role.structured_output_required:
-        relaxed_role.structured_output_required = False
-        relaxations.append("Made structured output optional")
-        
-        filtered = filter_candidates(relaxed_role, models)
-        if filtered:
-            scored = score_candidates(relaxed_role, weights, filtered)
+    if role.context_min:
+        relaxed_context = int(role.context_min * CONTEXT_RELAXATION_FACTOR)
+        overrides["context_min"] = masks.context_mask(relaxed_context)
+        updates["context_min"] = relaxed_context
+        relaxations.append(f"Lowered context requirement from {role.context_min} to {relaxed_context}")
+
+        scored = attempt()
+        if scored:
             return scored, relaxations
-    
-    # Relaxation Step 4: Turn reasoning_required into preference
-    if relaxed_role.reasoning_required:
-        relaxed_role.reasoning_required = False
-        relaxations.append("Made reasoning optional")
-        
-        filtered = filter_candidates(relaxed_role, models)
-        if filtered:
-            scored = score_candidates(relaxed_role, weights, filtered)
+
+    # Relaxation Step 3: Raise max_ttft_ms
+    if role.max_ttft_ms:
+        relaxed_ttft = int(role.max_ttft_ms * LATENCY_RELAXATION_FACTOR)
+        overrides["max_ttft_ms"] = masks.ttft_mask(relaxed_ttft)
+        updates["max_ttft_ms"] = relaxed_ttft
+        relaxations.append(f"Raised time-to-first-token limit from {role.max_ttft_ms} ms to {relaxed_ttft} ms")
+
+        scored = attempt()
+        if scored:
             return scored, relaxations
-    
-    # Relaxation Step 5: Turn tools_required into preference
-    if relaxed_role.tools_required:
-        relaxed_role.tools_required = False
-        relaxations.append("Made tools optional")
-        
-        filtered = filter_candidates(relaxed_role, models)
-        if filtered:
-            scored = score_candidates(relaxed_role, weights, filtered)
+
+    # Relaxation Step 4: Accept models below the expected load; they are
+    # still ranked down by how much of it they can sustain
+    if "capacity" in masks.masks:
+        overrides["capacity"] = None
+        relaxations.append(f"Ignored rate limits below the expected load of {role.expected_rps:g} requests/second")
+
+        scored = attempt()
+        if scored:
             return scored, relaxations
-    
+
+    # Relaxation Steps 5-7: Turn required capabilities into preferences
+    for name, description in (
+        ("structured_output_required", "Made structured output optional"),
+        ("reasoning_required", "Made reasoning optional"),
+        ("tools_required", "Made tools optional"),
+    ):
+        if getattr(role, name):
+            overrides[name] = None
+            updates[name] = False
+            relaxations.append(description)
+
+            scored = attempt()
+            if scored:
+                return scored, relaxations
+
     # If still no candidates, return empty with all relaxations attempted
     return [], relaxations
@@ -3,13 +3,30 @@ SP7 - Scoring Engine: Model scoring and ranking logic.
 
 Computes weighted scores for models and ranks them.
 """
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from llmhub_cli.generator.needs import RoleNeed
 from llmhub_cli.generator.selection.weights_models import Weights
 from llmhub_cli.catalog.schema import CanonicalModel
 
 
+# Bump whenever weights, scoring, filtering or relaxation change the results
+# of select_for_role, so cached SelectionResults are not reused
+SCORER_VERSION = 4
+
+# Time to first token scoring 1.0 (or better) and 0.0 (or worse)
+FAST_TTFT_MS = 200.0
+SLOW_TTFT_MS = 3000.0
+
+# Output throughput scoring 1.0
+FAST_TOKENS_PER_SECOND = 150.0
+
+# Observed end-to-end call latency scoring 1.0 (or better) and 0.0 (or worse)
+FAST_CALL_MS = 1000.0
+SLOW_CALL_MS = 20000.0
+
+
 def _normalize_tier(tier: int) -> float:
     """Normalize tier (1-5) to score (1.0-0.0), where 1 is best."""
     return (6 - tier) / 5.0
@@ -71,28 +88,93 @@ def _compute_context_score(model: CanonicalModel, role: RoleNeed) -> float:
     return min(1.0, model.context_tokens / 200000)
 
 
+def _compute_latency_score(model: CanonicalModel) -> float:
+    """Compute normalized latency score (faster = higher score)."""
+    components = []
+    if model.ttft_ms is not None:
+        # Normalize: FAST_TTFT_MS → 1.0, SLOW_TTFT_MS → 0.0
+        ttft = (SLOW_TTFT_MS - model.ttft_ms) / (SLOW_TTFT_MS - FAST_TTFT_MS)
+        components.append(max(0.0, min(1.0, ttft)))
+    if model.output_tokens_per_second is not None:
+        components.append(max(0.0, min(1.0, model.output_tokens_per_second / FAST_TOKENS_PER_SECOND)))
+    if model.observed_latency_ms is not None:
+        # Normalize: FAST_CALL_MS → 1.0, SLOW_CALL_MS → 0.0
+        observed = (SLOW_CALL_MS - model.observed_latency_ms) / (SLOW_CALL_MS - FAST_CALL_MS)
+        components.append(max(0.0, min(1.0, observed)))
+    
+    if not components:
+        return 0.5  # Unknown = medium
+    return sum(components) / len(components)
+
+
+def _compute_reliability_score(model: CanonicalModel) -> float:
+    """Compute reliability multiplier (share of successful calls, 1.0 if unknown)."""
+    if model.error_rate is None:
+        return 1.0
+    return 1.0 - max(0.0, min(1.0, model.error_rate))
+
+
+def required_rpm(role: RoleNeed) -> Optional[float]:
+    """Requests per minute the role's expected load needs, if known."""
+    if not role.expected_rps:
+        return None
+    return role.expected_rps * 60
+
+
+def required_tpm(role: RoleNeed) -> Optional[float]:
+    """Tokens per minute the role's expected load needs, if known."""
+    rpm = required_rpm(role)
+    if rpm is None or not role.tokens_per_request:
+        return None
+    return rpm * role.tokens_per_request
+
+
+def _compute_capacity_score(model: CanonicalModel, role: RoleNeed) -> float:
+    """Compute capacity multiplier (share of the expected load the model's rate limits sustain)."""
+    factor = 1.0
+    for limit, required in (
+        (model.rate_limit_rpm, required_rpm(role)),
+        (model.rate_limit_tpm, required_tpm(role)),
+    ):
+        if required and limit is not None:
+            factor = min(factor, min(1.0, limit / required))
+    return factor
+
+
+@lru_cache(maxsize=4096)
+def _parse_model_date(date_str: str) -> Optional[datetime]:
+    """Parse an ISO date from the catalog, or None if it is not a valid date."""
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _freshness_from_age(age_days: int) -> float:
+    """Map model age in days to a freshness score."""
+    # Normalize: 0 days = 1.0, 365 days = 0.5, 730+ days = 0.0
+    if age_days <= 0:
+        return 1.0
+    elif age_days <= 365:
+        return 1.0 - 0.5 * (age_days / 365)
+    elif age_days <= 730:
+        return 0.5 - 0.5 * ((age_days - 365) / 365)
+    else:
+        return 0.0
+
+
 def _compute_freshness_score(model: CanonicalModel) -> float:
     """Compute normalized freshness score."""
     date_str = model.last_updated or model.release_date
     if not date_str:
         return 0.5  # Unknown = medium
     
-    try:
-        model_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        now = datetime.now(model_date.tzinfo) if model_date.tzinfo else datetime.now()
-        age_days = (now - model_date).days
-        
-        # Normalize: 0 days = 1.0, 365 days = 0.5, 730+ days = 0.0
-        if age_days <= 0:
-            return 1.0
-        elif age_days <= 365:
-            return 1.0 - 0.5 * (age_days / 365)
-        elif age_days <= 730:
-            return 0.5 - 0.5 * ((age_days - 365) / 365)
-        else:
-            return 0.0
-    except:
-        return 0.5
+    model_date = _parse_model_date(date_str)
+    if model_date is None:
+        return 0.5  # Unparseable = medium
+    
+    now = datetime.now(model_date.tzinfo) if model_date.tzinfo else datetime.now()
+    return _freshness_from_age((now - model_date).days)
 
 
 def _compute_final_score(
@@ -107,6 +189,8 @@ def _compute_final_score(
     creative_score = _compute_creative_score(model)
     context_score = _compute_context_score(model, role)
     freshness_score = _compute_freshness_score(model)
+    latency_score = _compute_latency_score(model)
+    reliability_score = _compute_reliability_score(model)
     
     final_score = (
         weights.w_quality * quality_score +
@@ -114,9 +198,15 @@ def _compute_final_score(
         weights.w_reasoning * reasoning_score +
         weights.w_creative * creative_score +
         weights.w_context * context_score +
-        weights.w_freshness * freshness_score
+        weights.w_freshness * freshness_score +
+        weights.w_latency * latency_score
     )
     
+    # Scale by reliability so models failing often rank lower on every dimension,
+    # and by capacity so models that cannot sustain the load rank lower too
+    final_score = final_score * reliability_score
+    final_score = final_score * _compute_capacity_score(model, role)
+    
     return final_score
 
 
@@ -128,6 +218,11 @@ def score_candidates(
     """
     Score and rank models by weighted multi-factor scoring.
     
+    Ties are broken by provider allowlist membership, arena score and
+    context tokens (descending), then model_id (ascending). Scoring runs on
+    the vectorized ScoringEngine: candidates taken from a catalog whose
+    engine is already built are scored on its feature matrix rows.
+    
     Args:
         role: RoleNeed for context
         weights: Scoring weights
@@ -136,30 +231,7 @@ def score_candidates(
     Returns:
         List of (model, score) tuples, sorted descending by score
     """
-    scored = []
-    
-    for model in models:
-        score = _compute_final_score(model, role, weights)
-        scored.append((model, score))
-    
-    # Sort by score descending, with tie-breaking
-    def sort_key(item: Tuple[CanonicalModel, float]) -> Tuple[float, int, float, int, str]:
-        model, score = item
-        
-        # Tie-breakers (negated for descending sort)
-        in_allowlist = 1 if (role.provider_allowlist and model.provider in role.provider_allowlist) else 0
-        arena = model.arena_score if model.arena_score else 0
-        context = model.context_tokens if model.context_tokens else 0
-        model_id = model.model_id
-        
-        return (
-            -score,  # Primary: score descending
-            -in_allowlist,  # Provider in allowlist
-            -arena,  # Arena score descending
-            -context,  # Context tokens descending
-            model_id,  # Model ID ascending
-        )
-    
-    scored.sort(key=sort_key)
+    from llmhub_cli.generator.selection.engine import engine_containing
     
-    return scored
+    engine, positions = engine_containing(models)
+    return engine.rank_candidates(role, weights, positions)
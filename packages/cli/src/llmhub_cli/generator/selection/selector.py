@@ -3,20 +3,24 @@ SP9 - Selector Orchestrator: Main selection orchestration logic.
 
 Coordinates all selection subproblems to select models for a role.
 """
-from typing import List
+from typing import List, Optional, Tuple
 from llmhub_cli.generator.needs import RoleNeed
 from llmhub_cli.catalog.schema import CanonicalModel
-from llmhub_cli.generator.selection.filter import filter_candidates
+from llmhub_cli.catalog.handle import get_catalog_handle
 from llmhub_cli.generator.selection.weights import derive_weights
-from llmhub_cli.generator.selection.scorer import score_candidates
-from llmhub_cli.generator.selection.relaxer import relax_and_select
+from llmhub_cli.generator.selection.weights_models import Weights
+from llmhub_cli.generator.selection.engine import engine_for, ScoringEngine
+from llmhub_cli.generator.selection.scorer import _compute_capacity_score
+from llmhub_cli.generator.selection.relaxer import ConstraintMasks, relax_and_select
 from .selector_models import SelectionResult, SelectorOptions
+from . import cache as selection_cache
 
 
 def select_for_role(
     role: RoleNeed,
     models: List[CanonicalModel],
-    options: SelectorOptions = SelectorOptions()
+    options: SelectorOptions = SelectorOptions(),
+    use_cache: bool = True
 ) -> SelectionResult:
     """
     Select model(s) for a role need.
@@ -25,25 +29,145 @@ def select_for_role(
         role: RoleNeed with constraints and preferences
         models: Full catalog of models
         options: Selection options
+        use_cache: Reuse cached selections (see select_for_roles)
         
     Returns:
         SelectionResult with primary, backups, and rationale
     """
-    # Step 1: Derive weights from role
-    weights = derive_weights(role)
+    return select_for_roles([role], models, options, use_cache=use_cache)[0]
+
+
+def select_for_roles(
+    roles: List[RoleNeed],
+    models: List[CanonicalModel],
+    options: SelectorOptions = SelectorOptions(),
+    use_cache: bool = True,
+    catalog_fingerprint: Optional[str] = None
+) -> List[SelectionResult]:
+    """
+    Select model(s) for many role needs against one catalog.
+    
+    All roles whose constraints leave candidates are scored together on the
+    catalog's ScoringEngine; only roles that need relaxation are handled
+    one by one.
     
-    # Step 2: Filter candidates
-    filtered = filter_candidates(role, models)
+    Results are cached on disk per (RoleNeed, options, catalog, scorer
+    version) when the catalog's fingerprint is known: either passed in, or
+    because models is the catalog loaded through the CatalogHandle. Ad-hoc
+    model lists are never cached.
     
-    # Step 3: Score or relax
-    relaxations = []
-    if filtered:
-        # Score and rank
-        scored = score_candidates(role, weights, filtered)
-    else:
-        # Apply relaxation
-        scored, relaxations = relax_and_select(role, models, weights)
+    Args:
+        roles: RoleNeeds with constraints and preferences
+        models: Full catalog of models
+        options: Selection options
+        use_cache: Reuse and store cached selections (default True)
+        catalog_fingerprint: Fingerprint of models, if known
+        
+    Returns:
+        SelectionResults in the same order as roles
+    """
+    fingerprint = None
+    if use_cache:
+        fingerprint = catalog_fingerprint or get_catalog_handle().fingerprint_of(models)
+    if fingerprint is None:
+        return _select_uncached(roles, models, options)
+    
+    keys = [selection_cache.selection_cache_key(role, options, fingerprint) for role in roles]
+    results: List[Optional[SelectionResult]] = [
+        selection_cache.load_cached_selection(fingerprint, key) for key in keys
+    ]
+    
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        selected = _select_uncached([roles[i] for i in missing], models, options)
+        for i, result in zip(missing, selected):
+            results[i] = result
+            selection_cache.save_cached_selection(fingerprint, keys[i], result)
+    
+    return results
+
+
+def _select_uncached(
+    roles: List[RoleNeed],
+    models: List[CanonicalModel],
+    options: SelectorOptions
+) -> List[SelectionResult]:
+    """Select for roles against the catalog, without the cache."""
+    engine = engine_for(models)
+    top_k = options.num_backups + 1
     
+    # Step 1: Derive weights from roles
+    weights = [derive_weights(role) for role in roles]
+    
+    # Step 2: Filter candidates (one mask per constraint, reused when relaxing)
+    masks = [ConstraintMasks(role, models) for role in roles]
+    candidates = [m.positions() for m in masks]
+    
+    # Step 3: Score (all roles with candidates at once) or relax
+    direct = [i for i, positions in enumerate(candidates) if positions.size]
+    ranked = engine.rank_many(
+        [roles[i] for i in direct],
+        [weights[i] for i in direct],
+        [candidates[i] for i in direct],
+        top_k
+    )
+    scored_by_role = dict(zip(direct, ranked))
+    
+    results = []
+    for i, role in enumerate(roles):
+        relaxations: List[str] = []
+        if i in scored_by_role:
+            scored = scored_by_role[i]
+        else:
+            scored, relaxations = relax_and_select(role, models, weights[i], masks[i], top_k)
+        results.append(_build_result(role, weights[i], scored, relaxations, masks[i], options, engine))
+    
+    return results
+
+
+def _capacity_note(
+    role: RoleNeed,
+    weights: Weights,
+    primary: CanonicalModel,
+    relaxations: List[str],
+    masks: ConstraintMasks,
+    engine: ScoringEngine
+) -> Optional[str]:
+    """Explain how the role's expected load shaped the choice, if it did."""
+    if "capacity" not in masks.masks:
+        return None
+    load = f"{role.expected_rps:g} requests/second"
+    
+    coverage = _compute_capacity_score(primary, role)
+    if coverage < 1.0:
+        return f"Capacity: no candidate's rate limits sustain {load}; {primary.canonical_id} covers {coverage:.0%}"
+    
+    excluded = masks.eliminated["capacity"]
+    if not excluded:
+        return None
+    
+    if not relaxations:
+        # Would a model that cannot sustain the load have won otherwise?
+        unloaded = role.model_copy(update={"expected_rps": None})
+        best = engine.rank_candidates(unloaded, weights, masks.positions({"capacity": None}), top_k=1)
+        if best and best[0][0].canonical_id != primary.canonical_id:
+            return (
+                f"Capacity decided the choice: {best[0][0].canonical_id} ranks higher "
+                f"but its rate limits cannot sustain {load}"
+            )
+    return f"Capacity: excluded {excluded} model(s) with rate limits below {load}"
+
+
+def _build_result(
+    role: RoleNeed,
+    weights: Weights,
+    scored: List[Tuple[CanonicalModel, float]],
+    relaxations: List[str],
+    masks: ConstraintMasks,
+    options: SelectorOptions,
+    engine: ScoringEngine
+) -> SelectionResult:
+    """Pick primary and backups from ranked candidates and explain the choice."""
     # Step 4: Select primary and backups
     primary = None
     primary_provider = None
@@ -64,10 +188,14 @@ def select_for_role(
     elif options.require_primary:
         # No candidates found even after relaxation
         rationale = "No suitable models found even after applying all relaxations"
+        diagnostic = masks.diagnostic()
+        if diagnostic:
+            rationale += f" ({diagnostic})"
         return SelectionResult(
             role_id=role.id,
             rationale=rationale,
-            relaxations_applied=relaxations
+            relaxations_applied=relaxations,
+            constraint_eliminations=masks.eliminated
         )
     
     # Step 5: Generate rationale
@@ -87,10 +215,16 @@ def select_for_role(
             factors.append(f"cost ({weights.w_cost:.1%})")
         if weights.w_reasoning > 0.2:
             factors.append(f"reasoning ({weights.w_reasoning:.1%})")
+        if weights.w_latency > 0.2:
+            factors.append(f"latency ({weights.w_latency:.1%})")
         
         if factors:
             rationale_parts.append(f"Top factors: {', '.join(factors)}")
         
+        capacity_note = _capacity_note(role, weights, primary_candidate, relaxations, masks, engine)
+        if capacity_note:
+            rationale_parts.append(capacity_note)
+        
         if backups:
             rationale_parts.append(f"{len(backups)} backup(s) available")
     
@@ -104,5 +238,6 @@ def select_for_role(
         primary_score=primary_score,
         backups=backups,
         rationale=rationale,
-        relaxations_applied=relaxations
+        relaxations_applied=relaxations,
+        constraint_eliminations=masks.eliminated
     )
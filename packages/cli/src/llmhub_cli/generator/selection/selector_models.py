@@ -1,5 +1,5 @@
 """SP9 - Selector Orchestrator: Data models."""
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, Field
 
 
@@ -19,3 +19,4 @@ class SelectionResult(BaseModel):
     backups: List[str] = Field(default_factory=list)  # List of canonical_ids
     rationale: Optional[str] = None
     relaxations_applied: List[str] = Field(default_factory=list)
+    constraint_eliminations: Dict[str, int] = Field(default_factory=dict)  # Constraint name → models it rules out
@@ -25,6 +25,7 @@ def derive_weights(role: RoleNeed) -> Weights:
         "w_creative": 0.0,
         "w_context": 0.0,
         "w_freshness": 0.0,
+        "w_latency": 0.0,
     }
     
     # Adjust based on task kind
@@ -57,6 +58,9 @@ def derive_weights(role: RoleNeed) -> Weights:
     if role.context_min:
         raw_weights["w_context"] = 0.15
     
+    # Latency only counts for roles more sensitive than the default (0.5)
+    raw_weights["w_latency"] = 0.8 * max(0.0, role.latency_sensitivity - 0.5)
+    
     # Reduce cost weight if latency sensitivity is high
     if role.latency_sensitivity > 0.7:
         raw_weights["w_cost"] *= 0.5
@@ -67,6 +71,6 @@ def derive_weights(role: RoleNeed) -> Weights:
         normalized = {k: v / total for k, v in raw_weights.items()}
     else:
         # Fallback: equal weights
-        normalized = {k: 1.0 / 6 for k in raw_weights.keys()}
+        normalized = {k: 1.0 / len(raw_weights) for k in raw_weights.keys()}
     
     return Weights(**normalized)
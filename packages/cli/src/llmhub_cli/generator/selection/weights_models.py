@@ -10,8 +10,9 @@ class Weights(BaseModel):
     w_creative: float = Field(ge=0.0, le=1.0)
     w_context: float = Field(ge=0.0, le=1.0)
     w_freshness: float = Field(ge=0.0, le=1.0)
+    w_latency: float = Field(default=0.0, ge=0.0, le=1.0)
     
-    @field_validator("w_quality", "w_cost", "w_reasoning", "w_creative", "w_context", "w_freshness")
+    @field_validator("w_quality", "w_cost", "w_reasoning", "w_creative", "w_context", "w_freshness", "w_latency")
     @classmethod
     def validate_weight(cls, v: float) -> float:
         """Ensure weights are in valid range."""
@@ -25,6 +25,9 @@ class Preferences(BaseModel):
     providers: Optional[list[str]] = None  # Allowlist
     provider_blocklist: Optional[list[str]] = None
     model_denylist: Optional[list[str]] = None
+    max_ttft_ms: Optional[int] = None  # Hard limit on time to first token
+    expected_rps: Optional[float] = None  # Expected peak requests per second
+    tokens_per_request: Optional[int] = None  # Expected input + output tokens per request
 
 
 class DefaultPreferences(BaseModel):
@@ -8,18 +8,21 @@ from llmhub_runtime.models import (
     LLMMode
 )
 from .spec_models import SpecConfig, RoleKind
+from .fingerprints import RoleFingerprint, compute_role_fingerprints
 
 
 class GeneratorOptions(BaseModel):
     """Options for runtime generation."""
     no_llm: bool = False
     explain: bool = False
+    no_cache: bool = False  # With no_llm, re-select roles instead of reusing cached selections
 
 
 class GenerationResult(BaseModel):
     """Result of runtime generation."""
     runtime: RuntimeConfig
     explanations: dict[str, str] = Field(default_factory=dict)
+    fingerprints: dict[str, RoleFingerprint] = Field(default_factory=dict)  # Inputs per role
 
 
 def _map_kind_to_mode(kind: RoleKind) -> LLMMode:
@@ -129,20 +132,99 @@ def _select_model_stub(spec: SpecConfig, role_name: str) -> tuple[str, str, dict
     return provider, model, params
 
 
+def _load_offline_catalog():
+    """Cached catalog of any age, or None if there is none."""
+    # Imported lazily: the generator package imports this module
+    from .catalog.handle import get_catalog_handle
+    
+    catalog = get_catalog_handle().load(ttl_hours=None)
+    if catalog is None or not catalog.models:
+        return None
+    return catalog
+
+
+def _select_offline(spec: SpecConfig, catalog, role_names: list[str], use_cache: bool = True) -> dict:
+    """
+    Select models with the generator pipeline without network access.
+    
+    Roles are interpreted with deterministic rules and matched against the
+    cached catalog by the filter/score/relax pipeline.
+    
+    Returns:
+        Role name → SelectionResult for the given roles
+    """
+    from .generator.spec import ProjectSpec
+    from .generator.needs import interpret_needs_offline
+    from .generator.selection import select_for_roles
+    
+    data = spec.model_dump(mode="json")
+    data["roles"] = {name: data["roles"][name] for name in role_names}
+    if not data["roles"]:
+        return {}
+    project_spec = ProjectSpec.model_validate(data)
+    needs = interpret_needs_offline(project_spec)
+    selections = select_for_roles(needs, catalog.models, use_cache=use_cache, catalog_fingerprint=catalog.fingerprint)
+    return {selection.role_id: selection for selection in selections}
+
+
+def role_fingerprints(
+    spec: SpecConfig,
+    options: Optional[GeneratorOptions] = None,
+    catalog=None
+) -> dict[str, RoleFingerprint]:
+    """
+    Fingerprint the inputs each role would be generated from.
+    
+    Args:
+        spec: SpecConfig to fingerprint.
+        options: Generation options (the mode decides which inputs count).
+        catalog: Catalog for no_llm mode; loaded from the cache if omitted.
+    
+    Returns:
+        Role name → RoleFingerprint.
+    """
+    if options is None:
+        options = GeneratorOptions()
+    
+    if not options.no_llm:
+        # Built-in heuristics only depend on the spec
+        return compute_role_fingerprints(spec, None, None, "heuristic")
+    
+    from .generator.selection import SelectorOptions
+    
+    if catalog is None:
+        catalog = _load_offline_catalog()
+    return compute_role_fingerprints(
+        spec,
+        catalog.fingerprint if catalog is not None else None,
+        SelectorOptions(),
+        "offline"
+    )
+
+
 def generate_runtime(
     spec: SpecConfig,
-    options: Optional[GeneratorOptions] = None
+    options: Optional[GeneratorOptions] = None,
+    previous: Optional[GenerationResult] = None
 ) -> GenerationResult:
     """
     Generate runtime configuration from spec.
     
-    This is a stub implementation that uses simple heuristics.
-    In production, this would use sophisticated model selection,
-    potentially calling LLMs for recommendations.
+    With options.no_llm, roles are interpreted with deterministic local
+    rules and models are chosen from the cached catalog by the generator's
+    filter/score/relax pipeline, with no network access. Forced models,
+    roles without a match, and runs without a cached catalog use simple
+    built-in heuristics, as does the default mode.
+    
+    With previous, roles whose recorded fingerprint matches their current
+    inputs are copied from the previous runtime unchanged; only new or
+    changed roles are generated.
     
     Args:
         spec: SpecConfig to convert.
         options: Optional generation options.
+        previous: Optional earlier result (runtime and fingerprints) to
+            update incrementally.
     
     Returns:
         GenerationResult with RuntimeConfig and explanations.
@@ -152,6 +234,22 @@ def generate_runtime(
     
     explanations = {}
     
+    catalog = _load_offline_catalog() if options.no_llm else None
+    fingerprints = role_fingerprints(spec, options, catalog)
+    
+    carried = set()
+    if previous is not None:
+        carried = {
+            role_name for role_name in spec.roles
+            if role_name in previous.runtime.roles
+            and previous.fingerprints.get(role_name) == fingerprints[role_name]
+        }
+    
+    selections: dict = {}
+    if catalog is not None:
+        pending = [role_name for role_name in spec.roles if role_name not in carried]
+        selections = _select_offline(spec, catalog, pending, use_cache=not options.no_cache)
+    
     # Convert providers
     runtime_providers = {}
     for provider_name, provider_config in spec.providers.items():
@@ -163,8 +261,45 @@ def generate_runtime(
     # Convert roles
     runtime_roles = {}
     for role_name, role_spec in spec.roles.items():
-        provider, model, params = _select_model_stub(spec, role_name)
+        if role_name in carried:
+            role_config = previous.runtime.roles[role_name]
+            runtime_roles[role_name] = role_config
+            if role_config.provider not in runtime_providers and role_config.provider in previous.runtime.providers:
+                runtime_providers[role_config.provider] = previous.runtime.providers[role_config.provider]
+            if options.explain:
+                explanations[role_name] = previous.explanations.get(
+                    role_name, "Unchanged since the last generation"
+                )
+            continue
+        
         mode = _map_kind_to_mode(role_spec.kind)
+        selection = selections.get(role_name)
+        forced = bool(role_spec.force_provider and role_spec.force_model)
+        
+        if selection is not None and selection.primary and not forced:
+            provider = selection.primary_provider
+            model = selection.primary_model
+            params = {**role_spec.mode_params}
+            explanation = selection.rationale
+            
+            # Selected providers may not be listed in the spec
+            if provider not in runtime_providers:
+                from .generator.emitter.builder import PROVIDER_ENV_KEYS
+                runtime_providers[provider] = ProviderConfig(
+                    env_key=PROVIDER_ENV_KEYS.get(provider.lower())
+                )
+        else:
+            provider, model, params = _select_model_stub(spec, role_name)
+            explanation = (
+                f"Selected {provider}:{model} based on kind={role_spec.kind}, "
+                f"cost={role_spec.preferences.cost}, "
+                f"quality={role_spec.preferences.quality}"
+            )
+            if options.no_llm and not forced:
+                if catalog is None:
+                    explanation += " (no cached catalog; run 'llmhub catalog refresh')"
+                elif selection is not None:
+                    explanation += f" ({selection.rationale})"
         
         runtime_roles[role_name] = RoleConfig(
             provider=provider,
@@ -174,11 +309,7 @@ def generate_runtime(
         )
         
         if options.explain:
-            explanations[role_name] = (
-                f"Selected {provider}:{model} based on kind={role_spec.kind}, "
-                f"cost={role_spec.preferences.cost}, "
-                f"quality={role_spec.preferences.quality}"
-            )
+            explanations[role_name] = explanation
     
     # Convert defaults if present
     runtime_defaults = None
@@ -200,4 +331,4 @@ def generate_runtime(
         defaults=runtime_defaults
     )
     
-    return GenerationResult(runtime=runtime, explanations=explanations)
+    return GenerationResult(runtime=runtime, explanations=explanations, fingerprints=fingerprints)
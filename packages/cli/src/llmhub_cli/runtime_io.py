@@ -1,6 +1,10 @@
+import os
+import tempfile
 from pathlib import Path
+from typing import Mapping, Optional
 import yaml
 from llmhub_runtime.models import RuntimeConfig, LLMMode
+from .fingerprints import RoleFingerprint
 
 
 class RuntimeError(Exception):
@@ -33,13 +37,48 @@ def load_runtime(path: Path) -> RuntimeConfig:
         raise RuntimeError(f"Failed to load runtime from {path}: {str(e)}")
 
 
-def save_runtime(path: Path, runtime: RuntimeConfig) -> None:
+def load_runtime_fingerprints(path: Path) -> dict[str, RoleFingerprint]:
     """
-    Save runtime config to YAML file.
+    Load the per-role input fingerprints recorded in a runtime file.
+    
+    Args:
+        path: Path to llmhub.yaml.
+    
+    Returns:
+        Role name → RoleFingerprint; empty if the file is missing or has
+        no (valid) fingerprints.
+    """
+    try:
+        with open(path, 'r') as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return {}
+    
+    meta = data.get("meta") if isinstance(data, dict) else None
+    fingerprints = {}
+    for role_name, role_meta in (meta or {}).items():
+        if not isinstance(role_meta, dict) or not role_meta.get("fingerprint"):
+            continue
+        try:
+            fingerprints[role_name] = RoleFingerprint.model_validate(role_meta["fingerprint"])
+        except ValueError:
+            continue
+    return fingerprints
+
+
+def save_runtime(
+    path: Path,
+    runtime: RuntimeConfig,
+    fingerprints: Optional[Mapping[str, RoleFingerprint]] = None
+) -> None:
+    """
+    Save runtime config to YAML file (atomically).
     
     Args:
         path: Path to write llmhub.yaml.
         runtime: RuntimeConfig to save.
+        fingerprints: Optional per-role input fingerprints, written under
+            meta.<role>.fingerprint (as in generated machine configs).
     
     Raises:
         RuntimeError: If file cannot be written.
@@ -63,14 +102,28 @@ def save_runtime(path: Path, runtime: RuntimeConfig) -> None:
         
         data = convert_enums(data)
         
-        # Write YAML with stable formatting
-        with open(path, 'w') as f:
-            yaml.dump(
-                data,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True
-            )
+        if fingerprints:
+            data["meta"] = {
+                role_name: {"fingerprint": fingerprint.model_dump(mode='json', exclude_none=True)}
+                for role_name, fingerprint in fingerprints.items()
+                if role_name in runtime.roles
+            }
+        
+        # Write YAML with stable formatting to a temp file, then rename, so
+        # readers never see a partially written runtime
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                yaml.dump(
+                    data,
+                    f,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    allow_unicode=True
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
     except Exception as e:
         raise RuntimeError(f"Failed to save runtime to {path}: {str(e)}")
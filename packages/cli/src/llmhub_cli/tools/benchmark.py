@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Selection pipeline benchmarks on synthetic catalogs.
+
+Measures filter_candidates, score_candidates, relax_and_select,
+select_for_role and select_for_roles on seeded synthetic catalogs (see
+synthetic_catalog) and reports time, throughput and peak memory per stage.
+Results can be checked against regression thresholds to gate CI.
+
+Usage:
+    python -m llmhub_cli.tools.benchmark                      # quick preset
+    python -m llmhub_cli.tools.benchmark --preset full        # 1k-100k models, 1-1000 roles
+    python -m llmhub_cli.tools.benchmark --models 5000 --roles 50
+    python -m llmhub_cli.tools.benchmark --output reports/benchmarks/run.json \\
+        --thresholds packages/cli/benchmarks/thresholds.json
+
+Thresholds file format (keys are "<stage>@<models>x<roles>"; "*" matches any size):
+    {"select_for_roles@10000x100": {"max_seconds": 2.0, "max_peak_mb": 200},
+     "filter_candidates@*": {"min_roles_per_second": 100}}
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional
+from pydantic import BaseModel
+
+
+# Catalog sizes × role counts per preset
+PRESETS = {
+    "quick": ([1000, 10000], [1, 100]),
+    "full": ([1000, 10000, 100000], [1, 100, 1000]),
+}
+
+# Per-role stages run on at most this many roles; throughput is per role
+PER_ROLE_SAMPLE = 20
+
+
+class BenchmarkResult(BaseModel):
+    """Measurements of one stage on one catalog/role-count scenario."""
+    stage: str
+    models: int
+    roles: int  # Roles in the scenario
+    measured_roles: int  # Roles actually run through the stage
+    seconds: float
+    roles_per_second: float
+    peak_mb: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage}@{self.models}x{self.roles}"
+
+
+def _measure(fn: Callable[[], object], measure_memory: bool) -> tuple[float, Optional[float]]:
+    """Wall time of fn, then (optionally) its peak traced memory in a second run."""
+    gc.collect()
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+
+    peak_mb = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_mb = peak / (1024 * 1024)
+    return seconds, peak_mb
+
+
+def run_scenario(
+    model_count: int,
+    role_count: int,
+    seed: int = 0,
+    measure_memory: bool = True
+) -> list[BenchmarkResult]:
+    """
+    Benchmark every stage on one synthetic catalog and role set.
+
+    The first stage ("prepare") builds the catalog index and scoring
+    feature matrix; later stages run warm, as in a long-running process.
+
+    Args:
+        model_count: Catalog size
+        role_count: Number of roles
+        seed: Random seed for the synthetic data
+        measure_memory: Also record peak memory (runs each stage twice)
+
+    Returns:
+        One BenchmarkResult per stage
+    """
+    from llmhub_cli.catalog.index import index_for
+    from llmhub_cli.generator.selection import (
+        filter_candidates,
+        score_candidates,
+        relax_and_select,
+        select_for_role,
+        select_for_roles,
+        derive_weights,
+        engine_for,
+    )
+    from .synthetic_catalog import synthetic_models, synthetic_roles
+
+    models = synthetic_models(model_count, seed)
+    roles = synthetic_roles(role_count, seed)
+    sample = roles[:PER_ROLE_SAMPLE]
+    weights = [derive_weights(role) for role in sample]
+
+    def prepare():
+        # Fresh copies defeat the identity memos, so each run is cold
+        fresh = list(models)
+        index_for(fresh)
+        engine_for(fresh)
+
+    index_for(models)
+    engine_for(models)
+    candidates = [filter_candidates(role, models) for role in sample]
+
+    stages: list[tuple[str, int, Callable[[], object]]] = [
+        ("prepare", 0, prepare),
+        ("filter_candidates", len(sample), lambda: [filter_candidates(r, models) for r in sample]),
+        ("score_candidates", len(sample), lambda: [
+            score_candidates(r, w, c) for r, w, c in zip(sample, weights, candidates)
+        ]),
+        ("relax_and_select", len(sample), lambda: [
+            relax_and_select(r, models, w) for r, w in zip(sample, weights)
+        ]),
+        ("select_for_role", len(sample), lambda: [
+            select_for_role(r, models, use_cache=False) for r in sample
+        ]),
+        ("select_for_roles", len(roles), lambda: select_for_roles(roles, models, use_cache=False)),
+    ]
+
+    results = []
+    for stage, measured, fn in stages:
+        # "prepare" memoizes indexes and engines for fresh copies, which may
+        # evict the catalog's; re-warm them outside the measurement
+        index_for(models)
+        engine_for(models)
+        seconds, peak_mb = _measure(fn, measure_memory)
+        results.append(BenchmarkResult(
+            stage=stage,
+            models=model_count,
+            roles=role_count,
+            measured_roles=measured,
+            seconds=round(seconds, 6),
+            roles_per_second=round(measured / seconds, 2) if measured and seconds > 0 else 0.0,
+            peak_mb=round(peak_mb, 3) if peak_mb is not None else None,
+        ))
+    return results
+
+
+def run_benchmarks(
+    model_counts: list[int],
+    role_counts: list[int],
+    seed: int = 0,
+    measure_memory: bool = True
+) -> list[BenchmarkResult]:
+    """Run every catalog size × role count scenario."""
+    results = []
+    for model_count in model_counts:
+        for role_count in role_counts:
+            results.extend(run_scenario(model_count, role_count, seed, measure_memory))
+    return results
+
+
+def check_thresholds(results: list[BenchmarkResult], thresholds: dict) -> list[str]:
+    """
+    Compare results with regression thresholds.
+
+    Args:
+        results: Benchmark results
+        thresholds: Mapping of "<stage>@<models>x<roles>" (or "<stage>@*")
+            to limits: max_seconds, max_peak_mb, min_roles_per_second
+
+    Returns:
+        Human-readable violations, empty if all limits hold
+    """
+    violations = []
+    for result in results:
+        for key in (result.key, f"{result.stage}@*"):
+            limits = thresholds.get(key)
+            if not limits:
+                continue
+            if "max_seconds" in limits and result.seconds > limits["max_seconds"]:
+                violations.append(f"{result.key}: {result.seconds:.3f}s > {limits['max_seconds']}s")
+            if ("max_peak_mb" in limits and result.peak_mb is not None
+                    and result.peak_mb > limits["max_peak_mb"]):
+                violations.append(f"{result.key}: peak {result.peak_mb:.1f} MB > {limits['max_peak_mb']} MB")
+            if ("min_roles_per_second" in limits and result.measured_roles
+                    and result.roles_per_second < limits["min_roles_per_second"]):
+                violations.append(
+                    f"{result.key}: {result.roles_per_second:.1f} roles/s < {limits['min_roles_per_second']} roles/s"
+                )
+    return violations
+
+
+def format_table(results: list[BenchmarkResult]) -> str:
+    """Format results as a plain-text table."""
+    header = f"{'stage':<20} {'models':>8} {'roles':>6} {'seconds':>10} {'roles/s':>12} {'peak MB':>9}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        peak = f"{r.peak_mb:.1f}" if r.peak_mb is not None else "-"
+        rate = f"{r.roles_per_second:.1f}" if r.measured_roles else "-"
+        lines.append(f"{r.stage:<20} {r.models:>8} {r.roles:>6} {r.seconds:>10.4f} {rate:>12} {peak:>9}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point; returns the exit code."""
+    parser = argparse.ArgumentParser(description="Benchmark the model selection pipeline")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--models", type=int, nargs="+", help="Catalog sizes (overrides preset)")
+    parser.add_argument("--roles", type=int, nargs="+", help="Role counts (overrides preset)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak memory measurement")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--thresholds", type=Path, help="Fail if results exceed these thresholds")
+    args = parser.parse_args(argv)
+
+    preset_models, preset_roles = PRESETS[args.preset]
+    results = run_benchmarks(
+        args.models or preset_models,
+        args.roles or preset_roles,
+        seed=args.seed,
+        measure_memory=not args.no_memory,
+    )
+    print(format_table(results))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(
+            {"seed": args.seed, "results": [r.model_dump() for r in results]}, indent=2
+        ))
+        print(f"\nResults written to {args.output}")
+
+    if args.thresholds:
+        violations = check_thresholds(results, json.loads(args.thresholds.read_text()))
+        if violations:
+            print("\nThreshold violations:")
+            for violation in violations:
+                print(f"  {violation}")
+            return 1
+        print("\nAll thresholds met")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Local stand-in for any-llm with configurable latency profiles.
+
+StandInProvider mimics any_llm.completion: it streams canned chunks after a
+configurable time to first token, at a configurable output rate, and fails
+a configurable fraction of requests. Installed in place of the any_llm
+module used by LLMHub, it lets latency probes and runtime tests run without
+network access or API keys.
+
+Example:
+    >>> standin = StandInProvider({"openai/fast": LatencyProfile(ttft_ms=50)})
+    >>> with standin.install():
+    ...     summaries = probe_models(models)
+"""
+import random
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional
+from unittest.mock import patch
+from pydantic import BaseModel
+
+
+class LatencyProfile(BaseModel):
+    """How a stand-in model responds."""
+    ttft_ms: float = 50.0
+    output_tokens_per_second: float = 200.0
+    error_rate: float = 0.0
+    tokens: int = 20  # Tokens per response (capped by max_tokens)
+    failed_tokens: int = 0  # Tokens a failing stream yields before it breaks off
+
+
+def _chunk(content: Optional[str], completion_tokens: Optional[int] = None) -> SimpleNamespace:
+    """Chat completion chunk shaped like any-llm's."""
+    usage = SimpleNamespace(completion_tokens=completion_tokens) if completion_tokens else None
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))], usage=usage)
+
+
+class StandInProvider:
+    """Drop-in replacement for the any_llm module."""
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, LatencyProfile]] = None,
+        default: Optional[LatencyProfile] = None,
+        seed: int = 0
+    ) -> None:
+        """
+        Initialize the stand-in.
+
+        Args:
+            profiles: "provider/model" (or bare model) → LatencyProfile
+            default: Profile for models not in profiles
+            seed: Random seed for simulated errors
+        """
+        self.profiles = profiles or {}
+        self.default = default or LatencyProfile()
+        self.calls: list[dict] = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def profile_for(self, provider: Optional[str], model: str) -> LatencyProfile:
+        """Profile of a model."""
+        return self.profiles.get(f"{provider}/{model}") or self.profiles.get(model) or self.default
+
+    def completion(
+        self,
+        model: str,
+        messages: list,
+        provider: Optional[str] = None,
+        stream: Optional[bool] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Respond like any_llm.completion, after the profile's delays."""
+        profile = self.profile_for(provider, model)
+        with self._lock:
+            self.calls.append({"provider": provider, "model": model, "stream": bool(stream)})
+            failed = self._rng.random() < profile.error_rate
+        tokens = min(profile.tokens, max_tokens) if max_tokens else profile.tokens
+
+        if stream:
+            return self._stream(profile, tokens, failed)
+
+        time.sleep(profile.ttft_ms / 1000 + tokens / profile.output_tokens_per_second)
+        if failed:
+            raise RuntimeError(f"Stand-in error from {provider}/{model}")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(role="assistant", content="tok " * tokens))],
+            usage=SimpleNamespace(completion_tokens=tokens),
+        )
+
+    def _stream(self, profile: LatencyProfile, tokens: int, failed: bool) -> Iterator[SimpleNamespace]:
+        time.sleep(profile.ttft_ms / 1000)
+        interval = 1 / profile.output_tokens_per_second
+        for i in range(tokens):
+            if failed and i == profile.failed_tokens:
+                raise RuntimeError("Stand-in error")
+            if i:
+                time.sleep(interval)
+            yield _chunk("tok ")
+        if failed:
+            raise RuntimeError("Stand-in error")
+        yield _chunk(None, completion_tokens=tokens)
+
+    def embedding(self, model: str, inputs: Any, provider: Optional[str] = None, **kwargs: Any) -> Any:
+        """Respond like any_llm.embedding with a fixed vector per input."""
+        profile = self.profile_for(provider, model)
+        time.sleep(profile.ttft_ms / 1000)
+        items = [inputs] if isinstance(inputs, str) else list(inputs)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[0.0, 1.0]) for _ in items])
+
+    @contextmanager
+    def install(self) -> Iterator["StandInProvider"]:
+        """Route LLMHub calls to this stand-in for the duration of the block."""
+        with patch("llmhub_runtime.hub.any_llm", self):
+            yield self
@@ -0,0 +1,161 @@
+"""
+Seeded synthetic catalogs and role needs for benchmarks.
+
+Generates CanonicalModel lists and RoleNeed lists whose distributions of
+provider, tier, price, context, modality and capability roughly follow a
+real catalog, so the selection pipeline sees realistic selectivity. The
+same seed always yields the same data.
+"""
+import random
+from datetime import date, timedelta
+from typing import Optional
+from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.generator.needs import RoleNeed
+
+
+# (provider, relative share of models)
+PROVIDERS = [
+    ("openai", 12), ("anthropic", 8), ("google", 10), ("mistral", 8),
+    ("meta", 10), ("deepseek", 5), ("cohere", 4), ("xai", 3),
+    ("together", 15), ("groq", 8), ("fireworks", 10), ("bedrock", 7),
+]
+
+# quality_tier → share of models; most models are mid-tier
+QUALITY_TIER_SHARE = {1: 8, 2: 20, 3: 37, 4: 25, 5: 10}
+
+# quality_tier → median input price per million tokens; output is ~4x
+MEDIAN_INPUT_PRICE = {1: 10.0, 2: 3.0, 3: 0.8, 4: 0.25, 5: 0.08}
+
+# (context tokens, share)
+CONTEXT_SIZES = [(8192, 10), (32768, 25), (131072, 40), (200000, 15), (1000000, 10)]
+
+TASK_KINDS = ["reasoning", "creative", "factual", "chat", "general"]
+
+_EPOCH = date(2023, 1, 1)
+
+
+def _weighted(rng: random.Random, pairs):
+    values, weights = zip(*pairs)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _clamp_tier(tier: int) -> int:
+    return max(1, min(5, tier))
+
+
+def _cost_tier(price: float) -> int:
+    """Cost tier from fixed input price bands (1 = cheapest)."""
+    for tier, limit in ((1, 0.2), (2, 1.0), (3, 3.0), (4, 10.0)):
+        if price < limit:
+            return tier
+    return 5
+
+
+def synthetic_model(rng: random.Random, index: int) -> CanonicalModel:
+    """
+    Generate one synthetic model.
+
+    Args:
+        rng: Seeded random source
+        index: Position, used to keep ids unique
+
+    Returns:
+        CanonicalModel
+    """
+    provider = _weighted(rng, PROVIDERS)
+    quality_tier = _weighted(rng, QUALITY_TIER_SHARE.items())
+    family = f"family-{rng.randrange(200)}"
+    model_id = f"{family}-{index}"
+
+    embedding = rng.random() < 0.04
+    image_out = not embedding and rng.random() < 0.02
+    input_modalities = ["text"]
+    if not embedding and rng.random() < 0.3:
+        input_modalities.append("image")
+    if not embedding and rng.random() < 0.05:
+        input_modalities.append("audio")
+    output_modalities = ["embedding"] if embedding else ["image"] if image_out else ["text"]
+
+    price_input: Optional[float] = None
+    price_output: Optional[float] = None
+    if rng.random() < 0.9:
+        price_input = round(MEDIAN_INPUT_PRICE[quality_tier] * rng.lognormvariate(0, 0.5), 4)
+        price_output = round(price_input * rng.uniform(2, 6), 4)
+
+    arena_score = None
+    if rng.random() < 0.4:
+        arena_score = round(rng.gauss(1300 - 40 * quality_tier, 25), 1)
+
+    release = _EPOCH + timedelta(days=rng.randrange(3 * 365))
+
+    return CanonicalModel(
+        canonical_id=f"{provider}/{model_id}",
+        provider=provider,
+        model_id=model_id,
+        family=family,
+        supports_reasoning=not embedding and rng.random() < (0.5 if quality_tier <= 2 else 0.1),
+        supports_tool_call=not embedding and rng.random() < 0.6,
+        supports_structured_output=not embedding and rng.random() < 0.5,
+        input_modalities=input_modalities,
+        output_modalities=output_modalities,
+        context_tokens=None if rng.random() < 0.05 else _weighted(rng, CONTEXT_SIZES),
+        price_input_per_million=price_input,
+        price_output_per_million=price_output,
+        quality_tier=quality_tier,
+        reasoning_tier=_clamp_tier(quality_tier + rng.choice([-1, 0, 0, 1])),
+        creative_tier=_clamp_tier(quality_tier + rng.choice([-1, 0, 0, 1])),
+        cost_tier=_cost_tier(price_input) if price_input is not None else 3,
+        arena_score=arena_score,
+        release_date=release.isoformat() if rng.random() < 0.8 else None,
+        open_weights=rng.random() < 0.3,
+    )
+
+
+def synthetic_models(count: int, seed: int = 0) -> list[CanonicalModel]:
+    """
+    Generate a synthetic catalog.
+
+    Args:
+        count: Number of models
+        seed: Random seed
+
+    Returns:
+        List of CanonicalModel
+    """
+    rng = random.Random(seed)
+    return [synthetic_model(rng, i) for i in range(count)]
+
+
+def synthetic_roles(count: int, seed: int = 0) -> list[RoleNeed]:
+    """
+    Generate synthetic role needs with a realistic mix of constraints.
+
+    Args:
+        count: Number of roles
+        seed: Random seed
+
+    Returns:
+        List of RoleNeed
+    """
+    rng = random.Random(seed)
+    providers = [name for name, _ in PROVIDERS]
+    roles = []
+    for i in range(count):
+        allowlist = rng.sample(providers, rng.randint(1, 3)) if rng.random() < 0.2 else None
+        blocklist = rng.sample(providers, 1) if rng.random() < 0.1 else None
+        roles.append(RoleNeed(
+            id=f"role{i}",
+            task_kind=rng.choice(TASK_KINDS),
+            importance=rng.choice(["low", "medium", "high", "critical"]),
+            quality_bias=round(rng.random(), 2),
+            cost_bias=round(rng.random(), 2),
+            latency_sensitivity=round(rng.random(), 2),
+            reasoning_required=rng.random() < 0.15,
+            tools_required=rng.random() < 0.3,
+            structured_output_required=rng.random() < 0.25,
+            context_min=_weighted(rng, [(None, 70), (32768, 20), (131072, 10)]),
+            modalities_in=["text", "image"] if rng.random() < 0.1 else ["text"],
+            provider_allowlist=allowlist,
+            provider_blocklist=blocklist,
+        ))
+    return roles
@@ -0,0 +1,135 @@
+"""
+Watch mode: regenerate llmhub.yaml whenever llmhub.spec.yaml changes.
+
+One long-running process keeps the catalog, feature matrix and caches warm
+and the last GenerationResult in memory, so each spec edit only regenerates
+the roles whose fingerprint changed.
+"""
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from pydantic import BaseModel, Field
+from .spec_models import load_spec
+from .runtime_io import load_runtime, load_runtime_fingerprints, save_runtime
+from .generator_hook import generate_runtime, GeneratorOptions, GenerationResult
+
+
+class WatchEvent(BaseModel):
+    """One regeneration triggered by a spec change."""
+    result: GenerationResult
+    regenerated: list[str] = Field(default_factory=list)  # Roles not carried over
+    elapsed_ms: float
+
+
+class SpecWatcher:
+    """
+    Regenerates a runtime file from a spec file when the spec changes.
+
+    Changes are detected by polling the spec's (mtime, size) and confirmed
+    by a content hash, so touching the file or rewriting identical content
+    does not trigger a regeneration.
+    """
+
+    def __init__(
+        self,
+        spec_path: Path,
+        runtime_path: Path,
+        options: Optional[GeneratorOptions] = None
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            spec_path: Path to llmhub.spec.yaml.
+            runtime_path: Path to llmhub.yaml (rewritten atomically).
+            options: Generation options.
+        """
+        self.spec_path = Path(spec_path)
+        self.runtime_path = Path(runtime_path)
+        self.options = options or GeneratorOptions()
+        self.result: Optional[GenerationResult] = None
+        self._stat_key: Optional[tuple[int, int]] = None
+        self._digest: Optional[str] = None
+
+        # Start from the existing runtime so the first run is incremental too
+        if self.runtime_path.exists():
+            try:
+                self.result = GenerationResult(
+                    runtime=load_runtime(self.runtime_path),
+                    fingerprints=load_runtime_fingerprints(self.runtime_path)
+                )
+            except Exception:
+                self.result = None
+
+    def poll(self) -> Optional[WatchEvent]:
+        """
+        Regenerate if the spec changed since the last poll.
+
+        Returns:
+            WatchEvent if the runtime was regenerated, None otherwise.
+
+        Raises:
+            SpecError: If the changed spec is invalid (the next poll only
+                retries after another change).
+            RuntimeError: If the runtime cannot be written.
+        """
+        try:
+            stat = self.spec_path.stat()
+        except FileNotFoundError:
+            return None
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key == self._stat_key:
+            return None
+        self._stat_key = stat_key
+
+        digest = hashlib.sha256(self.spec_path.read_bytes()).hexdigest()
+        if digest == self._digest:
+            return None
+        self._digest = digest
+
+        started = time.perf_counter()
+        spec = load_spec(self.spec_path)
+        previous = self.result
+        result = generate_runtime(spec, self.options, previous)
+        save_runtime(self.runtime_path, result.runtime, result.fingerprints)
+        self.result = result
+
+        regenerated = [
+            role for role in result.runtime.roles
+            if previous is None or previous.fingerprints.get(role) != result.fingerprints.get(role)
+        ]
+        return WatchEvent(
+            result=result,
+            regenerated=regenerated,
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def run(
+        self,
+        on_event: Callable[[WatchEvent], None],
+        on_error: Callable[[Exception], None],
+        interval: float = 0.2,
+        stop: Optional[threading.Event] = None
+    ) -> None:
+        """
+        Poll until stopped (or interrupted).
+
+        Args:
+            on_event: Called after each regeneration.
+            on_error: Called with errors; watching continues.
+            interval: Seconds between polls.
+            stop: Optional event that ends the loop when set.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                event = self.poll()
+            except Exception as e:
+                on_error(e)
+            else:
+                if event is not None:
+                    on_event(event)
+            stop.wait(interval)
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the CLI unit tests.
+"""
+import pytest
+from llmhub_cli.catalog import Catalog, CanonicalModel
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog.handle import get_catalog_handle
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """
+    Point the catalog cache at tmp_path/catalog.json.
+
+    Everything kept next to the cache (lock file, features, probes, source
+    caches, user overrides) moves with it, and deployment telemetry is read
+    from tmp_path/telemetry.
+    """
+    path = tmp_path / "catalog.json"
+    monkeypatch.setattr(cache_module, "_get_cache_path", lambda: path)
+    monkeypatch.setenv("LLMHUB_TELEMETRY_DIR", str(tmp_path / "telemetry"))
+    get_catalog_handle().invalidate()
+    yield path
+    get_catalog_handle().invalidate()
+
+
+def _make_catalog(model_id: str = "gpt-4o") -> Catalog:
+    return Catalog(
+        built_at="2024-12-02T00:00:00",
+        models=[CanonicalModel(canonical_id=f"openai/{model_id}", provider="openai", model_id=model_id)],
+    )
+
+
+@pytest.fixture
+def make_catalog():
+    """Factory for a one-model catalog: make_catalog("gpt-4o-mini")."""
+    return _make_catalog
@@ -0,0 +1,126 @@
+"""Tests for SP10 - per-role fingerprints and incremental generation."""
+from unittest.mock import patch
+import pytest
+import yaml
+from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.fingerprints import compute_role_fingerprints, stale_roles
+from llmhub_cli.generator import generate_machine_config, ProjectSpec, SelectorOptions
+from llmhub_cli.generator import needs as needs_module
+from llmhub_cli.generator.emitter import load_machine_config
+
+
+CATALOG = [
+    CanonicalModel(canonical_id="openai/gpt-4o", provider="openai", model_id="gpt-4o",
+                   quality_tier=1, cost_tier=4),
+    CanonicalModel(canonical_id="openai/gpt-4o-mini", provider="openai", model_id="gpt-4o-mini",
+                   quality_tier=3, cost_tier=1),
+    CanonicalModel(canonical_id="anthropic/claude-3-5-sonnet", provider="anthropic",
+                   model_id="claude-3-5-sonnet", quality_tier=1, cost_tier=4),
+]
+
+
+def _write_spec(path, summarizer_description="Summarize text"):
+    path.write_text(yaml.safe_dump({
+        "project": "test-app",
+        "env": "dev",
+        "roles": {
+            "analyst": {"kind": "chat", "description": "Analyze feedback", "preferences": {"quality": "high"}},
+            "summarizer": {"kind": "chat", "description": summarizer_description, "preferences": {"cost": "low"}},
+        },
+    }))
+
+
+@pytest.fixture
+def paths(tmp_path):
+    spec_path = tmp_path / "llmhub.spec.yaml"
+    _write_spec(spec_path)
+    return spec_path, tmp_path / "llmhub.yaml"
+
+
+def _generate(spec_path, output_path, catalog=CATALOG, **kwargs):
+    return generate_machine_config(
+        str(spec_path), None, output_path=str(output_path),
+        catalog_override=catalog, no_llm=True, **kwargs
+    )
+
+
+def _interpreted_roles(spy):
+    return [role_id for call in spy.call_args_list for role_id in call.args[0].roles]
+
+
+def test_fingerprints_are_recorded_per_role(paths):
+    spec_path, output_path = paths
+
+    _generate(spec_path, output_path)
+
+    config = load_machine_config(str(output_path))
+    analyst, summarizer = config.meta["analyst"].fingerprint, config.meta["summarizer"].fingerprint
+    assert analyst.interpreter == "offline"
+    assert analyst.catalog == summarizer.catalog is not None
+    assert analyst.selector == summarizer.selector
+    assert analyst.spec != summarizer.spec
+
+
+def test_unchanged_spec_interprets_nothing(paths):
+    spec_path, output_path = paths
+    first = _generate(spec_path, output_path)
+
+    with patch("llmhub_cli.generator.interpret_needs_offline") as spy:
+        second = _generate(spec_path, output_path, incremental=True)
+
+    spy.assert_not_called()
+    assert second == first
+
+
+def test_only_changed_role_is_regenerated(paths):
+    spec_path, output_path = paths
+    first = _generate(spec_path, output_path)
+    _write_spec(spec_path, summarizer_description="Summarize support tickets")
+
+    with patch("llmhub_cli.generator.interpret_needs_offline",
+               wraps=needs_module.interpret_needs_offline) as spy:
+        second = _generate(spec_path, output_path, incremental=True)
+
+    assert _interpreted_roles(spy) == ["summarizer"]
+    assert list(second.roles) == ["analyst", "summarizer"]
+    assert second.roles["analyst"] == first.roles["analyst"]
+    assert second.meta["summarizer"].fingerprint.spec != first.meta["summarizer"].fingerprint.spec
+
+
+def test_catalog_change_regenerates_every_role(paths):
+    spec_path, output_path = paths
+    _generate(spec_path, output_path)
+
+    with patch("llmhub_cli.generator.interpret_needs_offline",
+               wraps=needs_module.interpret_needs_offline) as spy:
+        _generate(spec_path, output_path, catalog=CATALOG[:2], incremental=True)
+
+    assert _interpreted_roles(spy) == ["analyst", "summarizer"]
+
+
+def test_unreadable_previous_config_regenerates_everything(paths):
+    spec_path, output_path = paths
+    output_path.write_text("roles: [not, a, config]")
+
+    config = _generate(spec_path, output_path, incremental=True)
+
+    assert set(config.roles) == {"analyst", "summarizer"}
+
+
+def test_stale_roles_and_changes():
+    spec = ProjectSpec.model_validate({
+        "project": "test-app",
+        "env": "dev",
+        "roles": {
+            "a": {"kind": "chat", "description": "A"},
+            "b": {"kind": "chat", "description": "B"},
+        },
+    })
+    previous = compute_role_fingerprints(spec, "cat-1", SelectorOptions(), "offline")
+
+    assert stale_roles(previous, previous) == []
+    assert stale_roles(previous, {"a": previous["a"]}) == ["b"]
+
+    current = compute_role_fingerprints(spec, "cat-2", SelectorOptions(num_backups=1), "offline")
+    assert stale_roles(current, previous) == ["a", "b"]
+    assert previous["a"].changes(current["a"]) == ["catalog", "selector"]
@@ -0,0 +1,133 @@
+"""Tests for SP2 - per-role needs interpretation cache."""
+import json
+from unittest.mock import Mock
+import pytest
+from llmhub_runtime import RuntimeConfig
+from llmhub_cli.generator.spec import ProjectSpec
+from llmhub_cli.generator.needs import interpret_needs
+from llmhub_cli.generator.needs import cache as needs_cache
+
+
+@pytest.fixture(autouse=True)
+def needs_dir(tmp_path, monkeypatch):
+    """Keep cached interpretations in a temporary directory."""
+    path = tmp_path / "needs"
+    monkeypatch.setattr(needs_cache, "_get_needs_cache_dir", lambda: path)
+    return path
+
+
+def _spec(**role_overrides) -> ProjectSpec:
+    roles = {
+        "analyst": {"kind": "chat", "description": "Analyze feedback", "preferences": {"quality": "high"}},
+        "summarizer": {"kind": "chat", "description": "Summarize text", "preferences": {"cost": "low"}},
+    }
+    for role_id, role in role_overrides.items():
+        roles[role_id] = role
+    return ProjectSpec.model_validate({
+        "project": "test-app",
+        "env": "dev",
+        "roles": roles,
+        "defaults": {"providers": ["openai"]},
+    })
+
+
+def _hub(model: str = "gpt-4o-mini") -> Mock:
+    """Hub whose completion echoes one RoleNeed per role in the prompt."""
+    hub = Mock()
+    hub.config = RuntimeConfig.model_validate({
+        "project": "generator",
+        "env": "dev",
+        "providers": {"openai": {"env_key": "OPENAI_API_KEY"}},
+        "roles": {"llm.generator": {"provider": "openai", "model": model, "mode": "chat"}},
+    })
+
+    def completion(role, messages, params_override=None):
+        prompt = messages[1]["content"]
+        role_ids = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Role: ")]
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps({
+            "roles": [{"id": role_id, "task_kind": "general", "notes": model} for role_id in role_ids]
+        })
+        return response
+
+    hub.completion.side_effect = completion
+    return hub
+
+
+def _prompted_roles(hub: Mock) -> list[str]:
+    prompt = hub.completion.call_args.kwargs["messages"][1]["content"]
+    return [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Role: ")]
+
+
+def test_unchanged_spec_makes_no_llm_call(needs_dir):
+    interpret_needs(_spec(), _hub())
+
+    hub = _hub()
+    needs = interpret_needs(_spec(), hub)
+
+    hub.completion.assert_not_called()
+    assert [n.id for n in needs] == ["analyst", "summarizer"]
+    assert len(list(needs_dir.glob("*.json"))) == 2
+
+
+def test_only_changed_and_new_roles_are_interpreted():
+    interpret_needs(_spec(), _hub())
+
+    hub = _hub()
+    spec = _spec(
+        summarizer={"kind": "chat", "description": "Summarize long documents", "preferences": {"cost": "low"}},
+        writer={"kind": "chat", "description": "Write copy"},
+    )
+    needs = interpret_needs(spec, hub)
+
+    assert hub.completion.call_count == 1
+    assert _prompted_roles(hub) == ["summarizer", "writer"]
+    assert [n.id for n in needs] == ["analyst", "summarizer", "writer"]
+
+
+def test_defaults_and_generator_model_are_part_of_the_key():
+    interpret_needs(_spec(), _hub())
+
+    hub = _hub(model="gpt-4o")
+    needs = interpret_needs(_spec(), hub)
+    assert _prompted_roles(hub) == ["analyst", "summarizer"]
+    assert all(n.notes == "gpt-4o" for n in needs)
+
+    spec = _spec()
+    spec.defaults.providers = ["anthropic"]
+    hub = _hub(model="gpt-4o")
+    interpret_needs(spec, hub)
+    assert _prompted_roles(hub) == ["analyst", "summarizer"]
+
+
+def test_use_cache_false_reinterprets_every_role():
+    interpret_needs(_spec(), _hub())
+
+    hub = _hub()
+    interpret_needs(_spec(), hub, use_cache=False)
+
+    assert _prompted_roles(hub) == ["analyst", "summarizer"]
+
+
+def test_hub_without_runtime_config_is_not_cached(needs_dir):
+    hub = _hub()
+    hub.config = None
+
+    interpret_needs(_spec(), hub)
+    interpret_needs(_spec(), hub)
+
+    assert hub.completion.call_count == 2
+    assert not needs_dir.exists()
+
+
+def test_corrupt_entry_is_reinterpreted(needs_dir):
+    interpret_needs(_spec(), _hub())
+    for path in needs_dir.glob("*.json"):
+        path.write_text("{not json")
+
+    hub = _hub()
+    needs = interpret_needs(_spec(), hub)
+
+    assert _prompted_roles(hub) == ["analyst", "summarizer"]
+    assert [n.id for n in needs] == ["analyst", "summarizer"]
@@ -0,0 +1,95 @@
+"""Tests for SP2 - deterministic offline needs interpretation."""
+from llmhub_cli.generator.spec import ProjectSpec
+from llmhub_cli.generator.needs import interpret_needs_offline
+
+
+def _spec(roles: dict, **extra) -> ProjectSpec:
+    return ProjectSpec.model_validate({"project": "test-app", "env": "dev", "roles": roles, **extra})
+
+
+def test_preference_levels_map_to_biases():
+    spec = _spec({
+        "fast": {"kind": "chat", "description": "Chat", "preferences": {"quality": "low", "cost": "low", "latency": "low"}},
+        "best": {"kind": "chat", "description": "Chat", "preferences": {"quality": "high", "cost": "high"}},
+        "plain": {"kind": "chat", "description": "Chat"},
+    })
+
+    fast, best, plain = interpret_needs_offline(spec)
+
+    assert (fast.quality_bias, fast.cost_bias, fast.latency_sensitivity) == (0.2, 0.8, 0.8)
+    assert (best.quality_bias, best.cost_bias) == (0.8, 0.2)
+    assert (plain.quality_bias, plain.cost_bias, plain.latency_sensitivity) == (0.5, 0.5, 0.5)
+
+
+def test_description_keywords():
+    spec = _spec({
+        "analyst": {"kind": "chat", "description": "Analyze customer-facing reports step by step"},
+        "writer": {"kind": "chat", "description": "Write marketing stories"},
+        "extractor": {"kind": "chat", "description": "Extract fields from long documents as JSON"},
+        "agent": {"kind": "chat", "description": "Agent that reads screenshots"},
+    })
+
+    analyst, writer, extractor, agent = interpret_needs_offline(spec)
+
+    assert (analyst.task_kind, analyst.importance, analyst.reasoning_required) == ("reasoning", "critical", True)
+    assert writer.task_kind == "creative"
+    assert extractor.task_kind == "factual"
+    assert extractor.structured_output_required
+    assert extractor.context_min == 100000
+    assert agent.tools_required
+    assert agent.modalities_in == ["text", "image"]
+
+
+def test_role_kinds_set_modalities():
+    spec = _spec({
+        "embed": {"kind": "embedding", "description": "Text embeddings"},
+        "tool": {"kind": "tool", "description": "Calls functions"},
+        "image": {"kind": "image", "description": "Generate images"},
+    })
+
+    embed, tool, image = interpret_needs_offline(spec)
+
+    assert embed.modalities_out == ["embedding"]
+    assert embed.task_kind == "general"
+    assert tool.tools_required
+    assert image.modalities_out == ["image"]
+
+
+def test_provider_constraints():
+    spec = _spec(
+        {
+            "own": {"kind": "chat", "description": "Chat", "preferences": {
+                "providers": ["anthropic"], "provider_blocklist": ["mistral"], "model_denylist": ["gpt-4"],
+            }},
+            "default": {"kind": "chat", "description": "Chat"},
+            "forced": {"kind": "chat", "description": "Chat", "force_provider": "google"},
+        },
+        providers={"openai": {"enabled": True}, "google": {"enabled": False}},
+        defaults={"providers": ["openai"]},
+    )
+
+    own, default, forced = interpret_needs_offline(spec)
+
+    assert own.provider_allowlist == ["anthropic"]
+    assert own.provider_blocklist == ["mistral", "google"]
+    assert own.model_denylist == ["gpt-4"]
+    assert default.provider_allowlist == ["openai"]
+    assert forced.provider_allowlist == ["google"]
+    assert forced.provider_blocklist is None
+
+
+def test_enabled_providers_are_the_fallback_allowlist():
+    spec = _spec(
+        {"chat": {"kind": "chat", "description": "Chat"}},
+        providers={"openai": {"enabled": True}, "anthropic": {"enabled": True}},
+    )
+
+    (need,) = interpret_needs_offline(spec)
+
+    assert need.provider_allowlist == ["openai", "anthropic"]
+
+
+def test_interpretation_is_deterministic():
+    spec = _spec({f"role{i}": {"kind": "chat", "description": f"Summarize report {i}"} for i in range(5)})
+
+    assert interpret_needs_offline(spec) == interpret_needs_offline(spec)
@@ -0,0 +1,148 @@
+"""Tests for SP2 - sharded, concurrent needs interpretation."""
+import json
+import threading
+import time
+from unittest.mock import Mock
+import pytest
+from llmhub_runtime import RuntimeConfig
+from llmhub_cli.generator.spec import ProjectSpec
+from llmhub_cli.generator.needs import interpret_needs, InterpreterError
+from llmhub_cli.generator.needs import cache as needs_cache
+
+
+def _spec(n: int) -> ProjectSpec:
+    return ProjectSpec.model_validate({
+        "project": "test-app",
+        "env": "dev",
+        "roles": {f"role{i}": {"kind": "chat", "description": f"Role number {i}"} for i in range(n)},
+    })
+
+
+def _role_ids(messages) -> list[str]:
+    return [line.split(": ", 1)[1] for line in messages[1]["content"].splitlines() if line.startswith("Role: ")]
+
+
+class FakeHub:
+    """Hub answering one RoleNeed per prompted role; can fail chosen roles."""
+
+    def __init__(self, fail_times=None, malformed=(), delay=0.0):
+        self.config = None  # Not cacheable
+        self.fail_times = dict(fail_times or {})
+        self.malformed = set(malformed)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def completion(self, role, messages, params_override=None):
+        role_ids = _role_ids(messages)
+        with self._lock:
+            self.calls.append(role_ids)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            with self._lock:
+                for role_id in role_ids:
+                    if self.fail_times.get(role_id, 0) > 0:
+                        self.fail_times[role_id] -= 1
+                        raise RuntimeError(f"provider error for {role_id}")
+            roles = [
+                {"id": role_id, "quality_bias": 7 if role_id in self.malformed else 0.5}
+                for role_id in role_ids
+            ]
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = json.dumps({"roles": roles})
+            return response
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_shards_cover_all_roles_in_spec_order():
+    hub = FakeHub()
+
+    needs = interpret_needs(_spec(10), hub, shard_size=3)
+
+    assert [n.id for n in needs] == [f"role{i}" for i in range(10)]
+    assert sorted(len(c) for c in hub.calls) == [1, 3, 3, 3]
+
+
+def test_concurrency_is_bounded_and_parallel():
+    hub = FakeHub(delay=0.05)
+
+    interpret_needs(_spec(12), hub, shard_size=1, max_concurrency=4)
+
+    assert hub.max_active == 4
+
+
+def test_only_failed_shards_are_retried():
+    hub = FakeHub(fail_times={"role4": 1})
+
+    needs = interpret_needs(_spec(6), hub, shard_size=2)
+
+    assert [n.id for n in needs] == [f"role{i}" for i in range(6)]
+    assert hub.calls.count(["role4", "role5"]) == 2
+    assert hub.calls.count(["role0", "role1"]) == 1
+    assert hub.calls.count(["role2", "role3"]) == 1
+
+
+def test_persistent_failure_reports_failed_roles():
+    hub = FakeHub(malformed={"role3"})
+
+    with pytest.raises(InterpreterError, match="role2, role3"):
+        interpret_needs(_spec(4), hub, shard_size=2, max_retries=2)
+
+    assert hub.calls.count(["role2", "role3"]) == 3
+
+
+def test_missing_role_in_response_fails_shard():
+    hub = FakeHub()
+    original = hub.completion
+
+    def drop_role1(role, messages, params_override=None):
+        response = original(role, messages, params_override)
+        data = json.loads(response.choices[0].message.content)
+        data["roles"] = [r for r in data["roles"] if r["id"] != "role1"]
+        response.choices[0].message.content = json.dumps(data)
+        return response
+
+    hub.completion = drop_role1
+
+    with pytest.raises(InterpreterError, match="missing roles: role1"):
+        interpret_needs(_spec(2), hub, shard_size=2, max_retries=0)
+
+
+def test_succeeded_shards_are_cached_when_another_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(needs_cache, "_get_needs_cache_dir", lambda: tmp_path / "needs")
+    hub = FakeHub(malformed={"role3"})
+    hub.config = RuntimeConfig.model_validate({
+        "project": "generator",
+        "env": "dev",
+        "providers": {"openai": {"env_key": "OPENAI_API_KEY"}},
+        "roles": {"llm.generator": {"provider": "openai", "model": "gpt-4o-mini", "mode": "chat"}},
+    })
+
+    with pytest.raises(InterpreterError) as excinfo:
+        interpret_needs(_spec(6), hub, shard_size=2, max_retries=0)
+    assert "roles role2, role3:" in str(excinfo.value)
+    assert "role0" not in str(excinfo.value)
+
+    # The next run only sends the failed shard's roles
+    hub.malformed.clear()
+    hub.calls.clear()
+    needs = interpret_needs(_spec(6), hub, shard_size=2)
+
+    assert [n.id for n in needs] == [f"role{i}" for i in range(6)]
+    assert hub.calls == [["role2", "role3"]]
+
+
+def test_non_positive_shard_size_and_concurrency_are_clamped():
+    hub = FakeHub()
+
+    needs = interpret_needs(_spec(3), hub, shard_size=-2, max_concurrency=0, max_retries=-1)
+
+    assert [n.id for n in needs] == ["role0", "role1", "role2"]
+    assert len(hub.calls) == 3
@@ -172,3 +172,70 @@ def test_filter_combined_constraints():
     
     assert len(filtered) == 1
     assert filtered[0].model_id == "gpt-4"
+
+
+def test_filter_modalities():
+    """Test filtering by required input and output modalities."""
+    role = RoleNeed(
+        id="test",
+        modalities_in=["text", "image"]
+    )
+    models = [
+        create_mock_model("openai/gpt-4o", "openai", "gpt-4o", input_modalities=["text", "image"]),
+        create_mock_model("openai/gpt-3.5", "openai", "gpt-3.5-turbo", input_modalities=["text"]),
+        create_mock_model("openai/dall-e", "openai", "dall-e", input_modalities=["text", "image"],
+                          output_modalities=["image"]),
+    ]
+    
+    filtered = filter_candidates(role, models)
+    
+    assert [m.model_id for m in filtered] == ["gpt-4o"]
+
+
+def test_filter_matches_reference_loop():
+    """Test index-based filtering agrees with a plain per-model check."""
+    import random
+    
+    rng = random.Random(7)
+    providers = ["openai", "anthropic", "google", "mistral"]
+    models = [
+        create_mock_model(
+            f"{providers[i % 4]}/m{i}", providers[i % 4], f"m{i}",
+            supports_reasoning=rng.random() < 0.5,
+            supports_tool_call=rng.random() < 0.5,
+            supports_structured_output=rng.random() < 0.5,
+            context_tokens=rng.choice([None, 4000, 32000, 128000, 200000]),
+            input_modalities=rng.choice([["text"], ["text", "image"]]),
+        )
+        for i in range(200)
+    ]
+    
+    def reference(role, model):
+        return (
+            (not role.provider_allowlist or model.provider in role.provider_allowlist)
+            and not (role.provider_blocklist and model.provider in role.provider_blocklist)
+            and not (role.model_denylist and (model.canonical_id in role.model_denylist
+                                              or model.model_id in role.model_denylist))
+            and (not role.reasoning_required or model.supports_reasoning)
+            and (not role.tools_required or model.supports_tool_call)
+            and (not role.structured_output_required or model.supports_structured_output)
+            and all(m in model.input_modalities for m in role.modalities_in)
+            and all(m in model.output_modalities for m in role.modalities_out)
+            and (role.context_min is None
+                 or (model.context_tokens is not None and model.context_tokens >= role.context_min))
+        )
+    
+    for _ in range(50):
+        role = RoleNeed(
+            id="test",
+            provider_allowlist=rng.choice([None, ["openai"], ["anthropic", "google"]]),
+            provider_blocklist=rng.choice([None, ["mistral"]]),
+            model_denylist=rng.choice([None, ["m1", "openai/m4"]]),
+            reasoning_required=rng.random() < 0.3,
+            tools_required=rng.random() < 0.3,
+            structured_output_required=rng.random() < 0.3,
+            context_min=rng.choice([None, 0, 32000, 150000]),
+            modalities_in=rng.choice([["text"], ["text", "image"]]),
+        )
+        expected = [m for m in models if reference(role, m)]
+        assert filter_candidates(role, models) == expected
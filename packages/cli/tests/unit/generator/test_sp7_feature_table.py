@@ -0,0 +1,99 @@
+"""Tests for SP7 - persisted per-model Feature Table."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import numpy as np
+from llmhub_cli.catalog import Catalog, CanonicalModel
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog.handle import get_catalog_handle
+from llmhub_cli.generator.selection import features as features_module
+from llmhub_cli.generator.selection.features import FeatureTable, feature_table_for
+from llmhub_cli.generator.selection.scorer import _compute_freshness_score
+
+
+def _dated_models() -> list[CanonicalModel]:
+    now = datetime.now()
+    dates = [
+        None,
+        "not-a-date",
+        "2024-13-45",
+        (now + timedelta(days=10)).isoformat(),
+        (now - timedelta(days=1)).date().isoformat(),
+        (now - timedelta(days=200)).isoformat(),
+        (now - timedelta(days=365)).isoformat(),
+        (now - timedelta(days=500)).isoformat(),
+        (now - timedelta(days=2000)).isoformat(),
+        (datetime.now(timezone.utc) - timedelta(days=100)).isoformat().replace("+00:00", "Z"),
+        (datetime.now(timezone(timedelta(hours=-7))) - timedelta(days=600)).isoformat(),
+    ]
+    return [
+        CanonicalModel(
+            canonical_id=f"openai/m{i}",
+            provider="openai",
+            model_id=f"m{i}",
+            release_date=date,
+            last_updated="2020-01-01" if i == 0 else None,
+            arena_score=1200.0 if i % 2 else None,
+            context_tokens=128000 if i % 3 else None,
+        )
+        for i, date in enumerate(dates)
+    ]
+
+
+def test_vectorized_freshness_matches_scalar():
+    models = _dated_models()
+
+    table = FeatureTable.build(models)
+
+    assert table.freshness().tolist() == [_compute_freshness_score(m) for m in models]
+
+
+def test_memoized_catalog_table_is_persisted_and_reused(cache_path):
+    models = _dated_models()
+    cache_module.save_catalog(Catalog(built_at="2024-12-02T00:00:00", models=models))
+    catalog = get_catalog_handle().load()
+
+    first = feature_table_for(catalog.models)
+    saved = list((cache_path.parent / "features").glob("*.npz"))
+    assert [p.name for p in saved] == [f"v{features_module.FEATURE_TABLE_VERSION}-{catalog.fingerprint}.npz"]
+
+    with patch.object(FeatureTable, "build", side_effect=AssertionError("rebuilt")):
+        second = feature_table_for(catalog.models)
+
+    np.testing.assert_array_equal(second.tiers, first.tiers)
+    np.testing.assert_array_equal(second.date_us, first.date_us)
+    np.testing.assert_array_equal(second.model_id_rank, first.model_id_rank)
+
+
+def test_unfingerprinted_lists_are_not_persisted(cache_path):
+    feature_table_for(_dated_models())
+
+    assert not (cache_path.parent / "features").exists()
+
+
+def test_load_rejects_stale_or_corrupt_tables(tmp_path):
+    models = _dated_models()
+    path = tmp_path / "table.npz"
+    FeatureTable.build(models).save(path)
+
+    assert FeatureTable.load(path, len(models)) is not None
+    assert FeatureTable.load(path, len(models) + 1) is None
+
+    with patch.object(features_module, "FEATURE_TABLE_VERSION", 99):
+        assert FeatureTable.load(path, len(models)) is None
+
+    path.write_bytes(b"garbage")
+    assert FeatureTable.load(path, len(models)) is None
+    assert FeatureTable.load(tmp_path / "missing.npz", len(models)) is None
+
+
+def test_new_catalog_prunes_old_tables(cache_path):
+    for model_id in ("a", "b"):
+        models = [CanonicalModel(canonical_id=f"openai/{model_id}", provider="openai", model_id=model_id)]
+        cache_module.save_catalog(Catalog(built_at="2024-12-02T00:00:00", models=models))
+        get_catalog_handle().invalidate()
+        catalog = get_catalog_handle().load()
+        feature_table_for(catalog.models)
+
+    saved = list((cache_path.parent / "features").glob("*.npz"))
+    assert len(saved) == 1
+    assert catalog.fingerprint in saved[0].name
@@ -0,0 +1,117 @@
+"""Tests for latency as a selection dimension (weights, scoring, max_ttft_ms)."""
+import random
+import pytest
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection import (
+    derive_weights,
+    filter_candidates,
+    score_candidates,
+    relax_and_select,
+    select_for_role,
+    ConstraintMasks,
+)
+from llmhub_cli.generator.selection.scorer import _compute_final_score, _compute_latency_score
+from llmhub_cli.catalog.schema import CanonicalModel
+
+
+def _model(model_id: str, ttft_ms=None, tps=None, **kwargs) -> CanonicalModel:
+    return CanonicalModel(
+        canonical_id=f"openai/{model_id}",
+        provider="openai",
+        model_id=model_id,
+        ttft_ms=ttft_ms,
+        output_tokens_per_second=tps,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def models():
+    return [
+        _model("slow", ttft_ms=2500, tps=20, quality_tier=2),
+        _model("fast", ttft_ms=250, tps=140, quality_tier=3),
+        _model("unmeasured", quality_tier=3),
+    ]
+
+
+def test_latency_score():
+    assert _compute_latency_score(_model("a")) == 0.5
+    assert _compute_latency_score(_model("a", ttft_ms=100, tps=300)) == 1.0
+    assert _compute_latency_score(_model("a", ttft_ms=5000, tps=0)) == 0.0
+    assert _compute_latency_score(_model("a", ttft_ms=200)) == 1.0
+    assert _compute_latency_score(_model("a", tps=75)) == 0.5
+
+
+def test_latency_weight_follows_sensitivity():
+    assert derive_weights(RoleNeed(id="r", latency_sensitivity=0.3)).w_latency == 0.0
+    assert derive_weights(RoleNeed(id="r", latency_sensitivity=0.5)).w_latency == 0.0
+    assert derive_weights(RoleNeed(id="r", latency_sensitivity=0.9)).w_latency > 0.1
+
+
+def test_latency_sensitive_role_prefers_fast_model(models):
+    relaxed = select_for_role(RoleNeed(id="r", latency_sensitivity=0.0), models)
+    sensitive = select_for_role(RoleNeed(id="r", latency_sensitivity=1.0, cost_bias=0.0), models)
+
+    assert relaxed.primary_model == "slow"
+    assert sensitive.primary_model == "fast"
+
+
+def test_vectorized_scores_match_scalar_with_latency():
+    rng = random.Random(3)
+    models = [
+        _model(
+            f"m{i}",
+            ttft_ms=rng.choice([None, 150, 800, 2000, 4000]),
+            tps=rng.choice([None, 10, 60, 200]),
+            quality_tier=rng.randint(1, 5),
+            cost_tier=rng.randint(1, 5),
+            context_tokens=rng.choice([None, 32000, 128000]),
+        )
+        for i in range(80)
+    ]
+    for sensitivity in (0.0, 0.6, 1.0):
+        role = RoleNeed(id="r", latency_sensitivity=sensitivity)
+        weights = derive_weights(role)
+        scored = dict((m.model_id, s) for m, s in score_candidates(role, weights, models))
+        for model in models:
+            assert scored[model.model_id] == _compute_final_score(model, role, weights)
+
+
+def test_max_ttft_ms_excludes_only_measured_slow_models(models):
+    role = RoleNeed(id="r", max_ttft_ms=1000)
+
+    assert [m.model_id for m in filter_candidates(role, models)] == ["fast", "unmeasured"]
+    assert ConstraintMasks(role, models).eliminated["max_ttft_ms"] == 1
+
+
+def test_max_ttft_ms_is_relaxed(models):
+    measured = [m for m in models if m.ttft_ms is not None]
+    role = RoleNeed(id="r", max_ttft_ms=100)
+
+    scored, relaxations = relax_and_select(role, measured, derive_weights(role))
+
+    assert relaxations == ["Raised time-to-first-token limit from 100 ms to 200 ms"]
+    assert scored == []
+
+    role = RoleNeed(id="r", max_ttft_ms=150)
+    scored, relaxations = relax_and_select(role, measured, derive_weights(role))
+
+    assert relaxations == ["Raised time-to-first-token limit from 150 ms to 300 ms"]
+    assert [m.model_id for m, _ in scored] == ["fast"]
+
+
+def test_unreliable_and_observed_slow_models_rank_lower():
+    models = [
+        _model("flaky", quality_tier=2, error_rate=0.4),
+        _model("sluggish", quality_tier=2, observed_latency_ms=18000),
+        _model("steady", quality_tier=2, error_rate=0.0, observed_latency_ms=800),
+    ]
+    role = RoleNeed(id="r", latency_sensitivity=0.9)
+    weights = derive_weights(role)
+
+    ranked = score_candidates(role, weights, models)
+
+    assert ranked[0][0].model_id == "steady"
+    assert ranked[-1][0].model_id == "flaky"
+    for model, score in ranked:
+        assert score == _compute_final_score(model, role, weights)
@@ -0,0 +1,188 @@
+"""Tests for SP7 - vectorized Scoring Engine."""
+import random
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection import (
+    derive_weights,
+    score_candidates,
+    filter_candidates,
+    select_for_role,
+    select_for_roles,
+    SelectorOptions,
+    engine_for,
+)
+from llmhub_cli.generator.selection import engine as engine_module
+from llmhub_cli.generator.selection import features as features_module
+from llmhub_cli.generator.selection import scorer as scorer_module
+from llmhub_cli.generator.selection.scorer import _compute_final_score
+from llmhub_cli.generator.selection.weights_models import Weights
+from llmhub_cli.catalog.schema import CanonicalModel
+
+
+def _random_models(rng: random.Random, n: int) -> list[CanonicalModel]:
+    providers = ["openai", "anthropic", "google", "mistral"]
+    models = []
+    for i in range(n):
+        provider = rng.choice(providers)
+        models.append(CanonicalModel(
+            canonical_id=f"{provider}/m{i % 37}",
+            provider=provider,
+            model_id=f"m{i % 37}",
+            quality_tier=rng.randint(1, 5),
+            reasoning_tier=rng.randint(1, 5),
+            creative_tier=rng.randint(1, 5),
+            cost_tier=rng.randint(1, 5),
+            context_tokens=rng.choice([None, 0, 8000, 32000, 128000, 200000, 1000000]),
+            arena_score=rng.choice([None, 1100.0, 1250.0, 1400.0]),
+            release_date=rng.choice([None, "2024-01-15", "2023-06-01", "not-a-date"]),
+            supports_reasoning=rng.random() < 0.5,
+            supports_tool_call=rng.random() < 0.5,
+        ))
+    return models
+
+
+def _random_role(rng: random.Random, i: int) -> RoleNeed:
+    return RoleNeed(
+        id=f"role{i}",
+        task_kind=rng.choice(["general", "reasoning", "creative", "factual"]),
+        importance=rng.choice(["low", "medium", "high", "critical"]),
+        quality_bias=rng.choice([0.2, 0.5, 0.8]),
+        cost_bias=rng.choice([0.2, 0.5, 0.8]),
+        latency_sensitivity=rng.choice([0.3, 0.9]),
+        context_min=rng.choice([None, 16000, 100000]),
+        provider_allowlist=rng.choice([None, ["openai"], ["anthropic", "google"]]),
+        reasoning_required=rng.random() < 0.2,
+    )
+
+
+def _reference_ranking(role, weights, models):
+    """Scalar scoring with the original tuple-key sort."""
+    scored = [(m, _compute_final_score(m, role, weights)) for m in models]
+
+    def sort_key(item):
+        model, score = item
+        in_allowlist = 1 if (role.provider_allowlist and model.provider in role.provider_allowlist) else 0
+        return (-score, -in_allowlist, -(model.arena_score or 0), -(model.context_tokens or 0), model.model_id)
+
+    return sorted(scored, key=sort_key)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_score_candidates_matches_scalar_reference(seed):
+    """Vectorized scores and order must be identical to the scalar scorer."""
+    rng = random.Random(seed)
+    models = _random_models(rng, 150)
+
+    for i in range(10):
+        role = _random_role(rng, i)
+        weights = derive_weights(role)
+
+        actual = score_candidates(role, weights, models)
+        expected = _reference_ranking(role, weights, models)
+
+        assert [(m.canonical_id, s) for m, s in actual] == [(m.canonical_id, s) for m, s in expected]
+
+
+def test_rank_top_k_matches_full_sort_prefix():
+    """argpartition top-k keeps the same prefix as a full sort, ties included."""
+    rng = random.Random(11)
+    models = _random_models(rng, 300)
+    engine = engine_for(models)
+    positions = np.arange(len(models))
+
+    for i in range(10):
+        role = _random_role(rng, i)
+        weights = derive_weights(role)
+        full = engine.rank_candidates(role, weights, positions)
+        for k in (0, 1, 3, 17):
+            assert engine.rank_candidates(role, weights, positions, top_k=k) == full[:k]
+
+
+def test_score_matrix_matches_single_role_scores():
+    rng = random.Random(5)
+    models = _random_models(rng, 100)
+    engine = engine_for(models)
+    roles = [_random_role(rng, i) for i in range(7)]
+    weights = [derive_weights(r) for r in roles]
+
+    matrix = engine.score_matrix(roles, weights)
+
+    assert matrix.shape == (100, 7)
+    for j, (role, w) in enumerate(zip(roles, weights)):
+        assert matrix[:, j].tolist() == [_compute_final_score(m, role, w) for m in models]
+
+
+def test_select_for_roles_matches_select_for_role():
+    """Batch selection must agree with selecting roles one at a time."""
+    rng = random.Random(3)
+    models = _random_models(rng, 200)
+    roles = [_random_role(rng, i) for i in range(40)]
+    roles.append(RoleNeed(id="impossible", provider_allowlist=["openai"], context_min=10**9))
+    options = SelectorOptions(num_backups=3)
+
+    batch = select_for_roles(roles, models, options)
+
+    assert [r.role_id for r in batch] == [r.id for r in roles]
+    for role, result in zip(roles, batch):
+        single = select_for_role(role, models, options)
+        assert result == single
+        if result.primary and not result.relaxations_applied:
+            expected = _reference_ranking(role, derive_weights(role), filter_candidates(role, models))
+            assert result.primary == expected[0][0].canonical_id
+            assert result.backups == [m.canonical_id for m, _ in expected[1:4]]
+
+
+def test_empty_inputs():
+    engine = engine_for([])
+    role = RoleNeed(id="test")
+    assert engine.rank_candidates(role, derive_weights(role), np.arange(0)) == []
+    assert select_for_roles([], [], SelectorOptions()) == []
+
+
+def test_score_candidates_reuses_catalog_engine():
+    """Filtered candidate lists are scored on the catalog engine, not memoized."""
+    rng = random.Random(7)
+    models = _random_models(rng, 200)
+    engine_module._engine_memo.clear()
+    engine = engine_for(models)
+
+    for i in range(10):
+        role = _random_role(rng, i)
+        weights = derive_weights(role)
+        candidates = filter_candidates(role, models)
+
+        actual = score_candidates(role, weights, candidates)
+        expected = _reference_ranking(role, weights, candidates)
+        assert [(m.canonical_id, s) for m, s in actual] == [(m.canonical_id, s) for m, s in expected]
+
+    assert engine_module._engine_memo.cached() == [engine]
+
+    # Models from no known catalog get a throwaway engine
+    outsiders = _random_models(rng, 20)
+    role = RoleNeed(id="r")
+    assert len(score_candidates(role, derive_weights(role), outsiders)) == 20
+    assert engine_module._engine_memo.cached() == [engine]
+
+
+def test_freshness_is_computed_at_score_time(monkeypatch):
+    released = (datetime.now() - timedelta(days=30)).date().isoformat()
+    models = [CanonicalModel(canonical_id="openai/a", provider="openai", model_id="a", release_date=released)]
+    engine = engine_for(models)
+    role = RoleNeed(id="r")
+    weights = Weights(w_quality=0.5, w_cost=0, w_reasoning=0, w_creative=0, w_context=0, w_freshness=0.5)
+    before = engine.score(role, weights, np.arange(1))[0]
+
+    class _Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=3 * 365)
+
+    monkeypatch.setattr(features_module, "datetime", _Later)
+    monkeypatch.setattr(scorer_module, "datetime", _Later)
+
+    assert engine.features.column("freshness").tolist() == [0.0]
+    after = engine.score(role, weights, np.arange(1))[0]
+    assert after < before
+    assert after == _compute_final_score(models[0], role, weights)
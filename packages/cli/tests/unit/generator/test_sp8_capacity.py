@@ -0,0 +1,144 @@
+"""Tests for capacity-aware selection (expected_rps, tokens_per_request, rate limits)."""
+import json
+import random
+import pytest
+from unittest.mock import patch
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection import (
+    derive_weights,
+    filter_candidates,
+    score_candidates,
+    relax_and_select,
+    select_for_role,
+    ConstraintMasks,
+)
+from llmhub_cli.generator.selection.scorer import (
+    _compute_capacity_score,
+    _compute_final_score,
+    required_rpm,
+    required_tpm,
+)
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.handle import get_catalog_handle
+from llmhub_cli.catalog.schema import AnyLLMModel, CanonicalModel
+
+
+def _model(model_id: str, rpm=None, tpm=None, **kwargs) -> CanonicalModel:
+    return CanonicalModel(
+        canonical_id=f"openai/{model_id}",
+        provider="openai",
+        model_id=model_id,
+        rate_limit_rpm=rpm,
+        rate_limit_tpm=tpm,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def models():
+    return [
+        _model("premium", rpm=60, tpm=100_000, quality_tier=1),
+        _model("scalable", rpm=10_000, tpm=2_000_000, quality_tier=2),
+        _model("unlisted", quality_tier=3),
+    ]
+
+
+def test_required_load():
+    role = RoleNeed(id="r", expected_rps=5, tokens_per_request=1000)
+
+    assert required_rpm(role) == 300
+    assert required_tpm(role) == 300_000
+    assert required_rpm(RoleNeed(id="r")) is None
+    assert required_tpm(RoleNeed(id="r", expected_rps=5)) is None
+
+
+def test_capacity_score():
+    role = RoleNeed(id="r", expected_rps=2, tokens_per_request=1000)
+
+    assert _compute_capacity_score(_model("a"), role) == 1.0
+    assert _compute_capacity_score(_model("a", rpm=240, tpm=240_000), role) == 1.0
+    assert _compute_capacity_score(_model("a", rpm=60, tpm=240_000), role) == 0.5
+    assert _compute_capacity_score(_model("a", rpm=240, tpm=30_000), role) == 0.25
+    assert _compute_capacity_score(_model("a", rpm=1), RoleNeed(id="r")) == 1.0
+
+
+def test_insufficient_limits_are_filtered_unknown_pass(models):
+    role = RoleNeed(id="r", expected_rps=5, tokens_per_request=1000)
+
+    assert [m.model_id for m in filter_candidates(role, models)] == ["scalable", "unlisted"]
+    assert ConstraintMasks(role, models).eliminated["capacity"] == 1
+
+
+def test_capacity_decides_choice(models):
+    result = select_for_role(RoleNeed(id="r", expected_rps=5), models)
+
+    assert result.primary_model == "scalable"
+    assert "Capacity decided the choice: openai/premium ranks higher" in result.rationale
+    assert "5 requests/second" in result.rationale
+
+    assert select_for_role(RoleNeed(id="r"), models).primary_model == "premium"
+
+
+def test_capacity_is_relaxed_but_still_down_ranks():
+    models = [
+        _model("tiny", rpm=10, quality_tier=1),
+        _model("small", rpm=120, quality_tier=2),
+    ]
+    role = RoleNeed(id="r", expected_rps=10)
+
+    scored, relaxations = relax_and_select(role, models, derive_weights(role))
+
+    assert relaxations == ["Ignored rate limits below the expected load of 10 requests/second"]
+    assert [m.model_id for m, _ in scored] == ["small", "tiny"]
+
+    result = select_for_role(role, models)
+    assert "Capacity: no candidate's rate limits sustain 10 requests/second" in result.rationale
+
+
+def test_vectorized_scores_match_scalar_with_capacity():
+    rng = random.Random(5)
+    models = [
+        _model(
+            f"m{i}",
+            rpm=rng.choice([None, 30, 600, 10_000]),
+            tpm=rng.choice([None, 40_000, 1_000_000]),
+            quality_tier=rng.randint(1, 5),
+            cost_tier=rng.randint(1, 5),
+        )
+        for i in range(80)
+    ]
+    for rps, tokens in ((None, None), (2, None), (20, 3000)):
+        role = RoleNeed(id="r", expected_rps=rps, tokens_per_request=tokens)
+        weights = derive_weights(role)
+        scored = dict((m.model_id, s) for m, s in score_candidates(role, weights, models))
+        for model in models:
+            assert scored[model.model_id] == _compute_final_score(model, role, weights)
+
+
+def test_build_applies_provider_and_model_rate_limits(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_get_cache_path", lambda: tmp_path / "catalog.json")
+    monkeypatch.setenv("LLMHUB_TELEMETRY_DIR", str(tmp_path / "telemetry"))
+    (tmp_path / "overrides.json").write_text(json.dumps({
+        "rate_limits": {
+            "openai": {"rpm": 500, "tpm": 200_000},
+            "openai/gpt-4o": {"rpm": 5000},
+        },
+    }))
+    get_catalog_handle().invalidate()
+
+    with patch.object(builder_module, "load_anyllm_models", return_value=[
+        AnyLLMModel(provider="openai", model_id="gpt-4o"),
+        AnyLLMModel(provider="openai", model_id="gpt-4"),
+        AnyLLMModel(provider="anthropic", model_id="claude-3-haiku"),
+    ]), patch.object(builder_module, "load_modelsdev_models", return_value={}), \
+            patch.object(builder_module, "load_arena_models", return_value={}):
+        catalog = builder_module._build_fresh_catalog()
+    get_catalog_handle().invalidate()
+
+    by_id = {m.model_id: m for m in catalog.models}
+    assert (by_id["gpt-4o"].rate_limit_rpm, by_id["gpt-4o"].rate_limit_tpm) == (5000, 200_000)
+    assert (by_id["gpt-4"].rate_limit_rpm, by_id["gpt-4"].rate_limit_tpm) == (500, 200_000)
+    assert by_id["claude-3-haiku"].rate_limit_rpm is None
+    # Packaged sections are still present
+    assert builder_module.load_overrides()["id_mappings"]
@@ -0,0 +1,120 @@
+"""Tests for SP8 - mask-based Relaxation Engine."""
+import random
+from copy import deepcopy
+import pytest
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection import (
+    derive_weights,
+    filter_candidates,
+    score_candidates,
+    relax_and_select,
+    select_for_role,
+    ConstraintMasks,
+)
+from llmhub_cli.catalog.schema import CanonicalModel
+
+
+def _reference_relax(role, models, weights):
+    """The original deepcopy-and-refilter relaxation loop."""
+    relaxations = []
+    relaxed = deepcopy(role)
+    steps = [
+        ("provider_allowlist", None, "Removed provider allowlist"),
+        ("context_min", "context", None),
+        ("structured_output_required", False, "Made structured output optional"),
+        ("reasoning_required", False, "Made reasoning optional"),
+        ("tools_required", False, "Made tools optional"),
+    ]
+    for name, value, description in steps:
+        if not getattr(relaxed, name):
+            continue
+        if value == "context":
+            original = relaxed.context_min
+            relaxed.context_min = int(original * 0.75)
+            description = f"Lowered context requirement from {original} to {relaxed.context_min}"
+        else:
+            setattr(relaxed, name, value)
+        relaxations.append(description)
+        filtered = filter_candidates(relaxed, models)
+        if filtered:
+            return score_candidates(relaxed, weights, filtered), relaxations
+    return [], relaxations
+
+
+@pytest.fixture
+def models():
+    rng = random.Random(7)
+    result = []
+    for i in range(120):
+        provider = rng.choice(["openai", "anthropic", "google"])
+        result.append(CanonicalModel(
+            canonical_id=f"{provider}/m{i}",
+            provider=provider,
+            model_id=f"m{i}",
+            quality_tier=rng.randint(1, 5),
+            cost_tier=rng.randint(1, 5),
+            context_tokens=rng.choice([None, 8000, 32000, 128000]),
+            supports_reasoning=rng.random() < 0.3,
+            supports_tool_call=rng.random() < 0.3,
+            supports_structured_output=rng.random() < 0.2,
+            input_modalities=rng.choice([["text"], ["text", "image"]]),
+        ))
+    return result
+
+
+def test_relaxation_matches_reference(models):
+    rng = random.Random(1)
+    for i in range(60):
+        role = RoleNeed(
+            id=f"role{i}",
+            provider_allowlist=rng.choice([None, ["mistral"], ["openai"]]),
+            context_min=rng.choice([None, 40000, 150000, 1000000]),
+            structured_output_required=rng.random() < 0.5,
+            reasoning_required=rng.random() < 0.5,
+            tools_required=rng.random() < 0.5,
+            modalities_in=rng.choice([[], ["image"], ["video"]]),
+        )
+        weights = derive_weights(role)
+
+        actual = relax_and_select(role, models, weights)
+        expected = _reference_relax(role, models, weights)
+
+        assert actual[1] == expected[1]
+        assert [(m.canonical_id, s) for m, s in actual[0]] == [(m.canonical_id, s) for m, s in expected[0]]
+
+
+def test_relaxation_does_not_mutate_role(models):
+    role = RoleNeed(id="test", provider_allowlist=["mistral"], context_min=1000000, tools_required=True)
+    before = role.model_dump()
+
+    relax_and_select(role, models, derive_weights(role))
+
+    assert role.model_dump() == before
+
+
+def test_elimination_counts(models):
+    role = RoleNeed(id="test", provider_allowlist=["openai"], reasoning_required=True, context_min=100000)
+
+    masks = ConstraintMasks(role, models)
+
+    assert masks.eliminated == {
+        "provider_allowlist": sum(m.provider != "openai" for m in models),
+        "reasoning_required": sum(not m.supports_reasoning for m in models),
+        "modalities": 0,  # Default text in/out
+        "context_min": sum((m.context_tokens or 0) < 100000 for m in models),
+    }
+    assert masks.positions().tolist() == [
+        i for i, m in enumerate(models)
+        if m.provider == "openai" and m.supports_reasoning and (m.context_tokens or 0) >= 100000
+    ]
+
+
+def test_no_candidates_rationale_explains_constraints(models):
+    role = RoleNeed(id="test", modalities_in=["video"], tools_required=True)
+
+    result = select_for_role(role, models)
+
+    assert result.primary is None
+    assert result.relaxations_applied == ["Made tools optional"]
+    assert result.constraint_eliminations["modalities"] == len(models)
+    assert f"modalities eliminates {len(models)}/{len(models)}" in result.rationale
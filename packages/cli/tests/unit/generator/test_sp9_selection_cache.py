@@ -0,0 +1,88 @@
+"""Tests for SP9 - on-disk SelectionResult cache."""
+from unittest.mock import patch
+import pytest
+from llmhub_cli.catalog.schema import CanonicalModel
+from llmhub_cli.generator.needs import RoleNeed
+from llmhub_cli.generator.selection import SelectorOptions, select_for_roles
+from llmhub_cli.generator.selection import cache as selection_cache
+from llmhub_cli.generator.selection import selector
+
+
+MODELS = [
+    CanonicalModel(canonical_id="openai/gpt-4o", provider="openai", model_id="gpt-4o",
+                   quality_tier=1, cost_tier=4),
+    CanonicalModel(canonical_id="openai/gpt-4o-mini", provider="openai", model_id="gpt-4o-mini",
+                   quality_tier=3, cost_tier=1),
+]
+
+ROLES = [
+    RoleNeed(id="best", quality_bias=0.9, cost_bias=0.1),
+    RoleNeed(id="cheap", quality_bias=0.1, cost_bias=0.9),
+]
+
+
+@pytest.fixture(autouse=True)
+def selections_dir(tmp_path, monkeypatch):
+    """Keep cached selections in a temporary directory."""
+    path = tmp_path / "selections"
+    monkeypatch.setattr(selection_cache, "_get_selection_cache_dir", lambda: path)
+    return path
+
+
+def _spy():
+    return patch.object(selector, "_select_uncached", wraps=selector._select_uncached)
+
+
+def test_cached_results_are_reused(selections_dir):
+    first = select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1")
+
+    with _spy() as spy:
+        second = select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1")
+
+    spy.assert_not_called()
+    assert second == first
+    assert len(list((selections_dir / "cat-1").glob("*.json"))) == 2
+
+
+def test_only_changed_needs_and_options_are_selected():
+    select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1")
+    changed = [ROLES[0], ROLES[1].model_copy(update={"cost_bias": 0.5})]
+
+    with _spy() as spy:
+        select_for_roles(changed, MODELS, catalog_fingerprint="cat-1")
+        assert [r.id for r in spy.call_args.args[0]] == ["cheap"]
+
+        select_for_roles(ROLES, MODELS, SelectorOptions(num_backups=0), catalog_fingerprint="cat-1")
+        assert [r.id for r in spy.call_args.args[0]] == ["best", "cheap"]
+
+
+def test_new_catalog_invalidates_previous_entries(selections_dir):
+    select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1")
+
+    with _spy() as spy:
+        select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-2")
+
+    spy.assert_called_once()
+    assert [p.name for p in selections_dir.iterdir()] == ["cat-2"]
+
+
+def test_scorer_version_is_part_of_the_key():
+    key = selection_cache.selection_cache_key(ROLES[0], SelectorOptions(), "cat-1")
+
+    with patch.object(selection_cache, "SCORER_VERSION", selection_cache.SCORER_VERSION + 1):
+        assert selection_cache.selection_cache_key(ROLES[0], SelectorOptions(), "cat-1") != key
+
+
+def test_unknown_catalog_and_use_cache_false_are_not_cached(selections_dir):
+    select_for_roles(ROLES, MODELS)
+    select_for_roles(ROLES, MODELS, use_cache=False, catalog_fingerprint="cat-1")
+
+    assert not selections_dir.exists()
+
+
+def test_corrupt_entry_is_reselected(selections_dir):
+    first = select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1")
+    for path in (selections_dir / "cat-1").glob("*.json"):
+        path.write_text("{not json")
+
+    assert select_for_roles(ROLES, MODELS, catalog_fingerprint="cat-1") == first
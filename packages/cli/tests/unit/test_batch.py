@@ -0,0 +1,77 @@
+"""
+Unit tests for multi-project batch generation (llmhub generate --all).
+"""
+import pytest
+import yaml
+from typer.testing import CliRunner
+from llmhub_cli.batch import discover_specs, generate_all
+from llmhub_cli.cli import app
+from llmhub_cli.runtime_io import load_runtime
+
+runner = CliRunner()
+
+
+def _write_spec(project, cost="medium"):
+    project.mkdir(parents=True, exist_ok=True)
+    (project / "llmhub.spec.yaml").write_text(yaml.safe_dump({
+        "project": project.name,
+        "env": "dev",
+        "providers": {"openai": {"enabled": True, "env_key": "OPENAI_API_KEY"}},
+        "roles": {"llm.chat": {"kind": "chat", "description": "Chat", "preferences": {"cost": cost}}},
+    }))
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    for name in ["services/api", "services/worker", "tools/cli"]:
+        _write_spec(tmp_path / name)
+    _write_spec(tmp_path / "node_modules" / "pkg")
+    _write_spec(tmp_path / ".hidden" / "svc")
+    return tmp_path
+
+
+def test_discover_skips_hidden_and_vendored_dirs(monorepo):
+    projects = discover_specs(monorepo)
+
+    assert [p.relative_to(monorepo).as_posix() for p in projects] == [
+        "services/api", "services/worker", "tools/cli"
+    ]
+
+
+def test_generate_all_writes_every_project(monorepo):
+    outcomes = generate_all(monorepo, max_workers=2)
+
+    assert [o.status for o in outcomes] == ["created"] * 3
+    assert outcomes[0].changes == ["+ llm.chat → openai:gpt-4o-mini"]
+    for outcome in outcomes:
+        assert load_runtime(outcome.root / "llmhub.yaml").project == outcome.root.name
+        assert (outcome.root / ".env.example").exists()
+
+
+def test_second_run_reports_only_changes(monorepo):
+    generate_all(monorepo)
+    _write_spec(monorepo / "services/worker", cost="low")
+    (monorepo / "tools/cli" / "llmhub.spec.yaml").write_text("roles: [broken")
+
+    outcomes = {o.root.name: o for o in generate_all(monorepo)}
+
+    assert outcomes["api"].status == "unchanged"
+    assert outcomes["worker"].status == "updated"
+    assert outcomes["worker"].changes == ["~ llm.chat: settings changed"]
+    assert outcomes["cli"].status == "failed"
+    assert outcomes["cli"].error
+
+
+def test_dry_run_writes_nothing(monorepo):
+    outcomes = generate_all(monorepo, write=False)
+
+    assert [o.status for o in outcomes] == ["created"] * 3
+    assert not list(monorepo.rglob("llmhub.yaml"))
+
+
+def test_cli_summary(monorepo):
+    result = runner.invoke(app, ["generate", "--all", str(monorepo)])
+
+    assert result.exit_code == 0
+    assert "services/api" in result.stdout
+    assert "3 created" in result.stdout
@@ -0,0 +1,57 @@
+"""
+Unit tests for the selection benchmark suite and synthetic catalogs.
+"""
+import json
+from llmhub_cli.tools.synthetic_catalog import synthetic_models, synthetic_roles
+from llmhub_cli.tools.benchmark import BenchmarkResult, check_thresholds, main, run_scenario
+
+
+def test_synthetic_data_is_seeded_and_varied():
+    models = synthetic_models(500, seed=7)
+
+    assert models == synthetic_models(500, seed=7)
+    assert models != synthetic_models(500, seed=8)
+    assert len({m.canonical_id for m in models}) == 500
+    assert {m.quality_tier for m in models} == {1, 2, 3, 4, 5}
+    assert any("image" in m.input_modalities for m in models)
+    assert any(m.output_modalities == ["embedding"] for m in models)
+    assert len({m.context_tokens for m in models}) > 3
+
+    roles = synthetic_roles(50, seed=7)
+    assert roles == synthetic_roles(50, seed=7)
+    assert any(r.provider_allowlist for r in roles)
+
+
+def test_scenario_reports_every_stage():
+    results = run_scenario(200, 5, measure_memory=True)
+
+    assert [r.stage for r in results] == [
+        "prepare", "filter_candidates", "score_candidates",
+        "relax_and_select", "select_for_role", "select_for_roles",
+    ]
+    assert all(r.seconds >= 0 and r.peak_mb is not None for r in results)
+    assert results[-1].measured_roles == 5
+
+
+def test_thresholds():
+    result = BenchmarkResult(stage="select_for_roles", models=1000, roles=10, measured_roles=10,
+                             seconds=2.0, roles_per_second=5.0, peak_mb=50.0)
+
+    assert check_thresholds([result], {"select_for_roles@1000x10": {"max_seconds": 3}}) == []
+    violations = check_thresholds([result], {
+        "select_for_roles@1000x10": {"max_seconds": 1, "max_peak_mb": 10},
+        "select_for_roles@*": {"min_roles_per_second": 100},
+    })
+    assert len(violations) == 3
+
+
+def test_main_writes_report_and_gates(tmp_path):
+    output = tmp_path / "report.json"
+    thresholds = tmp_path / "thresholds.json"
+    thresholds.write_text(json.dumps({"select_for_roles@*": {"max_seconds": 0}}))
+
+    code = main(["--models", "100", "--roles", "2", "--no-memory",
+                 "--output", str(output), "--thresholds", str(thresholds)])
+
+    assert code == 1
+    assert len(json.loads(output.read_text())["results"]) == 6
@@ -0,0 +1,204 @@
+"""
+Unit tests for any-llm discovery: key-aware skipping, the per-provider
+listing cache and parallel listing, against a fake any_llm module.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import types
+import pytest
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.mapper import fuse_sources, load_overrides
+from llmhub_cli.catalog.schema import ModelsDevModel
+from llmhub_cli.catalog.sources import anyllm as anyllm_module
+from llmhub_cli.catalog.sources.anyllm import (
+    DEFAULT_DISCOVERY_PROVIDERS,
+    ProviderSpec,
+    discovery_providers,
+    load_anyllm_models,
+)
+
+
+class _FakeModel:
+    def __init__(self, model_id: str):
+        self.id = model_id
+
+
+@pytest.fixture
+def fake_anyllm(tmp_path, monkeypatch):
+    """Fake any_llm module recording list_models calls, plus isolated caches."""
+    monkeypatch.setattr(cache_module, "_get_cache_path", lambda: tmp_path / "catalog.json")
+    for spec in DEFAULT_DISCOVERY_PROVIDERS:
+        for key in spec.env_keys:
+            monkeypatch.delenv(key, raising=False)
+
+    module = types.ModuleType("any_llm")
+    module.calls = []
+    module.catalog = {"alpha": ["a-1", "a-2"], "beta": ["b-1"]}
+    module.error = None
+
+    def list_models(provider):
+        module.calls.append(provider)
+        if module.error is not None:
+            raise module.error
+        return [_FakeModel(m) for m in module.catalog[provider]]
+
+    module.list_models = list_models
+    monkeypatch.setitem(sys.modules, "any_llm", module)
+    return module
+
+
+PROVIDERS = [
+    ProviderSpec(name="alpha", env_keys=["ALPHA_API_KEY"]),
+    ProviderSpec(name="beta", env_keys=["BETA_API_KEY"], ttl_hours=1),
+]
+
+
+def _ids(models):
+    return [(m.provider, m.model_id) for m in models]
+
+
+def test_unconfigured_providers_are_skipped_without_import(fake_anyllm, monkeypatch):
+    # Importing any_llm would now fail
+    monkeypatch.setitem(sys.modules, "any_llm", None)
+
+    assert load_anyllm_models(PROVIDERS) == []
+    assert load_anyllm_models() == []
+
+
+def test_lists_configured_providers_and_caches_per_provider(fake_anyllm, monkeypatch):
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+
+    assert _ids(load_anyllm_models(PROVIDERS)) == [("alpha", "a-1"), ("alpha", "a-2")]
+    assert fake_anyllm.calls == ["alpha"]
+
+    # alpha is served from its cache; only the newly configured beta is listed
+    monkeypatch.setenv("BETA_API_KEY", "key-b")
+    assert _ids(load_anyllm_models(PROVIDERS)) == [("alpha", "a-1"), ("alpha", "a-2"), ("beta", "b-1")]
+    assert fake_anyllm.calls == ["alpha", "beta"]
+
+    cache_dir = cache_module._get_sources_dir() / "anyllm"
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["alpha.json", "beta.json"]
+    assert "key-a" not in (cache_dir / "alpha.json").read_text()
+
+
+def test_cache_expires_per_provider_ttl(fake_anyllm, monkeypatch):
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+    monkeypatch.setenv("BETA_API_KEY", "key-b")
+    load_anyllm_models(PROVIDERS)
+
+    # Two hours old: past beta's 1h TTL, within alpha's 24h
+    stamp = time.time() - 2 * 3600
+    for name in ("alpha", "beta"):
+        os.utime(anyllm_module._get_provider_cache_path(name), (stamp, stamp))
+    fake_anyllm.calls.clear()
+
+    load_anyllm_models(PROVIDERS)
+    assert fake_anyllm.calls == ["beta"]
+
+
+def test_changed_credentials_invalidate_cache(fake_anyllm, monkeypatch):
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+    load_anyllm_models(PROVIDERS)
+
+    monkeypatch.setenv("ALPHA_API_KEY", "key-rotated")
+    fake_anyllm.catalog["alpha"] = ["a-3"]
+    assert _ids(load_anyllm_models(PROVIDERS)) == [("alpha", "a-3")]
+    assert fake_anyllm.calls == ["alpha", "alpha"]
+
+
+def test_failures_are_reported_and_fall_back_to_stale_cache(fake_anyllm, monkeypatch, capsys):
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+    monkeypatch.setenv("BETA_API_KEY", "key-b")
+    fake_anyllm.error = RuntimeError("401 Unauthorized")
+
+    assert load_anyllm_models(PROVIDERS) == []
+    out = capsys.readouterr().out
+    assert "Failed to list alpha models: 401 Unauthorized" in out
+    assert "Failed to list beta models" in out
+    # Failures are not cached
+    assert not (cache_module._get_sources_dir() / "anyllm").exists()
+
+    fake_anyllm.error = None
+    load_anyllm_models(PROVIDERS)
+    stamp = time.time() - 48 * 3600
+    os.utime(anyllm_module._get_provider_cache_path("alpha"), (stamp, stamp))
+    fake_anyllm.error = ConnectionError("unreachable")
+
+    assert _ids(load_anyllm_models(PROVIDERS))[:2] == [("alpha", "a-1"), ("alpha", "a-2")]
+    assert "using cached listing" in capsys.readouterr().out
+
+
+def test_providers_are_listed_in_parallel(fake_anyllm, monkeypatch):
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+    monkeypatch.setenv("BETA_API_KEY", "key-b")
+    barrier = threading.Barrier(2, timeout=5)
+    listing = fake_anyllm.list_models
+
+    def list_models(provider):
+        # Each listing waits for the other one to start
+        barrier.wait()
+        return listing(provider)
+
+    fake_anyllm.list_models = list_models
+
+    assert len(load_anyllm_models(PROVIDERS)) == 3
+    assert sorted(fake_anyllm.calls) == ["alpha", "beta"]
+
+
+def test_discovery_overrides_extend_and_adjust_registry(tmp_path, fake_anyllm, monkeypatch):
+    (tmp_path / "overrides.json").write_text(json.dumps({
+        "discovery": {
+            "alpha": {"env_keys": ["ALPHA_API_KEY"]},
+            "openai": {"ttl_hours": 2},
+            "ollama": {"enabled": False},
+            "broken": {"ttl_hours": "soon"},
+        },
+    }))
+    monkeypatch.setenv("ALPHA_API_KEY", "key-a")
+    monkeypatch.setenv("OLLAMA_HOST", "http://localhost:11434")
+
+    specs = {spec.name: spec for spec in discovery_providers(load_overrides())}
+    assert specs["openai"].ttl_hours == 2
+    assert specs["openai"].env_keys == ["OPENAI_API_KEY"]
+    assert specs["ollama"].enabled is False
+    assert "broken" not in specs
+
+    # Default registry plus overrides: only alpha is configured and enabled
+    assert _ids(load_anyllm_models()) == [("alpha", "a-1"), ("alpha", "a-2")]
+    assert fake_anyllm.calls == ["alpha"]
+
+
+def test_any_llm_ids_are_catalogued_under_models_dev_providers(fake_anyllm, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "key-g")
+    monkeypatch.setenv("DASHSCOPE_API_KEY", "key-d")
+    fake_anyllm.catalog = {
+        "gemini": ["models/gemini-1.5-pro"],
+        "dashscope": ["qwen-max"],
+    }
+
+    discovered = load_anyllm_models()
+    assert sorted(fake_anyllm.calls) == ["dashscope", "gemini"]
+    assert _ids(discovered) == [("google", "gemini-1.5-pro"), ("qwen", "qwen-max")]
+
+    overrides = load_overrides()
+    assert builder_module._modelsdev_providers(discovered, overrides) == {"google", "alibaba"}
+
+    modelsdev_map = {
+        f"{provider}/{model_id}": ModelsDevModel(
+            canonical_id=f"{provider}/{model_id}",
+            provider=provider,
+            model_id=model_id,
+            price_input_per_million=1.25,
+            supports_tool_call=True,
+        )
+        for provider, model_id in (("google", "gemini-1.5-pro"), ("alibaba", "qwen-max"))
+    }
+    fused = {r.canonical_id: r for r in fuse_sources(discovered, modelsdev_map, {}, overrides)}
+
+    assert set(fused) == {"google/gemini-1.5-pro", "qwen/qwen-max"}
+    assert fused["google/gemini-1.5-pro"].modelsdev.price_input_per_million == 1.25
+    assert fused["qwen/qwen-max"].modelsdev.supports_tool_call
@@ -0,0 +1,150 @@
+"""
+Unit tests for the in-process arena leaderboard source, served by a local
+fixture HTTP server.
+"""
+import os
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from llmhub_cli.catalog.sources import arena as arena_module
+from llmhub_cli.catalog.sources.arena import load_arena_models, _iter_leaderboard
+
+FIXTURE_PATH = Path(__file__).parent.parent / "fixtures" / "arena_leaderboard.json"
+
+ETAG = '"leaderboard-v1"'
+
+
+class _LeaderboardServer(ThreadingHTTPServer):
+    """Serves the fixture leaderboard with an ETag and logs request headers."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _LeaderboardHandler)
+        self.payload = FIXTURE_PATH.read_bytes()
+        self.status = 200
+        self.requests: list = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/leaderboard-text.json"
+
+
+class _LeaderboardHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.status != 200:
+            self.send_response(server.status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", "Mon, 02 Dec 2024 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(server.payload)))
+        self.end_headers()
+        self.wfile.write(server.payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Local leaderboard server plus an isolated arena cache dir."""
+    httpd = _LeaderboardServer()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("LLMHUB_ARENA_CACHE_DIR", str(tmp_path / "arena"))
+    monkeypatch.setenv(arena_module.ARENA_URL_ENV, httpd.url)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _expire(path: Path) -> None:
+    stamp = time.time() - 25 * 3600
+    os.utime(path, (stamp, stamp))
+
+
+def test_streaming_parse_matches_json_in_any_chunking():
+    text = FIXTURE_PATH.read_text()
+    expected = list(_iter_leaderboard([text]))
+
+    for size in (1, 7, 64):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert list(_iter_leaderboard(chunks)) == expected
+
+    assert [(c, m) for c, m, _ in expected][:3] == [
+        ("coding", "gpt-4o-2024-05-13"),
+        ("coding", "claude-3-5-sonnet-20240620"),
+        ("coding", "coding-only-model"),
+    ]
+    assert ("meta", "not a category") not in [(c, m) for c, m, _ in expected]
+
+
+def test_malformed_leaderboard_raises():
+    with pytest.raises(ValueError):
+        list(_iter_leaderboard(['{"coding": {"a": {"rating": 1}']))
+    with pytest.raises(ValueError):
+        list(_iter_leaderboard(['["not", "an", "object"]']))
+
+
+def test_load_prefers_overall_text_and_skips_unrated():
+    models = load_arena_models(FIXTURE_PATH)
+
+    assert set(models) == {
+        "gpt-4o-2024-05-13",
+        "claude-3-5-sonnet-20240620",
+        "coding-only-model",
+        "llama-3.1-8b-instruct",
+    }
+    assert models["claude-3-5-sonnet-20240620"].rating == 1268.3
+    assert models["claude-3-5-sonnet-20240620"].category == "overall_text"
+    assert models["coding-only-model"].category == "coding"
+    assert models["llama-3.1-8b-instruct"].rating_q025 is None
+
+
+def test_fetches_once_then_revalidates_conditionally(server):
+    models = load_arena_models()
+    assert models["gpt-4o-2024-05-13"].rating == 1285.7
+    assert len(server.requests) == 1
+
+    # Fresh cache: no request at all
+    load_arena_models()
+    assert len(server.requests) == 1
+
+    # Expired cache: conditional request, 304, TTL restarted
+    cache_path = arena_module._get_arena_cache_path()
+    _expire(cache_path)
+    assert load_arena_models() == models
+    assert len(server.requests) == 2
+    assert server.requests[1].get("If-None-Match") == ETAG
+    assert server.requests[1].get("If-Modified-Since") == "Mon, 02 Dec 2024 00:00:00 GMT"
+    assert arena_module._is_fresh(cache_path)
+
+
+def test_failed_refresh_falls_back_to_stale_cache(server):
+    load_arena_models()
+    cache_path = arena_module._get_arena_cache_path()
+    _expire(cache_path)
+
+    server.status = 500
+    assert "gpt-4o-2024-05-13" in load_arena_models()
+
+    server.status = 200
+    server.payload = b'{"overall_text": {"truncated": '
+    _expire(cache_path)
+    (cache_path.parent / "leaderboard-text.meta.json").unlink()
+    assert "gpt-4o-2024-05-13" in load_arena_models()
+    assert sorted(p.name for p in cache_path.parent.iterdir()) == ["leaderboard-text.json"]
+
+
+def test_unreachable_source_without_cache_returns_empty(server):
+    server.status = 404
+
+    assert load_arena_models() == {}
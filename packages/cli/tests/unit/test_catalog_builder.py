@@ -0,0 +1,165 @@
+"""
+Unit tests for catalog builder tier derivation.
+"""
+import random
+import numpy as np
+import pytest
+from llmhub_cli.catalog.schema import AnyLLMModel, ModelsDevModel, ArenaModel, FusedRaw
+from llmhub_cli.catalog.builder import (
+    GlobalStats,
+    PROVIDER_QUALITY_TIERS,
+    _compute_global_stats,
+    _derive_canonical_models,
+    _derive_canonical,
+    _derive_cost_tiers,
+    _derive_quality_tiers,
+)
+
+
+def _reference_cost_tier(avg_price, stats):
+    """Per-model if/elif rule the vectorized derivation must reproduce."""
+    if avg_price is None:
+        return 3
+    if avg_price <= stats.price_p20:
+        return 1
+    elif avg_price <= stats.price_p40:
+        return 2
+    elif avg_price <= stats.price_p60:
+        return 3
+    elif avg_price <= stats.price_p80:
+        return 4
+    return 5
+
+
+def _reference_quality_tier(arena_score, provider, stats):
+    if arena_score is not None:
+        if arena_score >= stats.arena_p80:
+            return 1
+        elif arena_score >= stats.arena_p60:
+            return 2
+        elif arena_score >= stats.arena_p40:
+            return 3
+        elif arena_score >= stats.arena_p20:
+            return 4
+        return 5
+    return PROVIDER_QUALITY_TIERS.get(provider.lower(), 3)
+
+
+def _reference_tags(f):
+    tags = []
+    if f.modelsdev:
+        if f.modelsdev.supports_reasoning:
+            tags.append("reasoning")
+        if f.modelsdev.supports_tool_call:
+            tags.append("tools")
+        if f.modelsdev.supports_structured_output:
+            tags.append("structured-output")
+        if f.modelsdev.open_weights:
+            tags.append("open-weights")
+        if "image" in f.modelsdev.input_modalities:
+            tags.append("vision")
+        if "audio" in f.modelsdev.input_modalities:
+            tags.append("audio-input")
+        if "image" in f.modelsdev.output_modalities:
+            tags.append("image-gen")
+    return tags
+
+
+def _random_fused(rng: random.Random, n: int) -> list[FusedRaw]:
+    providers = ["openai", "Anthropic", "google", "deepseek", "acme"]
+    prices = [None, 0.0, 0.15, 0.6, 1.0, 2.5, 3.0, 10.0, 15.0]
+    records = []
+    for i in range(n):
+        provider = rng.choice(providers)
+        anyllm = AnyLLMModel(provider=provider, model_id=f"model-{i}")
+        modelsdev = None
+        if rng.random() < 0.8:
+            modelsdev = ModelsDevModel(
+                canonical_id=f"{provider}/model-{i}",
+                provider=provider,
+                model_id=f"model-{i}",
+                supports_reasoning=rng.random() < 0.4,
+                supports_tool_call=rng.random() < 0.5,
+                supports_structured_output=rng.random() < 0.3,
+                open_weights=rng.random() < 0.2,
+                input_modalities=rng.choice([["text"], ["text", "image"], ["text", "audio"]]),
+                output_modalities=rng.choice([["text"], ["text", "image"]]),
+                price_input_per_million=rng.choice(prices),
+                price_output_per_million=rng.choice(prices),
+            )
+        arena = None
+        if rng.random() < 0.6:
+            arena = ArenaModel(arena_id=f"model-{i}", rating=rng.choice([0.0, 1000.0, 1150.0, 1200.0, 1250.0, 1300.0]))
+        records.append(FusedRaw(canonical_id=f"{provider}/model-{i}", anyllm=anyllm, modelsdev=modelsdev, arena=arena))
+    return records
+
+
+class TestVectorizedTiers:
+    """Vectorized tiers must match the per-model rules exactly."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_derivation_matches_reference(self, seed):
+        fused = _random_fused(random.Random(seed), 300)
+        stats = _compute_global_stats(fused)
+
+        models = _derive_canonical_models(fused, stats, {})
+
+        for f, m in zip(fused, models):
+            md = f.modelsdev
+            avg = None
+            if md and md.price_input_per_million is not None and md.price_output_per_million is not None:
+                avg = (md.price_input_per_million + md.price_output_per_million) / 2
+            quality = _reference_quality_tier(f.arena.rating if f.arena else None, f.anyllm.provider, stats)
+            reasoning = quality
+            if md and md.supports_reasoning and reasoning > 1:
+                reasoning = max(1, reasoning - 1)
+
+            assert m.cost_tier == _reference_cost_tier(avg, stats)
+            assert m.quality_tier == quality
+            assert m.reasoning_tier == reasoning
+            assert m.creative_tier == quality
+            assert m.tags == _reference_tags(f)
+
+    def test_boundaries_and_duplicate_quantiles(self):
+        stats = GlobalStats(
+            price_p20=1.0, price_p40=1.0, price_p60=2.0, price_p80=3.0,
+            arena_p20=1000.0, arena_p40=1100.0, arena_p60=1100.0, arena_p80=1300.0,
+        )
+        prices = [None, 0.5, 1.0, 1.5, 2.0, 3.0, 3.5]
+        scores = [None, 900.0, 1000.0, 1100.0, 1200.0, 1300.0, 1400.0]
+
+        cost = _derive_cost_tiers(np.array([np.nan if p is None else p for p in prices]), stats)
+        quality = _derive_quality_tiers(
+            np.array([np.nan if s is None else s for s in scores]), ["anthropic"] * len(scores), stats
+        )
+
+        assert cost.tolist() == [_reference_cost_tier(p, stats) for p in prices]
+        assert quality.tolist() == [_reference_quality_tier(s, "anthropic", stats) for s in scores]
+
+    def test_global_stats_quantiles(self):
+        fused = _random_fused(random.Random(5), 200)
+        stats = _compute_global_stats(fused)
+
+        prices = [
+            (f.modelsdev.price_input_per_million + f.modelsdev.price_output_per_million) / 2
+            for f in fused
+            if f.modelsdev and f.modelsdev.price_input_per_million and f.modelsdev.price_output_per_million
+        ]
+        assert stats.price_p40 == float(np.percentile(np.array(prices), 40))
+
+    def test_empty_input(self):
+        assert _derive_canonical_models([], GlobalStats(), {}) == []
+        assert _compute_global_stats([]) == GlobalStats()
+
+    def test_single_record_uses_family_override(self):
+        f = FusedRaw(
+            canonical_id="openai/gpt-4o-2024",
+            anyllm=AnyLLMModel(provider="openai", model_id="gpt-4o-2024"),
+        )
+        model = _derive_canonical(f, GlobalStats(), {"model_families": {"gpt-4o": "GPT-4o"}})
+
+        assert model.family == "GPT-4o"
+        assert model.display_name == "gpt-4o-2024"
+        assert model.cost_tier == 3
+        assert model.quality_tier == 2
+        assert model.tags == []
@@ -0,0 +1,225 @@
+"""
+Unit tests for the process-wide CatalogHandle.
+"""
+import os
+import threading
+import time
+from unittest.mock import patch
+from llmhub_cli.catalog import CatalogHandle, build_catalog
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.fingerprint import compute_fingerprint
+from llmhub_cli.catalog.schema import AnyLLMModel
+from llmhub_cli.catalog.sources import modelsdev as modelsdev_module
+
+
+class TestCatalogHandle:
+    """Tests for CatalogHandle memoization."""
+
+    def test_load_missing_cache_returns_none(self, cache_path):
+        assert CatalogHandle().load() is None
+
+    def test_load_memoizes_until_file_changes(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+        handle = CatalogHandle()
+
+        with patch.object(cache_module, "load_cached_catalog", wraps=cache_module.load_cached_catalog) as spy:
+            first = handle.load()
+            second = handle.load()
+
+        assert first is second
+        assert spy.call_count == 1
+
+        cache_module.save_catalog(make_catalog("gpt-4o-mini"))
+        st = cache_path.stat()
+        os.utime(cache_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        third = handle.load()
+        assert third is not first
+        assert third.models[0].model_id == "gpt-4o-mini"
+
+    def test_invalidate_forces_reload(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+        handle = CatalogHandle()
+        first = handle.load()
+
+        handle.invalidate()
+
+        assert handle.load() is not first
+
+    def test_deleted_cache_is_not_served_from_memory(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+        handle = CatalogHandle()
+        assert handle.load() is not None
+
+        cache_module.clear_cache()
+
+        assert handle.load() is None
+
+    def test_ttl_applies_to_memoized_catalog(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+        handle = CatalogHandle()
+        assert handle.load(ttl_hours=24) is not None
+
+        assert handle.load(ttl_hours=0) is None
+
+
+class TestBuildCatalogMemoization:
+    """Tests for build_catalog sharing the process-wide handle."""
+
+    def test_build_catalog_reuses_memoized_catalog(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+
+        with patch.object(builder_module, "_build_fresh_catalog") as mock_build:
+            first = build_catalog()
+            second = build_catalog()
+
+        mock_build.assert_not_called()
+        assert first is second
+
+    def test_concurrent_cold_builds_run_once(self, cache_path, make_catalog):
+        calls = []
+
+        def fake_build(profile=False):
+            calls.append(1)
+            catalog = make_catalog()
+            cache_module.save_catalog(catalog)
+            return catalog
+
+        results = []
+        with patch.object(builder_module, "_build_fresh_catalog", side_effect=fake_build):
+            threads = [threading.Thread(target=lambda: results.append(build_catalog())) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+
+
+def _age(path, hours: float) -> None:
+    """Backdate a cache file's mtime by hours."""
+    stamp = time.time() - hours * 3600
+    os.utime(path, (stamp, stamp))
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving expired caches while rebuilding in the background."""
+
+    def test_expired_cache_is_served_and_rebuilt_in_background(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 30)
+        release = threading.Event()
+
+        def slow_build(**kwargs):
+            assert kwargs["save"] is False
+            release.wait(5)
+            return make_catalog("new")
+
+        with patch.object(builder_module, "_build_fresh_catalog", side_effect=slow_build) as mock_build:
+            stale = build_catalog(ttl_hours=24, max_stale_hours=48)
+            assert stale.models[0].model_id == "old"
+
+            # A second caller neither blocks nor starts another rebuild
+            assert build_catalog(ttl_hours=24, max_stale_hours=48) is stale
+
+            release.set()
+            builder_module._wait_for_revalidation(5)
+
+        assert mock_build.call_count == 1
+        assert cache_module.load_cached_catalog().models[0].model_id == "new"
+        assert build_catalog(ttl_hours=24).models[0].model_id == "new"
+
+    def test_background_rebuild_keeps_source_warnings_quiet(self, cache_path, make_catalog, monkeypatch, capsys):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 30)
+        # models.dev is unreachable, so its source warns
+        monkeypatch.setenv(modelsdev_module.MODELSDEV_URL_ENV, "http://127.0.0.1:9/api.json")
+
+        with patch.object(builder_module, "load_anyllm_models", return_value=[
+            AnyLLMModel(provider="openai", model_id="gpt-4o-mini"),
+        ]), patch.object(builder_module, "load_arena_models", return_value={}), \
+                patch.object(builder_module, "_load_env_file"):
+            assert build_catalog(ttl_hours=24, max_stale_hours=48).models[0].model_id == "old"
+            builder_module._wait_for_revalidation(10)
+
+            assert cache_module.load_cached_catalog().models[0].model_id == "gpt-4o-mini"
+            assert capsys.readouterr().out == ""
+
+            # A foreground build still reports them
+            builder_module._build_fresh_catalog(save=False)
+            assert "Failed to fetch models.dev data" in capsys.readouterr().out
+
+    def test_cache_beyond_max_staleness_blocks(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 72)
+
+        with patch.object(builder_module, "_build_fresh_catalog", return_value=make_catalog("new")) as mock_build, \
+                patch.object(builder_module, "_revalidate_in_background") as mock_background:
+            catalog = build_catalog(ttl_hours=24, max_stale_hours=48)
+
+        assert catalog.models[0].model_id == "new"
+        mock_build.assert_called_once_with(profile=False)
+        mock_background.assert_not_called()
+
+    def test_expired_cache_blocks_by_default(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 30)
+
+        with patch.object(builder_module, "_build_fresh_catalog", return_value=make_catalog("new")), \
+                patch.object(builder_module, "_revalidate_in_background") as mock_background:
+            assert build_catalog(ttl_hours=24).models[0].model_id == "new"
+
+        mock_background.assert_not_called()
+
+    def test_failed_background_rebuild_keeps_stale_cache(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 30)
+
+        with patch.object(builder_module, "_build_fresh_catalog", side_effect=RuntimeError("offline")):
+            assert build_catalog(ttl_hours=24, max_stale_hours=48).models[0].model_id == "old"
+            builder_module._wait_for_revalidation(5)
+
+        assert cache_module.load_cached_catalog(ttl_hours=None).models[0].model_id == "old"
+
+    def test_detached_rebuild_spawns_one_process(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog("old"))
+        _age(cache_path, 30)
+
+        with patch.object(builder_module.subprocess, "Popen") as mock_popen:
+            mock_popen.return_value.poll.return_value = None
+            build_catalog(ttl_hours=24, max_stale_hours=48, detach=True)
+            build_catalog(ttl_hours=24, max_stale_hours=48, detach=True)
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0][1:] == ["-c", builder_module._REVALIDATE_COMMAND.format(ttl_hours=24)]
+        builder_module._revalidation = None
+
+
+class TestCatalogFingerprint:
+    """Tests for catalog content fingerprints."""
+
+    def test_fingerprint_depends_on_models_only(self, make_catalog):
+        a = make_catalog()
+        b = make_catalog()
+        b.built_at = "2025-01-01T00:00:00"
+
+        assert compute_fingerprint(a.models) == compute_fingerprint(b.models)
+        assert compute_fingerprint(a.models) != compute_fingerprint(make_catalog("gpt-4o-mini").models)
+
+    def test_legacy_cache_gets_fingerprint_on_load(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+
+        catalog = CatalogHandle().load()
+
+        assert catalog.fingerprint == compute_fingerprint(catalog.models)
+
+    def test_fingerprint_of_matches_memoized_list_only(self, cache_path, make_catalog):
+        cache_module.save_catalog(make_catalog())
+        handle = CatalogHandle()
+        catalog = handle.load()
+
+        assert handle.fingerprint_of(catalog.models) == catalog.fingerprint
+        assert handle.fingerprint_of(list(catalog.models)) is None
@@ -0,0 +1,136 @@
+"""
+Unit tests for the CatalogIndex bitset index and query API.
+"""
+import pytest
+from llmhub_cli.catalog import CanonicalModel
+from llmhub_cli.catalog.index import (
+    CatalogIndex,
+    index_for,
+    And,
+    Or,
+    Not,
+    Provider,
+    HasTag,
+    HasCapability,
+    InputModality,
+    OutputModality,
+    ModelIn,
+    ContextRange,
+    PriceRange,
+)
+
+
+@pytest.fixture
+def models():
+    """Return a small, varied model list."""
+    return [
+        CanonicalModel(
+            canonical_id="openai/gpt-4o", provider="openai", model_id="gpt-4o",
+            supports_tool_call=True, supports_structured_output=True,
+            input_modalities=["text", "image"], context_tokens=128000,
+            price_input_per_million=2.5, price_output_per_million=10.0,
+            tags=["tools", "vision"],
+        ),
+        CanonicalModel(
+            canonical_id="openai/gpt-4o-mini", provider="openai", model_id="gpt-4o-mini",
+            supports_tool_call=True, context_tokens=128000,
+            price_input_per_million=0.15, price_output_per_million=0.6,
+            tags=["tools"],
+        ),
+        CanonicalModel(
+            canonical_id="anthropic/claude-3-5-sonnet", provider="anthropic", model_id="claude-3-5-sonnet",
+            supports_reasoning=True, supports_tool_call=True, context_tokens=200000,
+            price_input_per_million=3.0, price_output_per_million=15.0,
+            tags=["reasoning", "tools"],
+        ),
+        CanonicalModel(
+            canonical_id="OpenAI/legacy", provider="OpenAI", model_id="legacy",
+            context_tokens=None, output_modalities=["embedding"],
+        ),
+    ]
+
+
+def _ids(selected):
+    return [m.model_id for m in selected]
+
+
+class TestPrimitiveBitsets:
+    """Tests for single-predicate lookups."""
+
+    def test_provider_is_case_sensitive_by_default(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(Provider("openai"))) == ["gpt-4o", "gpt-4o-mini"]
+        assert _ids(index.select(Provider("openai", case_sensitive=False))) == ["gpt-4o", "gpt-4o-mini", "legacy"]
+
+    def test_tag_and_capability(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(HasTag("vision"))) == ["gpt-4o"]
+        assert _ids(index.select(HasCapability("reasoning"))) == ["claude-3-5-sonnet"]
+
+    def test_unknown_keys_match_nothing(self, models):
+        index = CatalogIndex(models)
+        assert index.count(Provider("nonexistent")) == 0
+        assert index.count(HasTag("nonexistent")) == 0
+        assert index.count(InputModality("video")) == 0
+
+    def test_unknown_capability_raises(self, models):
+        with pytest.raises(ValueError):
+            CatalogIndex(models).capability("telepathy")
+
+    def test_modalities(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(InputModality("image"))) == ["gpt-4o"]
+        assert _ids(index.select(OutputModality("embedding"))) == ["legacy"]
+
+    def test_model_in_matches_canonical_and_model_id(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(ModelIn(["gpt-4o-mini", "anthropic/claude-3-5-sonnet"]))) == [
+            "gpt-4o-mini", "claude-3-5-sonnet"
+        ]
+
+    def test_bitsets_are_read_only(self, models):
+        index = CatalogIndex(models)
+        with pytest.raises(ValueError):
+            index.tag("tools")[0] = False
+
+
+class TestRangePredicates:
+    """Tests for sorted-array range queries."""
+
+    def test_context_range_inclusive_and_skips_unknown(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(ContextRange(min=128000))) == ["gpt-4o", "gpt-4o-mini", "claude-3-5-sonnet"]
+        assert _ids(index.select(ContextRange(max=128000))) == ["gpt-4o", "gpt-4o-mini"]
+        assert _ids(index.select(ContextRange(min=0))) == ["gpt-4o", "gpt-4o-mini", "claude-3-5-sonnet"]
+
+    def test_price_range_uses_average_price(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(PriceRange(max=1.0))) == ["gpt-4o-mini"]
+        assert _ids(index.select(PriceRange(min=6.25, max=9.0))) == ["gpt-4o", "claude-3-5-sonnet"]
+
+
+class TestComposition:
+    """Tests for AND/OR/NOT composition."""
+
+    def test_and_or_not(self, models):
+        index = CatalogIndex(models)
+        query = (Provider("openai") | Provider("anthropic")) & HasTag("tools") & ~HasTag("vision")
+        assert _ids(index.select(query)) == ["gpt-4o-mini", "claude-3-5-sonnet"]
+
+    def test_empty_and_matches_all_empty_or_matches_none(self, models):
+        index = CatalogIndex(models)
+        assert index.count(And()) == len(models)
+        assert index.count(Or()) == 0
+
+    def test_not_of_range(self, models):
+        index = CatalogIndex(models)
+        assert _ids(index.select(Not(ContextRange(min=150000)))) == ["gpt-4o", "gpt-4o-mini", "legacy"]
+
+    def test_empty_catalog(self):
+        index = CatalogIndex([])
+        assert index.select(Provider("openai") & ContextRange(min=1)) == []
+
+
+def test_index_for_is_built_once_per_list(models):
+    assert index_for(models) is index_for(models)
+    assert index_for(list(models)) is not index_for(models)
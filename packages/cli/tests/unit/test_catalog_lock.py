@@ -0,0 +1,132 @@
+"""
+Unit tests for cross-process single-flight catalog rebuilds and atomic cache writes.
+"""
+import json
+import subprocess
+import sys
+import textwrap
+import pytest
+from unittest.mock import patch
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.lock import FileLock
+
+
+def test_file_locks_exclude_each_other(tmp_path):
+    first = FileLock(tmp_path / "x.lock")
+    second = FileLock(tmp_path / "x.lock", timeout=0.1)
+
+    with first:
+        assert first.locked
+        assert not second.acquire(blocking=False)
+        with pytest.raises(TimeoutError):
+            with second:
+                pass
+
+    assert not first.locked
+    assert second.acquire(blocking=False)
+    second.release()
+
+
+# Each process fakes a slow rebuild and logs it, then builds the catalog
+_WORKER = textwrap.dedent("""
+    import os, sys, time
+    from pathlib import Path
+    from llmhub_cli.catalog import Catalog, CanonicalModel
+    from llmhub_cli.catalog import cache as cache_module
+    from llmhub_cli.catalog import builder as builder_module
+
+    root = Path(sys.argv[1])
+    cache_module._get_cache_path = lambda: root / "catalog.json"
+
+    def slow_build(echo=print, save=True, profile=False):
+        with open(root / "builds.log", "a") as f:
+            f.write(f"{os.getpid()}\\n")
+        time.sleep(1.0)
+        catalog = Catalog(built_at="now", models=[
+            CanonicalModel(canonical_id="openai/m", provider="openai", model_id="m"),
+        ])
+        cache_module.save_catalog(catalog)
+        return catalog
+
+    builder_module._build_fresh_catalog = slow_build
+    print(builder_module.build_catalog().models[0].canonical_id)
+""")
+
+
+def test_parallel_processes_rebuild_cold_cache_once(tmp_path):
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", _WORKER, str(tmp_path)],
+            cwd=tmp_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(6)
+    ]
+    outputs = [worker.communicate(timeout=60) for worker in workers]
+
+    assert all(worker.returncode == 0 for worker in workers), outputs
+    assert all(out.strip() == "openai/m" for out, _ in outputs)
+    assert len((tmp_path / "builds.log").read_text().split()) == 1
+
+
+def test_waiting_force_refresh_reuses_rebuild_by_lock_holder(cache_path, make_catalog):
+    cache_module.save_catalog(make_catalog("old"))
+    holder = FileLock(cache_module._get_rebuild_lock_path())
+    holder.acquire()
+
+    class OtherProcessFinishes(FileLock):
+        def acquire(self, *args, **kwargs):
+            # The holder writes its result and releases the lock while we wait
+            cache_module.save_catalog(make_catalog("theirs"))
+            holder.release()
+            return super().acquire(*args, **kwargs)
+
+    with patch.object(builder_module, "FileLock", OtherProcessFinishes), \
+            patch.object(builder_module, "_build_fresh_catalog") as mock_build:
+        catalog = builder_module.build_catalog(force_refresh=True)
+
+    mock_build.assert_not_called()
+    assert catalog.models[0].model_id == "theirs"
+    released = FileLock(cache_module._get_rebuild_lock_path())
+    assert released.acquire(blocking=False)
+    released.release()
+
+
+def test_profiled_force_refresh_does_not_reuse_rebuild_by_lock_holder(cache_path, make_catalog):
+    cache_module.save_catalog(make_catalog("old"))
+    holder = FileLock(cache_module._get_rebuild_lock_path())
+    holder.acquire()
+
+    class OtherProcessFinishes(FileLock):
+        def acquire(self, *args, **kwargs):
+            cache_module.save_catalog(make_catalog("theirs"))
+            holder.release()
+            return super().acquire(*args, **kwargs)
+
+    with patch.object(builder_module, "FileLock", OtherProcessFinishes), \
+            patch.object(builder_module, "_build_fresh_catalog", return_value=make_catalog("ours")) as mock_build:
+        catalog = builder_module.build_catalog(force_refresh=True, profile=True)
+
+    mock_build.assert_called_once_with(profile=True)
+    assert catalog.models[0].model_id == "ours"
+
+
+def test_background_rebuild_skips_while_another_process_rebuilds(cache_path):
+    with FileLock(cache_module._get_rebuild_lock_path()), \
+            patch.object(builder_module, "_build_fresh_catalog") as mock_build:
+        builder_module._revalidate(24)
+
+    mock_build.assert_not_called()
+
+
+def test_save_catalog_replaces_atomically(cache_path, make_catalog):
+    cache_module.save_catalog(make_catalog("old"))
+
+    with patch.object(cache_module.json, "dump", side_effect=ValueError("boom")):
+        cache_module.save_catalog(make_catalog("new"))
+
+    assert json.loads(cache_path.read_text())["models"][0]["model_id"] == "old"
+    assert [p.name for p in cache_path.parent.iterdir()] == ["catalog.json"]
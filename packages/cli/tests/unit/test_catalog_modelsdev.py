@@ -0,0 +1,201 @@
+"""
+Unit tests for streaming models.dev ingestion and its normalized cache,
+served by a local fixture HTTP server.
+"""
+import json
+import threading
+import tracemalloc
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.schema import AnyLLMModel
+from llmhub_cli.catalog.sources import modelsdev as modelsdev_module
+from llmhub_cli.catalog.sources.modelsdev import (
+    load_modelsdev_models,
+    normalize_modelsdev,
+    _iter_modelsdev_stream,
+    _normalize_entries,
+)
+from llmhub_cli.catalog.sources.jsonstream import JsonStream
+
+FIXTURE_PATH = Path(__file__).parent.parent / "fixtures" / "modelsdev_api.json"
+
+
+class _ApiServer(ThreadingHTTPServer):
+    """Serves the fixture api.json and counts requests."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _ApiHandler)
+        self.payload = FIXTURE_PATH.read_bytes()
+        self.status = 200
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api.json"
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", str(len(self.server.payload)))
+        self.end_headers()
+        self.wfile.write(self.server.payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Local models.dev server plus an isolated catalog cache dir."""
+    httpd = _ApiServer()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(cache_module, "_get_cache_path", lambda: tmp_path / "catalog.json")
+    monkeypatch.setenv(modelsdev_module.MODELSDEV_URL_ENV, httpd.url)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_stream_matches_parsed_payload_in_any_chunking():
+    text = FIXTURE_PATH.read_text()
+    expected = normalize_modelsdev(json.loads(text), providers={"openai", "anthropic"})
+
+    for size in (1, 5, 4096):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert _normalize_entries(_iter_modelsdev_stream(chunks, {"openai", "anthropic"})) == expected
+
+    assert set(expected) == {"openai/gpt-4o", "openai/o3-mini", "anthropic/claude-3-5-haiku-20241022"}
+    gpt4o = expected["openai/gpt-4o"]
+    assert gpt4o.price_input_per_million == 2.5
+    assert gpt4o.context_tokens == 128000
+    assert gpt4o.max_output_tokens == 16384
+    assert gpt4o.supports_tool_call and not gpt4o.supports_reasoning
+    assert gpt4o.input_modalities == ["text", "image"]
+    assert gpt4o.knowledge_cutoff == "2023-09"
+
+
+def test_wrapped_layout_with_model_lists():
+    payload = {"providers": {"openai": {"models": [
+        {"id": "gpt-4", "pricing": {"input": 30, "output": 60}, "capabilities": {"tools": True}},
+        {"name": "no-id-uses-name"},
+        {},
+    ]}}}
+    text = json.dumps(payload)
+
+    streamed = _normalize_entries(_iter_modelsdev_stream([text]))
+
+    assert streamed == normalize_modelsdev(payload)
+    assert set(streamed) == {"openai/gpt-4", "openai/no-id-uses-name"}
+    assert streamed["openai/gpt-4"].supports_tool_call
+
+
+def test_skip_does_not_build_values():
+    text = '{"a": {"s": "}\\"]", "n": [1, {"x": "{"}]}, "b": 2}'
+    stream = JsonStream(text[i:i + 3] for i in range(0, len(text), 3))
+
+    keys = []
+    for key in stream.members():
+        keys.append(key)
+        if key == "a":
+            stream.skip()
+        else:
+            assert stream.value() == 2
+
+    assert keys == ["a", "b"]
+
+
+def test_numbers_split_across_chunks():
+    payload = {"a": 1.5, "b": [2e3, -0.25, 12, 3.5E-2, True, None], "c": {"x": 1e+2}, "d": 7}
+    text = json.dumps(payload).replace("2000.0", "2e3").replace("100.0", "1e+2").replace("0.035", "3.5E-2")
+
+    # One character per chunk splits every number after "." / "e" / "+"
+    stream = JsonStream(iter(text))
+    assert {key: stream.value() for key in stream.members()} == payload
+
+    stream = JsonStream(iter(text))
+    keys = []
+    for key in stream.members():
+        keys.append(key)
+        if key != "d":
+            stream.skip()
+        else:
+            assert stream.value() == 7
+    assert keys == ["a", "b", "c", "d"]
+
+    stream = JsonStream(iter(["[1.", "5, 2e", "3]"]))
+    assert [stream.value() for _ in stream.items()] == [1.5, 2000.0]
+
+
+def test_peak_memory_is_bounded_by_wanted_providers():
+    models = {f"m{i}": {"id": f"m{i}", "name": "x" * 200, "cost": {"input": 1, "output": 2}} for i in range(200)}
+    provider = json.dumps({"models": models})
+    size = 0
+
+    def chunks():
+        nonlocal size
+        yield "{"
+        for p in range(100):
+            piece = f'{"," if p else ""}"p{p}": {provider}'
+            size += len(piece)
+            yield piece
+        yield "}"
+
+    tracemalloc.start()
+    try:
+        normalized = _normalize_entries(_iter_modelsdev_stream(chunks(), {"p7"}))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(normalized) == 200
+    assert size > 4_000_000
+    assert peak < size / 4
+
+
+def test_load_caches_normalized_models(server):
+    models = load_modelsdev_models({"openai"})
+    assert set(models) == {"openai/gpt-4o", "openai/o3-mini"}
+    assert server.requests == 1
+
+    cache_path = cache_module._get_sources_dir() / "modelsdev.json"
+    cached = json.loads(cache_path.read_text())
+    assert cached["providers"] == ["openai"]
+    assert "supports_structured_output" not in cached["models"][0]
+
+    # Covered providers come from the cache, without a request
+    assert load_modelsdev_models({"openai"}) == models
+    assert server.requests == 1
+
+    # A new provider triggers one parse for both
+    both = load_modelsdev_models({"openai", "anthropic"})
+    assert server.requests == 2
+    assert set(both) == set(models) | {"anthropic/claude-3-5-haiku-20241022"}
+    assert load_modelsdev_models({"anthropic"}).keys() == {"anthropic/claude-3-5-haiku-20241022"}
+    assert server.requests == 2
+
+
+def test_unreachable_source_uses_cache_or_returns_empty(server):
+    server.status = 503
+    assert load_modelsdev_models({"openai"}) == {}
+
+    server.status = 200
+    models = load_modelsdev_models({"openai"})
+    server.status = 503
+    assert load_modelsdev_models({"openai", "anthropic"}) == models
+    assert load_modelsdev_models(set()) == {}
+
+
+def test_build_parses_only_providers_fusion_can_use():
+    overrides = {"id_mappings": {
+        "openai/gpt-4o": {"modelsdev_id": "azure/gpt-4o"},
+        "mistral/large": {"modelsdev_id": "mistralai/large"},
+    }}
+    models = [AnyLLMModel(provider="openai", model_id="gpt-4o")]
+
+    assert builder_module._modelsdev_providers(models, overrides) == {"openai", "azure"}
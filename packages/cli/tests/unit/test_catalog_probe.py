@@ -0,0 +1,122 @@
+"""
+Unit tests for catalog latency probing against the local stand-in provider.
+"""
+import pytest
+from unittest.mock import patch
+from typer.testing import CliRunner
+from llmhub_cli.cli import app
+from llmhub_cli.catalog import Catalog, CanonicalModel
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.schema import AnyLLMModel
+from llmhub_cli.catalog.probe import (
+    probe_models,
+    save_probe_summaries,
+    load_probe_summaries,
+    probe_latency,
+    _get_probes_path,
+)
+from llmhub_cli.tools.standin_provider import StandInProvider, LatencyProfile
+from llmhub_runtime import LLMHub
+from llmhub_runtime.telemetry import TelemetrySink, aggregate_call_log
+
+
+@pytest.fixture
+def models():
+    return [
+        CanonicalModel(canonical_id="openai/fast", provider="openai", model_id="fast"),
+        CanonicalModel(canonical_id="openai/slow", provider="openai", model_id="slow"),
+        CanonicalModel(canonical_id="openai/broken", provider="openai", model_id="broken"),
+    ]
+
+
+@pytest.fixture
+def standin():
+    return StandInProvider({
+        "openai/fast": LatencyProfile(ttft_ms=10, output_tokens_per_second=1000, tokens=10),
+        "openai/slow": LatencyProfile(ttft_ms=80, output_tokens_per_second=200, tokens=10),
+        "openai/broken": LatencyProfile(error_rate=1.0),
+    })
+
+
+def test_probe_measures_latency_throughput_and_errors(models, standin):
+    with standin.install():
+        summaries = probe_models(models, samples=3, max_workers=6)
+
+    fast, slow, broken = (summaries[m.canonical_id] for m in models)
+
+    assert fast.requests == 6 and fast.errors == 0
+    assert 10 <= fast.ttft_ms.p50 < slow.ttft_ms.p50
+    assert slow.ttft_ms.p50 >= 80
+    assert fast.output_tokens_per_second.p50 > slow.output_tokens_per_second.p50
+    assert slow.output_tokens_per_second.p50 <= 200
+
+    assert broken.error_rate == 1.0
+    assert broken.ttft_ms is None
+    assert "Stand-in error" in broken.last_error
+
+    # Every request was streamed through LLMHub
+    assert len(standin.calls) == 18
+    assert all(call["stream"] for call in standin.calls)
+
+
+def test_streams_failing_midway_are_errors_in_probe_and_telemetry(tmp_path):
+    broken = CanonicalModel(canonical_id="openai/flaky", provider="openai", model_id="flaky")
+    standin = StandInProvider({"openai/flaky": LatencyProfile(ttft_ms=1, error_rate=1.0, failed_tokens=3)})
+    sink = TelemetrySink(tmp_path / "calls.log")
+
+    with standin.install():
+        summaries = probe_models(
+            [broken], samples=2,
+            hub_factory=lambda config: LLMHub(config_obj=config, telemetry=sink),
+        )
+
+    summary = summaries["openai/flaky"]
+    assert summary.requests == 4 and summary.error_rate == 1.0
+    assert summary.ttft_ms is None
+    assert summary.output_tokens_per_second is None
+    assert "Stand-in error" in summary.last_error
+
+    stats = aggregate_call_log(sink.path)[("openai", "flaky")]
+    assert stats.calls == 4 and stats.error_rate == 1.0
+
+
+def test_summaries_are_merged_and_feed_catalog_build(cache_path, models, standin):
+    with standin.install():
+        first = probe_models(models[:1], samples=2)
+        second = probe_models(models[1:2], samples=2)
+    save_probe_summaries(first)
+    save_probe_summaries(second)
+
+    assert _get_probes_path().parent == cache_path.parent
+    assert set(load_probe_summaries()) == {"openai/fast", "openai/slow"}
+    assert probe_latency()["openai/fast"]["ttft_ms"] == first["openai/fast"].ttft_ms.p50
+
+    with patch.object(builder_module, "load_anyllm_models", return_value=[
+        AnyLLMModel(provider="openai", model_id="fast"),
+        AnyLLMModel(provider="openai", model_id="unprobed"),
+    ]), patch.object(builder_module, "load_modelsdev_models", return_value={}), \
+            patch.object(builder_module, "load_arena_models", return_value={}):
+        catalog = builder_module._build_fresh_catalog()
+
+    by_id = {m.model_id: m for m in catalog.models}
+    assert by_id["fast"].ttft_ms == first["openai/fast"].ttft_ms.p50
+    assert by_id["fast"].output_tokens_per_second == first["openai/fast"].output_tokens_per_second.p50
+    assert by_id["unprobed"].ttft_ms is None
+
+
+def test_unreadable_probes_file_is_ignored(cache_path):
+    _get_probes_path().write_text("{not json")
+
+    assert load_probe_summaries() == {}
+
+
+def test_probe_command(cache_path, models, standin):
+    cache_module.save_catalog(Catalog(built_at="2024-12-02T00:00:00", models=models))
+
+    with standin.install():
+        result = CliRunner().invoke(app, ["catalog", "probe", "--model", "fast", "--samples", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "openai/fast" in result.output
+    assert set(load_probe_summaries()) == {"openai/fast"}
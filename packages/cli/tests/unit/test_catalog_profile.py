@@ -0,0 +1,111 @@
+"""
+Unit tests for stage-level catalog build profiling.
+"""
+import time
+import tracemalloc
+import pytest
+from unittest.mock import patch
+from typer.testing import CliRunner
+from llmhub_cli.cli import app
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.profile import BuildProfiler
+from llmhub_cli.catalog.schema import AnyLLMModel, ArenaModel
+
+
+@pytest.fixture
+def sources():
+    """Patch the network sources with two any-llm models and one arena score."""
+    with patch.object(builder_module, "load_anyllm_models", return_value=[
+        AnyLLMModel(provider="openai", model_id="gpt-4o"),
+        AnyLLMModel(provider="anthropic", model_id="claude-3-haiku"),
+    ]), patch.object(builder_module, "load_modelsdev_models", return_value={}), \
+            patch.object(builder_module, "load_arena_models", return_value={
+                "gpt-4o": ArenaModel(arena_id="gpt-4o", rating=1280.0),
+            }), patch.object(builder_module, "_load_env_file"):
+        yield
+
+
+def test_profiler_records_time_cpu_memory_and_items():
+    profiler = BuildProfiler()
+
+    with profiler.stage("sleep") as stage:
+        time.sleep(0.05)
+        stage.items = 3
+    with profiler.stage("allocate"):
+        block = bytearray(4 * 1024 * 1024)
+        del block
+
+    profile = profiler.finish()
+    sleep, allocate = profile.stages
+
+    assert (sleep.stage, sleep.items) == ("sleep", 3)
+    assert sleep.seconds >= 0.05
+    assert sleep.cpu_seconds < sleep.seconds
+    assert allocate.items is None
+    assert allocate.peak_mb >= 4
+    assert sleep.peak_mb < 1
+    assert profile.peak_mb >= 4
+    assert profile.seconds >= sleep.seconds + allocate.seconds
+    assert not tracemalloc.is_tracing()
+
+
+def test_disabled_profiler_measures_nothing():
+    profiler = BuildProfiler(enabled=False)
+
+    with profiler.stage("anything") as stage:
+        stage.items = 1
+
+    assert profiler.finish() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiler_stops_tracing_when_a_stage_fails():
+    profiler = BuildProfiler()
+
+    with pytest.raises(RuntimeError):
+        try:
+            with profiler.stage("fails"):
+                raise RuntimeError("offline")
+        finally:
+            profile = profiler.finish()
+
+    assert [s.stage for s in profile.stages] == ["fails"]
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiled_build_stores_profile_in_catalog(cache_path, sources):
+    catalog = builder_module.build_catalog(force_refresh=True, profile=True)
+
+    stages = {s.stage: s for s in catalog.build_profile.stages}
+    assert list(stages) == [
+        "overrides", "anyllm", "modelsdev", "arena", "latency",
+        "fuse", "stats", "derive", "fingerprint",
+    ]
+    assert stages["anyllm"].items == 2
+    assert stages["arena"].items == 1
+    assert stages["derive"].items == 2
+    assert all(s.peak_mb is not None for s in stages.values())
+
+    # Persisted with the cache
+    cached = cache_module.load_cached_catalog()
+    assert cached.build_profile == catalog.build_profile
+    assert cached.fingerprint == catalog.fingerprint
+
+
+def test_unprofiled_build_has_no_profile(cache_path, sources):
+    assert builder_module.build_catalog(force_refresh=True).build_profile is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_refresh_command_profile_option(cache_path, sources):
+    result = CliRunner().invoke(app, ["catalog", "refresh", "--profile"])
+
+    assert result.exit_code == 0, result.output
+    assert "Build profile" in result.output
+    assert "modelsdev" in result.output
+    assert cache_module.load_cached_catalog().build_profile is not None
+
+    result = CliRunner().invoke(app, ["catalog", "refresh"])
+    assert result.exit_code == 0, result.output
+    assert "Build profile" not in result.output
@@ -0,0 +1,72 @@
+"""
+Unit tests for ingesting runtime call telemetry into the catalog.
+"""
+import pytest
+from unittest.mock import patch
+from llmhub_runtime.telemetry import TelemetrySink
+from llmhub_cli.catalog import cache as cache_module
+from llmhub_cli.catalog import builder as builder_module
+from llmhub_cli.catalog.handle import get_catalog_handle
+from llmhub_cli.catalog.schema import AnyLLMModel
+from llmhub_cli.catalog.sources.telemetry import load_telemetry_latency
+
+
+@pytest.fixture
+def telemetry_dir(tmp_path, monkeypatch):
+    """Isolate the catalog cache and the default telemetry log."""
+    monkeypatch.setattr(cache_module, "_get_cache_path", lambda: tmp_path / "catalog.json")
+    monkeypatch.setenv("LLMHUB_TELEMETRY_DIR", str(tmp_path / "telemetry"))
+    get_catalog_handle().invalidate()
+    yield tmp_path / "telemetry"
+    get_catalog_handle().invalidate()
+
+
+def _log_calls(model: str, count: int, ms: float, failures: int = 0) -> None:
+    sink = TelemetrySink()
+    for i in range(count):
+        success = i >= failures
+        sink.record({
+            "provider": "openai",
+            "model": model,
+            "duration_ms": ms,
+            "success": success,
+            "error": None if success else TimeoutError(),
+        })
+    sink.close()
+
+
+def test_load_telemetry_latency_ignores_rarely_called_models(telemetry_dir):
+    _log_calls("gpt-4o", 40, 900.0, failures=4)
+    _log_calls("gpt-4", 3, 100.0)
+
+    latency = load_telemetry_latency()
+
+    assert latency == {"openai/gpt-4o": {"error_rate": 0.1, "observed_latency_ms": 900.0}}
+    assert "openai/gpt-4" in load_telemetry_latency(min_calls=1)
+
+
+def test_build_merges_telemetry(telemetry_dir):
+    _log_calls("gpt-4o", 30, 1500.0, failures=3)
+
+    with patch.object(builder_module, "load_anyllm_models", return_value=[
+        AnyLLMModel(provider="openai", model_id="gpt-4o"),
+        AnyLLMModel(provider="openai", model_id="gpt-4"),
+    ]), patch.object(builder_module, "load_modelsdev_models", return_value={}), \
+            patch.object(builder_module, "load_arena_models", return_value={}):
+        catalog = builder_module._build_fresh_catalog()
+
+    by_id = {m.model_id: m for m in catalog.models}
+    assert by_id["gpt-4o"].observed_latency_ms == 1500.0
+    assert by_id["gpt-4o"].error_rate == 0.1
+    assert by_id["gpt-4"].observed_latency_ms is None
+    assert by_id["gpt-4"].error_rate is None
+
+
+def test_merge_latency_prefers_later_sources_per_field():
+    merged = builder_module._merge_latency(
+        {"a/m": {"ttft_ms": 300.0, "error_rate": 0.5}},
+        {"a/m": {"error_rate": 0.1, "observed_latency_ms": 800.0}},
+        {"a/m": {"ttft_ms": 100.0}},
+    )
+
+    assert merged == {"a/m": {"ttft_ms": 100.0, "error_rate": 0.1, "observed_latency_ms": 800.0}}
@@ -0,0 +1,94 @@
+"""
+Import-time budget for the llmhub CLI.
+
+`llmhub --help` and light commands must not pay for numpy, requests, the
+catalog sources or the provider SDKs; those are imported inside the
+commands that need them.
+"""
+import subprocess
+import sys
+import pytest
+
+
+# Cumulative import time of llmhub_cli.cli (typer, rich and pydantic
+# included), generous enough for slow CI machines
+IMPORT_BUDGET_SECONDS = 0.75
+
+HEAVY_MODULES = [
+    "numpy",
+    "requests",
+    "dotenv",
+    "any_llm",
+    "openai",
+    "anthropic",
+    "llmhub_runtime.hub",
+    "llmhub_cli.catalog",
+    "llmhub_cli.generator",
+]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    """Cumulative microseconds for module from -X importtime output."""
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in import time report")
+
+
+def test_help_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "from llmhub_cli.cli import app\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('loaded:', [m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    result = _run(code)
+
+    assert result.returncode == 0, result.stderr
+    assert "LLMHub CLI" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "loaded: []"
+
+
+def test_cli_import_time_budget():
+    # Best of three runs, to ignore a cold filesystem cache
+    timings = []
+    for _ in range(3):
+        result = _run("import llmhub_cli.cli", "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+        timings.append(_cumulative_import_us(result.stderr, "llmhub_cli.cli"))
+
+    assert min(timings) / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_package_api_is_imported_on_first_use():
+    code = (
+        "import sys, llmhub_cli\n"
+        "assert 'llmhub_cli.generator' not in sys.modules\n"
+        "from llmhub_cli import load_spec, generate_runtime_from_spec, build_catalog\n"
+        "assert 'llmhub_cli.generator' in sys.modules\n"
+        "print(generate_runtime_from_spec.__module__)\n"
+    )
+    result = _run(code)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "llmhub_cli.generator"
+
+
+def test_unknown_attribute_raises():
+    import llmhub_cli
+
+    with pytest.raises(AttributeError):
+        llmhub_cli.not_an_api
@@ -162,3 +162,30 @@ def test_diff_command(tmp_path, monkeypatch):
     assert result.exit_code == 0
     # Should show roles in sync
     assert "llm.inference" in result.stdout
+
+
+def test_incremental_generate_and_diff_staleness(tmp_path, monkeypatch):
+    """Test generate --incremental and stale roles in runtime diff."""
+    monkeypatch.chdir(tmp_path)
+    
+    runner.invoke(app, ["init"])
+    runner.invoke(app, ["generate", "--force"])
+    
+    result = runner.invoke(app, ["runtime", "diff"])
+    assert "in sync" in result.stdout
+    
+    # Change one role's preferences
+    spec_path = tmp_path / "llmhub.spec.yaml"
+    spec_path.write_text(spec_path.read_text().replace("cost: medium", "cost: low", 1))
+    
+    result = runner.invoke(app, ["runtime", "diff"])
+    assert result.exit_code == 0
+    assert "Stale roles (1)" in result.stdout
+    assert "spec changed" in result.stdout
+    
+    result = runner.invoke(app, ["generate", "--incremental"])
+    assert result.exit_code == 0
+    assert "Regenerating 1 of" in result.stdout
+    
+    result = runner.invoke(app, ["runtime", "diff"])
+    assert "in sync" in result.stdout
@@ -136,6 +136,74 @@ class TestGenerateRuntimeFromSpec:
             assert result.runtime.env == valid_spec.env
 
 
+class TestOfflineGeneration:
+    """Tests for --no-llm generation against the cached catalog."""
+    
+    @pytest.fixture
+    def cached_catalog(self, tmp_path, monkeypatch):
+        """Write a small catalog to a temporary cache file."""
+        from llmhub_cli.catalog import Catalog, CanonicalModel
+        from llmhub_cli.catalog import cache as cache_module
+        from llmhub_cli.catalog.handle import get_catalog_handle
+        
+        path = tmp_path / "catalog.json"
+        monkeypatch.setattr(cache_module, "_get_cache_path", lambda: path)
+        get_catalog_handle().invalidate()
+        catalog = Catalog(
+            built_at="2020-01-01T00:00:00",
+            models=[
+                CanonicalModel(canonical_id="openai/gpt-4o", provider="openai", model_id="gpt-4o",
+                               quality_tier=1, cost_tier=4),
+                CanonicalModel(canonical_id="openai/gpt-4o-mini", provider="openai", model_id="gpt-4o-mini",
+                               quality_tier=3, cost_tier=1),
+                CanonicalModel(canonical_id="anthropic/claude-3-5-sonnet", provider="anthropic",
+                               model_id="claude-3-5-sonnet", quality_tier=1, cost_tier=4),
+            ],
+        )
+        cache_module.save_catalog(catalog)
+        yield catalog
+        get_catalog_handle().invalidate()
+    
+    def test_no_llm_selects_from_cached_catalog(self, valid_spec, cached_catalog):
+        """Roles are matched against the (stale) cached catalog offline."""
+        options = GeneratorOptions(no_llm=True, explain=True)
+        
+        with patch('llmhub_cli.catalog.builder.build_catalog') as mock_build:
+            result = generate_runtime_from_spec(valid_spec, options)
+        
+        mock_build.assert_not_called()
+        chat = result.runtime.roles["llm.chat"]
+        assert (chat.provider, chat.model) in {("openai", "gpt-4o"), ("openai", "gpt-4o-mini"),
+                                               ("anthropic", "claude-3-5-sonnet")}
+        assert result.runtime.roles["llm.reasoning"].provider == "openai"
+        assert result.runtime.roles["llm.reasoning"].params == {"temperature": 0.7}
+        assert result.explanations["llm.chat"].startswith("Selected ")
+        
+        # No embedding model in the catalog: built-in heuristics with a reason
+        assert result.runtime.roles["llm.embedding"].model == "text-embedding-3-small"
+        assert "No suitable models found" in result.explanations["llm.embedding"]
+    
+    def test_no_llm_is_deterministic(self, valid_spec, cached_catalog):
+        options = GeneratorOptions(no_llm=True, explain=True)
+        
+        first = generate_runtime_from_spec(valid_spec, options)
+        second = generate_runtime_from_spec(valid_spec, options)
+        
+        assert first == second
+    
+    def test_no_llm_without_catalog_uses_heuristics(self, valid_spec, tmp_path, monkeypatch):
+        from llmhub_cli.catalog import cache as cache_module
+        from llmhub_cli.catalog.handle import get_catalog_handle
+        
+        monkeypatch.setattr(cache_module, "_get_cache_path", lambda: tmp_path / "catalog.json")
+        get_catalog_handle().invalidate()
+        
+        result = generate_runtime_from_spec(valid_spec, GeneratorOptions(no_llm=True, explain=True))
+        
+        assert set(result.runtime.roles) == set(valid_spec.roles)
+        assert "no cached catalog" in result.explanations["llm.chat"]
+
+
 class TestGeneratorOptions:
     """Tests for GeneratorOptions model."""
     
@@ -0,0 +1,118 @@
+"""
+Unit tests for watch mode (llmhub generate --watch).
+"""
+import os
+import threading
+import pytest
+import yaml
+from llmhub_cli.spec_models import SpecError
+from llmhub_cli.runtime_io import load_runtime, load_runtime_fingerprints
+from llmhub_cli.watch import SpecWatcher
+
+
+def _write_spec(path, chat_cost="medium"):
+    path.write_text(yaml.safe_dump({
+        "project": "test-project",
+        "env": "dev",
+        "providers": {"openai": {"enabled": True, "env_key": "OPENAI_API_KEY"}},
+        "roles": {
+            "llm.chat": {"kind": "chat", "description": "Chat", "preferences": {"cost": chat_cost}},
+            "llm.embedding": {"kind": "embedding", "description": "Embeddings"},
+        },
+    }))
+
+
+@pytest.fixture
+def paths(tmp_path):
+    spec_path = tmp_path / "llmhub.spec.yaml"
+    _write_spec(spec_path)
+    return spec_path, tmp_path / "llmhub.yaml"
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_first_poll_generates_runtime(paths):
+    spec_path, runtime_path = paths
+    watcher = SpecWatcher(spec_path, runtime_path)
+
+    event = watcher.poll()
+
+    assert event.regenerated == ["llm.chat", "llm.embedding"]
+    assert set(load_runtime(runtime_path).roles) == {"llm.chat", "llm.embedding"}
+    assert set(load_runtime_fingerprints(runtime_path)) == {"llm.chat", "llm.embedding"}
+
+
+def test_unchanged_or_touched_spec_does_not_regenerate(paths):
+    spec_path, runtime_path = paths
+    watcher = SpecWatcher(spec_path, runtime_path)
+    watcher.poll()
+
+    assert watcher.poll() is None
+    _bump_mtime(spec_path)
+    assert watcher.poll() is None
+
+
+def test_edit_regenerates_only_changed_role_quickly(paths):
+    spec_path, runtime_path = paths
+    watcher = SpecWatcher(spec_path, runtime_path)
+    watcher.poll()
+
+    _write_spec(spec_path, chat_cost="low")
+    _bump_mtime(spec_path)
+    event = watcher.poll()
+
+    assert event.regenerated == ["llm.chat"]
+    assert load_runtime(runtime_path).roles["llm.chat"].model == "gpt-4o-mini"
+    assert event.elapsed_ms < 100
+
+
+def test_existing_runtime_is_reused_on_start(paths):
+    spec_path, runtime_path = paths
+    SpecWatcher(spec_path, runtime_path).poll()
+
+    event = SpecWatcher(spec_path, runtime_path).poll()
+
+    assert event.regenerated == []
+
+
+def test_invalid_spec_keeps_previous_runtime(paths):
+    spec_path, runtime_path = paths
+    watcher = SpecWatcher(spec_path, runtime_path)
+    watcher.poll()
+    before = runtime_path.read_text()
+
+    spec_path.write_text("roles: [broken")
+    _bump_mtime(spec_path)
+    with pytest.raises(SpecError):
+        watcher.poll()
+
+    assert watcher.poll() is None
+    assert runtime_path.read_text() == before
+    assert not [p for p in runtime_path.parent.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_run_reports_events_and_errors_until_stopped(paths):
+    spec_path, runtime_path = paths
+    watcher = SpecWatcher(spec_path, runtime_path)
+    events, errors = [], []
+    stop = threading.Event()
+
+    def on_event(event):
+        events.append(event)
+        spec_path.write_text("roles: [broken")
+        _bump_mtime(spec_path)
+
+    def on_error(error):
+        errors.append(error)
+        stop.set()
+
+    thread = threading.Thread(target=watcher.run, args=(on_event, on_error), kwargs={"interval": 0.01, "stop": stop})
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(events) == 1
+    assert isinstance(errors[0], SpecError)
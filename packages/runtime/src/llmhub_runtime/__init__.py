@@ -1,5 +1,14 @@
-from .hub import LLMHub
 from .models import RuntimeConfig
 from .errors import EnvVarMissingError
 
+
+def __getattr__(name):
+    # LLMHub pulls in any_llm and every provider SDK; import it on first use
+    # so that config models can be used without paying for it
+    if name == "LLMHub":
+        from .hub import LLMHub
+        return LLMHub
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["LLMHub", "RuntimeConfig", "EnvVarMissingError"]
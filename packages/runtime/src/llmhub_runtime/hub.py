@@ -1,9 +1,11 @@
 import os
+import time
 from typing import Optional, Dict, Any, List, Union, Callable, Iterator, AsyncIterator
 from .models import RuntimeConfig, ResolvedCall
 from .config_loader import load_runtime_config
 from .resolver import resolve_role
 from .errors import EnvVarMissingError
+from .telemetry import TelemetrySink
 try:
     import any_llm
 except ImportError:
@@ -22,6 +24,7 @@ class LLMHub:
         strict_env: bool = False,
         on_before_call: Optional[Callable[[CallContext], None]] = None,
         on_after_call: Optional[Callable[[CallResult], None]] = None,
+        telemetry: Optional[TelemetrySink] = None,
     ):
         """
         Initialize the LLMHub client.
@@ -32,6 +35,7 @@ class LLMHub:
             strict_env: If True, check that all env_key vars exist on init.
             on_before_call: Hook to run before calling any-llm.
             on_after_call: Hook to run after calling any-llm.
+            telemetry: Optional sink recording latency and errors of every call.
 
         Raises:
             ValueError: If neither or both config_path and config_obj are provided.
@@ -48,6 +52,7 @@ class LLMHub:
         self.strict_env = strict_env
         self.on_before_call = on_before_call
         self.on_after_call = on_after_call
+        self.telemetry = telemetry
 
         if self.strict_env:
             self._validate_env_vars()
@@ -58,6 +63,12 @@ class LLMHub:
                 if provider_config.env_key not in os.environ:
                     raise EnvVarMissingError(f"Missing environment variable: {provider_config.env_key} for provider {provider_name}")
 
+    def _after_call(self, result: CallResult) -> None:
+        if self.telemetry:
+            self.telemetry.record(result)
+        if self.on_after_call:
+            self.on_after_call(result)
+
     def completion(
         self,
         role: str,
@@ -73,7 +84,9 @@ class LLMHub:
             params_override: Optional parameters to override defaults.
 
         Returns:
-            The raw response from any-llm.
+            The raw response from any-llm. With stream=True and a hook or
+            telemetry set, an iterator over its chunks that reports the call
+            once the stream ends or fails.
         """
         resolved = resolve_role(self.config, role, params_override)
 
@@ -93,7 +106,8 @@ class LLMHub:
         success = False
         error = None
         response = None
-        # Simple timing could be added here if needed for duration_ms
+        streamed = False
+        started = time.perf_counter()
 
         try:
             if any_llm is None:
@@ -106,23 +120,55 @@ class LLMHub:
                 **resolved.params
             )
             success = True
+            if resolved.params.get("stream") and (self.on_after_call or self.telemetry):
+                # A stream can still fail while it is consumed; record it then
+                streamed = True
+                return self._observe_stream(response, resolved, started)
             return response
         except Exception as e:
             error = e
             raise e
         finally:
-            if self.on_after_call:
+            if not streamed and (self.on_after_call or self.telemetry):
                 result: CallResult = {
                     "role": resolved.role,
                     "provider": resolved.provider,
                     "model": resolved.model,
                     "mode": resolved.mode,
-                    # "duration_ms": ... # Not implementing timing for now as not explicitly asked beyond spec details
+                    "duration_ms": (time.perf_counter() - started) * 1000,
                     "success": success,
                     "error": error,
                     "response": response
                 }
-                self.on_after_call(result)
+                self._after_call(result)
+
+    def _observe_stream(self, stream: Any, resolved: ResolvedCall, started: float) -> Iterator[Any]:
+        """Yield the chunks of a streamed completion, then report the call."""
+        success = False
+        error = None
+        try:
+            for chunk in stream:
+                yield chunk
+            success = True
+        except GeneratorExit:
+            # The caller stopped reading; the call itself did not fail
+            success = True
+            raise
+        except Exception as e:
+            error = e
+            raise e
+        finally:
+            result: CallResult = {
+                "role": resolved.role,
+                "provider": resolved.provider,
+                "model": resolved.model,
+                "mode": resolved.mode,
+                "duration_ms": (time.perf_counter() - started) * 1000,
+                "success": success,
+                "error": error,
+                "response": stream
+            }
+            self._after_call(result)
 
     def embedding(
         self,
@@ -158,6 +204,7 @@ class LLMHub:
         success = False
         error = None
         response = None
+        started = time.perf_counter()
 
         try:
             if any_llm is None:
@@ -175,14 +222,15 @@ class LLMHub:
             error = e
             raise e
         finally:
-             if self.on_after_call:
+             if self.on_after_call or self.telemetry:
                 result: CallResult = {
                     "role": resolved.role,
                     "provider": resolved.provider,
                     "model": resolved.model,
                     "mode": resolved.mode,
+                    "duration_ms": (time.perf_counter() - started) * 1000,
                     "success": success,
                     "error": error,
                     "response": response
                 }
-                self.on_after_call(result)
+                self._after_call(result)
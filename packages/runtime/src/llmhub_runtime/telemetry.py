@@ -0,0 +1,275 @@
+"""
+Telemetry: local call log with per-(provider, model) latency and error aggregates.
+
+TelemetrySink appends one compact JSON line per LLMHub call to a local log
+file, rotates it by size, and keeps running aggregates in memory. Each record
+is written with a single O_APPEND write, so several processes can share a
+log (rotation is best-effort across processes). aggregate_call_log() reads
+a log and its rotated files back into CallStats; the llmhub CLI ingests them
+when building its catalog, so generated configs prefer models that are fast
+and reliable in this deployment.
+
+Usage:
+
+    from llmhub_runtime import LLMHub
+    from llmhub_runtime.telemetry import TelemetrySink
+
+    hub = LLMHub(config_path="llmhub.yaml", telemetry=TelemetrySink())
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from pydantic import BaseModel
+
+# Overrides the directory of the default log
+TELEMETRY_DIR_ENV = "LLMHUB_TELEMETRY_DIR"
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+# Latencies kept per (provider, model) for in-memory percentiles
+_WINDOW = 1000
+
+StatsKey = Tuple[str, str]
+
+
+def default_telemetry_path() -> Path:
+    """
+    Path of the default call log.
+
+    Uses $LLMHUB_TELEMETRY_DIR/calls.log if set, otherwise
+    ~/.config/llmhub/telemetry/calls.log.
+    """
+    base = os.environ.get(TELEMETRY_DIR_ENV)
+    directory = Path(base) if base else Path.home() / ".config" / "llmhub" / "telemetry"
+    return directory / "calls.log"
+
+
+class CallStats(BaseModel):
+    """Aggregated calls to one (provider, model)."""
+    provider: str
+    model: str
+    calls: int = 0
+    errors: int = 0
+    latency_p50_ms: Optional[float] = None  # Successful calls only
+    latency_p90_ms: Optional[float] = None
+    last_call_at: Optional[float] = None  # Unix time
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Linearly interpolated percentile of an ascending list."""
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class _Accumulator:
+    """Running counts and a window of latencies for one (provider, model)."""
+
+    def __init__(self, window: Optional[int] = None) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latencies: Union[list, deque] = deque(maxlen=window) if window else []
+        self.last_call_at: Optional[float] = None
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.calls += 1
+        if record.get("ok"):
+            if record.get("ms") is not None:
+                self.latencies.append(float(record["ms"]))
+        else:
+            self.errors += 1
+        self.last_call_at = max(self.last_call_at or 0.0, float(record.get("t", 0.0)))
+
+    def stats(self, key: StatsKey) -> CallStats:
+        ordered = sorted(self.latencies)
+        return CallStats(
+            provider=key[0],
+            model=key[1],
+            calls=self.calls,
+            errors=self.errors,
+            latency_p50_ms=round(_percentile(ordered, 50), 1) if ordered else None,
+            latency_p90_ms=round(_percentile(ordered, 90), 1) if ordered else None,
+            last_call_at=self.last_call_at,
+        )
+
+
+class TelemetrySink:
+    """
+    Append-only, size-rotated call log plus in-memory aggregates.
+
+    Pass it to LLMHub(telemetry=...); it can also be used directly as an
+    on_after_call hook. Recording never raises: telemetry must not break
+    the calls it observes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Log file (default: default_telemetry_path()).
+            max_bytes: Rotate once the log reaches this size.
+            backups: Rotated files kept (calls.log.1 ... calls.log.N).
+        """
+        self.path = Path(path) if path else default_telemetry_path()
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._aggregates: Dict[StatsKey, _Accumulator] = {}
+
+    def record(self, result: Dict[str, Any]) -> None:
+        """
+        Record one call.
+
+        Args:
+            result: LLMHub call result (provider, model, role, success,
+                error, duration_ms).
+        """
+        entry: Dict[str, Any] = {
+            "t": round(time.time(), 3),
+            "p": result.get("provider"),
+            "m": result.get("model"),
+            "r": result.get("role"),
+            "ms": round(result["duration_ms"], 1) if result.get("duration_ms") is not None else None,
+            "ok": 1 if result.get("success") else 0,
+        }
+        if result.get("error") is not None:
+            entry["e"] = type(result["error"]).__name__
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode()
+
+        with self._lock:
+            key = (entry["p"], entry["m"])
+            accumulator = self._aggregates.get(key)
+            if accumulator is None:
+                accumulator = self._aggregates[key] = _Accumulator(_WINDOW)
+            accumulator.add(entry)
+
+            try:
+                self._write(line)
+            except OSError:
+                self._close()
+
+    __call__ = record
+
+    def _write(self, line: bytes) -> None:
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, line)
+        if os.fstat(self._fd).st_size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._close()
+        for i in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{i}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            finally:
+                self._fd = None
+
+    def close(self) -> None:
+        """Close the log file (it is reopened on the next record)."""
+        with self._lock:
+            self._close()
+
+    def stats(self) -> Dict[StatsKey, CallStats]:
+        """
+        Aggregates of the calls recorded by this sink.
+
+        Returns:
+            (provider, model) → CallStats (latency percentiles over the most
+            recent calls)
+        """
+        with self._lock:
+            return {key: accumulator.stats(key) for key, accumulator in self._aggregates.items()}
+
+
+def _log_files(path: Path) -> Iterable[Path]:
+    """The log and its rotated files, oldest first."""
+    rotated = []
+    for candidate in path.parent.glob(f"{path.name}.*"):
+        suffix = candidate.name[len(path.name) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), candidate))
+    for _, candidate in sorted(rotated, reverse=True):
+        yield candidate
+    if path.exists():
+        yield path
+
+
+def read_call_log(path: Optional[Union[str, Path]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the records of a call log and its rotated files, oldest first.
+
+    Malformed lines (e.g. a torn final line) are skipped.
+
+    Args:
+        path: Log file (default: default_telemetry_path()).
+
+    Yields:
+        Record dicts with keys t, p, m, r, ms, ok and (on failure) e.
+    """
+    for log_file in _log_files(Path(path) if path else default_telemetry_path()):
+        try:
+            with open(log_file, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get("p") and record.get("m"):
+                        yield record
+        except OSError:
+            continue
+
+
+def aggregate_call_log(
+    path: Optional[Union[str, Path]] = None,
+    since: Optional[float] = None
+) -> Dict[StatsKey, CallStats]:
+    """
+    Aggregate a call log per (provider, model).
+
+    Args:
+        path: Log file (default: default_telemetry_path()).
+        since: Only count calls at or after this Unix time.
+
+    Returns:
+        (provider, model) → CallStats
+    """
+    aggregates: Dict[StatsKey, _Accumulator] = {}
+    for record in read_call_log(path):
+        if since is not None and record.get("t", 0) < since:
+            continue
+        key = (record["p"], record["m"])
+        accumulator = aggregates.get(key)
+        if accumulator is None:
+            accumulator = aggregates[key] = _Accumulator()
+        accumulator.add(record)
+    return {key: accumulator.stats(key) for key, accumulator in aggregates.items()}
@@ -0,0 +1,137 @@
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from llmhub_runtime.hub import LLMHub
+from llmhub_runtime.telemetry import (
+    TelemetrySink,
+    aggregate_call_log,
+    read_call_log,
+    default_telemetry_path,
+)
+
+FIXTURE_PATH = str(Path(__file__).parent / "fixtures" / "llmhub.yaml")
+
+
+@pytest.fixture
+def mock_any_llm():
+    with patch("llmhub_runtime.hub.any_llm") as mock:
+        yield mock
+
+
+def _result(model="gpt-4", ms=100.0, success=True):
+    return {
+        "role": "llm.inference",
+        "provider": "openai",
+        "model": model,
+        "duration_ms": ms,
+        "success": success,
+        "error": None if success else TimeoutError("slow"),
+    }
+
+
+def test_hub_records_calls(mock_any_llm, tmp_path):
+    sink = TelemetrySink(tmp_path / "calls.log")
+    hub = LLMHub(config_path=FIXTURE_PATH, telemetry=sink)
+
+    hub.completion("llm.inference", messages=[])
+    mock_any_llm.completion.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        hub.completion("llm.inference", messages=[])
+
+    records = list(read_call_log(sink.path))
+    assert [(r["p"], r["m"], r["ok"]) for r in records] == [("openai", "gpt-4", 1), ("openai", "gpt-4", 0)]
+    assert records[1]["e"] == "RuntimeError"
+    assert records[0]["ms"] >= 0
+
+    stats = sink.stats()[("openai", "gpt-4")]
+    assert stats.calls == 2
+    assert stats.error_rate == 0.5
+
+
+def test_streams_are_recorded_when_consumed(mock_any_llm, tmp_path):
+    sink = TelemetrySink(tmp_path / "calls.log")
+    hub = LLMHub(config_path=FIXTURE_PATH, telemetry=sink)
+
+    def breaks_off():
+        yield "first"
+        raise ConnectionError("reset")
+
+    mock_any_llm.completion.return_value = iter(["a", "b"])
+    assert list(hub.completion("llm.inference", messages=[], params_override={"stream": True})) == ["a", "b"]
+
+    mock_any_llm.completion.return_value = breaks_off()
+    stream = hub.completion("llm.inference", messages=[], params_override={"stream": True})
+    assert len(list(read_call_log(sink.path))) == 1
+    with pytest.raises(ConnectionError):
+        list(stream)
+
+    records = list(read_call_log(sink.path))
+    assert [r["ok"] for r in records] == [1, 0]
+    assert records[1]["e"] == "ConnectionError"
+
+
+def test_hooks_receive_duration(mock_any_llm):
+    results = []
+    hub = LLMHub(config_path=FIXTURE_PATH, on_after_call=results.append)
+
+    hub.embedding("llm.embedding", input="hello")
+
+    assert results[0]["duration_ms"] >= 0
+
+
+def test_aggregate_percentiles_and_errors(tmp_path):
+    sink = TelemetrySink(tmp_path / "calls.log")
+    for ms in range(1, 101):
+        sink.record(_result(ms=float(ms)))
+    sink.record(_result(success=False))
+    sink.record(_result(model="gpt-4o-mini", ms=20.0))
+
+    stats = aggregate_call_log(sink.path)
+
+    gpt4 = stats[("openai", "gpt-4")]
+    assert gpt4.calls == 101
+    assert gpt4.errors == 1
+    assert gpt4.latency_p50_ms == 50.5
+    assert gpt4.latency_p90_ms == 90.1
+    assert stats[("openai", "gpt-4o-mini")].latency_p50_ms == 20.0
+    assert aggregate_call_log(sink.path) == sink.stats()
+
+
+def test_rotation_keeps_backups(tmp_path):
+    sink = TelemetrySink(tmp_path / "calls.log", max_bytes=400, backups=2)
+    for _ in range(61):
+        sink.record(_result())
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["calls.log", "calls.log.1", "calls.log.2"]
+    assert all(p.stat().st_size <= 400 + 200 for p in tmp_path.iterdir())
+    # Older records beyond the backups are gone, the rest are still readable
+    assert 0 < len(list(read_call_log(sink.path))) < 61
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    path = tmp_path / "calls.log"
+    sink = TelemetrySink(path)
+    sink.record(_result())
+    sink.close()
+    with open(path, "a") as f:
+        f.write('{"t": 1, "p": "openai", "m"')
+
+    assert aggregate_call_log(path)[("openai", "gpt-4")].calls == 1
+
+
+def test_recording_never_raises(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    sink = TelemetrySink(blocker / "calls.log")
+
+    sink.record(_result())
+
+    assert sink.stats()[("openai", "gpt-4")].calls == 1
+
+
+def test_default_path_respects_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLMHUB_TELEMETRY_DIR", str(tmp_path))
+
+    assert default_telemetry_path() == tmp_path / "calls.log"
+    assert TelemetrySink().path == tmp_path / "calls.log"